@@ -0,0 +1,208 @@
+import os
+import sys
+import random
+import tempfile
+import time
+import tracemalloc
+import argparse
+import logging
+from pathlib import Path
+
+import yaml
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+from threat_hunting.ai.sigma_parallel import ParallelSigmaAnalyzer
+
+PROCESSES = ['powershell.exe', 'cmd.exe', 'wmic.exe', 'rundll32.exe', 'regsvr32.exe',
+             'mshta.exe', 'certutil.exe', 'bitsadmin.exe', 'schtasks.exe', 'net.exe']
+ARGUMENTS = ['-nop', '-enc', 'hidden', '/c', 'downloadstring', 'bypass', 'urlcache',
+             '/transfer', '/create', 'user /add', 'shadowcopy', 'iex']
+EVENT_IDS = ['4688', '4624', '4625', '4672', '4720', '7045', '1102', '4104']
+USERS = ['SYSTEM', 'alice', 'bob', 'svc_backup']
+FOLDERS = ['temp', 'appdata', 'downloads', 'public', 'programdata', 'desktop']
+# Bruit bénin qui domine les journaux réels
+BENIGN_PROCESSES = ['svchost.exe', 'conhost.exe', 'chrome.exe', 'explorer.exe', 'msedge.exe', 'teams.exe']
+
+
+def generer_regles(rules_dir: Path, count: int, seed: int = 42, equality: bool = False, shared: bool = False,
+                   skewed: bool = False):
+    """Génère des règles SIGMA synthétiques, dans le style des règles livrées.
+
+    Avec equality, les sélections ne contiennent que des égalités (EventID,
+    chemin complet du processus, liste d'utilisateurs). Avec shared, les
+    règles combinent des sélections et filtres tirés d'un petit ensemble
+    commun, comme les règles d'une même famille. Avec skewed, les champs des
+    sélections sont écrits du plus coûteux au plus sélectif (motifs sur
+    ParentImage et CommandLine avant NewProcessName et EventID).
+    """
+    rng = random.Random(seed)
+    filters = [[f'*\\{folder}\\*{rng.randrange(20)}.exe' for folder in rng.sample(FOLDERS, 3)] for _ in range(10)]
+    for i in range(count):
+        process = rng.choice(PROCESSES)
+        argument = rng.choice(ARGUMENTS)
+        if equality:
+            selection = {
+                'EventID': rng.choice(EVENT_IDS),
+                'NewProcessName': f'C:\\Windows\\System32\\{process}',
+                'User': rng.sample(USERS, 2),
+            }
+        else:
+            selection = {
+                'EventID': rng.choice(EVENT_IDS),
+                'NewProcessName': f'*{process}',
+                'CommandLine': f'*{argument}*',
+                'ParentImage': [f'*\\{folder}\\*{rng.randrange(20)}.exe' for folder in rng.sample(FOLDERS, 3)],
+            }
+            if skewed:
+                selection = {name: selection[name] for name in reversed(list(selection))}
+        detection = {'selection': selection, 'condition': 'selection'}
+        if shared:
+            detection = {
+                'selection_img': {'EventID': rng.choice(EVENT_IDS[:2]), 'NewProcessName': f'*{process}'},
+                'selection_cli': {'CommandLine': f'*{argument}*'},
+                'filter': {'ParentImage': rng.choice(filters)},
+                'condition': 'selection_img and selection_cli and not filter',
+            }
+        # Métadonnées de la taille de celles des règles SigmaHQ, inutiles à l'évaluation
+        rule = {
+            'title': f'Règle synthétique {i}',
+            'id': f'bench-{i}',
+            'status': 'experimental',
+            'description': f'Détecte une exécution suspecte de {process} avec {argument}, '
+                           f'fréquemment observée lors des phases de persistance et de latéralisation. '
+                           f'Règle {i} générée pour le banc de mesure.',
+            'references': [f'https://attack.mitre.org/techniques/T{1000 + rng.randrange(600)}/',
+                           f'https://example.org/rapports/{i}'],
+            'author': 'Banc de mesure',
+            'date': '2024-01-15',
+            'tags': ['attack.execution', f'attack.t{1000 + rng.randrange(600)}'],
+            'logsource': {'product': 'windows', 'service': 'security'},
+            'detection': detection,
+            'falsepositives': ['Administration légitime', 'Outils de déploiement'],
+            'level': rng.choice(['low', 'medium', 'high']),
+        }
+        with open(rules_dir / f'rule_{i}.yml', 'w', encoding='utf-8') as f:
+            yaml.safe_dump(rule, f, allow_unicode=True, sort_keys=not skewed)
+
+
+def generer_logs(count: int, seed: int = 7, skewed: bool = False):
+    """Génère des événements Windows synthétiques.
+
+    Avec skewed, le mélange ressemble à un journal réel : 90 % de créations
+    de processus bénins (EventID 4688, svchost.exe, chrome.exe...), le reste
+    tiré comme sans skewed.
+    """
+    rng = random.Random(seed)
+    logs = []
+    for i in range(count):
+        if skewed and rng.random() < 0.9:
+            process = rng.choice(BENIGN_PROCESSES)
+            logs.append({
+                'EventID': '4688',
+                'NewProcessName': f'C:\\Program Files\\{process}',
+                'CommandLine': f'"{process}" --type=renderer --field-trial-handle={i} /prefetch:{rng.randrange(8)}',
+                'ParentImage': f'C:\\Users\\bob\\{rng.choice(FOLDERS)}\\{rng.choice(BENIGN_PROCESSES)}',
+                'User': rng.choice(USERS),
+                'Computer': f'host-{rng.randrange(50)}',
+            })
+            continue
+        process = rng.choice(PROCESSES)
+        logs.append({
+            'EventID': rng.choice(EVENT_IDS),
+            'NewProcessName': f'C:\\Windows\\System32\\{process}',
+            'CommandLine': f'{process} {rng.choice(ARGUMENTS)} {rng.choice(ARGUMENTS)} {i}',
+            'ParentImage': f'C:\\Users\\bob\\{rng.choice(FOLDERS)}\\tool{rng.randrange(20)}.exe',
+            'User': rng.choice(USERS),
+            'Computer': f'host-{rng.randrange(50)}',
+        })
+    return logs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc de mesure de l'analyseur SIGMA")
+    parser.add_argument('--rules', type=int, default=200, help='Nombre de règles synthétiques')
+    parser.add_argument('--events', type=int, default=50000, help="Nombre d'événements")
+    parser.add_argument('--repeat', type=int, default=3, help='Nombre de répétitions')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Mesure aussi le mode parallèle de 1 à N processus (courbe de passage à l\'échelle)')
+    parser.add_argument('--equality', action='store_true', help="Règles composées uniquement d'égalités")
+    parser.add_argument('--shared', action='store_true', help='Règles partageant sélections et filtres')
+    parser.add_argument('--batch', type=int, default=0,
+                        help='Mesure aussi le mode colonnes NumPy avec des lots de N événements')
+    parser.add_argument('--memory', action='store_true',
+                        help="Mesure la mémoire occupée par les règles chargées (tracemalloc)")
+    parser.add_argument('--skewed', action='store_true',
+                        help='Mélange d\'événements déséquilibré et sélections écrites du test le plus coûteux au plus sélectif')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Compare avec l\'ordre fixe des tests (sans réordonnancement adaptatif)')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    logs = generer_logs(args.events, skewed=args.skewed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rules_dir = Path(tmp)
+        generer_regles(rules_dir, args.rules, equality=args.equality, shared=args.shared, skewed=args.skewed)
+
+        if args.memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        analyzer = SigmaAnalyzer(str(rules_dir))
+        load_time = time.perf_counter() - start
+        if args.memory:
+            held, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"Mémoire des règles chargées : {held / 2**20:.1f} Mio "
+                  f"({held / max(len(analyzer.compiled_rules), 1) / 1024:.2f} Kio/règle)")
+
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = analyzer.analyze_logs(logs)
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+
+        print(f"Règles : {args.rules} (chargement {load_time:.2f} s)")
+        print(f"Événements : {args.events}, correspondances : {len(results)}")
+        print(f"Meilleur temps : {best:.3f} s, {args.events / best:,.0f} événements/s, "
+              f"{best / args.events * 1e6:.2f} µs/événement")
+
+        if args.adaptive:
+            static = SigmaAnalyzer(str(rules_dir), adaptive_ordering=False)
+            best_static = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                static_results = static.analyze_logs(logs)
+                duration = time.perf_counter() - start
+                best_static = duration if best_static is None else min(best_static, duration)
+            print(f"Ordre fixe : {best_static:.3f} s, {best_static / args.events * 1e6:.2f} µs/événement ; "
+                  f"ordre adaptatif x{best_static / best:.2f}, résultats identiques : {static_results == results}")
+            print(f"Réordonnancement : {analyzer.ruleset.optimizer.stats()}")
+
+        if args.batch:
+            best_batch = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                batch_results = list(analyzer.iter_batch_matches(logs, batch_size=args.batch))
+                duration = time.perf_counter() - start
+                best_batch = duration if best_batch is None else min(best_batch, duration)
+            print(f"Mode colonnes (lots de {args.batch}) : {best_batch:.3f} s, "
+                  f"{args.events / best_batch:,.0f} événements/s, accélération x{best / best_batch:.2f}, "
+                  f"résultats identiques : {batch_results == results}")
+
+        for workers in range(1, args.workers + 1):
+            with ParallelSigmaAnalyzer(analyzer, workers=workers) as parallel:
+                # Premier passage : démarrage et compilation des règles dans chaque processus
+                parallel.analyze_logs(logs[:workers])
+                start = time.perf_counter()
+                parallel_results = parallel.analyze_logs(logs)
+                duration = time.perf_counter() - start
+            identical = parallel_results == results
+            print(f"Parallèle {workers} processus : {duration:.3f} s, {args.events / duration:,.0f} événements/s, "
+                  f"accélération x{best / duration:.2f}, résultats identiques : {identical}")
+
+
+if __name__ == "__main__":
+    main()
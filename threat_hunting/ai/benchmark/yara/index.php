@@ -0,0 +1,1201 @@
+<?php
+function view_0($request) { return render("template_0.html", ["id" => intval($request["id"])]); }
+function view_1($request) { return render("template_1.html", ["id" => intval($request["id"])]); }
+function view_2($request) { return render("template_2.html", ["id" => intval($request["id"])]); }
+function view_3($request) { return render("template_3.html", ["id" => intval($request["id"])]); }
+function view_4($request) { return render("template_4.html", ["id" => intval($request["id"])]); }
+function view_5($request) { return render("template_5.html", ["id" => intval($request["id"])]); }
+function view_6($request) { return render("template_6.html", ["id" => intval($request["id"])]); }
+function view_7($request) { return render("template_7.html", ["id" => intval($request["id"])]); }
+function view_8($request) { return render("template_8.html", ["id" => intval($request["id"])]); }
+function view_9($request) { return render("template_9.html", ["id" => intval($request["id"])]); }
+function view_10($request) { return render("template_10.html", ["id" => intval($request["id"])]); }
+function view_11($request) { return render("template_11.html", ["id" => intval($request["id"])]); }
+function view_12($request) { return render("template_12.html", ["id" => intval($request["id"])]); }
+function view_13($request) { return render("template_13.html", ["id" => intval($request["id"])]); }
+function view_14($request) { return render("template_14.html", ["id" => intval($request["id"])]); }
+function view_15($request) { return render("template_15.html", ["id" => intval($request["id"])]); }
+function view_16($request) { return render("template_16.html", ["id" => intval($request["id"])]); }
+function view_17($request) { return render("template_17.html", ["id" => intval($request["id"])]); }
+function view_18($request) { return render("template_18.html", ["id" => intval($request["id"])]); }
+function view_19($request) { return render("template_19.html", ["id" => intval($request["id"])]); }
+function view_20($request) { return render("template_20.html", ["id" => intval($request["id"])]); }
+function view_21($request) { return render("template_21.html", ["id" => intval($request["id"])]); }
+function view_22($request) { return render("template_22.html", ["id" => intval($request["id"])]); }
+function view_23($request) { return render("template_23.html", ["id" => intval($request["id"])]); }
+function view_24($request) { return render("template_24.html", ["id" => intval($request["id"])]); }
+function view_25($request) { return render("template_25.html", ["id" => intval($request["id"])]); }
+function view_26($request) { return render("template_26.html", ["id" => intval($request["id"])]); }
+function view_27($request) { return render("template_27.html", ["id" => intval($request["id"])]); }
+function view_28($request) { return render("template_28.html", ["id" => intval($request["id"])]); }
+function view_29($request) { return render("template_29.html", ["id" => intval($request["id"])]); }
+function view_30($request) { return render("template_30.html", ["id" => intval($request["id"])]); }
+function view_31($request) { return render("template_31.html", ["id" => intval($request["id"])]); }
+function view_32($request) { return render("template_32.html", ["id" => intval($request["id"])]); }
+function view_33($request) { return render("template_33.html", ["id" => intval($request["id"])]); }
+function view_34($request) { return render("template_34.html", ["id" => intval($request["id"])]); }
+function view_35($request) { return render("template_35.html", ["id" => intval($request["id"])]); }
+function view_36($request) { return render("template_36.html", ["id" => intval($request["id"])]); }
+function view_37($request) { return render("template_37.html", ["id" => intval($request["id"])]); }
+function view_38($request) { return render("template_38.html", ["id" => intval($request["id"])]); }
+function view_39($request) { return render("template_39.html", ["id" => intval($request["id"])]); }
+function view_40($request) { return render("template_40.html", ["id" => intval($request["id"])]); }
+function view_41($request) { return render("template_41.html", ["id" => intval($request["id"])]); }
+function view_42($request) { return render("template_42.html", ["id" => intval($request["id"])]); }
+function view_43($request) { return render("template_43.html", ["id" => intval($request["id"])]); }
+function view_44($request) { return render("template_44.html", ["id" => intval($request["id"])]); }
+function view_45($request) { return render("template_45.html", ["id" => intval($request["id"])]); }
+function view_46($request) { return render("template_46.html", ["id" => intval($request["id"])]); }
+function view_47($request) { return render("template_47.html", ["id" => intval($request["id"])]); }
+function view_48($request) { return render("template_48.html", ["id" => intval($request["id"])]); }
+function view_49($request) { return render("template_49.html", ["id" => intval($request["id"])]); }
+function view_50($request) { return render("template_50.html", ["id" => intval($request["id"])]); }
+function view_51($request) { return render("template_51.html", ["id" => intval($request["id"])]); }
+function view_52($request) { return render("template_52.html", ["id" => intval($request["id"])]); }
+function view_53($request) { return render("template_53.html", ["id" => intval($request["id"])]); }
+function view_54($request) { return render("template_54.html", ["id" => intval($request["id"])]); }
+function view_55($request) { return render("template_55.html", ["id" => intval($request["id"])]); }
+function view_56($request) { return render("template_56.html", ["id" => intval($request["id"])]); }
+function view_57($request) { return render("template_57.html", ["id" => intval($request["id"])]); }
+function view_58($request) { return render("template_58.html", ["id" => intval($request["id"])]); }
+function view_59($request) { return render("template_59.html", ["id" => intval($request["id"])]); }
+function view_60($request) { return render("template_60.html", ["id" => intval($request["id"])]); }
+function view_61($request) { return render("template_61.html", ["id" => intval($request["id"])]); }
+function view_62($request) { return render("template_62.html", ["id" => intval($request["id"])]); }
+function view_63($request) { return render("template_63.html", ["id" => intval($request["id"])]); }
+function view_64($request) { return render("template_64.html", ["id" => intval($request["id"])]); }
+function view_65($request) { return render("template_65.html", ["id" => intval($request["id"])]); }
+function view_66($request) { return render("template_66.html", ["id" => intval($request["id"])]); }
+function view_67($request) { return render("template_67.html", ["id" => intval($request["id"])]); }
+function view_68($request) { return render("template_68.html", ["id" => intval($request["id"])]); }
+function view_69($request) { return render("template_69.html", ["id" => intval($request["id"])]); }
+function view_70($request) { return render("template_70.html", ["id" => intval($request["id"])]); }
+function view_71($request) { return render("template_71.html", ["id" => intval($request["id"])]); }
+function view_72($request) { return render("template_72.html", ["id" => intval($request["id"])]); }
+function view_73($request) { return render("template_73.html", ["id" => intval($request["id"])]); }
+function view_74($request) { return render("template_74.html", ["id" => intval($request["id"])]); }
+function view_75($request) { return render("template_75.html", ["id" => intval($request["id"])]); }
+function view_76($request) { return render("template_76.html", ["id" => intval($request["id"])]); }
+function view_77($request) { return render("template_77.html", ["id" => intval($request["id"])]); }
+function view_78($request) { return render("template_78.html", ["id" => intval($request["id"])]); }
+function view_79($request) { return render("template_79.html", ["id" => intval($request["id"])]); }
+function view_80($request) { return render("template_80.html", ["id" => intval($request["id"])]); }
+function view_81($request) { return render("template_81.html", ["id" => intval($request["id"])]); }
+function view_82($request) { return render("template_82.html", ["id" => intval($request["id"])]); }
+function view_83($request) { return render("template_83.html", ["id" => intval($request["id"])]); }
+function view_84($request) { return render("template_84.html", ["id" => intval($request["id"])]); }
+function view_85($request) { return render("template_85.html", ["id" => intval($request["id"])]); }
+function view_86($request) { return render("template_86.html", ["id" => intval($request["id"])]); }
+function view_87($request) { return render("template_87.html", ["id" => intval($request["id"])]); }
+function view_88($request) { return render("template_88.html", ["id" => intval($request["id"])]); }
+function view_89($request) { return render("template_89.html", ["id" => intval($request["id"])]); }
+function view_90($request) { return render("template_90.html", ["id" => intval($request["id"])]); }
+function view_91($request) { return render("template_91.html", ["id" => intval($request["id"])]); }
+function view_92($request) { return render("template_92.html", ["id" => intval($request["id"])]); }
+function view_93($request) { return render("template_93.html", ["id" => intval($request["id"])]); }
+function view_94($request) { return render("template_94.html", ["id" => intval($request["id"])]); }
+function view_95($request) { return render("template_95.html", ["id" => intval($request["id"])]); }
+function view_96($request) { return render("template_96.html", ["id" => intval($request["id"])]); }
+function view_97($request) { return render("template_97.html", ["id" => intval($request["id"])]); }
+function view_98($request) { return render("template_98.html", ["id" => intval($request["id"])]); }
+function view_99($request) { return render("template_99.html", ["id" => intval($request["id"])]); }
+function view_100($request) { return render("template_100.html", ["id" => intval($request["id"])]); }
+function view_101($request) { return render("template_101.html", ["id" => intval($request["id"])]); }
+function view_102($request) { return render("template_102.html", ["id" => intval($request["id"])]); }
+function view_103($request) { return render("template_103.html", ["id" => intval($request["id"])]); }
+function view_104($request) { return render("template_104.html", ["id" => intval($request["id"])]); }
+function view_105($request) { return render("template_105.html", ["id" => intval($request["id"])]); }
+function view_106($request) { return render("template_106.html", ["id" => intval($request["id"])]); }
+function view_107($request) { return render("template_107.html", ["id" => intval($request["id"])]); }
+function view_108($request) { return render("template_108.html", ["id" => intval($request["id"])]); }
+function view_109($request) { return render("template_109.html", ["id" => intval($request["id"])]); }
+function view_110($request) { return render("template_110.html", ["id" => intval($request["id"])]); }
+function view_111($request) { return render("template_111.html", ["id" => intval($request["id"])]); }
+function view_112($request) { return render("template_112.html", ["id" => intval($request["id"])]); }
+function view_113($request) { return render("template_113.html", ["id" => intval($request["id"])]); }
+function view_114($request) { return render("template_114.html", ["id" => intval($request["id"])]); }
+function view_115($request) { return render("template_115.html", ["id" => intval($request["id"])]); }
+function view_116($request) { return render("template_116.html", ["id" => intval($request["id"])]); }
+function view_117($request) { return render("template_117.html", ["id" => intval($request["id"])]); }
+function view_118($request) { return render("template_118.html", ["id" => intval($request["id"])]); }
+function view_119($request) { return render("template_119.html", ["id" => intval($request["id"])]); }
+function view_120($request) { return render("template_120.html", ["id" => intval($request["id"])]); }
+function view_121($request) { return render("template_121.html", ["id" => intval($request["id"])]); }
+function view_122($request) { return render("template_122.html", ["id" => intval($request["id"])]); }
+function view_123($request) { return render("template_123.html", ["id" => intval($request["id"])]); }
+function view_124($request) { return render("template_124.html", ["id" => intval($request["id"])]); }
+function view_125($request) { return render("template_125.html", ["id" => intval($request["id"])]); }
+function view_126($request) { return render("template_126.html", ["id" => intval($request["id"])]); }
+function view_127($request) { return render("template_127.html", ["id" => intval($request["id"])]); }
+function view_128($request) { return render("template_128.html", ["id" => intval($request["id"])]); }
+function view_129($request) { return render("template_129.html", ["id" => intval($request["id"])]); }
+function view_130($request) { return render("template_130.html", ["id" => intval($request["id"])]); }
+function view_131($request) { return render("template_131.html", ["id" => intval($request["id"])]); }
+function view_132($request) { return render("template_132.html", ["id" => intval($request["id"])]); }
+function view_133($request) { return render("template_133.html", ["id" => intval($request["id"])]); }
+function view_134($request) { return render("template_134.html", ["id" => intval($request["id"])]); }
+function view_135($request) { return render("template_135.html", ["id" => intval($request["id"])]); }
+function view_136($request) { return render("template_136.html", ["id" => intval($request["id"])]); }
+function view_137($request) { return render("template_137.html", ["id" => intval($request["id"])]); }
+function view_138($request) { return render("template_138.html", ["id" => intval($request["id"])]); }
+function view_139($request) { return render("template_139.html", ["id" => intval($request["id"])]); }
+function view_140($request) { return render("template_140.html", ["id" => intval($request["id"])]); }
+function view_141($request) { return render("template_141.html", ["id" => intval($request["id"])]); }
+function view_142($request) { return render("template_142.html", ["id" => intval($request["id"])]); }
+function view_143($request) { return render("template_143.html", ["id" => intval($request["id"])]); }
+function view_144($request) { return render("template_144.html", ["id" => intval($request["id"])]); }
+function view_145($request) { return render("template_145.html", ["id" => intval($request["id"])]); }
+function view_146($request) { return render("template_146.html", ["id" => intval($request["id"])]); }
+function view_147($request) { return render("template_147.html", ["id" => intval($request["id"])]); }
+function view_148($request) { return render("template_148.html", ["id" => intval($request["id"])]); }
+function view_149($request) { return render("template_149.html", ["id" => intval($request["id"])]); }
+function view_150($request) { return render("template_150.html", ["id" => intval($request["id"])]); }
+function view_151($request) { return render("template_151.html", ["id" => intval($request["id"])]); }
+function view_152($request) { return render("template_152.html", ["id" => intval($request["id"])]); }
+function view_153($request) { return render("template_153.html", ["id" => intval($request["id"])]); }
+function view_154($request) { return render("template_154.html", ["id" => intval($request["id"])]); }
+function view_155($request) { return render("template_155.html", ["id" => intval($request["id"])]); }
+function view_156($request) { return render("template_156.html", ["id" => intval($request["id"])]); }
+function view_157($request) { return render("template_157.html", ["id" => intval($request["id"])]); }
+function view_158($request) { return render("template_158.html", ["id" => intval($request["id"])]); }
+function view_159($request) { return render("template_159.html", ["id" => intval($request["id"])]); }
+function view_160($request) { return render("template_160.html", ["id" => intval($request["id"])]); }
+function view_161($request) { return render("template_161.html", ["id" => intval($request["id"])]); }
+function view_162($request) { return render("template_162.html", ["id" => intval($request["id"])]); }
+function view_163($request) { return render("template_163.html", ["id" => intval($request["id"])]); }
+function view_164($request) { return render("template_164.html", ["id" => intval($request["id"])]); }
+function view_165($request) { return render("template_165.html", ["id" => intval($request["id"])]); }
+function view_166($request) { return render("template_166.html", ["id" => intval($request["id"])]); }
+function view_167($request) { return render("template_167.html", ["id" => intval($request["id"])]); }
+function view_168($request) { return render("template_168.html", ["id" => intval($request["id"])]); }
+function view_169($request) { return render("template_169.html", ["id" => intval($request["id"])]); }
+function view_170($request) { return render("template_170.html", ["id" => intval($request["id"])]); }
+function view_171($request) { return render("template_171.html", ["id" => intval($request["id"])]); }
+function view_172($request) { return render("template_172.html", ["id" => intval($request["id"])]); }
+function view_173($request) { return render("template_173.html", ["id" => intval($request["id"])]); }
+function view_174($request) { return render("template_174.html", ["id" => intval($request["id"])]); }
+function view_175($request) { return render("template_175.html", ["id" => intval($request["id"])]); }
+function view_176($request) { return render("template_176.html", ["id" => intval($request["id"])]); }
+function view_177($request) { return render("template_177.html", ["id" => intval($request["id"])]); }
+function view_178($request) { return render("template_178.html", ["id" => intval($request["id"])]); }
+function view_179($request) { return render("template_179.html", ["id" => intval($request["id"])]); }
+function view_180($request) { return render("template_180.html", ["id" => intval($request["id"])]); }
+function view_181($request) { return render("template_181.html", ["id" => intval($request["id"])]); }
+function view_182($request) { return render("template_182.html", ["id" => intval($request["id"])]); }
+function view_183($request) { return render("template_183.html", ["id" => intval($request["id"])]); }
+function view_184($request) { return render("template_184.html", ["id" => intval($request["id"])]); }
+function view_185($request) { return render("template_185.html", ["id" => intval($request["id"])]); }
+function view_186($request) { return render("template_186.html", ["id" => intval($request["id"])]); }
+function view_187($request) { return render("template_187.html", ["id" => intval($request["id"])]); }
+function view_188($request) { return render("template_188.html", ["id" => intval($request["id"])]); }
+function view_189($request) { return render("template_189.html", ["id" => intval($request["id"])]); }
+function view_190($request) { return render("template_190.html", ["id" => intval($request["id"])]); }
+function view_191($request) { return render("template_191.html", ["id" => intval($request["id"])]); }
+function view_192($request) { return render("template_192.html", ["id" => intval($request["id"])]); }
+function view_193($request) { return render("template_193.html", ["id" => intval($request["id"])]); }
+function view_194($request) { return render("template_194.html", ["id" => intval($request["id"])]); }
+function view_195($request) { return render("template_195.html", ["id" => intval($request["id"])]); }
+function view_196($request) { return render("template_196.html", ["id" => intval($request["id"])]); }
+function view_197($request) { return render("template_197.html", ["id" => intval($request["id"])]); }
+function view_198($request) { return render("template_198.html", ["id" => intval($request["id"])]); }
+function view_199($request) { return render("template_199.html", ["id" => intval($request["id"])]); }
+function view_200($request) { return render("template_200.html", ["id" => intval($request["id"])]); }
+function view_201($request) { return render("template_201.html", ["id" => intval($request["id"])]); }
+function view_202($request) { return render("template_202.html", ["id" => intval($request["id"])]); }
+function view_203($request) { return render("template_203.html", ["id" => intval($request["id"])]); }
+function view_204($request) { return render("template_204.html", ["id" => intval($request["id"])]); }
+function view_205($request) { return render("template_205.html", ["id" => intval($request["id"])]); }
+function view_206($request) { return render("template_206.html", ["id" => intval($request["id"])]); }
+function view_207($request) { return render("template_207.html", ["id" => intval($request["id"])]); }
+function view_208($request) { return render("template_208.html", ["id" => intval($request["id"])]); }
+function view_209($request) { return render("template_209.html", ["id" => intval($request["id"])]); }
+function view_210($request) { return render("template_210.html", ["id" => intval($request["id"])]); }
+function view_211($request) { return render("template_211.html", ["id" => intval($request["id"])]); }
+function view_212($request) { return render("template_212.html", ["id" => intval($request["id"])]); }
+function view_213($request) { return render("template_213.html", ["id" => intval($request["id"])]); }
+function view_214($request) { return render("template_214.html", ["id" => intval($request["id"])]); }
+function view_215($request) { return render("template_215.html", ["id" => intval($request["id"])]); }
+function view_216($request) { return render("template_216.html", ["id" => intval($request["id"])]); }
+function view_217($request) { return render("template_217.html", ["id" => intval($request["id"])]); }
+function view_218($request) { return render("template_218.html", ["id" => intval($request["id"])]); }
+function view_219($request) { return render("template_219.html", ["id" => intval($request["id"])]); }
+function view_220($request) { return render("template_220.html", ["id" => intval($request["id"])]); }
+function view_221($request) { return render("template_221.html", ["id" => intval($request["id"])]); }
+function view_222($request) { return render("template_222.html", ["id" => intval($request["id"])]); }
+function view_223($request) { return render("template_223.html", ["id" => intval($request["id"])]); }
+function view_224($request) { return render("template_224.html", ["id" => intval($request["id"])]); }
+function view_225($request) { return render("template_225.html", ["id" => intval($request["id"])]); }
+function view_226($request) { return render("template_226.html", ["id" => intval($request["id"])]); }
+function view_227($request) { return render("template_227.html", ["id" => intval($request["id"])]); }
+function view_228($request) { return render("template_228.html", ["id" => intval($request["id"])]); }
+function view_229($request) { return render("template_229.html", ["id" => intval($request["id"])]); }
+function view_230($request) { return render("template_230.html", ["id" => intval($request["id"])]); }
+function view_231($request) { return render("template_231.html", ["id" => intval($request["id"])]); }
+function view_232($request) { return render("template_232.html", ["id" => intval($request["id"])]); }
+function view_233($request) { return render("template_233.html", ["id" => intval($request["id"])]); }
+function view_234($request) { return render("template_234.html", ["id" => intval($request["id"])]); }
+function view_235($request) { return render("template_235.html", ["id" => intval($request["id"])]); }
+function view_236($request) { return render("template_236.html", ["id" => intval($request["id"])]); }
+function view_237($request) { return render("template_237.html", ["id" => intval($request["id"])]); }
+function view_238($request) { return render("template_238.html", ["id" => intval($request["id"])]); }
+function view_239($request) { return render("template_239.html", ["id" => intval($request["id"])]); }
+function view_240($request) { return render("template_240.html", ["id" => intval($request["id"])]); }
+function view_241($request) { return render("template_241.html", ["id" => intval($request["id"])]); }
+function view_242($request) { return render("template_242.html", ["id" => intval($request["id"])]); }
+function view_243($request) { return render("template_243.html", ["id" => intval($request["id"])]); }
+function view_244($request) { return render("template_244.html", ["id" => intval($request["id"])]); }
+function view_245($request) { return render("template_245.html", ["id" => intval($request["id"])]); }
+function view_246($request) { return render("template_246.html", ["id" => intval($request["id"])]); }
+function view_247($request) { return render("template_247.html", ["id" => intval($request["id"])]); }
+function view_248($request) { return render("template_248.html", ["id" => intval($request["id"])]); }
+function view_249($request) { return render("template_249.html", ["id" => intval($request["id"])]); }
+function view_250($request) { return render("template_250.html", ["id" => intval($request["id"])]); }
+function view_251($request) { return render("template_251.html", ["id" => intval($request["id"])]); }
+function view_252($request) { return render("template_252.html", ["id" => intval($request["id"])]); }
+function view_253($request) { return render("template_253.html", ["id" => intval($request["id"])]); }
+function view_254($request) { return render("template_254.html", ["id" => intval($request["id"])]); }
+function view_255($request) { return render("template_255.html", ["id" => intval($request["id"])]); }
+function view_256($request) { return render("template_256.html", ["id" => intval($request["id"])]); }
+function view_257($request) { return render("template_257.html", ["id" => intval($request["id"])]); }
+function view_258($request) { return render("template_258.html", ["id" => intval($request["id"])]); }
+function view_259($request) { return render("template_259.html", ["id" => intval($request["id"])]); }
+function view_260($request) { return render("template_260.html", ["id" => intval($request["id"])]); }
+function view_261($request) { return render("template_261.html", ["id" => intval($request["id"])]); }
+function view_262($request) { return render("template_262.html", ["id" => intval($request["id"])]); }
+function view_263($request) { return render("template_263.html", ["id" => intval($request["id"])]); }
+function view_264($request) { return render("template_264.html", ["id" => intval($request["id"])]); }
+function view_265($request) { return render("template_265.html", ["id" => intval($request["id"])]); }
+function view_266($request) { return render("template_266.html", ["id" => intval($request["id"])]); }
+function view_267($request) { return render("template_267.html", ["id" => intval($request["id"])]); }
+function view_268($request) { return render("template_268.html", ["id" => intval($request["id"])]); }
+function view_269($request) { return render("template_269.html", ["id" => intval($request["id"])]); }
+function view_270($request) { return render("template_270.html", ["id" => intval($request["id"])]); }
+function view_271($request) { return render("template_271.html", ["id" => intval($request["id"])]); }
+function view_272($request) { return render("template_272.html", ["id" => intval($request["id"])]); }
+function view_273($request) { return render("template_273.html", ["id" => intval($request["id"])]); }
+function view_274($request) { return render("template_274.html", ["id" => intval($request["id"])]); }
+function view_275($request) { return render("template_275.html", ["id" => intval($request["id"])]); }
+function view_276($request) { return render("template_276.html", ["id" => intval($request["id"])]); }
+function view_277($request) { return render("template_277.html", ["id" => intval($request["id"])]); }
+function view_278($request) { return render("template_278.html", ["id" => intval($request["id"])]); }
+function view_279($request) { return render("template_279.html", ["id" => intval($request["id"])]); }
+function view_280($request) { return render("template_280.html", ["id" => intval($request["id"])]); }
+function view_281($request) { return render("template_281.html", ["id" => intval($request["id"])]); }
+function view_282($request) { return render("template_282.html", ["id" => intval($request["id"])]); }
+function view_283($request) { return render("template_283.html", ["id" => intval($request["id"])]); }
+function view_284($request) { return render("template_284.html", ["id" => intval($request["id"])]); }
+function view_285($request) { return render("template_285.html", ["id" => intval($request["id"])]); }
+function view_286($request) { return render("template_286.html", ["id" => intval($request["id"])]); }
+function view_287($request) { return render("template_287.html", ["id" => intval($request["id"])]); }
+function view_288($request) { return render("template_288.html", ["id" => intval($request["id"])]); }
+function view_289($request) { return render("template_289.html", ["id" => intval($request["id"])]); }
+function view_290($request) { return render("template_290.html", ["id" => intval($request["id"])]); }
+function view_291($request) { return render("template_291.html", ["id" => intval($request["id"])]); }
+function view_292($request) { return render("template_292.html", ["id" => intval($request["id"])]); }
+function view_293($request) { return render("template_293.html", ["id" => intval($request["id"])]); }
+function view_294($request) { return render("template_294.html", ["id" => intval($request["id"])]); }
+function view_295($request) { return render("template_295.html", ["id" => intval($request["id"])]); }
+function view_296($request) { return render("template_296.html", ["id" => intval($request["id"])]); }
+function view_297($request) { return render("template_297.html", ["id" => intval($request["id"])]); }
+function view_298($request) { return render("template_298.html", ["id" => intval($request["id"])]); }
+function view_299($request) { return render("template_299.html", ["id" => intval($request["id"])]); }
+function view_300($request) { return render("template_300.html", ["id" => intval($request["id"])]); }
+function view_301($request) { return render("template_301.html", ["id" => intval($request["id"])]); }
+function view_302($request) { return render("template_302.html", ["id" => intval($request["id"])]); }
+function view_303($request) { return render("template_303.html", ["id" => intval($request["id"])]); }
+function view_304($request) { return render("template_304.html", ["id" => intval($request["id"])]); }
+function view_305($request) { return render("template_305.html", ["id" => intval($request["id"])]); }
+function view_306($request) { return render("template_306.html", ["id" => intval($request["id"])]); }
+function view_307($request) { return render("template_307.html", ["id" => intval($request["id"])]); }
+function view_308($request) { return render("template_308.html", ["id" => intval($request["id"])]); }
+function view_309($request) { return render("template_309.html", ["id" => intval($request["id"])]); }
+function view_310($request) { return render("template_310.html", ["id" => intval($request["id"])]); }
+function view_311($request) { return render("template_311.html", ["id" => intval($request["id"])]); }
+function view_312($request) { return render("template_312.html", ["id" => intval($request["id"])]); }
+function view_313($request) { return render("template_313.html", ["id" => intval($request["id"])]); }
+function view_314($request) { return render("template_314.html", ["id" => intval($request["id"])]); }
+function view_315($request) { return render("template_315.html", ["id" => intval($request["id"])]); }
+function view_316($request) { return render("template_316.html", ["id" => intval($request["id"])]); }
+function view_317($request) { return render("template_317.html", ["id" => intval($request["id"])]); }
+function view_318($request) { return render("template_318.html", ["id" => intval($request["id"])]); }
+function view_319($request) { return render("template_319.html", ["id" => intval($request["id"])]); }
+function view_320($request) { return render("template_320.html", ["id" => intval($request["id"])]); }
+function view_321($request) { return render("template_321.html", ["id" => intval($request["id"])]); }
+function view_322($request) { return render("template_322.html", ["id" => intval($request["id"])]); }
+function view_323($request) { return render("template_323.html", ["id" => intval($request["id"])]); }
+function view_324($request) { return render("template_324.html", ["id" => intval($request["id"])]); }
+function view_325($request) { return render("template_325.html", ["id" => intval($request["id"])]); }
+function view_326($request) { return render("template_326.html", ["id" => intval($request["id"])]); }
+function view_327($request) { return render("template_327.html", ["id" => intval($request["id"])]); }
+function view_328($request) { return render("template_328.html", ["id" => intval($request["id"])]); }
+function view_329($request) { return render("template_329.html", ["id" => intval($request["id"])]); }
+function view_330($request) { return render("template_330.html", ["id" => intval($request["id"])]); }
+function view_331($request) { return render("template_331.html", ["id" => intval($request["id"])]); }
+function view_332($request) { return render("template_332.html", ["id" => intval($request["id"])]); }
+function view_333($request) { return render("template_333.html", ["id" => intval($request["id"])]); }
+function view_334($request) { return render("template_334.html", ["id" => intval($request["id"])]); }
+function view_335($request) { return render("template_335.html", ["id" => intval($request["id"])]); }
+function view_336($request) { return render("template_336.html", ["id" => intval($request["id"])]); }
+function view_337($request) { return render("template_337.html", ["id" => intval($request["id"])]); }
+function view_338($request) { return render("template_338.html", ["id" => intval($request["id"])]); }
+function view_339($request) { return render("template_339.html", ["id" => intval($request["id"])]); }
+function view_340($request) { return render("template_340.html", ["id" => intval($request["id"])]); }
+function view_341($request) { return render("template_341.html", ["id" => intval($request["id"])]); }
+function view_342($request) { return render("template_342.html", ["id" => intval($request["id"])]); }
+function view_343($request) { return render("template_343.html", ["id" => intval($request["id"])]); }
+function view_344($request) { return render("template_344.html", ["id" => intval($request["id"])]); }
+function view_345($request) { return render("template_345.html", ["id" => intval($request["id"])]); }
+function view_346($request) { return render("template_346.html", ["id" => intval($request["id"])]); }
+function view_347($request) { return render("template_347.html", ["id" => intval($request["id"])]); }
+function view_348($request) { return render("template_348.html", ["id" => intval($request["id"])]); }
+function view_349($request) { return render("template_349.html", ["id" => intval($request["id"])]); }
+function view_350($request) { return render("template_350.html", ["id" => intval($request["id"])]); }
+function view_351($request) { return render("template_351.html", ["id" => intval($request["id"])]); }
+function view_352($request) { return render("template_352.html", ["id" => intval($request["id"])]); }
+function view_353($request) { return render("template_353.html", ["id" => intval($request["id"])]); }
+function view_354($request) { return render("template_354.html", ["id" => intval($request["id"])]); }
+function view_355($request) { return render("template_355.html", ["id" => intval($request["id"])]); }
+function view_356($request) { return render("template_356.html", ["id" => intval($request["id"])]); }
+function view_357($request) { return render("template_357.html", ["id" => intval($request["id"])]); }
+function view_358($request) { return render("template_358.html", ["id" => intval($request["id"])]); }
+function view_359($request) { return render("template_359.html", ["id" => intval($request["id"])]); }
+function view_360($request) { return render("template_360.html", ["id" => intval($request["id"])]); }
+function view_361($request) { return render("template_361.html", ["id" => intval($request["id"])]); }
+function view_362($request) { return render("template_362.html", ["id" => intval($request["id"])]); }
+function view_363($request) { return render("template_363.html", ["id" => intval($request["id"])]); }
+function view_364($request) { return render("template_364.html", ["id" => intval($request["id"])]); }
+function view_365($request) { return render("template_365.html", ["id" => intval($request["id"])]); }
+function view_366($request) { return render("template_366.html", ["id" => intval($request["id"])]); }
+function view_367($request) { return render("template_367.html", ["id" => intval($request["id"])]); }
+function view_368($request) { return render("template_368.html", ["id" => intval($request["id"])]); }
+function view_369($request) { return render("template_369.html", ["id" => intval($request["id"])]); }
+function view_370($request) { return render("template_370.html", ["id" => intval($request["id"])]); }
+function view_371($request) { return render("template_371.html", ["id" => intval($request["id"])]); }
+function view_372($request) { return render("template_372.html", ["id" => intval($request["id"])]); }
+function view_373($request) { return render("template_373.html", ["id" => intval($request["id"])]); }
+function view_374($request) { return render("template_374.html", ["id" => intval($request["id"])]); }
+function view_375($request) { return render("template_375.html", ["id" => intval($request["id"])]); }
+function view_376($request) { return render("template_376.html", ["id" => intval($request["id"])]); }
+function view_377($request) { return render("template_377.html", ["id" => intval($request["id"])]); }
+function view_378($request) { return render("template_378.html", ["id" => intval($request["id"])]); }
+function view_379($request) { return render("template_379.html", ["id" => intval($request["id"])]); }
+function view_380($request) { return render("template_380.html", ["id" => intval($request["id"])]); }
+function view_381($request) { return render("template_381.html", ["id" => intval($request["id"])]); }
+function view_382($request) { return render("template_382.html", ["id" => intval($request["id"])]); }
+function view_383($request) { return render("template_383.html", ["id" => intval($request["id"])]); }
+function view_384($request) { return render("template_384.html", ["id" => intval($request["id"])]); }
+function view_385($request) { return render("template_385.html", ["id" => intval($request["id"])]); }
+function view_386($request) { return render("template_386.html", ["id" => intval($request["id"])]); }
+function view_387($request) { return render("template_387.html", ["id" => intval($request["id"])]); }
+function view_388($request) { return render("template_388.html", ["id" => intval($request["id"])]); }
+function view_389($request) { return render("template_389.html", ["id" => intval($request["id"])]); }
+function view_390($request) { return render("template_390.html", ["id" => intval($request["id"])]); }
+function view_391($request) { return render("template_391.html", ["id" => intval($request["id"])]); }
+function view_392($request) { return render("template_392.html", ["id" => intval($request["id"])]); }
+function view_393($request) { return render("template_393.html", ["id" => intval($request["id"])]); }
+function view_394($request) { return render("template_394.html", ["id" => intval($request["id"])]); }
+function view_395($request) { return render("template_395.html", ["id" => intval($request["id"])]); }
+function view_396($request) { return render("template_396.html", ["id" => intval($request["id"])]); }
+function view_397($request) { return render("template_397.html", ["id" => intval($request["id"])]); }
+function view_398($request) { return render("template_398.html", ["id" => intval($request["id"])]); }
+function view_399($request) { return render("template_399.html", ["id" => intval($request["id"])]); }
+function view_400($request) { return render("template_400.html", ["id" => intval($request["id"])]); }
+function view_401($request) { return render("template_401.html", ["id" => intval($request["id"])]); }
+function view_402($request) { return render("template_402.html", ["id" => intval($request["id"])]); }
+function view_403($request) { return render("template_403.html", ["id" => intval($request["id"])]); }
+function view_404($request) { return render("template_404.html", ["id" => intval($request["id"])]); }
+function view_405($request) { return render("template_405.html", ["id" => intval($request["id"])]); }
+function view_406($request) { return render("template_406.html", ["id" => intval($request["id"])]); }
+function view_407($request) { return render("template_407.html", ["id" => intval($request["id"])]); }
+function view_408($request) { return render("template_408.html", ["id" => intval($request["id"])]); }
+function view_409($request) { return render("template_409.html", ["id" => intval($request["id"])]); }
+function view_410($request) { return render("template_410.html", ["id" => intval($request["id"])]); }
+function view_411($request) { return render("template_411.html", ["id" => intval($request["id"])]); }
+function view_412($request) { return render("template_412.html", ["id" => intval($request["id"])]); }
+function view_413($request) { return render("template_413.html", ["id" => intval($request["id"])]); }
+function view_414($request) { return render("template_414.html", ["id" => intval($request["id"])]); }
+function view_415($request) { return render("template_415.html", ["id" => intval($request["id"])]); }
+function view_416($request) { return render("template_416.html", ["id" => intval($request["id"])]); }
+function view_417($request) { return render("template_417.html", ["id" => intval($request["id"])]); }
+function view_418($request) { return render("template_418.html", ["id" => intval($request["id"])]); }
+function view_419($request) { return render("template_419.html", ["id" => intval($request["id"])]); }
+function view_420($request) { return render("template_420.html", ["id" => intval($request["id"])]); }
+function view_421($request) { return render("template_421.html", ["id" => intval($request["id"])]); }
+function view_422($request) { return render("template_422.html", ["id" => intval($request["id"])]); }
+function view_423($request) { return render("template_423.html", ["id" => intval($request["id"])]); }
+function view_424($request) { return render("template_424.html", ["id" => intval($request["id"])]); }
+function view_425($request) { return render("template_425.html", ["id" => intval($request["id"])]); }
+function view_426($request) { return render("template_426.html", ["id" => intval($request["id"])]); }
+function view_427($request) { return render("template_427.html", ["id" => intval($request["id"])]); }
+function view_428($request) { return render("template_428.html", ["id" => intval($request["id"])]); }
+function view_429($request) { return render("template_429.html", ["id" => intval($request["id"])]); }
+function view_430($request) { return render("template_430.html", ["id" => intval($request["id"])]); }
+function view_431($request) { return render("template_431.html", ["id" => intval($request["id"])]); }
+function view_432($request) { return render("template_432.html", ["id" => intval($request["id"])]); }
+function view_433($request) { return render("template_433.html", ["id" => intval($request["id"])]); }
+function view_434($request) { return render("template_434.html", ["id" => intval($request["id"])]); }
+function view_435($request) { return render("template_435.html", ["id" => intval($request["id"])]); }
+function view_436($request) { return render("template_436.html", ["id" => intval($request["id"])]); }
+function view_437($request) { return render("template_437.html", ["id" => intval($request["id"])]); }
+function view_438($request) { return render("template_438.html", ["id" => intval($request["id"])]); }
+function view_439($request) { return render("template_439.html", ["id" => intval($request["id"])]); }
+function view_440($request) { return render("template_440.html", ["id" => intval($request["id"])]); }
+function view_441($request) { return render("template_441.html", ["id" => intval($request["id"])]); }
+function view_442($request) { return render("template_442.html", ["id" => intval($request["id"])]); }
+function view_443($request) { return render("template_443.html", ["id" => intval($request["id"])]); }
+function view_444($request) { return render("template_444.html", ["id" => intval($request["id"])]); }
+function view_445($request) { return render("template_445.html", ["id" => intval($request["id"])]); }
+function view_446($request) { return render("template_446.html", ["id" => intval($request["id"])]); }
+function view_447($request) { return render("template_447.html", ["id" => intval($request["id"])]); }
+function view_448($request) { return render("template_448.html", ["id" => intval($request["id"])]); }
+function view_449($request) { return render("template_449.html", ["id" => intval($request["id"])]); }
+function view_450($request) { return render("template_450.html", ["id" => intval($request["id"])]); }
+function view_451($request) { return render("template_451.html", ["id" => intval($request["id"])]); }
+function view_452($request) { return render("template_452.html", ["id" => intval($request["id"])]); }
+function view_453($request) { return render("template_453.html", ["id" => intval($request["id"])]); }
+function view_454($request) { return render("template_454.html", ["id" => intval($request["id"])]); }
+function view_455($request) { return render("template_455.html", ["id" => intval($request["id"])]); }
+function view_456($request) { return render("template_456.html", ["id" => intval($request["id"])]); }
+function view_457($request) { return render("template_457.html", ["id" => intval($request["id"])]); }
+function view_458($request) { return render("template_458.html", ["id" => intval($request["id"])]); }
+function view_459($request) { return render("template_459.html", ["id" => intval($request["id"])]); }
+function view_460($request) { return render("template_460.html", ["id" => intval($request["id"])]); }
+function view_461($request) { return render("template_461.html", ["id" => intval($request["id"])]); }
+function view_462($request) { return render("template_462.html", ["id" => intval($request["id"])]); }
+function view_463($request) { return render("template_463.html", ["id" => intval($request["id"])]); }
+function view_464($request) { return render("template_464.html", ["id" => intval($request["id"])]); }
+function view_465($request) { return render("template_465.html", ["id" => intval($request["id"])]); }
+function view_466($request) { return render("template_466.html", ["id" => intval($request["id"])]); }
+function view_467($request) { return render("template_467.html", ["id" => intval($request["id"])]); }
+function view_468($request) { return render("template_468.html", ["id" => intval($request["id"])]); }
+function view_469($request) { return render("template_469.html", ["id" => intval($request["id"])]); }
+function view_470($request) { return render("template_470.html", ["id" => intval($request["id"])]); }
+function view_471($request) { return render("template_471.html", ["id" => intval($request["id"])]); }
+function view_472($request) { return render("template_472.html", ["id" => intval($request["id"])]); }
+function view_473($request) { return render("template_473.html", ["id" => intval($request["id"])]); }
+function view_474($request) { return render("template_474.html", ["id" => intval($request["id"])]); }
+function view_475($request) { return render("template_475.html", ["id" => intval($request["id"])]); }
+function view_476($request) { return render("template_476.html", ["id" => intval($request["id"])]); }
+function view_477($request) { return render("template_477.html", ["id" => intval($request["id"])]); }
+function view_478($request) { return render("template_478.html", ["id" => intval($request["id"])]); }
+function view_479($request) { return render("template_479.html", ["id" => intval($request["id"])]); }
+function view_480($request) { return render("template_480.html", ["id" => intval($request["id"])]); }
+function view_481($request) { return render("template_481.html", ["id" => intval($request["id"])]); }
+function view_482($request) { return render("template_482.html", ["id" => intval($request["id"])]); }
+function view_483($request) { return render("template_483.html", ["id" => intval($request["id"])]); }
+function view_484($request) { return render("template_484.html", ["id" => intval($request["id"])]); }
+function view_485($request) { return render("template_485.html", ["id" => intval($request["id"])]); }
+function view_486($request) { return render("template_486.html", ["id" => intval($request["id"])]); }
+function view_487($request) { return render("template_487.html", ["id" => intval($request["id"])]); }
+function view_488($request) { return render("template_488.html", ["id" => intval($request["id"])]); }
+function view_489($request) { return render("template_489.html", ["id" => intval($request["id"])]); }
+function view_490($request) { return render("template_490.html", ["id" => intval($request["id"])]); }
+function view_491($request) { return render("template_491.html", ["id" => intval($request["id"])]); }
+function view_492($request) { return render("template_492.html", ["id" => intval($request["id"])]); }
+function view_493($request) { return render("template_493.html", ["id" => intval($request["id"])]); }
+function view_494($request) { return render("template_494.html", ["id" => intval($request["id"])]); }
+function view_495($request) { return render("template_495.html", ["id" => intval($request["id"])]); }
+function view_496($request) { return render("template_496.html", ["id" => intval($request["id"])]); }
+function view_497($request) { return render("template_497.html", ["id" => intval($request["id"])]); }
+function view_498($request) { return render("template_498.html", ["id" => intval($request["id"])]); }
+function view_499($request) { return render("template_499.html", ["id" => intval($request["id"])]); }
+function view_500($request) { return render("template_500.html", ["id" => intval($request["id"])]); }
+function view_501($request) { return render("template_501.html", ["id" => intval($request["id"])]); }
+function view_502($request) { return render("template_502.html", ["id" => intval($request["id"])]); }
+function view_503($request) { return render("template_503.html", ["id" => intval($request["id"])]); }
+function view_504($request) { return render("template_504.html", ["id" => intval($request["id"])]); }
+function view_505($request) { return render("template_505.html", ["id" => intval($request["id"])]); }
+function view_506($request) { return render("template_506.html", ["id" => intval($request["id"])]); }
+function view_507($request) { return render("template_507.html", ["id" => intval($request["id"])]); }
+function view_508($request) { return render("template_508.html", ["id" => intval($request["id"])]); }
+function view_509($request) { return render("template_509.html", ["id" => intval($request["id"])]); }
+function view_510($request) { return render("template_510.html", ["id" => intval($request["id"])]); }
+function view_511($request) { return render("template_511.html", ["id" => intval($request["id"])]); }
+function view_512($request) { return render("template_512.html", ["id" => intval($request["id"])]); }
+function view_513($request) { return render("template_513.html", ["id" => intval($request["id"])]); }
+function view_514($request) { return render("template_514.html", ["id" => intval($request["id"])]); }
+function view_515($request) { return render("template_515.html", ["id" => intval($request["id"])]); }
+function view_516($request) { return render("template_516.html", ["id" => intval($request["id"])]); }
+function view_517($request) { return render("template_517.html", ["id" => intval($request["id"])]); }
+function view_518($request) { return render("template_518.html", ["id" => intval($request["id"])]); }
+function view_519($request) { return render("template_519.html", ["id" => intval($request["id"])]); }
+function view_520($request) { return render("template_520.html", ["id" => intval($request["id"])]); }
+function view_521($request) { return render("template_521.html", ["id" => intval($request["id"])]); }
+function view_522($request) { return render("template_522.html", ["id" => intval($request["id"])]); }
+function view_523($request) { return render("template_523.html", ["id" => intval($request["id"])]); }
+function view_524($request) { return render("template_524.html", ["id" => intval($request["id"])]); }
+function view_525($request) { return render("template_525.html", ["id" => intval($request["id"])]); }
+function view_526($request) { return render("template_526.html", ["id" => intval($request["id"])]); }
+function view_527($request) { return render("template_527.html", ["id" => intval($request["id"])]); }
+function view_528($request) { return render("template_528.html", ["id" => intval($request["id"])]); }
+function view_529($request) { return render("template_529.html", ["id" => intval($request["id"])]); }
+function view_530($request) { return render("template_530.html", ["id" => intval($request["id"])]); }
+function view_531($request) { return render("template_531.html", ["id" => intval($request["id"])]); }
+function view_532($request) { return render("template_532.html", ["id" => intval($request["id"])]); }
+function view_533($request) { return render("template_533.html", ["id" => intval($request["id"])]); }
+function view_534($request) { return render("template_534.html", ["id" => intval($request["id"])]); }
+function view_535($request) { return render("template_535.html", ["id" => intval($request["id"])]); }
+function view_536($request) { return render("template_536.html", ["id" => intval($request["id"])]); }
+function view_537($request) { return render("template_537.html", ["id" => intval($request["id"])]); }
+function view_538($request) { return render("template_538.html", ["id" => intval($request["id"])]); }
+function view_539($request) { return render("template_539.html", ["id" => intval($request["id"])]); }
+function view_540($request) { return render("template_540.html", ["id" => intval($request["id"])]); }
+function view_541($request) { return render("template_541.html", ["id" => intval($request["id"])]); }
+function view_542($request) { return render("template_542.html", ["id" => intval($request["id"])]); }
+function view_543($request) { return render("template_543.html", ["id" => intval($request["id"])]); }
+function view_544($request) { return render("template_544.html", ["id" => intval($request["id"])]); }
+function view_545($request) { return render("template_545.html", ["id" => intval($request["id"])]); }
+function view_546($request) { return render("template_546.html", ["id" => intval($request["id"])]); }
+function view_547($request) { return render("template_547.html", ["id" => intval($request["id"])]); }
+function view_548($request) { return render("template_548.html", ["id" => intval($request["id"])]); }
+function view_549($request) { return render("template_549.html", ["id" => intval($request["id"])]); }
+function view_550($request) { return render("template_550.html", ["id" => intval($request["id"])]); }
+function view_551($request) { return render("template_551.html", ["id" => intval($request["id"])]); }
+function view_552($request) { return render("template_552.html", ["id" => intval($request["id"])]); }
+function view_553($request) { return render("template_553.html", ["id" => intval($request["id"])]); }
+function view_554($request) { return render("template_554.html", ["id" => intval($request["id"])]); }
+function view_555($request) { return render("template_555.html", ["id" => intval($request["id"])]); }
+function view_556($request) { return render("template_556.html", ["id" => intval($request["id"])]); }
+function view_557($request) { return render("template_557.html", ["id" => intval($request["id"])]); }
+function view_558($request) { return render("template_558.html", ["id" => intval($request["id"])]); }
+function view_559($request) { return render("template_559.html", ["id" => intval($request["id"])]); }
+function view_560($request) { return render("template_560.html", ["id" => intval($request["id"])]); }
+function view_561($request) { return render("template_561.html", ["id" => intval($request["id"])]); }
+function view_562($request) { return render("template_562.html", ["id" => intval($request["id"])]); }
+function view_563($request) { return render("template_563.html", ["id" => intval($request["id"])]); }
+function view_564($request) { return render("template_564.html", ["id" => intval($request["id"])]); }
+function view_565($request) { return render("template_565.html", ["id" => intval($request["id"])]); }
+function view_566($request) { return render("template_566.html", ["id" => intval($request["id"])]); }
+function view_567($request) { return render("template_567.html", ["id" => intval($request["id"])]); }
+function view_568($request) { return render("template_568.html", ["id" => intval($request["id"])]); }
+function view_569($request) { return render("template_569.html", ["id" => intval($request["id"])]); }
+function view_570($request) { return render("template_570.html", ["id" => intval($request["id"])]); }
+function view_571($request) { return render("template_571.html", ["id" => intval($request["id"])]); }
+function view_572($request) { return render("template_572.html", ["id" => intval($request["id"])]); }
+function view_573($request) { return render("template_573.html", ["id" => intval($request["id"])]); }
+function view_574($request) { return render("template_574.html", ["id" => intval($request["id"])]); }
+function view_575($request) { return render("template_575.html", ["id" => intval($request["id"])]); }
+function view_576($request) { return render("template_576.html", ["id" => intval($request["id"])]); }
+function view_577($request) { return render("template_577.html", ["id" => intval($request["id"])]); }
+function view_578($request) { return render("template_578.html", ["id" => intval($request["id"])]); }
+function view_579($request) { return render("template_579.html", ["id" => intval($request["id"])]); }
+function view_580($request) { return render("template_580.html", ["id" => intval($request["id"])]); }
+function view_581($request) { return render("template_581.html", ["id" => intval($request["id"])]); }
+function view_582($request) { return render("template_582.html", ["id" => intval($request["id"])]); }
+function view_583($request) { return render("template_583.html", ["id" => intval($request["id"])]); }
+function view_584($request) { return render("template_584.html", ["id" => intval($request["id"])]); }
+function view_585($request) { return render("template_585.html", ["id" => intval($request["id"])]); }
+function view_586($request) { return render("template_586.html", ["id" => intval($request["id"])]); }
+function view_587($request) { return render("template_587.html", ["id" => intval($request["id"])]); }
+function view_588($request) { return render("template_588.html", ["id" => intval($request["id"])]); }
+function view_589($request) { return render("template_589.html", ["id" => intval($request["id"])]); }
+function view_590($request) { return render("template_590.html", ["id" => intval($request["id"])]); }
+function view_591($request) { return render("template_591.html", ["id" => intval($request["id"])]); }
+function view_592($request) { return render("template_592.html", ["id" => intval($request["id"])]); }
+function view_593($request) { return render("template_593.html", ["id" => intval($request["id"])]); }
+function view_594($request) { return render("template_594.html", ["id" => intval($request["id"])]); }
+function view_595($request) { return render("template_595.html", ["id" => intval($request["id"])]); }
+function view_596($request) { return render("template_596.html", ["id" => intval($request["id"])]); }
+function view_597($request) { return render("template_597.html", ["id" => intval($request["id"])]); }
+function view_598($request) { return render("template_598.html", ["id" => intval($request["id"])]); }
+function view_599($request) { return render("template_599.html", ["id" => intval($request["id"])]); }
+function view_600($request) { return render("template_600.html", ["id" => intval($request["id"])]); }
+function view_601($request) { return render("template_601.html", ["id" => intval($request["id"])]); }
+function view_602($request) { return render("template_602.html", ["id" => intval($request["id"])]); }
+function view_603($request) { return render("template_603.html", ["id" => intval($request["id"])]); }
+function view_604($request) { return render("template_604.html", ["id" => intval($request["id"])]); }
+function view_605($request) { return render("template_605.html", ["id" => intval($request["id"])]); }
+function view_606($request) { return render("template_606.html", ["id" => intval($request["id"])]); }
+function view_607($request) { return render("template_607.html", ["id" => intval($request["id"])]); }
+function view_608($request) { return render("template_608.html", ["id" => intval($request["id"])]); }
+function view_609($request) { return render("template_609.html", ["id" => intval($request["id"])]); }
+function view_610($request) { return render("template_610.html", ["id" => intval($request["id"])]); }
+function view_611($request) { return render("template_611.html", ["id" => intval($request["id"])]); }
+function view_612($request) { return render("template_612.html", ["id" => intval($request["id"])]); }
+function view_613($request) { return render("template_613.html", ["id" => intval($request["id"])]); }
+function view_614($request) { return render("template_614.html", ["id" => intval($request["id"])]); }
+function view_615($request) { return render("template_615.html", ["id" => intval($request["id"])]); }
+function view_616($request) { return render("template_616.html", ["id" => intval($request["id"])]); }
+function view_617($request) { return render("template_617.html", ["id" => intval($request["id"])]); }
+function view_618($request) { return render("template_618.html", ["id" => intval($request["id"])]); }
+function view_619($request) { return render("template_619.html", ["id" => intval($request["id"])]); }
+function view_620($request) { return render("template_620.html", ["id" => intval($request["id"])]); }
+function view_621($request) { return render("template_621.html", ["id" => intval($request["id"])]); }
+function view_622($request) { return render("template_622.html", ["id" => intval($request["id"])]); }
+function view_623($request) { return render("template_623.html", ["id" => intval($request["id"])]); }
+function view_624($request) { return render("template_624.html", ["id" => intval($request["id"])]); }
+function view_625($request) { return render("template_625.html", ["id" => intval($request["id"])]); }
+function view_626($request) { return render("template_626.html", ["id" => intval($request["id"])]); }
+function view_627($request) { return render("template_627.html", ["id" => intval($request["id"])]); }
+function view_628($request) { return render("template_628.html", ["id" => intval($request["id"])]); }
+function view_629($request) { return render("template_629.html", ["id" => intval($request["id"])]); }
+function view_630($request) { return render("template_630.html", ["id" => intval($request["id"])]); }
+function view_631($request) { return render("template_631.html", ["id" => intval($request["id"])]); }
+function view_632($request) { return render("template_632.html", ["id" => intval($request["id"])]); }
+function view_633($request) { return render("template_633.html", ["id" => intval($request["id"])]); }
+function view_634($request) { return render("template_634.html", ["id" => intval($request["id"])]); }
+function view_635($request) { return render("template_635.html", ["id" => intval($request["id"])]); }
+function view_636($request) { return render("template_636.html", ["id" => intval($request["id"])]); }
+function view_637($request) { return render("template_637.html", ["id" => intval($request["id"])]); }
+function view_638($request) { return render("template_638.html", ["id" => intval($request["id"])]); }
+function view_639($request) { return render("template_639.html", ["id" => intval($request["id"])]); }
+function view_640($request) { return render("template_640.html", ["id" => intval($request["id"])]); }
+function view_641($request) { return render("template_641.html", ["id" => intval($request["id"])]); }
+function view_642($request) { return render("template_642.html", ["id" => intval($request["id"])]); }
+function view_643($request) { return render("template_643.html", ["id" => intval($request["id"])]); }
+function view_644($request) { return render("template_644.html", ["id" => intval($request["id"])]); }
+function view_645($request) { return render("template_645.html", ["id" => intval($request["id"])]); }
+function view_646($request) { return render("template_646.html", ["id" => intval($request["id"])]); }
+function view_647($request) { return render("template_647.html", ["id" => intval($request["id"])]); }
+function view_648($request) { return render("template_648.html", ["id" => intval($request["id"])]); }
+function view_649($request) { return render("template_649.html", ["id" => intval($request["id"])]); }
+function view_650($request) { return render("template_650.html", ["id" => intval($request["id"])]); }
+function view_651($request) { return render("template_651.html", ["id" => intval($request["id"])]); }
+function view_652($request) { return render("template_652.html", ["id" => intval($request["id"])]); }
+function view_653($request) { return render("template_653.html", ["id" => intval($request["id"])]); }
+function view_654($request) { return render("template_654.html", ["id" => intval($request["id"])]); }
+function view_655($request) { return render("template_655.html", ["id" => intval($request["id"])]); }
+function view_656($request) { return render("template_656.html", ["id" => intval($request["id"])]); }
+function view_657($request) { return render("template_657.html", ["id" => intval($request["id"])]); }
+function view_658($request) { return render("template_658.html", ["id" => intval($request["id"])]); }
+function view_659($request) { return render("template_659.html", ["id" => intval($request["id"])]); }
+function view_660($request) { return render("template_660.html", ["id" => intval($request["id"])]); }
+function view_661($request) { return render("template_661.html", ["id" => intval($request["id"])]); }
+function view_662($request) { return render("template_662.html", ["id" => intval($request["id"])]); }
+function view_663($request) { return render("template_663.html", ["id" => intval($request["id"])]); }
+function view_664($request) { return render("template_664.html", ["id" => intval($request["id"])]); }
+function view_665($request) { return render("template_665.html", ["id" => intval($request["id"])]); }
+function view_666($request) { return render("template_666.html", ["id" => intval($request["id"])]); }
+function view_667($request) { return render("template_667.html", ["id" => intval($request["id"])]); }
+function view_668($request) { return render("template_668.html", ["id" => intval($request["id"])]); }
+function view_669($request) { return render("template_669.html", ["id" => intval($request["id"])]); }
+function view_670($request) { return render("template_670.html", ["id" => intval($request["id"])]); }
+function view_671($request) { return render("template_671.html", ["id" => intval($request["id"])]); }
+function view_672($request) { return render("template_672.html", ["id" => intval($request["id"])]); }
+function view_673($request) { return render("template_673.html", ["id" => intval($request["id"])]); }
+function view_674($request) { return render("template_674.html", ["id" => intval($request["id"])]); }
+function view_675($request) { return render("template_675.html", ["id" => intval($request["id"])]); }
+function view_676($request) { return render("template_676.html", ["id" => intval($request["id"])]); }
+function view_677($request) { return render("template_677.html", ["id" => intval($request["id"])]); }
+function view_678($request) { return render("template_678.html", ["id" => intval($request["id"])]); }
+function view_679($request) { return render("template_679.html", ["id" => intval($request["id"])]); }
+function view_680($request) { return render("template_680.html", ["id" => intval($request["id"])]); }
+function view_681($request) { return render("template_681.html", ["id" => intval($request["id"])]); }
+function view_682($request) { return render("template_682.html", ["id" => intval($request["id"])]); }
+function view_683($request) { return render("template_683.html", ["id" => intval($request["id"])]); }
+function view_684($request) { return render("template_684.html", ["id" => intval($request["id"])]); }
+function view_685($request) { return render("template_685.html", ["id" => intval($request["id"])]); }
+function view_686($request) { return render("template_686.html", ["id" => intval($request["id"])]); }
+function view_687($request) { return render("template_687.html", ["id" => intval($request["id"])]); }
+function view_688($request) { return render("template_688.html", ["id" => intval($request["id"])]); }
+function view_689($request) { return render("template_689.html", ["id" => intval($request["id"])]); }
+function view_690($request) { return render("template_690.html", ["id" => intval($request["id"])]); }
+function view_691($request) { return render("template_691.html", ["id" => intval($request["id"])]); }
+function view_692($request) { return render("template_692.html", ["id" => intval($request["id"])]); }
+function view_693($request) { return render("template_693.html", ["id" => intval($request["id"])]); }
+function view_694($request) { return render("template_694.html", ["id" => intval($request["id"])]); }
+function view_695($request) { return render("template_695.html", ["id" => intval($request["id"])]); }
+function view_696($request) { return render("template_696.html", ["id" => intval($request["id"])]); }
+function view_697($request) { return render("template_697.html", ["id" => intval($request["id"])]); }
+function view_698($request) { return render("template_698.html", ["id" => intval($request["id"])]); }
+function view_699($request) { return render("template_699.html", ["id" => intval($request["id"])]); }
+function view_700($request) { return render("template_700.html", ["id" => intval($request["id"])]); }
+function view_701($request) { return render("template_701.html", ["id" => intval($request["id"])]); }
+function view_702($request) { return render("template_702.html", ["id" => intval($request["id"])]); }
+function view_703($request) { return render("template_703.html", ["id" => intval($request["id"])]); }
+function view_704($request) { return render("template_704.html", ["id" => intval($request["id"])]); }
+function view_705($request) { return render("template_705.html", ["id" => intval($request["id"])]); }
+function view_706($request) { return render("template_706.html", ["id" => intval($request["id"])]); }
+function view_707($request) { return render("template_707.html", ["id" => intval($request["id"])]); }
+function view_708($request) { return render("template_708.html", ["id" => intval($request["id"])]); }
+function view_709($request) { return render("template_709.html", ["id" => intval($request["id"])]); }
+function view_710($request) { return render("template_710.html", ["id" => intval($request["id"])]); }
+function view_711($request) { return render("template_711.html", ["id" => intval($request["id"])]); }
+function view_712($request) { return render("template_712.html", ["id" => intval($request["id"])]); }
+function view_713($request) { return render("template_713.html", ["id" => intval($request["id"])]); }
+function view_714($request) { return render("template_714.html", ["id" => intval($request["id"])]); }
+function view_715($request) { return render("template_715.html", ["id" => intval($request["id"])]); }
+function view_716($request) { return render("template_716.html", ["id" => intval($request["id"])]); }
+function view_717($request) { return render("template_717.html", ["id" => intval($request["id"])]); }
+function view_718($request) { return render("template_718.html", ["id" => intval($request["id"])]); }
+function view_719($request) { return render("template_719.html", ["id" => intval($request["id"])]); }
+function view_720($request) { return render("template_720.html", ["id" => intval($request["id"])]); }
+function view_721($request) { return render("template_721.html", ["id" => intval($request["id"])]); }
+function view_722($request) { return render("template_722.html", ["id" => intval($request["id"])]); }
+function view_723($request) { return render("template_723.html", ["id" => intval($request["id"])]); }
+function view_724($request) { return render("template_724.html", ["id" => intval($request["id"])]); }
+function view_725($request) { return render("template_725.html", ["id" => intval($request["id"])]); }
+function view_726($request) { return render("template_726.html", ["id" => intval($request["id"])]); }
+function view_727($request) { return render("template_727.html", ["id" => intval($request["id"])]); }
+function view_728($request) { return render("template_728.html", ["id" => intval($request["id"])]); }
+function view_729($request) { return render("template_729.html", ["id" => intval($request["id"])]); }
+function view_730($request) { return render("template_730.html", ["id" => intval($request["id"])]); }
+function view_731($request) { return render("template_731.html", ["id" => intval($request["id"])]); }
+function view_732($request) { return render("template_732.html", ["id" => intval($request["id"])]); }
+function view_733($request) { return render("template_733.html", ["id" => intval($request["id"])]); }
+function view_734($request) { return render("template_734.html", ["id" => intval($request["id"])]); }
+function view_735($request) { return render("template_735.html", ["id" => intval($request["id"])]); }
+function view_736($request) { return render("template_736.html", ["id" => intval($request["id"])]); }
+function view_737($request) { return render("template_737.html", ["id" => intval($request["id"])]); }
+function view_738($request) { return render("template_738.html", ["id" => intval($request["id"])]); }
+function view_739($request) { return render("template_739.html", ["id" => intval($request["id"])]); }
+function view_740($request) { return render("template_740.html", ["id" => intval($request["id"])]); }
+function view_741($request) { return render("template_741.html", ["id" => intval($request["id"])]); }
+function view_742($request) { return render("template_742.html", ["id" => intval($request["id"])]); }
+function view_743($request) { return render("template_743.html", ["id" => intval($request["id"])]); }
+function view_744($request) { return render("template_744.html", ["id" => intval($request["id"])]); }
+function view_745($request) { return render("template_745.html", ["id" => intval($request["id"])]); }
+function view_746($request) { return render("template_746.html", ["id" => intval($request["id"])]); }
+function view_747($request) { return render("template_747.html", ["id" => intval($request["id"])]); }
+function view_748($request) { return render("template_748.html", ["id" => intval($request["id"])]); }
+function view_749($request) { return render("template_749.html", ["id" => intval($request["id"])]); }
+function view_750($request) { return render("template_750.html", ["id" => intval($request["id"])]); }
+function view_751($request) { return render("template_751.html", ["id" => intval($request["id"])]); }
+function view_752($request) { return render("template_752.html", ["id" => intval($request["id"])]); }
+function view_753($request) { return render("template_753.html", ["id" => intval($request["id"])]); }
+function view_754($request) { return render("template_754.html", ["id" => intval($request["id"])]); }
+function view_755($request) { return render("template_755.html", ["id" => intval($request["id"])]); }
+function view_756($request) { return render("template_756.html", ["id" => intval($request["id"])]); }
+function view_757($request) { return render("template_757.html", ["id" => intval($request["id"])]); }
+function view_758($request) { return render("template_758.html", ["id" => intval($request["id"])]); }
+function view_759($request) { return render("template_759.html", ["id" => intval($request["id"])]); }
+function view_760($request) { return render("template_760.html", ["id" => intval($request["id"])]); }
+function view_761($request) { return render("template_761.html", ["id" => intval($request["id"])]); }
+function view_762($request) { return render("template_762.html", ["id" => intval($request["id"])]); }
+function view_763($request) { return render("template_763.html", ["id" => intval($request["id"])]); }
+function view_764($request) { return render("template_764.html", ["id" => intval($request["id"])]); }
+function view_765($request) { return render("template_765.html", ["id" => intval($request["id"])]); }
+function view_766($request) { return render("template_766.html", ["id" => intval($request["id"])]); }
+function view_767($request) { return render("template_767.html", ["id" => intval($request["id"])]); }
+function view_768($request) { return render("template_768.html", ["id" => intval($request["id"])]); }
+function view_769($request) { return render("template_769.html", ["id" => intval($request["id"])]); }
+function view_770($request) { return render("template_770.html", ["id" => intval($request["id"])]); }
+function view_771($request) { return render("template_771.html", ["id" => intval($request["id"])]); }
+function view_772($request) { return render("template_772.html", ["id" => intval($request["id"])]); }
+function view_773($request) { return render("template_773.html", ["id" => intval($request["id"])]); }
+function view_774($request) { return render("template_774.html", ["id" => intval($request["id"])]); }
+function view_775($request) { return render("template_775.html", ["id" => intval($request["id"])]); }
+function view_776($request) { return render("template_776.html", ["id" => intval($request["id"])]); }
+function view_777($request) { return render("template_777.html", ["id" => intval($request["id"])]); }
+function view_778($request) { return render("template_778.html", ["id" => intval($request["id"])]); }
+function view_779($request) { return render("template_779.html", ["id" => intval($request["id"])]); }
+function view_780($request) { return render("template_780.html", ["id" => intval($request["id"])]); }
+function view_781($request) { return render("template_781.html", ["id" => intval($request["id"])]); }
+function view_782($request) { return render("template_782.html", ["id" => intval($request["id"])]); }
+function view_783($request) { return render("template_783.html", ["id" => intval($request["id"])]); }
+function view_784($request) { return render("template_784.html", ["id" => intval($request["id"])]); }
+function view_785($request) { return render("template_785.html", ["id" => intval($request["id"])]); }
+function view_786($request) { return render("template_786.html", ["id" => intval($request["id"])]); }
+function view_787($request) { return render("template_787.html", ["id" => intval($request["id"])]); }
+function view_788($request) { return render("template_788.html", ["id" => intval($request["id"])]); }
+function view_789($request) { return render("template_789.html", ["id" => intval($request["id"])]); }
+function view_790($request) { return render("template_790.html", ["id" => intval($request["id"])]); }
+function view_791($request) { return render("template_791.html", ["id" => intval($request["id"])]); }
+function view_792($request) { return render("template_792.html", ["id" => intval($request["id"])]); }
+function view_793($request) { return render("template_793.html", ["id" => intval($request["id"])]); }
+function view_794($request) { return render("template_794.html", ["id" => intval($request["id"])]); }
+function view_795($request) { return render("template_795.html", ["id" => intval($request["id"])]); }
+function view_796($request) { return render("template_796.html", ["id" => intval($request["id"])]); }
+function view_797($request) { return render("template_797.html", ["id" => intval($request["id"])]); }
+function view_798($request) { return render("template_798.html", ["id" => intval($request["id"])]); }
+function view_799($request) { return render("template_799.html", ["id" => intval($request["id"])]); }
+function view_800($request) { return render("template_800.html", ["id" => intval($request["id"])]); }
+function view_801($request) { return render("template_801.html", ["id" => intval($request["id"])]); }
+function view_802($request) { return render("template_802.html", ["id" => intval($request["id"])]); }
+function view_803($request) { return render("template_803.html", ["id" => intval($request["id"])]); }
+function view_804($request) { return render("template_804.html", ["id" => intval($request["id"])]); }
+function view_805($request) { return render("template_805.html", ["id" => intval($request["id"])]); }
+function view_806($request) { return render("template_806.html", ["id" => intval($request["id"])]); }
+function view_807($request) { return render("template_807.html", ["id" => intval($request["id"])]); }
+function view_808($request) { return render("template_808.html", ["id" => intval($request["id"])]); }
+function view_809($request) { return render("template_809.html", ["id" => intval($request["id"])]); }
+function view_810($request) { return render("template_810.html", ["id" => intval($request["id"])]); }
+function view_811($request) { return render("template_811.html", ["id" => intval($request["id"])]); }
+function view_812($request) { return render("template_812.html", ["id" => intval($request["id"])]); }
+function view_813($request) { return render("template_813.html", ["id" => intval($request["id"])]); }
+function view_814($request) { return render("template_814.html", ["id" => intval($request["id"])]); }
+function view_815($request) { return render("template_815.html", ["id" => intval($request["id"])]); }
+function view_816($request) { return render("template_816.html", ["id" => intval($request["id"])]); }
+function view_817($request) { return render("template_817.html", ["id" => intval($request["id"])]); }
+function view_818($request) { return render("template_818.html", ["id" => intval($request["id"])]); }
+function view_819($request) { return render("template_819.html", ["id" => intval($request["id"])]); }
+function view_820($request) { return render("template_820.html", ["id" => intval($request["id"])]); }
+function view_821($request) { return render("template_821.html", ["id" => intval($request["id"])]); }
+function view_822($request) { return render("template_822.html", ["id" => intval($request["id"])]); }
+function view_823($request) { return render("template_823.html", ["id" => intval($request["id"])]); }
+function view_824($request) { return render("template_824.html", ["id" => intval($request["id"])]); }
+function view_825($request) { return render("template_825.html", ["id" => intval($request["id"])]); }
+function view_826($request) { return render("template_826.html", ["id" => intval($request["id"])]); }
+function view_827($request) { return render("template_827.html", ["id" => intval($request["id"])]); }
+function view_828($request) { return render("template_828.html", ["id" => intval($request["id"])]); }
+function view_829($request) { return render("template_829.html", ["id" => intval($request["id"])]); }
+function view_830($request) { return render("template_830.html", ["id" => intval($request["id"])]); }
+function view_831($request) { return render("template_831.html", ["id" => intval($request["id"])]); }
+function view_832($request) { return render("template_832.html", ["id" => intval($request["id"])]); }
+function view_833($request) { return render("template_833.html", ["id" => intval($request["id"])]); }
+function view_834($request) { return render("template_834.html", ["id" => intval($request["id"])]); }
+function view_835($request) { return render("template_835.html", ["id" => intval($request["id"])]); }
+function view_836($request) { return render("template_836.html", ["id" => intval($request["id"])]); }
+function view_837($request) { return render("template_837.html", ["id" => intval($request["id"])]); }
+function view_838($request) { return render("template_838.html", ["id" => intval($request["id"])]); }
+function view_839($request) { return render("template_839.html", ["id" => intval($request["id"])]); }
+function view_840($request) { return render("template_840.html", ["id" => intval($request["id"])]); }
+function view_841($request) { return render("template_841.html", ["id" => intval($request["id"])]); }
+function view_842($request) { return render("template_842.html", ["id" => intval($request["id"])]); }
+function view_843($request) { return render("template_843.html", ["id" => intval($request["id"])]); }
+function view_844($request) { return render("template_844.html", ["id" => intval($request["id"])]); }
+function view_845($request) { return render("template_845.html", ["id" => intval($request["id"])]); }
+function view_846($request) { return render("template_846.html", ["id" => intval($request["id"])]); }
+function view_847($request) { return render("template_847.html", ["id" => intval($request["id"])]); }
+function view_848($request) { return render("template_848.html", ["id" => intval($request["id"])]); }
+function view_849($request) { return render("template_849.html", ["id" => intval($request["id"])]); }
+function view_850($request) { return render("template_850.html", ["id" => intval($request["id"])]); }
+function view_851($request) { return render("template_851.html", ["id" => intval($request["id"])]); }
+function view_852($request) { return render("template_852.html", ["id" => intval($request["id"])]); }
+function view_853($request) { return render("template_853.html", ["id" => intval($request["id"])]); }
+function view_854($request) { return render("template_854.html", ["id" => intval($request["id"])]); }
+function view_855($request) { return render("template_855.html", ["id" => intval($request["id"])]); }
+function view_856($request) { return render("template_856.html", ["id" => intval($request["id"])]); }
+function view_857($request) { return render("template_857.html", ["id" => intval($request["id"])]); }
+function view_858($request) { return render("template_858.html", ["id" => intval($request["id"])]); }
+function view_859($request) { return render("template_859.html", ["id" => intval($request["id"])]); }
+function view_860($request) { return render("template_860.html", ["id" => intval($request["id"])]); }
+function view_861($request) { return render("template_861.html", ["id" => intval($request["id"])]); }
+function view_862($request) { return render("template_862.html", ["id" => intval($request["id"])]); }
+function view_863($request) { return render("template_863.html", ["id" => intval($request["id"])]); }
+function view_864($request) { return render("template_864.html", ["id" => intval($request["id"])]); }
+function view_865($request) { return render("template_865.html", ["id" => intval($request["id"])]); }
+function view_866($request) { return render("template_866.html", ["id" => intval($request["id"])]); }
+function view_867($request) { return render("template_867.html", ["id" => intval($request["id"])]); }
+function view_868($request) { return render("template_868.html", ["id" => intval($request["id"])]); }
+function view_869($request) { return render("template_869.html", ["id" => intval($request["id"])]); }
+function view_870($request) { return render("template_870.html", ["id" => intval($request["id"])]); }
+function view_871($request) { return render("template_871.html", ["id" => intval($request["id"])]); }
+function view_872($request) { return render("template_872.html", ["id" => intval($request["id"])]); }
+function view_873($request) { return render("template_873.html", ["id" => intval($request["id"])]); }
+function view_874($request) { return render("template_874.html", ["id" => intval($request["id"])]); }
+function view_875($request) { return render("template_875.html", ["id" => intval($request["id"])]); }
+function view_876($request) { return render("template_876.html", ["id" => intval($request["id"])]); }
+function view_877($request) { return render("template_877.html", ["id" => intval($request["id"])]); }
+function view_878($request) { return render("template_878.html", ["id" => intval($request["id"])]); }
+function view_879($request) { return render("template_879.html", ["id" => intval($request["id"])]); }
+function view_880($request) { return render("template_880.html", ["id" => intval($request["id"])]); }
+function view_881($request) { return render("template_881.html", ["id" => intval($request["id"])]); }
+function view_882($request) { return render("template_882.html", ["id" => intval($request["id"])]); }
+function view_883($request) { return render("template_883.html", ["id" => intval($request["id"])]); }
+function view_884($request) { return render("template_884.html", ["id" => intval($request["id"])]); }
+function view_885($request) { return render("template_885.html", ["id" => intval($request["id"])]); }
+function view_886($request) { return render("template_886.html", ["id" => intval($request["id"])]); }
+function view_887($request) { return render("template_887.html", ["id" => intval($request["id"])]); }
+function view_888($request) { return render("template_888.html", ["id" => intval($request["id"])]); }
+function view_889($request) { return render("template_889.html", ["id" => intval($request["id"])]); }
+function view_890($request) { return render("template_890.html", ["id" => intval($request["id"])]); }
+function view_891($request) { return render("template_891.html", ["id" => intval($request["id"])]); }
+function view_892($request) { return render("template_892.html", ["id" => intval($request["id"])]); }
+function view_893($request) { return render("template_893.html", ["id" => intval($request["id"])]); }
+function view_894($request) { return render("template_894.html", ["id" => intval($request["id"])]); }
+function view_895($request) { return render("template_895.html", ["id" => intval($request["id"])]); }
+function view_896($request) { return render("template_896.html", ["id" => intval($request["id"])]); }
+function view_897($request) { return render("template_897.html", ["id" => intval($request["id"])]); }
+function view_898($request) { return render("template_898.html", ["id" => intval($request["id"])]); }
+function view_899($request) { return render("template_899.html", ["id" => intval($request["id"])]); }
+function view_900($request) { return render("template_900.html", ["id" => intval($request["id"])]); }
+function view_901($request) { return render("template_901.html", ["id" => intval($request["id"])]); }
+function view_902($request) { return render("template_902.html", ["id" => intval($request["id"])]); }
+function view_903($request) { return render("template_903.html", ["id" => intval($request["id"])]); }
+function view_904($request) { return render("template_904.html", ["id" => intval($request["id"])]); }
+function view_905($request) { return render("template_905.html", ["id" => intval($request["id"])]); }
+function view_906($request) { return render("template_906.html", ["id" => intval($request["id"])]); }
+function view_907($request) { return render("template_907.html", ["id" => intval($request["id"])]); }
+function view_908($request) { return render("template_908.html", ["id" => intval($request["id"])]); }
+function view_909($request) { return render("template_909.html", ["id" => intval($request["id"])]); }
+function view_910($request) { return render("template_910.html", ["id" => intval($request["id"])]); }
+function view_911($request) { return render("template_911.html", ["id" => intval($request["id"])]); }
+function view_912($request) { return render("template_912.html", ["id" => intval($request["id"])]); }
+function view_913($request) { return render("template_913.html", ["id" => intval($request["id"])]); }
+function view_914($request) { return render("template_914.html", ["id" => intval($request["id"])]); }
+function view_915($request) { return render("template_915.html", ["id" => intval($request["id"])]); }
+function view_916($request) { return render("template_916.html", ["id" => intval($request["id"])]); }
+function view_917($request) { return render("template_917.html", ["id" => intval($request["id"])]); }
+function view_918($request) { return render("template_918.html", ["id" => intval($request["id"])]); }
+function view_919($request) { return render("template_919.html", ["id" => intval($request["id"])]); }
+function view_920($request) { return render("template_920.html", ["id" => intval($request["id"])]); }
+function view_921($request) { return render("template_921.html", ["id" => intval($request["id"])]); }
+function view_922($request) { return render("template_922.html", ["id" => intval($request["id"])]); }
+function view_923($request) { return render("template_923.html", ["id" => intval($request["id"])]); }
+function view_924($request) { return render("template_924.html", ["id" => intval($request["id"])]); }
+function view_925($request) { return render("template_925.html", ["id" => intval($request["id"])]); }
+function view_926($request) { return render("template_926.html", ["id" => intval($request["id"])]); }
+function view_927($request) { return render("template_927.html", ["id" => intval($request["id"])]); }
+function view_928($request) { return render("template_928.html", ["id" => intval($request["id"])]); }
+function view_929($request) { return render("template_929.html", ["id" => intval($request["id"])]); }
+function view_930($request) { return render("template_930.html", ["id" => intval($request["id"])]); }
+function view_931($request) { return render("template_931.html", ["id" => intval($request["id"])]); }
+function view_932($request) { return render("template_932.html", ["id" => intval($request["id"])]); }
+function view_933($request) { return render("template_933.html", ["id" => intval($request["id"])]); }
+function view_934($request) { return render("template_934.html", ["id" => intval($request["id"])]); }
+function view_935($request) { return render("template_935.html", ["id" => intval($request["id"])]); }
+function view_936($request) { return render("template_936.html", ["id" => intval($request["id"])]); }
+function view_937($request) { return render("template_937.html", ["id" => intval($request["id"])]); }
+function view_938($request) { return render("template_938.html", ["id" => intval($request["id"])]); }
+function view_939($request) { return render("template_939.html", ["id" => intval($request["id"])]); }
+function view_940($request) { return render("template_940.html", ["id" => intval($request["id"])]); }
+function view_941($request) { return render("template_941.html", ["id" => intval($request["id"])]); }
+function view_942($request) { return render("template_942.html", ["id" => intval($request["id"])]); }
+function view_943($request) { return render("template_943.html", ["id" => intval($request["id"])]); }
+function view_944($request) { return render("template_944.html", ["id" => intval($request["id"])]); }
+function view_945($request) { return render("template_945.html", ["id" => intval($request["id"])]); }
+function view_946($request) { return render("template_946.html", ["id" => intval($request["id"])]); }
+function view_947($request) { return render("template_947.html", ["id" => intval($request["id"])]); }
+function view_948($request) { return render("template_948.html", ["id" => intval($request["id"])]); }
+function view_949($request) { return render("template_949.html", ["id" => intval($request["id"])]); }
+function view_950($request) { return render("template_950.html", ["id" => intval($request["id"])]); }
+function view_951($request) { return render("template_951.html", ["id" => intval($request["id"])]); }
+function view_952($request) { return render("template_952.html", ["id" => intval($request["id"])]); }
+function view_953($request) { return render("template_953.html", ["id" => intval($request["id"])]); }
+function view_954($request) { return render("template_954.html", ["id" => intval($request["id"])]); }
+function view_955($request) { return render("template_955.html", ["id" => intval($request["id"])]); }
+function view_956($request) { return render("template_956.html", ["id" => intval($request["id"])]); }
+function view_957($request) { return render("template_957.html", ["id" => intval($request["id"])]); }
+function view_958($request) { return render("template_958.html", ["id" => intval($request["id"])]); }
+function view_959($request) { return render("template_959.html", ["id" => intval($request["id"])]); }
+function view_960($request) { return render("template_960.html", ["id" => intval($request["id"])]); }
+function view_961($request) { return render("template_961.html", ["id" => intval($request["id"])]); }
+function view_962($request) { return render("template_962.html", ["id" => intval($request["id"])]); }
+function view_963($request) { return render("template_963.html", ["id" => intval($request["id"])]); }
+function view_964($request) { return render("template_964.html", ["id" => intval($request["id"])]); }
+function view_965($request) { return render("template_965.html", ["id" => intval($request["id"])]); }
+function view_966($request) { return render("template_966.html", ["id" => intval($request["id"])]); }
+function view_967($request) { return render("template_967.html", ["id" => intval($request["id"])]); }
+function view_968($request) { return render("template_968.html", ["id" => intval($request["id"])]); }
+function view_969($request) { return render("template_969.html", ["id" => intval($request["id"])]); }
+function view_970($request) { return render("template_970.html", ["id" => intval($request["id"])]); }
+function view_971($request) { return render("template_971.html", ["id" => intval($request["id"])]); }
+function view_972($request) { return render("template_972.html", ["id" => intval($request["id"])]); }
+function view_973($request) { return render("template_973.html", ["id" => intval($request["id"])]); }
+function view_974($request) { return render("template_974.html", ["id" => intval($request["id"])]); }
+function view_975($request) { return render("template_975.html", ["id" => intval($request["id"])]); }
+function view_976($request) { return render("template_976.html", ["id" => intval($request["id"])]); }
+function view_977($request) { return render("template_977.html", ["id" => intval($request["id"])]); }
+function view_978($request) { return render("template_978.html", ["id" => intval($request["id"])]); }
+function view_979($request) { return render("template_979.html", ["id" => intval($request["id"])]); }
+function view_980($request) { return render("template_980.html", ["id" => intval($request["id"])]); }
+function view_981($request) { return render("template_981.html", ["id" => intval($request["id"])]); }
+function view_982($request) { return render("template_982.html", ["id" => intval($request["id"])]); }
+function view_983($request) { return render("template_983.html", ["id" => intval($request["id"])]); }
+function view_984($request) { return render("template_984.html", ["id" => intval($request["id"])]); }
+function view_985($request) { return render("template_985.html", ["id" => intval($request["id"])]); }
+function view_986($request) { return render("template_986.html", ["id" => intval($request["id"])]); }
+function view_987($request) { return render("template_987.html", ["id" => intval($request["id"])]); }
+function view_988($request) { return render("template_988.html", ["id" => intval($request["id"])]); }
+function view_989($request) { return render("template_989.html", ["id" => intval($request["id"])]); }
+function view_990($request) { return render("template_990.html", ["id" => intval($request["id"])]); }
+function view_991($request) { return render("template_991.html", ["id" => intval($request["id"])]); }
+function view_992($request) { return render("template_992.html", ["id" => intval($request["id"])]); }
+function view_993($request) { return render("template_993.html", ["id" => intval($request["id"])]); }
+function view_994($request) { return render("template_994.html", ["id" => intval($request["id"])]); }
+function view_995($request) { return render("template_995.html", ["id" => intval($request["id"])]); }
+function view_996($request) { return render("template_996.html", ["id" => intval($request["id"])]); }
+function view_997($request) { return render("template_997.html", ["id" => intval($request["id"])]); }
+function view_998($request) { return render("template_998.html", ["id" => intval($request["id"])]); }
+function view_999($request) { return render("template_999.html", ["id" => intval($request["id"])]); }
+function view_1000($request) { return render("template_1000.html", ["id" => intval($request["id"])]); }
+function view_1001($request) { return render("template_1001.html", ["id" => intval($request["id"])]); }
+function view_1002($request) { return render("template_1002.html", ["id" => intval($request["id"])]); }
+function view_1003($request) { return render("template_1003.html", ["id" => intval($request["id"])]); }
+function view_1004($request) { return render("template_1004.html", ["id" => intval($request["id"])]); }
+function view_1005($request) { return render("template_1005.html", ["id" => intval($request["id"])]); }
+function view_1006($request) { return render("template_1006.html", ["id" => intval($request["id"])]); }
+function view_1007($request) { return render("template_1007.html", ["id" => intval($request["id"])]); }
+function view_1008($request) { return render("template_1008.html", ["id" => intval($request["id"])]); }
+function view_1009($request) { return render("template_1009.html", ["id" => intval($request["id"])]); }
+function view_1010($request) { return render("template_1010.html", ["id" => intval($request["id"])]); }
+function view_1011($request) { return render("template_1011.html", ["id" => intval($request["id"])]); }
+function view_1012($request) { return render("template_1012.html", ["id" => intval($request["id"])]); }
+function view_1013($request) { return render("template_1013.html", ["id" => intval($request["id"])]); }
+function view_1014($request) { return render("template_1014.html", ["id" => intval($request["id"])]); }
+function view_1015($request) { return render("template_1015.html", ["id" => intval($request["id"])]); }
+function view_1016($request) { return render("template_1016.html", ["id" => intval($request["id"])]); }
+function view_1017($request) { return render("template_1017.html", ["id" => intval($request["id"])]); }
+function view_1018($request) { return render("template_1018.html", ["id" => intval($request["id"])]); }
+function view_1019($request) { return render("template_1019.html", ["id" => intval($request["id"])]); }
+function view_1020($request) { return render("template_1020.html", ["id" => intval($request["id"])]); }
+function view_1021($request) { return render("template_1021.html", ["id" => intval($request["id"])]); }
+function view_1022($request) { return render("template_1022.html", ["id" => intval($request["id"])]); }
+function view_1023($request) { return render("template_1023.html", ["id" => intval($request["id"])]); }
+function view_1024($request) { return render("template_1024.html", ["id" => intval($request["id"])]); }
+function view_1025($request) { return render("template_1025.html", ["id" => intval($request["id"])]); }
+function view_1026($request) { return render("template_1026.html", ["id" => intval($request["id"])]); }
+function view_1027($request) { return render("template_1027.html", ["id" => intval($request["id"])]); }
+function view_1028($request) { return render("template_1028.html", ["id" => intval($request["id"])]); }
+function view_1029($request) { return render("template_1029.html", ["id" => intval($request["id"])]); }
+function view_1030($request) { return render("template_1030.html", ["id" => intval($request["id"])]); }
+function view_1031($request) { return render("template_1031.html", ["id" => intval($request["id"])]); }
+function view_1032($request) { return render("template_1032.html", ["id" => intval($request["id"])]); }
+function view_1033($request) { return render("template_1033.html", ["id" => intval($request["id"])]); }
+function view_1034($request) { return render("template_1034.html", ["id" => intval($request["id"])]); }
+function view_1035($request) { return render("template_1035.html", ["id" => intval($request["id"])]); }
+function view_1036($request) { return render("template_1036.html", ["id" => intval($request["id"])]); }
+function view_1037($request) { return render("template_1037.html", ["id" => intval($request["id"])]); }
+function view_1038($request) { return render("template_1038.html", ["id" => intval($request["id"])]); }
+function view_1039($request) { return render("template_1039.html", ["id" => intval($request["id"])]); }
+function view_1040($request) { return render("template_1040.html", ["id" => intval($request["id"])]); }
+function view_1041($request) { return render("template_1041.html", ["id" => intval($request["id"])]); }
+function view_1042($request) { return render("template_1042.html", ["id" => intval($request["id"])]); }
+function view_1043($request) { return render("template_1043.html", ["id" => intval($request["id"])]); }
+function view_1044($request) { return render("template_1044.html", ["id" => intval($request["id"])]); }
+function view_1045($request) { return render("template_1045.html", ["id" => intval($request["id"])]); }
+function view_1046($request) { return render("template_1046.html", ["id" => intval($request["id"])]); }
+function view_1047($request) { return render("template_1047.html", ["id" => intval($request["id"])]); }
+function view_1048($request) { return render("template_1048.html", ["id" => intval($request["id"])]); }
+function view_1049($request) { return render("template_1049.html", ["id" => intval($request["id"])]); }
+function view_1050($request) { return render("template_1050.html", ["id" => intval($request["id"])]); }
+function view_1051($request) { return render("template_1051.html", ["id" => intval($request["id"])]); }
+function view_1052($request) { return render("template_1052.html", ["id" => intval($request["id"])]); }
+function view_1053($request) { return render("template_1053.html", ["id" => intval($request["id"])]); }
+function view_1054($request) { return render("template_1054.html", ["id" => intval($request["id"])]); }
+function view_1055($request) { return render("template_1055.html", ["id" => intval($request["id"])]); }
+function view_1056($request) { return render("template_1056.html", ["id" => intval($request["id"])]); }
+function view_1057($request) { return render("template_1057.html", ["id" => intval($request["id"])]); }
+function view_1058($request) { return render("template_1058.html", ["id" => intval($request["id"])]); }
+function view_1059($request) { return render("template_1059.html", ["id" => intval($request["id"])]); }
+function view_1060($request) { return render("template_1060.html", ["id" => intval($request["id"])]); }
+function view_1061($request) { return render("template_1061.html", ["id" => intval($request["id"])]); }
+function view_1062($request) { return render("template_1062.html", ["id" => intval($request["id"])]); }
+function view_1063($request) { return render("template_1063.html", ["id" => intval($request["id"])]); }
+function view_1064($request) { return render("template_1064.html", ["id" => intval($request["id"])]); }
+function view_1065($request) { return render("template_1065.html", ["id" => intval($request["id"])]); }
+function view_1066($request) { return render("template_1066.html", ["id" => intval($request["id"])]); }
+function view_1067($request) { return render("template_1067.html", ["id" => intval($request["id"])]); }
+function view_1068($request) { return render("template_1068.html", ["id" => intval($request["id"])]); }
+function view_1069($request) { return render("template_1069.html", ["id" => intval($request["id"])]); }
+function view_1070($request) { return render("template_1070.html", ["id" => intval($request["id"])]); }
+function view_1071($request) { return render("template_1071.html", ["id" => intval($request["id"])]); }
+function view_1072($request) { return render("template_1072.html", ["id" => intval($request["id"])]); }
+function view_1073($request) { return render("template_1073.html", ["id" => intval($request["id"])]); }
+function view_1074($request) { return render("template_1074.html", ["id" => intval($request["id"])]); }
+function view_1075($request) { return render("template_1075.html", ["id" => intval($request["id"])]); }
+function view_1076($request) { return render("template_1076.html", ["id" => intval($request["id"])]); }
+function view_1077($request) { return render("template_1077.html", ["id" => intval($request["id"])]); }
+function view_1078($request) { return render("template_1078.html", ["id" => intval($request["id"])]); }
+function view_1079($request) { return render("template_1079.html", ["id" => intval($request["id"])]); }
+function view_1080($request) { return render("template_1080.html", ["id" => intval($request["id"])]); }
+function view_1081($request) { return render("template_1081.html", ["id" => intval($request["id"])]); }
+function view_1082($request) { return render("template_1082.html", ["id" => intval($request["id"])]); }
+function view_1083($request) { return render("template_1083.html", ["id" => intval($request["id"])]); }
+function view_1084($request) { return render("template_1084.html", ["id" => intval($request["id"])]); }
+function view_1085($request) { return render("template_1085.html", ["id" => intval($request["id"])]); }
+function view_1086($request) { return render("template_1086.html", ["id" => intval($request["id"])]); }
+function view_1087($request) { return render("template_1087.html", ["id" => intval($request["id"])]); }
+function view_1088($request) { return render("template_1088.html", ["id" => intval($request["id"])]); }
+function view_1089($request) { return render("template_1089.html", ["id" => intval($request["id"])]); }
+function view_1090($request) { return render("template_1090.html", ["id" => intval($request["id"])]); }
+function view_1091($request) { return render("template_1091.html", ["id" => intval($request["id"])]); }
+function view_1092($request) { return render("template_1092.html", ["id" => intval($request["id"])]); }
+function view_1093($request) { return render("template_1093.html", ["id" => intval($request["id"])]); }
+function view_1094($request) { return render("template_1094.html", ["id" => intval($request["id"])]); }
+function view_1095($request) { return render("template_1095.html", ["id" => intval($request["id"])]); }
+function view_1096($request) { return render("template_1096.html", ["id" => intval($request["id"])]); }
+function view_1097($request) { return render("template_1097.html", ["id" => intval($request["id"])]); }
+function view_1098($request) { return render("template_1098.html", ["id" => intval($request["id"])]); }
+function view_1099($request) { return render("template_1099.html", ["id" => intval($request["id"])]); }
+function view_1100($request) { return render("template_1100.html", ["id" => intval($request["id"])]); }
+function view_1101($request) { return render("template_1101.html", ["id" => intval($request["id"])]); }
+function view_1102($request) { return render("template_1102.html", ["id" => intval($request["id"])]); }
+function view_1103($request) { return render("template_1103.html", ["id" => intval($request["id"])]); }
+function view_1104($request) { return render("template_1104.html", ["id" => intval($request["id"])]); }
+function view_1105($request) { return render("template_1105.html", ["id" => intval($request["id"])]); }
+function view_1106($request) { return render("template_1106.html", ["id" => intval($request["id"])]); }
+function view_1107($request) { return render("template_1107.html", ["id" => intval($request["id"])]); }
+function view_1108($request) { return render("template_1108.html", ["id" => intval($request["id"])]); }
+function view_1109($request) { return render("template_1109.html", ["id" => intval($request["id"])]); }
+function view_1110($request) { return render("template_1110.html", ["id" => intval($request["id"])]); }
+function view_1111($request) { return render("template_1111.html", ["id" => intval($request["id"])]); }
+function view_1112($request) { return render("template_1112.html", ["id" => intval($request["id"])]); }
+function view_1113($request) { return render("template_1113.html", ["id" => intval($request["id"])]); }
+function view_1114($request) { return render("template_1114.html", ["id" => intval($request["id"])]); }
+function view_1115($request) { return render("template_1115.html", ["id" => intval($request["id"])]); }
+function view_1116($request) { return render("template_1116.html", ["id" => intval($request["id"])]); }
+function view_1117($request) { return render("template_1117.html", ["id" => intval($request["id"])]); }
+function view_1118($request) { return render("template_1118.html", ["id" => intval($request["id"])]); }
+function view_1119($request) { return render("template_1119.html", ["id" => intval($request["id"])]); }
+function view_1120($request) { return render("template_1120.html", ["id" => intval($request["id"])]); }
+function view_1121($request) { return render("template_1121.html", ["id" => intval($request["id"])]); }
+function view_1122($request) { return render("template_1122.html", ["id" => intval($request["id"])]); }
+function view_1123($request) { return render("template_1123.html", ["id" => intval($request["id"])]); }
+function view_1124($request) { return render("template_1124.html", ["id" => intval($request["id"])]); }
+function view_1125($request) { return render("template_1125.html", ["id" => intval($request["id"])]); }
+function view_1126($request) { return render("template_1126.html", ["id" => intval($request["id"])]); }
+function view_1127($request) { return render("template_1127.html", ["id" => intval($request["id"])]); }
+function view_1128($request) { return render("template_1128.html", ["id" => intval($request["id"])]); }
+function view_1129($request) { return render("template_1129.html", ["id" => intval($request["id"])]); }
+function view_1130($request) { return render("template_1130.html", ["id" => intval($request["id"])]); }
+function view_1131($request) { return render("template_1131.html", ["id" => intval($request["id"])]); }
+function view_1132($request) { return render("template_1132.html", ["id" => intval($request["id"])]); }
+function view_1133($request) { return render("template_1133.html", ["id" => intval($request["id"])]); }
+function view_1134($request) { return render("template_1134.html", ["id" => intval($request["id"])]); }
+function view_1135($request) { return render("template_1135.html", ["id" => intval($request["id"])]); }
+function view_1136($request) { return render("template_1136.html", ["id" => intval($request["id"])]); }
+function view_1137($request) { return render("template_1137.html", ["id" => intval($request["id"])]); }
+function view_1138($request) { return render("template_1138.html", ["id" => intval($request["id"])]); }
+function view_1139($request) { return render("template_1139.html", ["id" => intval($request["id"])]); }
+function view_1140($request) { return render("template_1140.html", ["id" => intval($request["id"])]); }
+function view_1141($request) { return render("template_1141.html", ["id" => intval($request["id"])]); }
+function view_1142($request) { return render("template_1142.html", ["id" => intval($request["id"])]); }
+function view_1143($request) { return render("template_1143.html", ["id" => intval($request["id"])]); }
+function view_1144($request) { return render("template_1144.html", ["id" => intval($request["id"])]); }
+function view_1145($request) { return render("template_1145.html", ["id" => intval($request["id"])]); }
+function view_1146($request) { return render("template_1146.html", ["id" => intval($request["id"])]); }
+function view_1147($request) { return render("template_1147.html", ["id" => intval($request["id"])]); }
+function view_1148($request) { return render("template_1148.html", ["id" => intval($request["id"])]); }
+function view_1149($request) { return render("template_1149.html", ["id" => intval($request["id"])]); }
+function view_1150($request) { return render("template_1150.html", ["id" => intval($request["id"])]); }
+function view_1151($request) { return render("template_1151.html", ["id" => intval($request["id"])]); }
+function view_1152($request) { return render("template_1152.html", ["id" => intval($request["id"])]); }
+function view_1153($request) { return render("template_1153.html", ["id" => intval($request["id"])]); }
+function view_1154($request) { return render("template_1154.html", ["id" => intval($request["id"])]); }
+function view_1155($request) { return render("template_1155.html", ["id" => intval($request["id"])]); }
+function view_1156($request) { return render("template_1156.html", ["id" => intval($request["id"])]); }
+function view_1157($request) { return render("template_1157.html", ["id" => intval($request["id"])]); }
+function view_1158($request) { return render("template_1158.html", ["id" => intval($request["id"])]); }
+function view_1159($request) { return render("template_1159.html", ["id" => intval($request["id"])]); }
+function view_1160($request) { return render("template_1160.html", ["id" => intval($request["id"])]); }
+function view_1161($request) { return render("template_1161.html", ["id" => intval($request["id"])]); }
+function view_1162($request) { return render("template_1162.html", ["id" => intval($request["id"])]); }
+function view_1163($request) { return render("template_1163.html", ["id" => intval($request["id"])]); }
+function view_1164($request) { return render("template_1164.html", ["id" => intval($request["id"])]); }
+function view_1165($request) { return render("template_1165.html", ["id" => intval($request["id"])]); }
+function view_1166($request) { return render("template_1166.html", ["id" => intval($request["id"])]); }
+function view_1167($request) { return render("template_1167.html", ["id" => intval($request["id"])]); }
+function view_1168($request) { return render("template_1168.html", ["id" => intval($request["id"])]); }
+function view_1169($request) { return render("template_1169.html", ["id" => intval($request["id"])]); }
+function view_1170($request) { return render("template_1170.html", ["id" => intval($request["id"])]); }
+function view_1171($request) { return render("template_1171.html", ["id" => intval($request["id"])]); }
+function view_1172($request) { return render("template_1172.html", ["id" => intval($request["id"])]); }
+function view_1173($request) { return render("template_1173.html", ["id" => intval($request["id"])]); }
+function view_1174($request) { return render("template_1174.html", ["id" => intval($request["id"])]); }
+function view_1175($request) { return render("template_1175.html", ["id" => intval($request["id"])]); }
+function view_1176($request) { return render("template_1176.html", ["id" => intval($request["id"])]); }
+function view_1177($request) { return render("template_1177.html", ["id" => intval($request["id"])]); }
+function view_1178($request) { return render("template_1178.html", ["id" => intval($request["id"])]); }
+function view_1179($request) { return render("template_1179.html", ["id" => intval($request["id"])]); }
+function view_1180($request) { return render("template_1180.html", ["id" => intval($request["id"])]); }
+function view_1181($request) { return render("template_1181.html", ["id" => intval($request["id"])]); }
+function view_1182($request) { return render("template_1182.html", ["id" => intval($request["id"])]); }
+function view_1183($request) { return render("template_1183.html", ["id" => intval($request["id"])]); }
+function view_1184($request) { return render("template_1184.html", ["id" => intval($request["id"])]); }
+function view_1185($request) { return render("template_1185.html", ["id" => intval($request["id"])]); }
+function view_1186($request) { return render("template_1186.html", ["id" => intval($request["id"])]); }
+function view_1187($request) { return render("template_1187.html", ["id" => intval($request["id"])]); }
+function view_1188($request) { return render("template_1188.html", ["id" => intval($request["id"])]); }
+function view_1189($request) { return render("template_1189.html", ["id" => intval($request["id"])]); }
+function view_1190($request) { return render("template_1190.html", ["id" => intval($request["id"])]); }
+function view_1191($request) { return render("template_1191.html", ["id" => intval($request["id"])]); }
+function view_1192($request) { return render("template_1192.html", ["id" => intval($request["id"])]); }
+function view_1193($request) { return render("template_1193.html", ["id" => intval($request["id"])]); }
+function view_1194($request) { return render("template_1194.html", ["id" => intval($request["id"])]); }
+function view_1195($request) { return render("template_1195.html", ["id" => intval($request["id"])]); }
+function view_1196($request) { return render("template_1196.html", ["id" => intval($request["id"])]); }
+function view_1197($request) { return render("template_1197.html", ["id" => intval($request["id"])]); }
+function view_1198($request) { return render("template_1198.html", ["id" => intval($request["id"])]); }
+function view_1199($request) { return render("template_1199.html", ["id" => intval($request["id"])]); }
@@ -0,0 +1,800 @@
+Get-Service -Name "svc0" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc1" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc2" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc3" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc4" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc5" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc6" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc7" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc8" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc9" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc10" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc11" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc12" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc13" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc14" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc15" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc16" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc17" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc18" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc19" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc20" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc21" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc22" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc23" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc24" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc25" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc26" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc27" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc28" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc29" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc30" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc31" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc32" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc33" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc34" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc35" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc36" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc37" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc38" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc39" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc40" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc41" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc42" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc43" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc44" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc45" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc46" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc47" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc48" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc49" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc50" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc51" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc52" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc53" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc54" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc55" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc56" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc57" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc58" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc59" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc60" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc61" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc62" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc63" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc64" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc65" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc66" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc67" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc68" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc69" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc70" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc71" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc72" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc73" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc74" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc75" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc76" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc77" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc78" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc79" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc80" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc81" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc82" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc83" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc84" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc85" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc86" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc87" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc88" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc89" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc90" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc91" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc92" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc93" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc94" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc95" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc96" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc97" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc98" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc99" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc100" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc101" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc102" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc103" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc104" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc105" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc106" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc107" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc108" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc109" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc110" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc111" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc112" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc113" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc114" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc115" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc116" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc117" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc118" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc119" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc120" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc121" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc122" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc123" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc124" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc125" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc126" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc127" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc128" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc129" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc130" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc131" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc132" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc133" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc134" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc135" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc136" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc137" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc138" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc139" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc140" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc141" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc142" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc143" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc144" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc145" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc146" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc147" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc148" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc149" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc150" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc151" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc152" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc153" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc154" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc155" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc156" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc157" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc158" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc159" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc160" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc161" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc162" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc163" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc164" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc165" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc166" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc167" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc168" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc169" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc170" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc171" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc172" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc173" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc174" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc175" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc176" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc177" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc178" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc179" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc180" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc181" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc182" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc183" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc184" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc185" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc186" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc187" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc188" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc189" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc190" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc191" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc192" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc193" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc194" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc195" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc196" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc197" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc198" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc199" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc200" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc201" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc202" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc203" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc204" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc205" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc206" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc207" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc208" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc209" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc210" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc211" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc212" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc213" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc214" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc215" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc216" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc217" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc218" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc219" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc220" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc221" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc222" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc223" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc224" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc225" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc226" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc227" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc228" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc229" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc230" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc231" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc232" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc233" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc234" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc235" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc236" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc237" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc238" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc239" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc240" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc241" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc242" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc243" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc244" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc245" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc246" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc247" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc248" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc249" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc250" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc251" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc252" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc253" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc254" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc255" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc256" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc257" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc258" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc259" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc260" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc261" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc262" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc263" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc264" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc265" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc266" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc267" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc268" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc269" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc270" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc271" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc272" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc273" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc274" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc275" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc276" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc277" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc278" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc279" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc280" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc281" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc282" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc283" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc284" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc285" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc286" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc287" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc288" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc289" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc290" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc291" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc292" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc293" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc294" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc295" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc296" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc297" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc298" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc299" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc300" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc301" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc302" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc303" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc304" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc305" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc306" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc307" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc308" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc309" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc310" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc311" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc312" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc313" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc314" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc315" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc316" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc317" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc318" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc319" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc320" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc321" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc322" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc323" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc324" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc325" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc326" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc327" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc328" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc329" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc330" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc331" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc332" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc333" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc334" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc335" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc336" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc337" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc338" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc339" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc340" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc341" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc342" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc343" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc344" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc345" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc346" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc347" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc348" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc349" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc350" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc351" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc352" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc353" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc354" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc355" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc356" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc357" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc358" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc359" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc360" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc361" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc362" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc363" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc364" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc365" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc366" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc367" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc368" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc369" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc370" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc371" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc372" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc373" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc374" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc375" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc376" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc377" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc378" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc379" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc380" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc381" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc382" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc383" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc384" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc385" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc386" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc387" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc388" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc389" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc390" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc391" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc392" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc393" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc394" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc395" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc396" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc397" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc398" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc399" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc400" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc401" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc402" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc403" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc404" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc405" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc406" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc407" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc408" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc409" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc410" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc411" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc412" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc413" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc414" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc415" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc416" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc417" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc418" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc419" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc420" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc421" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc422" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc423" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc424" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc425" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc426" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc427" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc428" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc429" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc430" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc431" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc432" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc433" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc434" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc435" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc436" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc437" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc438" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc439" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc440" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc441" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc442" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc443" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc444" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc445" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc446" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc447" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc448" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc449" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc450" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc451" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc452" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc453" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc454" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc455" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc456" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc457" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc458" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc459" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc460" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc461" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc462" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc463" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc464" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc465" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc466" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc467" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc468" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc469" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc470" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc471" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc472" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc473" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc474" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc475" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc476" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc477" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc478" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc479" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc480" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc481" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc482" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc483" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc484" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc485" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc486" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc487" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc488" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc489" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc490" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc491" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc492" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc493" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc494" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc495" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc496" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc497" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc498" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc499" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc500" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc501" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc502" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc503" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc504" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc505" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc506" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc507" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc508" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc509" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc510" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc511" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc512" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc513" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc514" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc515" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc516" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc517" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc518" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc519" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc520" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc521" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc522" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc523" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc524" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc525" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc526" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc527" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc528" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc529" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc530" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc531" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc532" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc533" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc534" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc535" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc536" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc537" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc538" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc539" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc540" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc541" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc542" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc543" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc544" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc545" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc546" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc547" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc548" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc549" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc550" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc551" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc552" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc553" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc554" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc555" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc556" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc557" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc558" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc559" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc560" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc561" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc562" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc563" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc564" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc565" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc566" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc567" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc568" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc569" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc570" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc571" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc572" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc573" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc574" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc575" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc576" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc577" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc578" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc579" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc580" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc581" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc582" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc583" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc584" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc585" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc586" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc587" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc588" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc589" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc590" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc591" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc592" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc593" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc594" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc595" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc596" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc597" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc598" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc599" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc600" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc601" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc602" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc603" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc604" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc605" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc606" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc607" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc608" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc609" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc610" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc611" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc612" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc613" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc614" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc615" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc616" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc617" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc618" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc619" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc620" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc621" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc622" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc623" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc624" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc625" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc626" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc627" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc628" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc629" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc630" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc631" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc632" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc633" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc634" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc635" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc636" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc637" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc638" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc639" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc640" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc641" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc642" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc643" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc644" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc645" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc646" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc647" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc648" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc649" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc650" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc651" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc652" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc653" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc654" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc655" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc656" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc657" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc658" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc659" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc660" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc661" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc662" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc663" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc664" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc665" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc666" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc667" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc668" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc669" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc670" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc671" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc672" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc673" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc674" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc675" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc676" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc677" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc678" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc679" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc680" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc681" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc682" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc683" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc684" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc685" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc686" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc687" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc688" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc689" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc690" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc691" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc692" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc693" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc694" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc695" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc696" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc697" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc698" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc699" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc700" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc701" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc702" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc703" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc704" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc705" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc706" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc707" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc708" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc709" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc710" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc711" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc712" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc713" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc714" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc715" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc716" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc717" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc718" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc719" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc720" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc721" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc722" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc723" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc724" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc725" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc726" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc727" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc728" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc729" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc730" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc731" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc732" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc733" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc734" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc735" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc736" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc737" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc738" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc739" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc740" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc741" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc742" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc743" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc744" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc745" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc746" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc747" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc748" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc749" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc750" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc751" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc752" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc753" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc754" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc755" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc756" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc757" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc758" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc759" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc760" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc761" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc762" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc763" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc764" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc765" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc766" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc767" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc768" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc769" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc770" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc771" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc772" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc773" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc774" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc775" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc776" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc777" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc778" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc779" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc780" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc781" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc782" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc783" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc784" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc785" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc786" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc787" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc788" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc789" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc790" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc791" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc792" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc793" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc794" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc795" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc796" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc797" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc798" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
+Get-Service -Name "svc799" | Where-Object { $_.Status -eq "Stopped" } | Start-Service -WhatIf
@@ -0,0 +1,1500 @@
+function handler0(event) { const value = document.getElementById("r0"); if (value) { value.textContent = String(0 * 2); } }
+function handler1(event) { const value = document.getElementById("r1"); if (value) { value.textContent = String(1 * 2); } }
+function handler2(event) { const value = document.getElementById("r2"); if (value) { value.textContent = String(2 * 2); } }
+function handler3(event) { const value = document.getElementById("r3"); if (value) { value.textContent = String(3 * 2); } }
+function handler4(event) { const value = document.getElementById("r4"); if (value) { value.textContent = String(4 * 2); } }
+function handler5(event) { const value = document.getElementById("r5"); if (value) { value.textContent = String(5 * 2); } }
+function handler6(event) { const value = document.getElementById("r6"); if (value) { value.textContent = String(6 * 2); } }
+function handler7(event) { const value = document.getElementById("r7"); if (value) { value.textContent = String(7 * 2); } }
+function handler8(event) { const value = document.getElementById("r8"); if (value) { value.textContent = String(8 * 2); } }
+function handler9(event) { const value = document.getElementById("r9"); if (value) { value.textContent = String(9 * 2); } }
+function handler10(event) { const value = document.getElementById("r10"); if (value) { value.textContent = String(10 * 2); } }
+function handler11(event) { const value = document.getElementById("r11"); if (value) { value.textContent = String(11 * 2); } }
+function handler12(event) { const value = document.getElementById("r12"); if (value) { value.textContent = String(12 * 2); } }
+function handler13(event) { const value = document.getElementById("r13"); if (value) { value.textContent = String(13 * 2); } }
+function handler14(event) { const value = document.getElementById("r14"); if (value) { value.textContent = String(14 * 2); } }
+function handler15(event) { const value = document.getElementById("r15"); if (value) { value.textContent = String(15 * 2); } }
+function handler16(event) { const value = document.getElementById("r16"); if (value) { value.textContent = String(16 * 2); } }
+function handler17(event) { const value = document.getElementById("r17"); if (value) { value.textContent = String(17 * 2); } }
+function handler18(event) { const value = document.getElementById("r18"); if (value) { value.textContent = String(18 * 2); } }
+function handler19(event) { const value = document.getElementById("r19"); if (value) { value.textContent = String(19 * 2); } }
+function handler20(event) { const value = document.getElementById("r20"); if (value) { value.textContent = String(20 * 2); } }
+function handler21(event) { const value = document.getElementById("r21"); if (value) { value.textContent = String(21 * 2); } }
+function handler22(event) { const value = document.getElementById("r22"); if (value) { value.textContent = String(22 * 2); } }
+function handler23(event) { const value = document.getElementById("r23"); if (value) { value.textContent = String(23 * 2); } }
+function handler24(event) { const value = document.getElementById("r24"); if (value) { value.textContent = String(24 * 2); } }
+function handler25(event) { const value = document.getElementById("r25"); if (value) { value.textContent = String(25 * 2); } }
+function handler26(event) { const value = document.getElementById("r26"); if (value) { value.textContent = String(26 * 2); } }
+function handler27(event) { const value = document.getElementById("r27"); if (value) { value.textContent = String(27 * 2); } }
+function handler28(event) { const value = document.getElementById("r28"); if (value) { value.textContent = String(28 * 2); } }
+function handler29(event) { const value = document.getElementById("r29"); if (value) { value.textContent = String(29 * 2); } }
+function handler30(event) { const value = document.getElementById("r30"); if (value) { value.textContent = String(30 * 2); } }
+function handler31(event) { const value = document.getElementById("r31"); if (value) { value.textContent = String(31 * 2); } }
+function handler32(event) { const value = document.getElementById("r32"); if (value) { value.textContent = String(32 * 2); } }
+function handler33(event) { const value = document.getElementById("r33"); if (value) { value.textContent = String(33 * 2); } }
+function handler34(event) { const value = document.getElementById("r34"); if (value) { value.textContent = String(34 * 2); } }
+function handler35(event) { const value = document.getElementById("r35"); if (value) { value.textContent = String(35 * 2); } }
+function handler36(event) { const value = document.getElementById("r36"); if (value) { value.textContent = String(36 * 2); } }
+function handler37(event) { const value = document.getElementById("r37"); if (value) { value.textContent = String(37 * 2); } }
+function handler38(event) { const value = document.getElementById("r38"); if (value) { value.textContent = String(38 * 2); } }
+function handler39(event) { const value = document.getElementById("r39"); if (value) { value.textContent = String(39 * 2); } }
+function handler40(event) { const value = document.getElementById("r40"); if (value) { value.textContent = String(40 * 2); } }
+function handler41(event) { const value = document.getElementById("r41"); if (value) { value.textContent = String(41 * 2); } }
+function handler42(event) { const value = document.getElementById("r42"); if (value) { value.textContent = String(42 * 2); } }
+function handler43(event) { const value = document.getElementById("r43"); if (value) { value.textContent = String(43 * 2); } }
+function handler44(event) { const value = document.getElementById("r44"); if (value) { value.textContent = String(44 * 2); } }
+function handler45(event) { const value = document.getElementById("r45"); if (value) { value.textContent = String(45 * 2); } }
+function handler46(event) { const value = document.getElementById("r46"); if (value) { value.textContent = String(46 * 2); } }
+function handler47(event) { const value = document.getElementById("r47"); if (value) { value.textContent = String(47 * 2); } }
+function handler48(event) { const value = document.getElementById("r48"); if (value) { value.textContent = String(48 * 2); } }
+function handler49(event) { const value = document.getElementById("r49"); if (value) { value.textContent = String(49 * 2); } }
+function handler50(event) { const value = document.getElementById("r50"); if (value) { value.textContent = String(50 * 2); } }
+function handler51(event) { const value = document.getElementById("r51"); if (value) { value.textContent = String(51 * 2); } }
+function handler52(event) { const value = document.getElementById("r52"); if (value) { value.textContent = String(52 * 2); } }
+function handler53(event) { const value = document.getElementById("r53"); if (value) { value.textContent = String(53 * 2); } }
+function handler54(event) { const value = document.getElementById("r54"); if (value) { value.textContent = String(54 * 2); } }
+function handler55(event) { const value = document.getElementById("r55"); if (value) { value.textContent = String(55 * 2); } }
+function handler56(event) { const value = document.getElementById("r56"); if (value) { value.textContent = String(56 * 2); } }
+function handler57(event) { const value = document.getElementById("r57"); if (value) { value.textContent = String(57 * 2); } }
+function handler58(event) { const value = document.getElementById("r58"); if (value) { value.textContent = String(58 * 2); } }
+function handler59(event) { const value = document.getElementById("r59"); if (value) { value.textContent = String(59 * 2); } }
+function handler60(event) { const value = document.getElementById("r60"); if (value) { value.textContent = String(60 * 2); } }
+function handler61(event) { const value = document.getElementById("r61"); if (value) { value.textContent = String(61 * 2); } }
+function handler62(event) { const value = document.getElementById("r62"); if (value) { value.textContent = String(62 * 2); } }
+function handler63(event) { const value = document.getElementById("r63"); if (value) { value.textContent = String(63 * 2); } }
+function handler64(event) { const value = document.getElementById("r64"); if (value) { value.textContent = String(64 * 2); } }
+function handler65(event) { const value = document.getElementById("r65"); if (value) { value.textContent = String(65 * 2); } }
+function handler66(event) { const value = document.getElementById("r66"); if (value) { value.textContent = String(66 * 2); } }
+function handler67(event) { const value = document.getElementById("r67"); if (value) { value.textContent = String(67 * 2); } }
+function handler68(event) { const value = document.getElementById("r68"); if (value) { value.textContent = String(68 * 2); } }
+function handler69(event) { const value = document.getElementById("r69"); if (value) { value.textContent = String(69 * 2); } }
+function handler70(event) { const value = document.getElementById("r70"); if (value) { value.textContent = String(70 * 2); } }
+function handler71(event) { const value = document.getElementById("r71"); if (value) { value.textContent = String(71 * 2); } }
+function handler72(event) { const value = document.getElementById("r72"); if (value) { value.textContent = String(72 * 2); } }
+function handler73(event) { const value = document.getElementById("r73"); if (value) { value.textContent = String(73 * 2); } }
+function handler74(event) { const value = document.getElementById("r74"); if (value) { value.textContent = String(74 * 2); } }
+function handler75(event) { const value = document.getElementById("r75"); if (value) { value.textContent = String(75 * 2); } }
+function handler76(event) { const value = document.getElementById("r76"); if (value) { value.textContent = String(76 * 2); } }
+function handler77(event) { const value = document.getElementById("r77"); if (value) { value.textContent = String(77 * 2); } }
+function handler78(event) { const value = document.getElementById("r78"); if (value) { value.textContent = String(78 * 2); } }
+function handler79(event) { const value = document.getElementById("r79"); if (value) { value.textContent = String(79 * 2); } }
+function handler80(event) { const value = document.getElementById("r80"); if (value) { value.textContent = String(80 * 2); } }
+function handler81(event) { const value = document.getElementById("r81"); if (value) { value.textContent = String(81 * 2); } }
+function handler82(event) { const value = document.getElementById("r82"); if (value) { value.textContent = String(82 * 2); } }
+function handler83(event) { const value = document.getElementById("r83"); if (value) { value.textContent = String(83 * 2); } }
+function handler84(event) { const value = document.getElementById("r84"); if (value) { value.textContent = String(84 * 2); } }
+function handler85(event) { const value = document.getElementById("r85"); if (value) { value.textContent = String(85 * 2); } }
+function handler86(event) { const value = document.getElementById("r86"); if (value) { value.textContent = String(86 * 2); } }
+function handler87(event) { const value = document.getElementById("r87"); if (value) { value.textContent = String(87 * 2); } }
+function handler88(event) { const value = document.getElementById("r88"); if (value) { value.textContent = String(88 * 2); } }
+function handler89(event) { const value = document.getElementById("r89"); if (value) { value.textContent = String(89 * 2); } }
+function handler90(event) { const value = document.getElementById("r90"); if (value) { value.textContent = String(90 * 2); } }
+function handler91(event) { const value = document.getElementById("r91"); if (value) { value.textContent = String(91 * 2); } }
+function handler92(event) { const value = document.getElementById("r92"); if (value) { value.textContent = String(92 * 2); } }
+function handler93(event) { const value = document.getElementById("r93"); if (value) { value.textContent = String(93 * 2); } }
+function handler94(event) { const value = document.getElementById("r94"); if (value) { value.textContent = String(94 * 2); } }
+function handler95(event) { const value = document.getElementById("r95"); if (value) { value.textContent = String(95 * 2); } }
+function handler96(event) { const value = document.getElementById("r96"); if (value) { value.textContent = String(96 * 2); } }
+function handler97(event) { const value = document.getElementById("r97"); if (value) { value.textContent = String(97 * 2); } }
+function handler98(event) { const value = document.getElementById("r98"); if (value) { value.textContent = String(98 * 2); } }
+function handler99(event) { const value = document.getElementById("r99"); if (value) { value.textContent = String(99 * 2); } }
+function handler100(event) { const value = document.getElementById("r100"); if (value) { value.textContent = String(100 * 2); } }
+function handler101(event) { const value = document.getElementById("r101"); if (value) { value.textContent = String(101 * 2); } }
+function handler102(event) { const value = document.getElementById("r102"); if (value) { value.textContent = String(102 * 2); } }
+function handler103(event) { const value = document.getElementById("r103"); if (value) { value.textContent = String(103 * 2); } }
+function handler104(event) { const value = document.getElementById("r104"); if (value) { value.textContent = String(104 * 2); } }
+function handler105(event) { const value = document.getElementById("r105"); if (value) { value.textContent = String(105 * 2); } }
+function handler106(event) { const value = document.getElementById("r106"); if (value) { value.textContent = String(106 * 2); } }
+function handler107(event) { const value = document.getElementById("r107"); if (value) { value.textContent = String(107 * 2); } }
+function handler108(event) { const value = document.getElementById("r108"); if (value) { value.textContent = String(108 * 2); } }
+function handler109(event) { const value = document.getElementById("r109"); if (value) { value.textContent = String(109 * 2); } }
+function handler110(event) { const value = document.getElementById("r110"); if (value) { value.textContent = String(110 * 2); } }
+function handler111(event) { const value = document.getElementById("r111"); if (value) { value.textContent = String(111 * 2); } }
+function handler112(event) { const value = document.getElementById("r112"); if (value) { value.textContent = String(112 * 2); } }
+function handler113(event) { const value = document.getElementById("r113"); if (value) { value.textContent = String(113 * 2); } }
+function handler114(event) { const value = document.getElementById("r114"); if (value) { value.textContent = String(114 * 2); } }
+function handler115(event) { const value = document.getElementById("r115"); if (value) { value.textContent = String(115 * 2); } }
+function handler116(event) { const value = document.getElementById("r116"); if (value) { value.textContent = String(116 * 2); } }
+function handler117(event) { const value = document.getElementById("r117"); if (value) { value.textContent = String(117 * 2); } }
+function handler118(event) { const value = document.getElementById("r118"); if (value) { value.textContent = String(118 * 2); } }
+function handler119(event) { const value = document.getElementById("r119"); if (value) { value.textContent = String(119 * 2); } }
+function handler120(event) { const value = document.getElementById("r120"); if (value) { value.textContent = String(120 * 2); } }
+function handler121(event) { const value = document.getElementById("r121"); if (value) { value.textContent = String(121 * 2); } }
+function handler122(event) { const value = document.getElementById("r122"); if (value) { value.textContent = String(122 * 2); } }
+function handler123(event) { const value = document.getElementById("r123"); if (value) { value.textContent = String(123 * 2); } }
+function handler124(event) { const value = document.getElementById("r124"); if (value) { value.textContent = String(124 * 2); } }
+function handler125(event) { const value = document.getElementById("r125"); if (value) { value.textContent = String(125 * 2); } }
+function handler126(event) { const value = document.getElementById("r126"); if (value) { value.textContent = String(126 * 2); } }
+function handler127(event) { const value = document.getElementById("r127"); if (value) { value.textContent = String(127 * 2); } }
+function handler128(event) { const value = document.getElementById("r128"); if (value) { value.textContent = String(128 * 2); } }
+function handler129(event) { const value = document.getElementById("r129"); if (value) { value.textContent = String(129 * 2); } }
+function handler130(event) { const value = document.getElementById("r130"); if (value) { value.textContent = String(130 * 2); } }
+function handler131(event) { const value = document.getElementById("r131"); if (value) { value.textContent = String(131 * 2); } }
+function handler132(event) { const value = document.getElementById("r132"); if (value) { value.textContent = String(132 * 2); } }
+function handler133(event) { const value = document.getElementById("r133"); if (value) { value.textContent = String(133 * 2); } }
+function handler134(event) { const value = document.getElementById("r134"); if (value) { value.textContent = String(134 * 2); } }
+function handler135(event) { const value = document.getElementById("r135"); if (value) { value.textContent = String(135 * 2); } }
+function handler136(event) { const value = document.getElementById("r136"); if (value) { value.textContent = String(136 * 2); } }
+function handler137(event) { const value = document.getElementById("r137"); if (value) { value.textContent = String(137 * 2); } }
+function handler138(event) { const value = document.getElementById("r138"); if (value) { value.textContent = String(138 * 2); } }
+function handler139(event) { const value = document.getElementById("r139"); if (value) { value.textContent = String(139 * 2); } }
+function handler140(event) { const value = document.getElementById("r140"); if (value) { value.textContent = String(140 * 2); } }
+function handler141(event) { const value = document.getElementById("r141"); if (value) { value.textContent = String(141 * 2); } }
+function handler142(event) { const value = document.getElementById("r142"); if (value) { value.textContent = String(142 * 2); } }
+function handler143(event) { const value = document.getElementById("r143"); if (value) { value.textContent = String(143 * 2); } }
+function handler144(event) { const value = document.getElementById("r144"); if (value) { value.textContent = String(144 * 2); } }
+function handler145(event) { const value = document.getElementById("r145"); if (value) { value.textContent = String(145 * 2); } }
+function handler146(event) { const value = document.getElementById("r146"); if (value) { value.textContent = String(146 * 2); } }
+function handler147(event) { const value = document.getElementById("r147"); if (value) { value.textContent = String(147 * 2); } }
+function handler148(event) { const value = document.getElementById("r148"); if (value) { value.textContent = String(148 * 2); } }
+function handler149(event) { const value = document.getElementById("r149"); if (value) { value.textContent = String(149 * 2); } }
+function handler150(event) { const value = document.getElementById("r150"); if (value) { value.textContent = String(150 * 2); } }
+function handler151(event) { const value = document.getElementById("r151"); if (value) { value.textContent = String(151 * 2); } }
+function handler152(event) { const value = document.getElementById("r152"); if (value) { value.textContent = String(152 * 2); } }
+function handler153(event) { const value = document.getElementById("r153"); if (value) { value.textContent = String(153 * 2); } }
+function handler154(event) { const value = document.getElementById("r154"); if (value) { value.textContent = String(154 * 2); } }
+function handler155(event) { const value = document.getElementById("r155"); if (value) { value.textContent = String(155 * 2); } }
+function handler156(event) { const value = document.getElementById("r156"); if (value) { value.textContent = String(156 * 2); } }
+function handler157(event) { const value = document.getElementById("r157"); if (value) { value.textContent = String(157 * 2); } }
+function handler158(event) { const value = document.getElementById("r158"); if (value) { value.textContent = String(158 * 2); } }
+function handler159(event) { const value = document.getElementById("r159"); if (value) { value.textContent = String(159 * 2); } }
+function handler160(event) { const value = document.getElementById("r160"); if (value) { value.textContent = String(160 * 2); } }
+function handler161(event) { const value = document.getElementById("r161"); if (value) { value.textContent = String(161 * 2); } }
+function handler162(event) { const value = document.getElementById("r162"); if (value) { value.textContent = String(162 * 2); } }
+function handler163(event) { const value = document.getElementById("r163"); if (value) { value.textContent = String(163 * 2); } }
+function handler164(event) { const value = document.getElementById("r164"); if (value) { value.textContent = String(164 * 2); } }
+function handler165(event) { const value = document.getElementById("r165"); if (value) { value.textContent = String(165 * 2); } }
+function handler166(event) { const value = document.getElementById("r166"); if (value) { value.textContent = String(166 * 2); } }
+function handler167(event) { const value = document.getElementById("r167"); if (value) { value.textContent = String(167 * 2); } }
+function handler168(event) { const value = document.getElementById("r168"); if (value) { value.textContent = String(168 * 2); } }
+function handler169(event) { const value = document.getElementById("r169"); if (value) { value.textContent = String(169 * 2); } }
+function handler170(event) { const value = document.getElementById("r170"); if (value) { value.textContent = String(170 * 2); } }
+function handler171(event) { const value = document.getElementById("r171"); if (value) { value.textContent = String(171 * 2); } }
+function handler172(event) { const value = document.getElementById("r172"); if (value) { value.textContent = String(172 * 2); } }
+function handler173(event) { const value = document.getElementById("r173"); if (value) { value.textContent = String(173 * 2); } }
+function handler174(event) { const value = document.getElementById("r174"); if (value) { value.textContent = String(174 * 2); } }
+function handler175(event) { const value = document.getElementById("r175"); if (value) { value.textContent = String(175 * 2); } }
+function handler176(event) { const value = document.getElementById("r176"); if (value) { value.textContent = String(176 * 2); } }
+function handler177(event) { const value = document.getElementById("r177"); if (value) { value.textContent = String(177 * 2); } }
+function handler178(event) { const value = document.getElementById("r178"); if (value) { value.textContent = String(178 * 2); } }
+function handler179(event) { const value = document.getElementById("r179"); if (value) { value.textContent = String(179 * 2); } }
+function handler180(event) { const value = document.getElementById("r180"); if (value) { value.textContent = String(180 * 2); } }
+function handler181(event) { const value = document.getElementById("r181"); if (value) { value.textContent = String(181 * 2); } }
+function handler182(event) { const value = document.getElementById("r182"); if (value) { value.textContent = String(182 * 2); } }
+function handler183(event) { const value = document.getElementById("r183"); if (value) { value.textContent = String(183 * 2); } }
+function handler184(event) { const value = document.getElementById("r184"); if (value) { value.textContent = String(184 * 2); } }
+function handler185(event) { const value = document.getElementById("r185"); if (value) { value.textContent = String(185 * 2); } }
+function handler186(event) { const value = document.getElementById("r186"); if (value) { value.textContent = String(186 * 2); } }
+function handler187(event) { const value = document.getElementById("r187"); if (value) { value.textContent = String(187 * 2); } }
+function handler188(event) { const value = document.getElementById("r188"); if (value) { value.textContent = String(188 * 2); } }
+function handler189(event) { const value = document.getElementById("r189"); if (value) { value.textContent = String(189 * 2); } }
+function handler190(event) { const value = document.getElementById("r190"); if (value) { value.textContent = String(190 * 2); } }
+function handler191(event) { const value = document.getElementById("r191"); if (value) { value.textContent = String(191 * 2); } }
+function handler192(event) { const value = document.getElementById("r192"); if (value) { value.textContent = String(192 * 2); } }
+function handler193(event) { const value = document.getElementById("r193"); if (value) { value.textContent = String(193 * 2); } }
+function handler194(event) { const value = document.getElementById("r194"); if (value) { value.textContent = String(194 * 2); } }
+function handler195(event) { const value = document.getElementById("r195"); if (value) { value.textContent = String(195 * 2); } }
+function handler196(event) { const value = document.getElementById("r196"); if (value) { value.textContent = String(196 * 2); } }
+function handler197(event) { const value = document.getElementById("r197"); if (value) { value.textContent = String(197 * 2); } }
+function handler198(event) { const value = document.getElementById("r198"); if (value) { value.textContent = String(198 * 2); } }
+function handler199(event) { const value = document.getElementById("r199"); if (value) { value.textContent = String(199 * 2); } }
+function handler200(event) { const value = document.getElementById("r200"); if (value) { value.textContent = String(200 * 2); } }
+function handler201(event) { const value = document.getElementById("r201"); if (value) { value.textContent = String(201 * 2); } }
+function handler202(event) { const value = document.getElementById("r202"); if (value) { value.textContent = String(202 * 2); } }
+function handler203(event) { const value = document.getElementById("r203"); if (value) { value.textContent = String(203 * 2); } }
+function handler204(event) { const value = document.getElementById("r204"); if (value) { value.textContent = String(204 * 2); } }
+function handler205(event) { const value = document.getElementById("r205"); if (value) { value.textContent = String(205 * 2); } }
+function handler206(event) { const value = document.getElementById("r206"); if (value) { value.textContent = String(206 * 2); } }
+function handler207(event) { const value = document.getElementById("r207"); if (value) { value.textContent = String(207 * 2); } }
+function handler208(event) { const value = document.getElementById("r208"); if (value) { value.textContent = String(208 * 2); } }
+function handler209(event) { const value = document.getElementById("r209"); if (value) { value.textContent = String(209 * 2); } }
+function handler210(event) { const value = document.getElementById("r210"); if (value) { value.textContent = String(210 * 2); } }
+function handler211(event) { const value = document.getElementById("r211"); if (value) { value.textContent = String(211 * 2); } }
+function handler212(event) { const value = document.getElementById("r212"); if (value) { value.textContent = String(212 * 2); } }
+function handler213(event) { const value = document.getElementById("r213"); if (value) { value.textContent = String(213 * 2); } }
+function handler214(event) { const value = document.getElementById("r214"); if (value) { value.textContent = String(214 * 2); } }
+function handler215(event) { const value = document.getElementById("r215"); if (value) { value.textContent = String(215 * 2); } }
+function handler216(event) { const value = document.getElementById("r216"); if (value) { value.textContent = String(216 * 2); } }
+function handler217(event) { const value = document.getElementById("r217"); if (value) { value.textContent = String(217 * 2); } }
+function handler218(event) { const value = document.getElementById("r218"); if (value) { value.textContent = String(218 * 2); } }
+function handler219(event) { const value = document.getElementById("r219"); if (value) { value.textContent = String(219 * 2); } }
+function handler220(event) { const value = document.getElementById("r220"); if (value) { value.textContent = String(220 * 2); } }
+function handler221(event) { const value = document.getElementById("r221"); if (value) { value.textContent = String(221 * 2); } }
+function handler222(event) { const value = document.getElementById("r222"); if (value) { value.textContent = String(222 * 2); } }
+function handler223(event) { const value = document.getElementById("r223"); if (value) { value.textContent = String(223 * 2); } }
+function handler224(event) { const value = document.getElementById("r224"); if (value) { value.textContent = String(224 * 2); } }
+function handler225(event) { const value = document.getElementById("r225"); if (value) { value.textContent = String(225 * 2); } }
+function handler226(event) { const value = document.getElementById("r226"); if (value) { value.textContent = String(226 * 2); } }
+function handler227(event) { const value = document.getElementById("r227"); if (value) { value.textContent = String(227 * 2); } }
+function handler228(event) { const value = document.getElementById("r228"); if (value) { value.textContent = String(228 * 2); } }
+function handler229(event) { const value = document.getElementById("r229"); if (value) { value.textContent = String(229 * 2); } }
+function handler230(event) { const value = document.getElementById("r230"); if (value) { value.textContent = String(230 * 2); } }
+function handler231(event) { const value = document.getElementById("r231"); if (value) { value.textContent = String(231 * 2); } }
+function handler232(event) { const value = document.getElementById("r232"); if (value) { value.textContent = String(232 * 2); } }
+function handler233(event) { const value = document.getElementById("r233"); if (value) { value.textContent = String(233 * 2); } }
+function handler234(event) { const value = document.getElementById("r234"); if (value) { value.textContent = String(234 * 2); } }
+function handler235(event) { const value = document.getElementById("r235"); if (value) { value.textContent = String(235 * 2); } }
+function handler236(event) { const value = document.getElementById("r236"); if (value) { value.textContent = String(236 * 2); } }
+function handler237(event) { const value = document.getElementById("r237"); if (value) { value.textContent = String(237 * 2); } }
+function handler238(event) { const value = document.getElementById("r238"); if (value) { value.textContent = String(238 * 2); } }
+function handler239(event) { const value = document.getElementById("r239"); if (value) { value.textContent = String(239 * 2); } }
+function handler240(event) { const value = document.getElementById("r240"); if (value) { value.textContent = String(240 * 2); } }
+function handler241(event) { const value = document.getElementById("r241"); if (value) { value.textContent = String(241 * 2); } }
+function handler242(event) { const value = document.getElementById("r242"); if (value) { value.textContent = String(242 * 2); } }
+function handler243(event) { const value = document.getElementById("r243"); if (value) { value.textContent = String(243 * 2); } }
+function handler244(event) { const value = document.getElementById("r244"); if (value) { value.textContent = String(244 * 2); } }
+function handler245(event) { const value = document.getElementById("r245"); if (value) { value.textContent = String(245 * 2); } }
+function handler246(event) { const value = document.getElementById("r246"); if (value) { value.textContent = String(246 * 2); } }
+function handler247(event) { const value = document.getElementById("r247"); if (value) { value.textContent = String(247 * 2); } }
+function handler248(event) { const value = document.getElementById("r248"); if (value) { value.textContent = String(248 * 2); } }
+function handler249(event) { const value = document.getElementById("r249"); if (value) { value.textContent = String(249 * 2); } }
+function handler250(event) { const value = document.getElementById("r250"); if (value) { value.textContent = String(250 * 2); } }
+function handler251(event) { const value = document.getElementById("r251"); if (value) { value.textContent = String(251 * 2); } }
+function handler252(event) { const value = document.getElementById("r252"); if (value) { value.textContent = String(252 * 2); } }
+function handler253(event) { const value = document.getElementById("r253"); if (value) { value.textContent = String(253 * 2); } }
+function handler254(event) { const value = document.getElementById("r254"); if (value) { value.textContent = String(254 * 2); } }
+function handler255(event) { const value = document.getElementById("r255"); if (value) { value.textContent = String(255 * 2); } }
+function handler256(event) { const value = document.getElementById("r256"); if (value) { value.textContent = String(256 * 2); } }
+function handler257(event) { const value = document.getElementById("r257"); if (value) { value.textContent = String(257 * 2); } }
+function handler258(event) { const value = document.getElementById("r258"); if (value) { value.textContent = String(258 * 2); } }
+function handler259(event) { const value = document.getElementById("r259"); if (value) { value.textContent = String(259 * 2); } }
+function handler260(event) { const value = document.getElementById("r260"); if (value) { value.textContent = String(260 * 2); } }
+function handler261(event) { const value = document.getElementById("r261"); if (value) { value.textContent = String(261 * 2); } }
+function handler262(event) { const value = document.getElementById("r262"); if (value) { value.textContent = String(262 * 2); } }
+function handler263(event) { const value = document.getElementById("r263"); if (value) { value.textContent = String(263 * 2); } }
+function handler264(event) { const value = document.getElementById("r264"); if (value) { value.textContent = String(264 * 2); } }
+function handler265(event) { const value = document.getElementById("r265"); if (value) { value.textContent = String(265 * 2); } }
+function handler266(event) { const value = document.getElementById("r266"); if (value) { value.textContent = String(266 * 2); } }
+function handler267(event) { const value = document.getElementById("r267"); if (value) { value.textContent = String(267 * 2); } }
+function handler268(event) { const value = document.getElementById("r268"); if (value) { value.textContent = String(268 * 2); } }
+function handler269(event) { const value = document.getElementById("r269"); if (value) { value.textContent = String(269 * 2); } }
+function handler270(event) { const value = document.getElementById("r270"); if (value) { value.textContent = String(270 * 2); } }
+function handler271(event) { const value = document.getElementById("r271"); if (value) { value.textContent = String(271 * 2); } }
+function handler272(event) { const value = document.getElementById("r272"); if (value) { value.textContent = String(272 * 2); } }
+function handler273(event) { const value = document.getElementById("r273"); if (value) { value.textContent = String(273 * 2); } }
+function handler274(event) { const value = document.getElementById("r274"); if (value) { value.textContent = String(274 * 2); } }
+function handler275(event) { const value = document.getElementById("r275"); if (value) { value.textContent = String(275 * 2); } }
+function handler276(event) { const value = document.getElementById("r276"); if (value) { value.textContent = String(276 * 2); } }
+function handler277(event) { const value = document.getElementById("r277"); if (value) { value.textContent = String(277 * 2); } }
+function handler278(event) { const value = document.getElementById("r278"); if (value) { value.textContent = String(278 * 2); } }
+function handler279(event) { const value = document.getElementById("r279"); if (value) { value.textContent = String(279 * 2); } }
+function handler280(event) { const value = document.getElementById("r280"); if (value) { value.textContent = String(280 * 2); } }
+function handler281(event) { const value = document.getElementById("r281"); if (value) { value.textContent = String(281 * 2); } }
+function handler282(event) { const value = document.getElementById("r282"); if (value) { value.textContent = String(282 * 2); } }
+function handler283(event) { const value = document.getElementById("r283"); if (value) { value.textContent = String(283 * 2); } }
+function handler284(event) { const value = document.getElementById("r284"); if (value) { value.textContent = String(284 * 2); } }
+function handler285(event) { const value = document.getElementById("r285"); if (value) { value.textContent = String(285 * 2); } }
+function handler286(event) { const value = document.getElementById("r286"); if (value) { value.textContent = String(286 * 2); } }
+function handler287(event) { const value = document.getElementById("r287"); if (value) { value.textContent = String(287 * 2); } }
+function handler288(event) { const value = document.getElementById("r288"); if (value) { value.textContent = String(288 * 2); } }
+function handler289(event) { const value = document.getElementById("r289"); if (value) { value.textContent = String(289 * 2); } }
+function handler290(event) { const value = document.getElementById("r290"); if (value) { value.textContent = String(290 * 2); } }
+function handler291(event) { const value = document.getElementById("r291"); if (value) { value.textContent = String(291 * 2); } }
+function handler292(event) { const value = document.getElementById("r292"); if (value) { value.textContent = String(292 * 2); } }
+function handler293(event) { const value = document.getElementById("r293"); if (value) { value.textContent = String(293 * 2); } }
+function handler294(event) { const value = document.getElementById("r294"); if (value) { value.textContent = String(294 * 2); } }
+function handler295(event) { const value = document.getElementById("r295"); if (value) { value.textContent = String(295 * 2); } }
+function handler296(event) { const value = document.getElementById("r296"); if (value) { value.textContent = String(296 * 2); } }
+function handler297(event) { const value = document.getElementById("r297"); if (value) { value.textContent = String(297 * 2); } }
+function handler298(event) { const value = document.getElementById("r298"); if (value) { value.textContent = String(298 * 2); } }
+function handler299(event) { const value = document.getElementById("r299"); if (value) { value.textContent = String(299 * 2); } }
+function handler300(event) { const value = document.getElementById("r300"); if (value) { value.textContent = String(300 * 2); } }
+function handler301(event) { const value = document.getElementById("r301"); if (value) { value.textContent = String(301 * 2); } }
+function handler302(event) { const value = document.getElementById("r302"); if (value) { value.textContent = String(302 * 2); } }
+function handler303(event) { const value = document.getElementById("r303"); if (value) { value.textContent = String(303 * 2); } }
+function handler304(event) { const value = document.getElementById("r304"); if (value) { value.textContent = String(304 * 2); } }
+function handler305(event) { const value = document.getElementById("r305"); if (value) { value.textContent = String(305 * 2); } }
+function handler306(event) { const value = document.getElementById("r306"); if (value) { value.textContent = String(306 * 2); } }
+function handler307(event) { const value = document.getElementById("r307"); if (value) { value.textContent = String(307 * 2); } }
+function handler308(event) { const value = document.getElementById("r308"); if (value) { value.textContent = String(308 * 2); } }
+function handler309(event) { const value = document.getElementById("r309"); if (value) { value.textContent = String(309 * 2); } }
+function handler310(event) { const value = document.getElementById("r310"); if (value) { value.textContent = String(310 * 2); } }
+function handler311(event) { const value = document.getElementById("r311"); if (value) { value.textContent = String(311 * 2); } }
+function handler312(event) { const value = document.getElementById("r312"); if (value) { value.textContent = String(312 * 2); } }
+function handler313(event) { const value = document.getElementById("r313"); if (value) { value.textContent = String(313 * 2); } }
+function handler314(event) { const value = document.getElementById("r314"); if (value) { value.textContent = String(314 * 2); } }
+function handler315(event) { const value = document.getElementById("r315"); if (value) { value.textContent = String(315 * 2); } }
+function handler316(event) { const value = document.getElementById("r316"); if (value) { value.textContent = String(316 * 2); } }
+function handler317(event) { const value = document.getElementById("r317"); if (value) { value.textContent = String(317 * 2); } }
+function handler318(event) { const value = document.getElementById("r318"); if (value) { value.textContent = String(318 * 2); } }
+function handler319(event) { const value = document.getElementById("r319"); if (value) { value.textContent = String(319 * 2); } }
+function handler320(event) { const value = document.getElementById("r320"); if (value) { value.textContent = String(320 * 2); } }
+function handler321(event) { const value = document.getElementById("r321"); if (value) { value.textContent = String(321 * 2); } }
+function handler322(event) { const value = document.getElementById("r322"); if (value) { value.textContent = String(322 * 2); } }
+function handler323(event) { const value = document.getElementById("r323"); if (value) { value.textContent = String(323 * 2); } }
+function handler324(event) { const value = document.getElementById("r324"); if (value) { value.textContent = String(324 * 2); } }
+function handler325(event) { const value = document.getElementById("r325"); if (value) { value.textContent = String(325 * 2); } }
+function handler326(event) { const value = document.getElementById("r326"); if (value) { value.textContent = String(326 * 2); } }
+function handler327(event) { const value = document.getElementById("r327"); if (value) { value.textContent = String(327 * 2); } }
+function handler328(event) { const value = document.getElementById("r328"); if (value) { value.textContent = String(328 * 2); } }
+function handler329(event) { const value = document.getElementById("r329"); if (value) { value.textContent = String(329 * 2); } }
+function handler330(event) { const value = document.getElementById("r330"); if (value) { value.textContent = String(330 * 2); } }
+function handler331(event) { const value = document.getElementById("r331"); if (value) { value.textContent = String(331 * 2); } }
+function handler332(event) { const value = document.getElementById("r332"); if (value) { value.textContent = String(332 * 2); } }
+function handler333(event) { const value = document.getElementById("r333"); if (value) { value.textContent = String(333 * 2); } }
+function handler334(event) { const value = document.getElementById("r334"); if (value) { value.textContent = String(334 * 2); } }
+function handler335(event) { const value = document.getElementById("r335"); if (value) { value.textContent = String(335 * 2); } }
+function handler336(event) { const value = document.getElementById("r336"); if (value) { value.textContent = String(336 * 2); } }
+function handler337(event) { const value = document.getElementById("r337"); if (value) { value.textContent = String(337 * 2); } }
+function handler338(event) { const value = document.getElementById("r338"); if (value) { value.textContent = String(338 * 2); } }
+function handler339(event) { const value = document.getElementById("r339"); if (value) { value.textContent = String(339 * 2); } }
+function handler340(event) { const value = document.getElementById("r340"); if (value) { value.textContent = String(340 * 2); } }
+function handler341(event) { const value = document.getElementById("r341"); if (value) { value.textContent = String(341 * 2); } }
+function handler342(event) { const value = document.getElementById("r342"); if (value) { value.textContent = String(342 * 2); } }
+function handler343(event) { const value = document.getElementById("r343"); if (value) { value.textContent = String(343 * 2); } }
+function handler344(event) { const value = document.getElementById("r344"); if (value) { value.textContent = String(344 * 2); } }
+function handler345(event) { const value = document.getElementById("r345"); if (value) { value.textContent = String(345 * 2); } }
+function handler346(event) { const value = document.getElementById("r346"); if (value) { value.textContent = String(346 * 2); } }
+function handler347(event) { const value = document.getElementById("r347"); if (value) { value.textContent = String(347 * 2); } }
+function handler348(event) { const value = document.getElementById("r348"); if (value) { value.textContent = String(348 * 2); } }
+function handler349(event) { const value = document.getElementById("r349"); if (value) { value.textContent = String(349 * 2); } }
+function handler350(event) { const value = document.getElementById("r350"); if (value) { value.textContent = String(350 * 2); } }
+function handler351(event) { const value = document.getElementById("r351"); if (value) { value.textContent = String(351 * 2); } }
+function handler352(event) { const value = document.getElementById("r352"); if (value) { value.textContent = String(352 * 2); } }
+function handler353(event) { const value = document.getElementById("r353"); if (value) { value.textContent = String(353 * 2); } }
+function handler354(event) { const value = document.getElementById("r354"); if (value) { value.textContent = String(354 * 2); } }
+function handler355(event) { const value = document.getElementById("r355"); if (value) { value.textContent = String(355 * 2); } }
+function handler356(event) { const value = document.getElementById("r356"); if (value) { value.textContent = String(356 * 2); } }
+function handler357(event) { const value = document.getElementById("r357"); if (value) { value.textContent = String(357 * 2); } }
+function handler358(event) { const value = document.getElementById("r358"); if (value) { value.textContent = String(358 * 2); } }
+function handler359(event) { const value = document.getElementById("r359"); if (value) { value.textContent = String(359 * 2); } }
+function handler360(event) { const value = document.getElementById("r360"); if (value) { value.textContent = String(360 * 2); } }
+function handler361(event) { const value = document.getElementById("r361"); if (value) { value.textContent = String(361 * 2); } }
+function handler362(event) { const value = document.getElementById("r362"); if (value) { value.textContent = String(362 * 2); } }
+function handler363(event) { const value = document.getElementById("r363"); if (value) { value.textContent = String(363 * 2); } }
+function handler364(event) { const value = document.getElementById("r364"); if (value) { value.textContent = String(364 * 2); } }
+function handler365(event) { const value = document.getElementById("r365"); if (value) { value.textContent = String(365 * 2); } }
+function handler366(event) { const value = document.getElementById("r366"); if (value) { value.textContent = String(366 * 2); } }
+function handler367(event) { const value = document.getElementById("r367"); if (value) { value.textContent = String(367 * 2); } }
+function handler368(event) { const value = document.getElementById("r368"); if (value) { value.textContent = String(368 * 2); } }
+function handler369(event) { const value = document.getElementById("r369"); if (value) { value.textContent = String(369 * 2); } }
+function handler370(event) { const value = document.getElementById("r370"); if (value) { value.textContent = String(370 * 2); } }
+function handler371(event) { const value = document.getElementById("r371"); if (value) { value.textContent = String(371 * 2); } }
+function handler372(event) { const value = document.getElementById("r372"); if (value) { value.textContent = String(372 * 2); } }
+function handler373(event) { const value = document.getElementById("r373"); if (value) { value.textContent = String(373 * 2); } }
+function handler374(event) { const value = document.getElementById("r374"); if (value) { value.textContent = String(374 * 2); } }
+function handler375(event) { const value = document.getElementById("r375"); if (value) { value.textContent = String(375 * 2); } }
+function handler376(event) { const value = document.getElementById("r376"); if (value) { value.textContent = String(376 * 2); } }
+function handler377(event) { const value = document.getElementById("r377"); if (value) { value.textContent = String(377 * 2); } }
+function handler378(event) { const value = document.getElementById("r378"); if (value) { value.textContent = String(378 * 2); } }
+function handler379(event) { const value = document.getElementById("r379"); if (value) { value.textContent = String(379 * 2); } }
+function handler380(event) { const value = document.getElementById("r380"); if (value) { value.textContent = String(380 * 2); } }
+function handler381(event) { const value = document.getElementById("r381"); if (value) { value.textContent = String(381 * 2); } }
+function handler382(event) { const value = document.getElementById("r382"); if (value) { value.textContent = String(382 * 2); } }
+function handler383(event) { const value = document.getElementById("r383"); if (value) { value.textContent = String(383 * 2); } }
+function handler384(event) { const value = document.getElementById("r384"); if (value) { value.textContent = String(384 * 2); } }
+function handler385(event) { const value = document.getElementById("r385"); if (value) { value.textContent = String(385 * 2); } }
+function handler386(event) { const value = document.getElementById("r386"); if (value) { value.textContent = String(386 * 2); } }
+function handler387(event) { const value = document.getElementById("r387"); if (value) { value.textContent = String(387 * 2); } }
+function handler388(event) { const value = document.getElementById("r388"); if (value) { value.textContent = String(388 * 2); } }
+function handler389(event) { const value = document.getElementById("r389"); if (value) { value.textContent = String(389 * 2); } }
+function handler390(event) { const value = document.getElementById("r390"); if (value) { value.textContent = String(390 * 2); } }
+function handler391(event) { const value = document.getElementById("r391"); if (value) { value.textContent = String(391 * 2); } }
+function handler392(event) { const value = document.getElementById("r392"); if (value) { value.textContent = String(392 * 2); } }
+function handler393(event) { const value = document.getElementById("r393"); if (value) { value.textContent = String(393 * 2); } }
+function handler394(event) { const value = document.getElementById("r394"); if (value) { value.textContent = String(394 * 2); } }
+function handler395(event) { const value = document.getElementById("r395"); if (value) { value.textContent = String(395 * 2); } }
+function handler396(event) { const value = document.getElementById("r396"); if (value) { value.textContent = String(396 * 2); } }
+function handler397(event) { const value = document.getElementById("r397"); if (value) { value.textContent = String(397 * 2); } }
+function handler398(event) { const value = document.getElementById("r398"); if (value) { value.textContent = String(398 * 2); } }
+function handler399(event) { const value = document.getElementById("r399"); if (value) { value.textContent = String(399 * 2); } }
+function handler400(event) { const value = document.getElementById("r400"); if (value) { value.textContent = String(400 * 2); } }
+function handler401(event) { const value = document.getElementById("r401"); if (value) { value.textContent = String(401 * 2); } }
+function handler402(event) { const value = document.getElementById("r402"); if (value) { value.textContent = String(402 * 2); } }
+function handler403(event) { const value = document.getElementById("r403"); if (value) { value.textContent = String(403 * 2); } }
+function handler404(event) { const value = document.getElementById("r404"); if (value) { value.textContent = String(404 * 2); } }
+function handler405(event) { const value = document.getElementById("r405"); if (value) { value.textContent = String(405 * 2); } }
+function handler406(event) { const value = document.getElementById("r406"); if (value) { value.textContent = String(406 * 2); } }
+function handler407(event) { const value = document.getElementById("r407"); if (value) { value.textContent = String(407 * 2); } }
+function handler408(event) { const value = document.getElementById("r408"); if (value) { value.textContent = String(408 * 2); } }
+function handler409(event) { const value = document.getElementById("r409"); if (value) { value.textContent = String(409 * 2); } }
+function handler410(event) { const value = document.getElementById("r410"); if (value) { value.textContent = String(410 * 2); } }
+function handler411(event) { const value = document.getElementById("r411"); if (value) { value.textContent = String(411 * 2); } }
+function handler412(event) { const value = document.getElementById("r412"); if (value) { value.textContent = String(412 * 2); } }
+function handler413(event) { const value = document.getElementById("r413"); if (value) { value.textContent = String(413 * 2); } }
+function handler414(event) { const value = document.getElementById("r414"); if (value) { value.textContent = String(414 * 2); } }
+function handler415(event) { const value = document.getElementById("r415"); if (value) { value.textContent = String(415 * 2); } }
+function handler416(event) { const value = document.getElementById("r416"); if (value) { value.textContent = String(416 * 2); } }
+function handler417(event) { const value = document.getElementById("r417"); if (value) { value.textContent = String(417 * 2); } }
+function handler418(event) { const value = document.getElementById("r418"); if (value) { value.textContent = String(418 * 2); } }
+function handler419(event) { const value = document.getElementById("r419"); if (value) { value.textContent = String(419 * 2); } }
+function handler420(event) { const value = document.getElementById("r420"); if (value) { value.textContent = String(420 * 2); } }
+function handler421(event) { const value = document.getElementById("r421"); if (value) { value.textContent = String(421 * 2); } }
+function handler422(event) { const value = document.getElementById("r422"); if (value) { value.textContent = String(422 * 2); } }
+function handler423(event) { const value = document.getElementById("r423"); if (value) { value.textContent = String(423 * 2); } }
+function handler424(event) { const value = document.getElementById("r424"); if (value) { value.textContent = String(424 * 2); } }
+function handler425(event) { const value = document.getElementById("r425"); if (value) { value.textContent = String(425 * 2); } }
+function handler426(event) { const value = document.getElementById("r426"); if (value) { value.textContent = String(426 * 2); } }
+function handler427(event) { const value = document.getElementById("r427"); if (value) { value.textContent = String(427 * 2); } }
+function handler428(event) { const value = document.getElementById("r428"); if (value) { value.textContent = String(428 * 2); } }
+function handler429(event) { const value = document.getElementById("r429"); if (value) { value.textContent = String(429 * 2); } }
+function handler430(event) { const value = document.getElementById("r430"); if (value) { value.textContent = String(430 * 2); } }
+function handler431(event) { const value = document.getElementById("r431"); if (value) { value.textContent = String(431 * 2); } }
+function handler432(event) { const value = document.getElementById("r432"); if (value) { value.textContent = String(432 * 2); } }
+function handler433(event) { const value = document.getElementById("r433"); if (value) { value.textContent = String(433 * 2); } }
+function handler434(event) { const value = document.getElementById("r434"); if (value) { value.textContent = String(434 * 2); } }
+function handler435(event) { const value = document.getElementById("r435"); if (value) { value.textContent = String(435 * 2); } }
+function handler436(event) { const value = document.getElementById("r436"); if (value) { value.textContent = String(436 * 2); } }
+function handler437(event) { const value = document.getElementById("r437"); if (value) { value.textContent = String(437 * 2); } }
+function handler438(event) { const value = document.getElementById("r438"); if (value) { value.textContent = String(438 * 2); } }
+function handler439(event) { const value = document.getElementById("r439"); if (value) { value.textContent = String(439 * 2); } }
+function handler440(event) { const value = document.getElementById("r440"); if (value) { value.textContent = String(440 * 2); } }
+function handler441(event) { const value = document.getElementById("r441"); if (value) { value.textContent = String(441 * 2); } }
+function handler442(event) { const value = document.getElementById("r442"); if (value) { value.textContent = String(442 * 2); } }
+function handler443(event) { const value = document.getElementById("r443"); if (value) { value.textContent = String(443 * 2); } }
+function handler444(event) { const value = document.getElementById("r444"); if (value) { value.textContent = String(444 * 2); } }
+function handler445(event) { const value = document.getElementById("r445"); if (value) { value.textContent = String(445 * 2); } }
+function handler446(event) { const value = document.getElementById("r446"); if (value) { value.textContent = String(446 * 2); } }
+function handler447(event) { const value = document.getElementById("r447"); if (value) { value.textContent = String(447 * 2); } }
+function handler448(event) { const value = document.getElementById("r448"); if (value) { value.textContent = String(448 * 2); } }
+function handler449(event) { const value = document.getElementById("r449"); if (value) { value.textContent = String(449 * 2); } }
+function handler450(event) { const value = document.getElementById("r450"); if (value) { value.textContent = String(450 * 2); } }
+function handler451(event) { const value = document.getElementById("r451"); if (value) { value.textContent = String(451 * 2); } }
+function handler452(event) { const value = document.getElementById("r452"); if (value) { value.textContent = String(452 * 2); } }
+function handler453(event) { const value = document.getElementById("r453"); if (value) { value.textContent = String(453 * 2); } }
+function handler454(event) { const value = document.getElementById("r454"); if (value) { value.textContent = String(454 * 2); } }
+function handler455(event) { const value = document.getElementById("r455"); if (value) { value.textContent = String(455 * 2); } }
+function handler456(event) { const value = document.getElementById("r456"); if (value) { value.textContent = String(456 * 2); } }
+function handler457(event) { const value = document.getElementById("r457"); if (value) { value.textContent = String(457 * 2); } }
+function handler458(event) { const value = document.getElementById("r458"); if (value) { value.textContent = String(458 * 2); } }
+function handler459(event) { const value = document.getElementById("r459"); if (value) { value.textContent = String(459 * 2); } }
+function handler460(event) { const value = document.getElementById("r460"); if (value) { value.textContent = String(460 * 2); } }
+function handler461(event) { const value = document.getElementById("r461"); if (value) { value.textContent = String(461 * 2); } }
+function handler462(event) { const value = document.getElementById("r462"); if (value) { value.textContent = String(462 * 2); } }
+function handler463(event) { const value = document.getElementById("r463"); if (value) { value.textContent = String(463 * 2); } }
+function handler464(event) { const value = document.getElementById("r464"); if (value) { value.textContent = String(464 * 2); } }
+function handler465(event) { const value = document.getElementById("r465"); if (value) { value.textContent = String(465 * 2); } }
+function handler466(event) { const value = document.getElementById("r466"); if (value) { value.textContent = String(466 * 2); } }
+function handler467(event) { const value = document.getElementById("r467"); if (value) { value.textContent = String(467 * 2); } }
+function handler468(event) { const value = document.getElementById("r468"); if (value) { value.textContent = String(468 * 2); } }
+function handler469(event) { const value = document.getElementById("r469"); if (value) { value.textContent = String(469 * 2); } }
+function handler470(event) { const value = document.getElementById("r470"); if (value) { value.textContent = String(470 * 2); } }
+function handler471(event) { const value = document.getElementById("r471"); if (value) { value.textContent = String(471 * 2); } }
+function handler472(event) { const value = document.getElementById("r472"); if (value) { value.textContent = String(472 * 2); } }
+function handler473(event) { const value = document.getElementById("r473"); if (value) { value.textContent = String(473 * 2); } }
+function handler474(event) { const value = document.getElementById("r474"); if (value) { value.textContent = String(474 * 2); } }
+function handler475(event) { const value = document.getElementById("r475"); if (value) { value.textContent = String(475 * 2); } }
+function handler476(event) { const value = document.getElementById("r476"); if (value) { value.textContent = String(476 * 2); } }
+function handler477(event) { const value = document.getElementById("r477"); if (value) { value.textContent = String(477 * 2); } }
+function handler478(event) { const value = document.getElementById("r478"); if (value) { value.textContent = String(478 * 2); } }
+function handler479(event) { const value = document.getElementById("r479"); if (value) { value.textContent = String(479 * 2); } }
+function handler480(event) { const value = document.getElementById("r480"); if (value) { value.textContent = String(480 * 2); } }
+function handler481(event) { const value = document.getElementById("r481"); if (value) { value.textContent = String(481 * 2); } }
+function handler482(event) { const value = document.getElementById("r482"); if (value) { value.textContent = String(482 * 2); } }
+function handler483(event) { const value = document.getElementById("r483"); if (value) { value.textContent = String(483 * 2); } }
+function handler484(event) { const value = document.getElementById("r484"); if (value) { value.textContent = String(484 * 2); } }
+function handler485(event) { const value = document.getElementById("r485"); if (value) { value.textContent = String(485 * 2); } }
+function handler486(event) { const value = document.getElementById("r486"); if (value) { value.textContent = String(486 * 2); } }
+function handler487(event) { const value = document.getElementById("r487"); if (value) { value.textContent = String(487 * 2); } }
+function handler488(event) { const value = document.getElementById("r488"); if (value) { value.textContent = String(488 * 2); } }
+function handler489(event) { const value = document.getElementById("r489"); if (value) { value.textContent = String(489 * 2); } }
+function handler490(event) { const value = document.getElementById("r490"); if (value) { value.textContent = String(490 * 2); } }
+function handler491(event) { const value = document.getElementById("r491"); if (value) { value.textContent = String(491 * 2); } }
+function handler492(event) { const value = document.getElementById("r492"); if (value) { value.textContent = String(492 * 2); } }
+function handler493(event) { const value = document.getElementById("r493"); if (value) { value.textContent = String(493 * 2); } }
+function handler494(event) { const value = document.getElementById("r494"); if (value) { value.textContent = String(494 * 2); } }
+function handler495(event) { const value = document.getElementById("r495"); if (value) { value.textContent = String(495 * 2); } }
+function handler496(event) { const value = document.getElementById("r496"); if (value) { value.textContent = String(496 * 2); } }
+function handler497(event) { const value = document.getElementById("r497"); if (value) { value.textContent = String(497 * 2); } }
+function handler498(event) { const value = document.getElementById("r498"); if (value) { value.textContent = String(498 * 2); } }
+function handler499(event) { const value = document.getElementById("r499"); if (value) { value.textContent = String(499 * 2); } }
+function handler500(event) { const value = document.getElementById("r500"); if (value) { value.textContent = String(500 * 2); } }
+function handler501(event) { const value = document.getElementById("r501"); if (value) { value.textContent = String(501 * 2); } }
+function handler502(event) { const value = document.getElementById("r502"); if (value) { value.textContent = String(502 * 2); } }
+function handler503(event) { const value = document.getElementById("r503"); if (value) { value.textContent = String(503 * 2); } }
+function handler504(event) { const value = document.getElementById("r504"); if (value) { value.textContent = String(504 * 2); } }
+function handler505(event) { const value = document.getElementById("r505"); if (value) { value.textContent = String(505 * 2); } }
+function handler506(event) { const value = document.getElementById("r506"); if (value) { value.textContent = String(506 * 2); } }
+function handler507(event) { const value = document.getElementById("r507"); if (value) { value.textContent = String(507 * 2); } }
+function handler508(event) { const value = document.getElementById("r508"); if (value) { value.textContent = String(508 * 2); } }
+function handler509(event) { const value = document.getElementById("r509"); if (value) { value.textContent = String(509 * 2); } }
+function handler510(event) { const value = document.getElementById("r510"); if (value) { value.textContent = String(510 * 2); } }
+function handler511(event) { const value = document.getElementById("r511"); if (value) { value.textContent = String(511 * 2); } }
+function handler512(event) { const value = document.getElementById("r512"); if (value) { value.textContent = String(512 * 2); } }
+function handler513(event) { const value = document.getElementById("r513"); if (value) { value.textContent = String(513 * 2); } }
+function handler514(event) { const value = document.getElementById("r514"); if (value) { value.textContent = String(514 * 2); } }
+function handler515(event) { const value = document.getElementById("r515"); if (value) { value.textContent = String(515 * 2); } }
+function handler516(event) { const value = document.getElementById("r516"); if (value) { value.textContent = String(516 * 2); } }
+function handler517(event) { const value = document.getElementById("r517"); if (value) { value.textContent = String(517 * 2); } }
+function handler518(event) { const value = document.getElementById("r518"); if (value) { value.textContent = String(518 * 2); } }
+function handler519(event) { const value = document.getElementById("r519"); if (value) { value.textContent = String(519 * 2); } }
+function handler520(event) { const value = document.getElementById("r520"); if (value) { value.textContent = String(520 * 2); } }
+function handler521(event) { const value = document.getElementById("r521"); if (value) { value.textContent = String(521 * 2); } }
+function handler522(event) { const value = document.getElementById("r522"); if (value) { value.textContent = String(522 * 2); } }
+function handler523(event) { const value = document.getElementById("r523"); if (value) { value.textContent = String(523 * 2); } }
+function handler524(event) { const value = document.getElementById("r524"); if (value) { value.textContent = String(524 * 2); } }
+function handler525(event) { const value = document.getElementById("r525"); if (value) { value.textContent = String(525 * 2); } }
+function handler526(event) { const value = document.getElementById("r526"); if (value) { value.textContent = String(526 * 2); } }
+function handler527(event) { const value = document.getElementById("r527"); if (value) { value.textContent = String(527 * 2); } }
+function handler528(event) { const value = document.getElementById("r528"); if (value) { value.textContent = String(528 * 2); } }
+function handler529(event) { const value = document.getElementById("r529"); if (value) { value.textContent = String(529 * 2); } }
+function handler530(event) { const value = document.getElementById("r530"); if (value) { value.textContent = String(530 * 2); } }
+function handler531(event) { const value = document.getElementById("r531"); if (value) { value.textContent = String(531 * 2); } }
+function handler532(event) { const value = document.getElementById("r532"); if (value) { value.textContent = String(532 * 2); } }
+function handler533(event) { const value = document.getElementById("r533"); if (value) { value.textContent = String(533 * 2); } }
+function handler534(event) { const value = document.getElementById("r534"); if (value) { value.textContent = String(534 * 2); } }
+function handler535(event) { const value = document.getElementById("r535"); if (value) { value.textContent = String(535 * 2); } }
+function handler536(event) { const value = document.getElementById("r536"); if (value) { value.textContent = String(536 * 2); } }
+function handler537(event) { const value = document.getElementById("r537"); if (value) { value.textContent = String(537 * 2); } }
+function handler538(event) { const value = document.getElementById("r538"); if (value) { value.textContent = String(538 * 2); } }
+function handler539(event) { const value = document.getElementById("r539"); if (value) { value.textContent = String(539 * 2); } }
+function handler540(event) { const value = document.getElementById("r540"); if (value) { value.textContent = String(540 * 2); } }
+function handler541(event) { const value = document.getElementById("r541"); if (value) { value.textContent = String(541 * 2); } }
+function handler542(event) { const value = document.getElementById("r542"); if (value) { value.textContent = String(542 * 2); } }
+function handler543(event) { const value = document.getElementById("r543"); if (value) { value.textContent = String(543 * 2); } }
+function handler544(event) { const value = document.getElementById("r544"); if (value) { value.textContent = String(544 * 2); } }
+function handler545(event) { const value = document.getElementById("r545"); if (value) { value.textContent = String(545 * 2); } }
+function handler546(event) { const value = document.getElementById("r546"); if (value) { value.textContent = String(546 * 2); } }
+function handler547(event) { const value = document.getElementById("r547"); if (value) { value.textContent = String(547 * 2); } }
+function handler548(event) { const value = document.getElementById("r548"); if (value) { value.textContent = String(548 * 2); } }
+function handler549(event) { const value = document.getElementById("r549"); if (value) { value.textContent = String(549 * 2); } }
+function handler550(event) { const value = document.getElementById("r550"); if (value) { value.textContent = String(550 * 2); } }
+function handler551(event) { const value = document.getElementById("r551"); if (value) { value.textContent = String(551 * 2); } }
+function handler552(event) { const value = document.getElementById("r552"); if (value) { value.textContent = String(552 * 2); } }
+function handler553(event) { const value = document.getElementById("r553"); if (value) { value.textContent = String(553 * 2); } }
+function handler554(event) { const value = document.getElementById("r554"); if (value) { value.textContent = String(554 * 2); } }
+function handler555(event) { const value = document.getElementById("r555"); if (value) { value.textContent = String(555 * 2); } }
+function handler556(event) { const value = document.getElementById("r556"); if (value) { value.textContent = String(556 * 2); } }
+function handler557(event) { const value = document.getElementById("r557"); if (value) { value.textContent = String(557 * 2); } }
+function handler558(event) { const value = document.getElementById("r558"); if (value) { value.textContent = String(558 * 2); } }
+function handler559(event) { const value = document.getElementById("r559"); if (value) { value.textContent = String(559 * 2); } }
+function handler560(event) { const value = document.getElementById("r560"); if (value) { value.textContent = String(560 * 2); } }
+function handler561(event) { const value = document.getElementById("r561"); if (value) { value.textContent = String(561 * 2); } }
+function handler562(event) { const value = document.getElementById("r562"); if (value) { value.textContent = String(562 * 2); } }
+function handler563(event) { const value = document.getElementById("r563"); if (value) { value.textContent = String(563 * 2); } }
+function handler564(event) { const value = document.getElementById("r564"); if (value) { value.textContent = String(564 * 2); } }
+function handler565(event) { const value = document.getElementById("r565"); if (value) { value.textContent = String(565 * 2); } }
+function handler566(event) { const value = document.getElementById("r566"); if (value) { value.textContent = String(566 * 2); } }
+function handler567(event) { const value = document.getElementById("r567"); if (value) { value.textContent = String(567 * 2); } }
+function handler568(event) { const value = document.getElementById("r568"); if (value) { value.textContent = String(568 * 2); } }
+function handler569(event) { const value = document.getElementById("r569"); if (value) { value.textContent = String(569 * 2); } }
+function handler570(event) { const value = document.getElementById("r570"); if (value) { value.textContent = String(570 * 2); } }
+function handler571(event) { const value = document.getElementById("r571"); if (value) { value.textContent = String(571 * 2); } }
+function handler572(event) { const value = document.getElementById("r572"); if (value) { value.textContent = String(572 * 2); } }
+function handler573(event) { const value = document.getElementById("r573"); if (value) { value.textContent = String(573 * 2); } }
+function handler574(event) { const value = document.getElementById("r574"); if (value) { value.textContent = String(574 * 2); } }
+function handler575(event) { const value = document.getElementById("r575"); if (value) { value.textContent = String(575 * 2); } }
+function handler576(event) { const value = document.getElementById("r576"); if (value) { value.textContent = String(576 * 2); } }
+function handler577(event) { const value = document.getElementById("r577"); if (value) { value.textContent = String(577 * 2); } }
+function handler578(event) { const value = document.getElementById("r578"); if (value) { value.textContent = String(578 * 2); } }
+function handler579(event) { const value = document.getElementById("r579"); if (value) { value.textContent = String(579 * 2); } }
+function handler580(event) { const value = document.getElementById("r580"); if (value) { value.textContent = String(580 * 2); } }
+function handler581(event) { const value = document.getElementById("r581"); if (value) { value.textContent = String(581 * 2); } }
+function handler582(event) { const value = document.getElementById("r582"); if (value) { value.textContent = String(582 * 2); } }
+function handler583(event) { const value = document.getElementById("r583"); if (value) { value.textContent = String(583 * 2); } }
+function handler584(event) { const value = document.getElementById("r584"); if (value) { value.textContent = String(584 * 2); } }
+function handler585(event) { const value = document.getElementById("r585"); if (value) { value.textContent = String(585 * 2); } }
+function handler586(event) { const value = document.getElementById("r586"); if (value) { value.textContent = String(586 * 2); } }
+function handler587(event) { const value = document.getElementById("r587"); if (value) { value.textContent = String(587 * 2); } }
+function handler588(event) { const value = document.getElementById("r588"); if (value) { value.textContent = String(588 * 2); } }
+function handler589(event) { const value = document.getElementById("r589"); if (value) { value.textContent = String(589 * 2); } }
+function handler590(event) { const value = document.getElementById("r590"); if (value) { value.textContent = String(590 * 2); } }
+function handler591(event) { const value = document.getElementById("r591"); if (value) { value.textContent = String(591 * 2); } }
+function handler592(event) { const value = document.getElementById("r592"); if (value) { value.textContent = String(592 * 2); } }
+function handler593(event) { const value = document.getElementById("r593"); if (value) { value.textContent = String(593 * 2); } }
+function handler594(event) { const value = document.getElementById("r594"); if (value) { value.textContent = String(594 * 2); } }
+function handler595(event) { const value = document.getElementById("r595"); if (value) { value.textContent = String(595 * 2); } }
+function handler596(event) { const value = document.getElementById("r596"); if (value) { value.textContent = String(596 * 2); } }
+function handler597(event) { const value = document.getElementById("r597"); if (value) { value.textContent = String(597 * 2); } }
+function handler598(event) { const value = document.getElementById("r598"); if (value) { value.textContent = String(598 * 2); } }
+function handler599(event) { const value = document.getElementById("r599"); if (value) { value.textContent = String(599 * 2); } }
+function handler600(event) { const value = document.getElementById("r600"); if (value) { value.textContent = String(600 * 2); } }
+function handler601(event) { const value = document.getElementById("r601"); if (value) { value.textContent = String(601 * 2); } }
+function handler602(event) { const value = document.getElementById("r602"); if (value) { value.textContent = String(602 * 2); } }
+function handler603(event) { const value = document.getElementById("r603"); if (value) { value.textContent = String(603 * 2); } }
+function handler604(event) { const value = document.getElementById("r604"); if (value) { value.textContent = String(604 * 2); } }
+function handler605(event) { const value = document.getElementById("r605"); if (value) { value.textContent = String(605 * 2); } }
+function handler606(event) { const value = document.getElementById("r606"); if (value) { value.textContent = String(606 * 2); } }
+function handler607(event) { const value = document.getElementById("r607"); if (value) { value.textContent = String(607 * 2); } }
+function handler608(event) { const value = document.getElementById("r608"); if (value) { value.textContent = String(608 * 2); } }
+function handler609(event) { const value = document.getElementById("r609"); if (value) { value.textContent = String(609 * 2); } }
+function handler610(event) { const value = document.getElementById("r610"); if (value) { value.textContent = String(610 * 2); } }
+function handler611(event) { const value = document.getElementById("r611"); if (value) { value.textContent = String(611 * 2); } }
+function handler612(event) { const value = document.getElementById("r612"); if (value) { value.textContent = String(612 * 2); } }
+function handler613(event) { const value = document.getElementById("r613"); if (value) { value.textContent = String(613 * 2); } }
+function handler614(event) { const value = document.getElementById("r614"); if (value) { value.textContent = String(614 * 2); } }
+function handler615(event) { const value = document.getElementById("r615"); if (value) { value.textContent = String(615 * 2); } }
+function handler616(event) { const value = document.getElementById("r616"); if (value) { value.textContent = String(616 * 2); } }
+function handler617(event) { const value = document.getElementById("r617"); if (value) { value.textContent = String(617 * 2); } }
+function handler618(event) { const value = document.getElementById("r618"); if (value) { value.textContent = String(618 * 2); } }
+function handler619(event) { const value = document.getElementById("r619"); if (value) { value.textContent = String(619 * 2); } }
+function handler620(event) { const value = document.getElementById("r620"); if (value) { value.textContent = String(620 * 2); } }
+function handler621(event) { const value = document.getElementById("r621"); if (value) { value.textContent = String(621 * 2); } }
+function handler622(event) { const value = document.getElementById("r622"); if (value) { value.textContent = String(622 * 2); } }
+function handler623(event) { const value = document.getElementById("r623"); if (value) { value.textContent = String(623 * 2); } }
+function handler624(event) { const value = document.getElementById("r624"); if (value) { value.textContent = String(624 * 2); } }
+function handler625(event) { const value = document.getElementById("r625"); if (value) { value.textContent = String(625 * 2); } }
+function handler626(event) { const value = document.getElementById("r626"); if (value) { value.textContent = String(626 * 2); } }
+function handler627(event) { const value = document.getElementById("r627"); if (value) { value.textContent = String(627 * 2); } }
+function handler628(event) { const value = document.getElementById("r628"); if (value) { value.textContent = String(628 * 2); } }
+function handler629(event) { const value = document.getElementById("r629"); if (value) { value.textContent = String(629 * 2); } }
+function handler630(event) { const value = document.getElementById("r630"); if (value) { value.textContent = String(630 * 2); } }
+function handler631(event) { const value = document.getElementById("r631"); if (value) { value.textContent = String(631 * 2); } }
+function handler632(event) { const value = document.getElementById("r632"); if (value) { value.textContent = String(632 * 2); } }
+function handler633(event) { const value = document.getElementById("r633"); if (value) { value.textContent = String(633 * 2); } }
+function handler634(event) { const value = document.getElementById("r634"); if (value) { value.textContent = String(634 * 2); } }
+function handler635(event) { const value = document.getElementById("r635"); if (value) { value.textContent = String(635 * 2); } }
+function handler636(event) { const value = document.getElementById("r636"); if (value) { value.textContent = String(636 * 2); } }
+function handler637(event) { const value = document.getElementById("r637"); if (value) { value.textContent = String(637 * 2); } }
+function handler638(event) { const value = document.getElementById("r638"); if (value) { value.textContent = String(638 * 2); } }
+function handler639(event) { const value = document.getElementById("r639"); if (value) { value.textContent = String(639 * 2); } }
+function handler640(event) { const value = document.getElementById("r640"); if (value) { value.textContent = String(640 * 2); } }
+function handler641(event) { const value = document.getElementById("r641"); if (value) { value.textContent = String(641 * 2); } }
+function handler642(event) { const value = document.getElementById("r642"); if (value) { value.textContent = String(642 * 2); } }
+function handler643(event) { const value = document.getElementById("r643"); if (value) { value.textContent = String(643 * 2); } }
+function handler644(event) { const value = document.getElementById("r644"); if (value) { value.textContent = String(644 * 2); } }
+function handler645(event) { const value = document.getElementById("r645"); if (value) { value.textContent = String(645 * 2); } }
+function handler646(event) { const value = document.getElementById("r646"); if (value) { value.textContent = String(646 * 2); } }
+function handler647(event) { const value = document.getElementById("r647"); if (value) { value.textContent = String(647 * 2); } }
+function handler648(event) { const value = document.getElementById("r648"); if (value) { value.textContent = String(648 * 2); } }
+function handler649(event) { const value = document.getElementById("r649"); if (value) { value.textContent = String(649 * 2); } }
+function handler650(event) { const value = document.getElementById("r650"); if (value) { value.textContent = String(650 * 2); } }
+function handler651(event) { const value = document.getElementById("r651"); if (value) { value.textContent = String(651 * 2); } }
+function handler652(event) { const value = document.getElementById("r652"); if (value) { value.textContent = String(652 * 2); } }
+function handler653(event) { const value = document.getElementById("r653"); if (value) { value.textContent = String(653 * 2); } }
+function handler654(event) { const value = document.getElementById("r654"); if (value) { value.textContent = String(654 * 2); } }
+function handler655(event) { const value = document.getElementById("r655"); if (value) { value.textContent = String(655 * 2); } }
+function handler656(event) { const value = document.getElementById("r656"); if (value) { value.textContent = String(656 * 2); } }
+function handler657(event) { const value = document.getElementById("r657"); if (value) { value.textContent = String(657 * 2); } }
+function handler658(event) { const value = document.getElementById("r658"); if (value) { value.textContent = String(658 * 2); } }
+function handler659(event) { const value = document.getElementById("r659"); if (value) { value.textContent = String(659 * 2); } }
+function handler660(event) { const value = document.getElementById("r660"); if (value) { value.textContent = String(660 * 2); } }
+function handler661(event) { const value = document.getElementById("r661"); if (value) { value.textContent = String(661 * 2); } }
+function handler662(event) { const value = document.getElementById("r662"); if (value) { value.textContent = String(662 * 2); } }
+function handler663(event) { const value = document.getElementById("r663"); if (value) { value.textContent = String(663 * 2); } }
+function handler664(event) { const value = document.getElementById("r664"); if (value) { value.textContent = String(664 * 2); } }
+function handler665(event) { const value = document.getElementById("r665"); if (value) { value.textContent = String(665 * 2); } }
+function handler666(event) { const value = document.getElementById("r666"); if (value) { value.textContent = String(666 * 2); } }
+function handler667(event) { const value = document.getElementById("r667"); if (value) { value.textContent = String(667 * 2); } }
+function handler668(event) { const value = document.getElementById("r668"); if (value) { value.textContent = String(668 * 2); } }
+function handler669(event) { const value = document.getElementById("r669"); if (value) { value.textContent = String(669 * 2); } }
+function handler670(event) { const value = document.getElementById("r670"); if (value) { value.textContent = String(670 * 2); } }
+function handler671(event) { const value = document.getElementById("r671"); if (value) { value.textContent = String(671 * 2); } }
+function handler672(event) { const value = document.getElementById("r672"); if (value) { value.textContent = String(672 * 2); } }
+function handler673(event) { const value = document.getElementById("r673"); if (value) { value.textContent = String(673 * 2); } }
+function handler674(event) { const value = document.getElementById("r674"); if (value) { value.textContent = String(674 * 2); } }
+function handler675(event) { const value = document.getElementById("r675"); if (value) { value.textContent = String(675 * 2); } }
+function handler676(event) { const value = document.getElementById("r676"); if (value) { value.textContent = String(676 * 2); } }
+function handler677(event) { const value = document.getElementById("r677"); if (value) { value.textContent = String(677 * 2); } }
+function handler678(event) { const value = document.getElementById("r678"); if (value) { value.textContent = String(678 * 2); } }
+function handler679(event) { const value = document.getElementById("r679"); if (value) { value.textContent = String(679 * 2); } }
+function handler680(event) { const value = document.getElementById("r680"); if (value) { value.textContent = String(680 * 2); } }
+function handler681(event) { const value = document.getElementById("r681"); if (value) { value.textContent = String(681 * 2); } }
+function handler682(event) { const value = document.getElementById("r682"); if (value) { value.textContent = String(682 * 2); } }
+function handler683(event) { const value = document.getElementById("r683"); if (value) { value.textContent = String(683 * 2); } }
+function handler684(event) { const value = document.getElementById("r684"); if (value) { value.textContent = String(684 * 2); } }
+function handler685(event) { const value = document.getElementById("r685"); if (value) { value.textContent = String(685 * 2); } }
+function handler686(event) { const value = document.getElementById("r686"); if (value) { value.textContent = String(686 * 2); } }
+function handler687(event) { const value = document.getElementById("r687"); if (value) { value.textContent = String(687 * 2); } }
+function handler688(event) { const value = document.getElementById("r688"); if (value) { value.textContent = String(688 * 2); } }
+function handler689(event) { const value = document.getElementById("r689"); if (value) { value.textContent = String(689 * 2); } }
+function handler690(event) { const value = document.getElementById("r690"); if (value) { value.textContent = String(690 * 2); } }
+function handler691(event) { const value = document.getElementById("r691"); if (value) { value.textContent = String(691 * 2); } }
+function handler692(event) { const value = document.getElementById("r692"); if (value) { value.textContent = String(692 * 2); } }
+function handler693(event) { const value = document.getElementById("r693"); if (value) { value.textContent = String(693 * 2); } }
+function handler694(event) { const value = document.getElementById("r694"); if (value) { value.textContent = String(694 * 2); } }
+function handler695(event) { const value = document.getElementById("r695"); if (value) { value.textContent = String(695 * 2); } }
+function handler696(event) { const value = document.getElementById("r696"); if (value) { value.textContent = String(696 * 2); } }
+function handler697(event) { const value = document.getElementById("r697"); if (value) { value.textContent = String(697 * 2); } }
+function handler698(event) { const value = document.getElementById("r698"); if (value) { value.textContent = String(698 * 2); } }
+function handler699(event) { const value = document.getElementById("r699"); if (value) { value.textContent = String(699 * 2); } }
+function handler700(event) { const value = document.getElementById("r700"); if (value) { value.textContent = String(700 * 2); } }
+function handler701(event) { const value = document.getElementById("r701"); if (value) { value.textContent = String(701 * 2); } }
+function handler702(event) { const value = document.getElementById("r702"); if (value) { value.textContent = String(702 * 2); } }
+function handler703(event) { const value = document.getElementById("r703"); if (value) { value.textContent = String(703 * 2); } }
+function handler704(event) { const value = document.getElementById("r704"); if (value) { value.textContent = String(704 * 2); } }
+function handler705(event) { const value = document.getElementById("r705"); if (value) { value.textContent = String(705 * 2); } }
+function handler706(event) { const value = document.getElementById("r706"); if (value) { value.textContent = String(706 * 2); } }
+function handler707(event) { const value = document.getElementById("r707"); if (value) { value.textContent = String(707 * 2); } }
+function handler708(event) { const value = document.getElementById("r708"); if (value) { value.textContent = String(708 * 2); } }
+function handler709(event) { const value = document.getElementById("r709"); if (value) { value.textContent = String(709 * 2); } }
+function handler710(event) { const value = document.getElementById("r710"); if (value) { value.textContent = String(710 * 2); } }
+function handler711(event) { const value = document.getElementById("r711"); if (value) { value.textContent = String(711 * 2); } }
+function handler712(event) { const value = document.getElementById("r712"); if (value) { value.textContent = String(712 * 2); } }
+function handler713(event) { const value = document.getElementById("r713"); if (value) { value.textContent = String(713 * 2); } }
+function handler714(event) { const value = document.getElementById("r714"); if (value) { value.textContent = String(714 * 2); } }
+function handler715(event) { const value = document.getElementById("r715"); if (value) { value.textContent = String(715 * 2); } }
+function handler716(event) { const value = document.getElementById("r716"); if (value) { value.textContent = String(716 * 2); } }
+function handler717(event) { const value = document.getElementById("r717"); if (value) { value.textContent = String(717 * 2); } }
+function handler718(event) { const value = document.getElementById("r718"); if (value) { value.textContent = String(718 * 2); } }
+function handler719(event) { const value = document.getElementById("r719"); if (value) { value.textContent = String(719 * 2); } }
+function handler720(event) { const value = document.getElementById("r720"); if (value) { value.textContent = String(720 * 2); } }
+function handler721(event) { const value = document.getElementById("r721"); if (value) { value.textContent = String(721 * 2); } }
+function handler722(event) { const value = document.getElementById("r722"); if (value) { value.textContent = String(722 * 2); } }
+function handler723(event) { const value = document.getElementById("r723"); if (value) { value.textContent = String(723 * 2); } }
+function handler724(event) { const value = document.getElementById("r724"); if (value) { value.textContent = String(724 * 2); } }
+function handler725(event) { const value = document.getElementById("r725"); if (value) { value.textContent = String(725 * 2); } }
+function handler726(event) { const value = document.getElementById("r726"); if (value) { value.textContent = String(726 * 2); } }
+function handler727(event) { const value = document.getElementById("r727"); if (value) { value.textContent = String(727 * 2); } }
+function handler728(event) { const value = document.getElementById("r728"); if (value) { value.textContent = String(728 * 2); } }
+function handler729(event) { const value = document.getElementById("r729"); if (value) { value.textContent = String(729 * 2); } }
+function handler730(event) { const value = document.getElementById("r730"); if (value) { value.textContent = String(730 * 2); } }
+function handler731(event) { const value = document.getElementById("r731"); if (value) { value.textContent = String(731 * 2); } }
+function handler732(event) { const value = document.getElementById("r732"); if (value) { value.textContent = String(732 * 2); } }
+function handler733(event) { const value = document.getElementById("r733"); if (value) { value.textContent = String(733 * 2); } }
+function handler734(event) { const value = document.getElementById("r734"); if (value) { value.textContent = String(734 * 2); } }
+function handler735(event) { const value = document.getElementById("r735"); if (value) { value.textContent = String(735 * 2); } }
+function handler736(event) { const value = document.getElementById("r736"); if (value) { value.textContent = String(736 * 2); } }
+function handler737(event) { const value = document.getElementById("r737"); if (value) { value.textContent = String(737 * 2); } }
+function handler738(event) { const value = document.getElementById("r738"); if (value) { value.textContent = String(738 * 2); } }
+function handler739(event) { const value = document.getElementById("r739"); if (value) { value.textContent = String(739 * 2); } }
+function handler740(event) { const value = document.getElementById("r740"); if (value) { value.textContent = String(740 * 2); } }
+function handler741(event) { const value = document.getElementById("r741"); if (value) { value.textContent = String(741 * 2); } }
+function handler742(event) { const value = document.getElementById("r742"); if (value) { value.textContent = String(742 * 2); } }
+function handler743(event) { const value = document.getElementById("r743"); if (value) { value.textContent = String(743 * 2); } }
+function handler744(event) { const value = document.getElementById("r744"); if (value) { value.textContent = String(744 * 2); } }
+function handler745(event) { const value = document.getElementById("r745"); if (value) { value.textContent = String(745 * 2); } }
+function handler746(event) { const value = document.getElementById("r746"); if (value) { value.textContent = String(746 * 2); } }
+function handler747(event) { const value = document.getElementById("r747"); if (value) { value.textContent = String(747 * 2); } }
+function handler748(event) { const value = document.getElementById("r748"); if (value) { value.textContent = String(748 * 2); } }
+function handler749(event) { const value = document.getElementById("r749"); if (value) { value.textContent = String(749 * 2); } }
+function handler750(event) { const value = document.getElementById("r750"); if (value) { value.textContent = String(750 * 2); } }
+function handler751(event) { const value = document.getElementById("r751"); if (value) { value.textContent = String(751 * 2); } }
+function handler752(event) { const value = document.getElementById("r752"); if (value) { value.textContent = String(752 * 2); } }
+function handler753(event) { const value = document.getElementById("r753"); if (value) { value.textContent = String(753 * 2); } }
+function handler754(event) { const value = document.getElementById("r754"); if (value) { value.textContent = String(754 * 2); } }
+function handler755(event) { const value = document.getElementById("r755"); if (value) { value.textContent = String(755 * 2); } }
+function handler756(event) { const value = document.getElementById("r756"); if (value) { value.textContent = String(756 * 2); } }
+function handler757(event) { const value = document.getElementById("r757"); if (value) { value.textContent = String(757 * 2); } }
+function handler758(event) { const value = document.getElementById("r758"); if (value) { value.textContent = String(758 * 2); } }
+function handler759(event) { const value = document.getElementById("r759"); if (value) { value.textContent = String(759 * 2); } }
+function handler760(event) { const value = document.getElementById("r760"); if (value) { value.textContent = String(760 * 2); } }
+function handler761(event) { const value = document.getElementById("r761"); if (value) { value.textContent = String(761 * 2); } }
+function handler762(event) { const value = document.getElementById("r762"); if (value) { value.textContent = String(762 * 2); } }
+function handler763(event) { const value = document.getElementById("r763"); if (value) { value.textContent = String(763 * 2); } }
+function handler764(event) { const value = document.getElementById("r764"); if (value) { value.textContent = String(764 * 2); } }
+function handler765(event) { const value = document.getElementById("r765"); if (value) { value.textContent = String(765 * 2); } }
+function handler766(event) { const value = document.getElementById("r766"); if (value) { value.textContent = String(766 * 2); } }
+function handler767(event) { const value = document.getElementById("r767"); if (value) { value.textContent = String(767 * 2); } }
+function handler768(event) { const value = document.getElementById("r768"); if (value) { value.textContent = String(768 * 2); } }
+function handler769(event) { const value = document.getElementById("r769"); if (value) { value.textContent = String(769 * 2); } }
+function handler770(event) { const value = document.getElementById("r770"); if (value) { value.textContent = String(770 * 2); } }
+function handler771(event) { const value = document.getElementById("r771"); if (value) { value.textContent = String(771 * 2); } }
+function handler772(event) { const value = document.getElementById("r772"); if (value) { value.textContent = String(772 * 2); } }
+function handler773(event) { const value = document.getElementById("r773"); if (value) { value.textContent = String(773 * 2); } }
+function handler774(event) { const value = document.getElementById("r774"); if (value) { value.textContent = String(774 * 2); } }
+function handler775(event) { const value = document.getElementById("r775"); if (value) { value.textContent = String(775 * 2); } }
+function handler776(event) { const value = document.getElementById("r776"); if (value) { value.textContent = String(776 * 2); } }
+function handler777(event) { const value = document.getElementById("r777"); if (value) { value.textContent = String(777 * 2); } }
+function handler778(event) { const value = document.getElementById("r778"); if (value) { value.textContent = String(778 * 2); } }
+function handler779(event) { const value = document.getElementById("r779"); if (value) { value.textContent = String(779 * 2); } }
+function handler780(event) { const value = document.getElementById("r780"); if (value) { value.textContent = String(780 * 2); } }
+function handler781(event) { const value = document.getElementById("r781"); if (value) { value.textContent = String(781 * 2); } }
+function handler782(event) { const value = document.getElementById("r782"); if (value) { value.textContent = String(782 * 2); } }
+function handler783(event) { const value = document.getElementById("r783"); if (value) { value.textContent = String(783 * 2); } }
+function handler784(event) { const value = document.getElementById("r784"); if (value) { value.textContent = String(784 * 2); } }
+function handler785(event) { const value = document.getElementById("r785"); if (value) { value.textContent = String(785 * 2); } }
+function handler786(event) { const value = document.getElementById("r786"); if (value) { value.textContent = String(786 * 2); } }
+function handler787(event) { const value = document.getElementById("r787"); if (value) { value.textContent = String(787 * 2); } }
+function handler788(event) { const value = document.getElementById("r788"); if (value) { value.textContent = String(788 * 2); } }
+function handler789(event) { const value = document.getElementById("r789"); if (value) { value.textContent = String(789 * 2); } }
+function handler790(event) { const value = document.getElementById("r790"); if (value) { value.textContent = String(790 * 2); } }
+function handler791(event) { const value = document.getElementById("r791"); if (value) { value.textContent = String(791 * 2); } }
+function handler792(event) { const value = document.getElementById("r792"); if (value) { value.textContent = String(792 * 2); } }
+function handler793(event) { const value = document.getElementById("r793"); if (value) { value.textContent = String(793 * 2); } }
+function handler794(event) { const value = document.getElementById("r794"); if (value) { value.textContent = String(794 * 2); } }
+function handler795(event) { const value = document.getElementById("r795"); if (value) { value.textContent = String(795 * 2); } }
+function handler796(event) { const value = document.getElementById("r796"); if (value) { value.textContent = String(796 * 2); } }
+function handler797(event) { const value = document.getElementById("r797"); if (value) { value.textContent = String(797 * 2); } }
+function handler798(event) { const value = document.getElementById("r798"); if (value) { value.textContent = String(798 * 2); } }
+function handler799(event) { const value = document.getElementById("r799"); if (value) { value.textContent = String(799 * 2); } }
+function handler800(event) { const value = document.getElementById("r800"); if (value) { value.textContent = String(800 * 2); } }
+function handler801(event) { const value = document.getElementById("r801"); if (value) { value.textContent = String(801 * 2); } }
+function handler802(event) { const value = document.getElementById("r802"); if (value) { value.textContent = String(802 * 2); } }
+function handler803(event) { const value = document.getElementById("r803"); if (value) { value.textContent = String(803 * 2); } }
+function handler804(event) { const value = document.getElementById("r804"); if (value) { value.textContent = String(804 * 2); } }
+function handler805(event) { const value = document.getElementById("r805"); if (value) { value.textContent = String(805 * 2); } }
+function handler806(event) { const value = document.getElementById("r806"); if (value) { value.textContent = String(806 * 2); } }
+function handler807(event) { const value = document.getElementById("r807"); if (value) { value.textContent = String(807 * 2); } }
+function handler808(event) { const value = document.getElementById("r808"); if (value) { value.textContent = String(808 * 2); } }
+function handler809(event) { const value = document.getElementById("r809"); if (value) { value.textContent = String(809 * 2); } }
+function handler810(event) { const value = document.getElementById("r810"); if (value) { value.textContent = String(810 * 2); } }
+function handler811(event) { const value = document.getElementById("r811"); if (value) { value.textContent = String(811 * 2); } }
+function handler812(event) { const value = document.getElementById("r812"); if (value) { value.textContent = String(812 * 2); } }
+function handler813(event) { const value = document.getElementById("r813"); if (value) { value.textContent = String(813 * 2); } }
+function handler814(event) { const value = document.getElementById("r814"); if (value) { value.textContent = String(814 * 2); } }
+function handler815(event) { const value = document.getElementById("r815"); if (value) { value.textContent = String(815 * 2); } }
+function handler816(event) { const value = document.getElementById("r816"); if (value) { value.textContent = String(816 * 2); } }
+function handler817(event) { const value = document.getElementById("r817"); if (value) { value.textContent = String(817 * 2); } }
+function handler818(event) { const value = document.getElementById("r818"); if (value) { value.textContent = String(818 * 2); } }
+function handler819(event) { const value = document.getElementById("r819"); if (value) { value.textContent = String(819 * 2); } }
+function handler820(event) { const value = document.getElementById("r820"); if (value) { value.textContent = String(820 * 2); } }
+function handler821(event) { const value = document.getElementById("r821"); if (value) { value.textContent = String(821 * 2); } }
+function handler822(event) { const value = document.getElementById("r822"); if (value) { value.textContent = String(822 * 2); } }
+function handler823(event) { const value = document.getElementById("r823"); if (value) { value.textContent = String(823 * 2); } }
+function handler824(event) { const value = document.getElementById("r824"); if (value) { value.textContent = String(824 * 2); } }
+function handler825(event) { const value = document.getElementById("r825"); if (value) { value.textContent = String(825 * 2); } }
+function handler826(event) { const value = document.getElementById("r826"); if (value) { value.textContent = String(826 * 2); } }
+function handler827(event) { const value = document.getElementById("r827"); if (value) { value.textContent = String(827 * 2); } }
+function handler828(event) { const value = document.getElementById("r828"); if (value) { value.textContent = String(828 * 2); } }
+function handler829(event) { const value = document.getElementById("r829"); if (value) { value.textContent = String(829 * 2); } }
+function handler830(event) { const value = document.getElementById("r830"); if (value) { value.textContent = String(830 * 2); } }
+function handler831(event) { const value = document.getElementById("r831"); if (value) { value.textContent = String(831 * 2); } }
+function handler832(event) { const value = document.getElementById("r832"); if (value) { value.textContent = String(832 * 2); } }
+function handler833(event) { const value = document.getElementById("r833"); if (value) { value.textContent = String(833 * 2); } }
+function handler834(event) { const value = document.getElementById("r834"); if (value) { value.textContent = String(834 * 2); } }
+function handler835(event) { const value = document.getElementById("r835"); if (value) { value.textContent = String(835 * 2); } }
+function handler836(event) { const value = document.getElementById("r836"); if (value) { value.textContent = String(836 * 2); } }
+function handler837(event) { const value = document.getElementById("r837"); if (value) { value.textContent = String(837 * 2); } }
+function handler838(event) { const value = document.getElementById("r838"); if (value) { value.textContent = String(838 * 2); } }
+function handler839(event) { const value = document.getElementById("r839"); if (value) { value.textContent = String(839 * 2); } }
+function handler840(event) { const value = document.getElementById("r840"); if (value) { value.textContent = String(840 * 2); } }
+function handler841(event) { const value = document.getElementById("r841"); if (value) { value.textContent = String(841 * 2); } }
+function handler842(event) { const value = document.getElementById("r842"); if (value) { value.textContent = String(842 * 2); } }
+function handler843(event) { const value = document.getElementById("r843"); if (value) { value.textContent = String(843 * 2); } }
+function handler844(event) { const value = document.getElementById("r844"); if (value) { value.textContent = String(844 * 2); } }
+function handler845(event) { const value = document.getElementById("r845"); if (value) { value.textContent = String(845 * 2); } }
+function handler846(event) { const value = document.getElementById("r846"); if (value) { value.textContent = String(846 * 2); } }
+function handler847(event) { const value = document.getElementById("r847"); if (value) { value.textContent = String(847 * 2); } }
+function handler848(event) { const value = document.getElementById("r848"); if (value) { value.textContent = String(848 * 2); } }
+function handler849(event) { const value = document.getElementById("r849"); if (value) { value.textContent = String(849 * 2); } }
+function handler850(event) { const value = document.getElementById("r850"); if (value) { value.textContent = String(850 * 2); } }
+function handler851(event) { const value = document.getElementById("r851"); if (value) { value.textContent = String(851 * 2); } }
+function handler852(event) { const value = document.getElementById("r852"); if (value) { value.textContent = String(852 * 2); } }
+function handler853(event) { const value = document.getElementById("r853"); if (value) { value.textContent = String(853 * 2); } }
+function handler854(event) { const value = document.getElementById("r854"); if (value) { value.textContent = String(854 * 2); } }
+function handler855(event) { const value = document.getElementById("r855"); if (value) { value.textContent = String(855 * 2); } }
+function handler856(event) { const value = document.getElementById("r856"); if (value) { value.textContent = String(856 * 2); } }
+function handler857(event) { const value = document.getElementById("r857"); if (value) { value.textContent = String(857 * 2); } }
+function handler858(event) { const value = document.getElementById("r858"); if (value) { value.textContent = String(858 * 2); } }
+function handler859(event) { const value = document.getElementById("r859"); if (value) { value.textContent = String(859 * 2); } }
+function handler860(event) { const value = document.getElementById("r860"); if (value) { value.textContent = String(860 * 2); } }
+function handler861(event) { const value = document.getElementById("r861"); if (value) { value.textContent = String(861 * 2); } }
+function handler862(event) { const value = document.getElementById("r862"); if (value) { value.textContent = String(862 * 2); } }
+function handler863(event) { const value = document.getElementById("r863"); if (value) { value.textContent = String(863 * 2); } }
+function handler864(event) { const value = document.getElementById("r864"); if (value) { value.textContent = String(864 * 2); } }
+function handler865(event) { const value = document.getElementById("r865"); if (value) { value.textContent = String(865 * 2); } }
+function handler866(event) { const value = document.getElementById("r866"); if (value) { value.textContent = String(866 * 2); } }
+function handler867(event) { const value = document.getElementById("r867"); if (value) { value.textContent = String(867 * 2); } }
+function handler868(event) { const value = document.getElementById("r868"); if (value) { value.textContent = String(868 * 2); } }
+function handler869(event) { const value = document.getElementById("r869"); if (value) { value.textContent = String(869 * 2); } }
+function handler870(event) { const value = document.getElementById("r870"); if (value) { value.textContent = String(870 * 2); } }
+function handler871(event) { const value = document.getElementById("r871"); if (value) { value.textContent = String(871 * 2); } }
+function handler872(event) { const value = document.getElementById("r872"); if (value) { value.textContent = String(872 * 2); } }
+function handler873(event) { const value = document.getElementById("r873"); if (value) { value.textContent = String(873 * 2); } }
+function handler874(event) { const value = document.getElementById("r874"); if (value) { value.textContent = String(874 * 2); } }
+function handler875(event) { const value = document.getElementById("r875"); if (value) { value.textContent = String(875 * 2); } }
+function handler876(event) { const value = document.getElementById("r876"); if (value) { value.textContent = String(876 * 2); } }
+function handler877(event) { const value = document.getElementById("r877"); if (value) { value.textContent = String(877 * 2); } }
+function handler878(event) { const value = document.getElementById("r878"); if (value) { value.textContent = String(878 * 2); } }
+function handler879(event) { const value = document.getElementById("r879"); if (value) { value.textContent = String(879 * 2); } }
+function handler880(event) { const value = document.getElementById("r880"); if (value) { value.textContent = String(880 * 2); } }
+function handler881(event) { const value = document.getElementById("r881"); if (value) { value.textContent = String(881 * 2); } }
+function handler882(event) { const value = document.getElementById("r882"); if (value) { value.textContent = String(882 * 2); } }
+function handler883(event) { const value = document.getElementById("r883"); if (value) { value.textContent = String(883 * 2); } }
+function handler884(event) { const value = document.getElementById("r884"); if (value) { value.textContent = String(884 * 2); } }
+function handler885(event) { const value = document.getElementById("r885"); if (value) { value.textContent = String(885 * 2); } }
+function handler886(event) { const value = document.getElementById("r886"); if (value) { value.textContent = String(886 * 2); } }
+function handler887(event) { const value = document.getElementById("r887"); if (value) { value.textContent = String(887 * 2); } }
+function handler888(event) { const value = document.getElementById("r888"); if (value) { value.textContent = String(888 * 2); } }
+function handler889(event) { const value = document.getElementById("r889"); if (value) { value.textContent = String(889 * 2); } }
+function handler890(event) { const value = document.getElementById("r890"); if (value) { value.textContent = String(890 * 2); } }
+function handler891(event) { const value = document.getElementById("r891"); if (value) { value.textContent = String(891 * 2); } }
+function handler892(event) { const value = document.getElementById("r892"); if (value) { value.textContent = String(892 * 2); } }
+function handler893(event) { const value = document.getElementById("r893"); if (value) { value.textContent = String(893 * 2); } }
+function handler894(event) { const value = document.getElementById("r894"); if (value) { value.textContent = String(894 * 2); } }
+function handler895(event) { const value = document.getElementById("r895"); if (value) { value.textContent = String(895 * 2); } }
+function handler896(event) { const value = document.getElementById("r896"); if (value) { value.textContent = String(896 * 2); } }
+function handler897(event) { const value = document.getElementById("r897"); if (value) { value.textContent = String(897 * 2); } }
+function handler898(event) { const value = document.getElementById("r898"); if (value) { value.textContent = String(898 * 2); } }
+function handler899(event) { const value = document.getElementById("r899"); if (value) { value.textContent = String(899 * 2); } }
+function handler900(event) { const value = document.getElementById("r900"); if (value) { value.textContent = String(900 * 2); } }
+function handler901(event) { const value = document.getElementById("r901"); if (value) { value.textContent = String(901 * 2); } }
+function handler902(event) { const value = document.getElementById("r902"); if (value) { value.textContent = String(902 * 2); } }
+function handler903(event) { const value = document.getElementById("r903"); if (value) { value.textContent = String(903 * 2); } }
+function handler904(event) { const value = document.getElementById("r904"); if (value) { value.textContent = String(904 * 2); } }
+function handler905(event) { const value = document.getElementById("r905"); if (value) { value.textContent = String(905 * 2); } }
+function handler906(event) { const value = document.getElementById("r906"); if (value) { value.textContent = String(906 * 2); } }
+function handler907(event) { const value = document.getElementById("r907"); if (value) { value.textContent = String(907 * 2); } }
+function handler908(event) { const value = document.getElementById("r908"); if (value) { value.textContent = String(908 * 2); } }
+function handler909(event) { const value = document.getElementById("r909"); if (value) { value.textContent = String(909 * 2); } }
+function handler910(event) { const value = document.getElementById("r910"); if (value) { value.textContent = String(910 * 2); } }
+function handler911(event) { const value = document.getElementById("r911"); if (value) { value.textContent = String(911 * 2); } }
+function handler912(event) { const value = document.getElementById("r912"); if (value) { value.textContent = String(912 * 2); } }
+function handler913(event) { const value = document.getElementById("r913"); if (value) { value.textContent = String(913 * 2); } }
+function handler914(event) { const value = document.getElementById("r914"); if (value) { value.textContent = String(914 * 2); } }
+function handler915(event) { const value = document.getElementById("r915"); if (value) { value.textContent = String(915 * 2); } }
+function handler916(event) { const value = document.getElementById("r916"); if (value) { value.textContent = String(916 * 2); } }
+function handler917(event) { const value = document.getElementById("r917"); if (value) { value.textContent = String(917 * 2); } }
+function handler918(event) { const value = document.getElementById("r918"); if (value) { value.textContent = String(918 * 2); } }
+function handler919(event) { const value = document.getElementById("r919"); if (value) { value.textContent = String(919 * 2); } }
+function handler920(event) { const value = document.getElementById("r920"); if (value) { value.textContent = String(920 * 2); } }
+function handler921(event) { const value = document.getElementById("r921"); if (value) { value.textContent = String(921 * 2); } }
+function handler922(event) { const value = document.getElementById("r922"); if (value) { value.textContent = String(922 * 2); } }
+function handler923(event) { const value = document.getElementById("r923"); if (value) { value.textContent = String(923 * 2); } }
+function handler924(event) { const value = document.getElementById("r924"); if (value) { value.textContent = String(924 * 2); } }
+function handler925(event) { const value = document.getElementById("r925"); if (value) { value.textContent = String(925 * 2); } }
+function handler926(event) { const value = document.getElementById("r926"); if (value) { value.textContent = String(926 * 2); } }
+function handler927(event) { const value = document.getElementById("r927"); if (value) { value.textContent = String(927 * 2); } }
+function handler928(event) { const value = document.getElementById("r928"); if (value) { value.textContent = String(928 * 2); } }
+function handler929(event) { const value = document.getElementById("r929"); if (value) { value.textContent = String(929 * 2); } }
+function handler930(event) { const value = document.getElementById("r930"); if (value) { value.textContent = String(930 * 2); } }
+function handler931(event) { const value = document.getElementById("r931"); if (value) { value.textContent = String(931 * 2); } }
+function handler932(event) { const value = document.getElementById("r932"); if (value) { value.textContent = String(932 * 2); } }
+function handler933(event) { const value = document.getElementById("r933"); if (value) { value.textContent = String(933 * 2); } }
+function handler934(event) { const value = document.getElementById("r934"); if (value) { value.textContent = String(934 * 2); } }
+function handler935(event) { const value = document.getElementById("r935"); if (value) { value.textContent = String(935 * 2); } }
+function handler936(event) { const value = document.getElementById("r936"); if (value) { value.textContent = String(936 * 2); } }
+function handler937(event) { const value = document.getElementById("r937"); if (value) { value.textContent = String(937 * 2); } }
+function handler938(event) { const value = document.getElementById("r938"); if (value) { value.textContent = String(938 * 2); } }
+function handler939(event) { const value = document.getElementById("r939"); if (value) { value.textContent = String(939 * 2); } }
+function handler940(event) { const value = document.getElementById("r940"); if (value) { value.textContent = String(940 * 2); } }
+function handler941(event) { const value = document.getElementById("r941"); if (value) { value.textContent = String(941 * 2); } }
+function handler942(event) { const value = document.getElementById("r942"); if (value) { value.textContent = String(942 * 2); } }
+function handler943(event) { const value = document.getElementById("r943"); if (value) { value.textContent = String(943 * 2); } }
+function handler944(event) { const value = document.getElementById("r944"); if (value) { value.textContent = String(944 * 2); } }
+function handler945(event) { const value = document.getElementById("r945"); if (value) { value.textContent = String(945 * 2); } }
+function handler946(event) { const value = document.getElementById("r946"); if (value) { value.textContent = String(946 * 2); } }
+function handler947(event) { const value = document.getElementById("r947"); if (value) { value.textContent = String(947 * 2); } }
+function handler948(event) { const value = document.getElementById("r948"); if (value) { value.textContent = String(948 * 2); } }
+function handler949(event) { const value = document.getElementById("r949"); if (value) { value.textContent = String(949 * 2); } }
+function handler950(event) { const value = document.getElementById("r950"); if (value) { value.textContent = String(950 * 2); } }
+function handler951(event) { const value = document.getElementById("r951"); if (value) { value.textContent = String(951 * 2); } }
+function handler952(event) { const value = document.getElementById("r952"); if (value) { value.textContent = String(952 * 2); } }
+function handler953(event) { const value = document.getElementById("r953"); if (value) { value.textContent = String(953 * 2); } }
+function handler954(event) { const value = document.getElementById("r954"); if (value) { value.textContent = String(954 * 2); } }
+function handler955(event) { const value = document.getElementById("r955"); if (value) { value.textContent = String(955 * 2); } }
+function handler956(event) { const value = document.getElementById("r956"); if (value) { value.textContent = String(956 * 2); } }
+function handler957(event) { const value = document.getElementById("r957"); if (value) { value.textContent = String(957 * 2); } }
+function handler958(event) { const value = document.getElementById("r958"); if (value) { value.textContent = String(958 * 2); } }
+function handler959(event) { const value = document.getElementById("r959"); if (value) { value.textContent = String(959 * 2); } }
+function handler960(event) { const value = document.getElementById("r960"); if (value) { value.textContent = String(960 * 2); } }
+function handler961(event) { const value = document.getElementById("r961"); if (value) { value.textContent = String(961 * 2); } }
+function handler962(event) { const value = document.getElementById("r962"); if (value) { value.textContent = String(962 * 2); } }
+function handler963(event) { const value = document.getElementById("r963"); if (value) { value.textContent = String(963 * 2); } }
+function handler964(event) { const value = document.getElementById("r964"); if (value) { value.textContent = String(964 * 2); } }
+function handler965(event) { const value = document.getElementById("r965"); if (value) { value.textContent = String(965 * 2); } }
+function handler966(event) { const value = document.getElementById("r966"); if (value) { value.textContent = String(966 * 2); } }
+function handler967(event) { const value = document.getElementById("r967"); if (value) { value.textContent = String(967 * 2); } }
+function handler968(event) { const value = document.getElementById("r968"); if (value) { value.textContent = String(968 * 2); } }
+function handler969(event) { const value = document.getElementById("r969"); if (value) { value.textContent = String(969 * 2); } }
+function handler970(event) { const value = document.getElementById("r970"); if (value) { value.textContent = String(970 * 2); } }
+function handler971(event) { const value = document.getElementById("r971"); if (value) { value.textContent = String(971 * 2); } }
+function handler972(event) { const value = document.getElementById("r972"); if (value) { value.textContent = String(972 * 2); } }
+function handler973(event) { const value = document.getElementById("r973"); if (value) { value.textContent = String(973 * 2); } }
+function handler974(event) { const value = document.getElementById("r974"); if (value) { value.textContent = String(974 * 2); } }
+function handler975(event) { const value = document.getElementById("r975"); if (value) { value.textContent = String(975 * 2); } }
+function handler976(event) { const value = document.getElementById("r976"); if (value) { value.textContent = String(976 * 2); } }
+function handler977(event) { const value = document.getElementById("r977"); if (value) { value.textContent = String(977 * 2); } }
+function handler978(event) { const value = document.getElementById("r978"); if (value) { value.textContent = String(978 * 2); } }
+function handler979(event) { const value = document.getElementById("r979"); if (value) { value.textContent = String(979 * 2); } }
+function handler980(event) { const value = document.getElementById("r980"); if (value) { value.textContent = String(980 * 2); } }
+function handler981(event) { const value = document.getElementById("r981"); if (value) { value.textContent = String(981 * 2); } }
+function handler982(event) { const value = document.getElementById("r982"); if (value) { value.textContent = String(982 * 2); } }
+function handler983(event) { const value = document.getElementById("r983"); if (value) { value.textContent = String(983 * 2); } }
+function handler984(event) { const value = document.getElementById("r984"); if (value) { value.textContent = String(984 * 2); } }
+function handler985(event) { const value = document.getElementById("r985"); if (value) { value.textContent = String(985 * 2); } }
+function handler986(event) { const value = document.getElementById("r986"); if (value) { value.textContent = String(986 * 2); } }
+function handler987(event) { const value = document.getElementById("r987"); if (value) { value.textContent = String(987 * 2); } }
+function handler988(event) { const value = document.getElementById("r988"); if (value) { value.textContent = String(988 * 2); } }
+function handler989(event) { const value = document.getElementById("r989"); if (value) { value.textContent = String(989 * 2); } }
+function handler990(event) { const value = document.getElementById("r990"); if (value) { value.textContent = String(990 * 2); } }
+function handler991(event) { const value = document.getElementById("r991"); if (value) { value.textContent = String(991 * 2); } }
+function handler992(event) { const value = document.getElementById("r992"); if (value) { value.textContent = String(992 * 2); } }
+function handler993(event) { const value = document.getElementById("r993"); if (value) { value.textContent = String(993 * 2); } }
+function handler994(event) { const value = document.getElementById("r994"); if (value) { value.textContent = String(994 * 2); } }
+function handler995(event) { const value = document.getElementById("r995"); if (value) { value.textContent = String(995 * 2); } }
+function handler996(event) { const value = document.getElementById("r996"); if (value) { value.textContent = String(996 * 2); } }
+function handler997(event) { const value = document.getElementById("r997"); if (value) { value.textContent = String(997 * 2); } }
+function handler998(event) { const value = document.getElementById("r998"); if (value) { value.textContent = String(998 * 2); } }
+function handler999(event) { const value = document.getElementById("r999"); if (value) { value.textContent = String(999 * 2); } }
+function handler1000(event) { const value = document.getElementById("r1000"); if (value) { value.textContent = String(1000 * 2); } }
+function handler1001(event) { const value = document.getElementById("r1001"); if (value) { value.textContent = String(1001 * 2); } }
+function handler1002(event) { const value = document.getElementById("r1002"); if (value) { value.textContent = String(1002 * 2); } }
+function handler1003(event) { const value = document.getElementById("r1003"); if (value) { value.textContent = String(1003 * 2); } }
+function handler1004(event) { const value = document.getElementById("r1004"); if (value) { value.textContent = String(1004 * 2); } }
+function handler1005(event) { const value = document.getElementById("r1005"); if (value) { value.textContent = String(1005 * 2); } }
+function handler1006(event) { const value = document.getElementById("r1006"); if (value) { value.textContent = String(1006 * 2); } }
+function handler1007(event) { const value = document.getElementById("r1007"); if (value) { value.textContent = String(1007 * 2); } }
+function handler1008(event) { const value = document.getElementById("r1008"); if (value) { value.textContent = String(1008 * 2); } }
+function handler1009(event) { const value = document.getElementById("r1009"); if (value) { value.textContent = String(1009 * 2); } }
+function handler1010(event) { const value = document.getElementById("r1010"); if (value) { value.textContent = String(1010 * 2); } }
+function handler1011(event) { const value = document.getElementById("r1011"); if (value) { value.textContent = String(1011 * 2); } }
+function handler1012(event) { const value = document.getElementById("r1012"); if (value) { value.textContent = String(1012 * 2); } }
+function handler1013(event) { const value = document.getElementById("r1013"); if (value) { value.textContent = String(1013 * 2); } }
+function handler1014(event) { const value = document.getElementById("r1014"); if (value) { value.textContent = String(1014 * 2); } }
+function handler1015(event) { const value = document.getElementById("r1015"); if (value) { value.textContent = String(1015 * 2); } }
+function handler1016(event) { const value = document.getElementById("r1016"); if (value) { value.textContent = String(1016 * 2); } }
+function handler1017(event) { const value = document.getElementById("r1017"); if (value) { value.textContent = String(1017 * 2); } }
+function handler1018(event) { const value = document.getElementById("r1018"); if (value) { value.textContent = String(1018 * 2); } }
+function handler1019(event) { const value = document.getElementById("r1019"); if (value) { value.textContent = String(1019 * 2); } }
+function handler1020(event) { const value = document.getElementById("r1020"); if (value) { value.textContent = String(1020 * 2); } }
+function handler1021(event) { const value = document.getElementById("r1021"); if (value) { value.textContent = String(1021 * 2); } }
+function handler1022(event) { const value = document.getElementById("r1022"); if (value) { value.textContent = String(1022 * 2); } }
+function handler1023(event) { const value = document.getElementById("r1023"); if (value) { value.textContent = String(1023 * 2); } }
+function handler1024(event) { const value = document.getElementById("r1024"); if (value) { value.textContent = String(1024 * 2); } }
+function handler1025(event) { const value = document.getElementById("r1025"); if (value) { value.textContent = String(1025 * 2); } }
+function handler1026(event) { const value = document.getElementById("r1026"); if (value) { value.textContent = String(1026 * 2); } }
+function handler1027(event) { const value = document.getElementById("r1027"); if (value) { value.textContent = String(1027 * 2); } }
+function handler1028(event) { const value = document.getElementById("r1028"); if (value) { value.textContent = String(1028 * 2); } }
+function handler1029(event) { const value = document.getElementById("r1029"); if (value) { value.textContent = String(1029 * 2); } }
+function handler1030(event) { const value = document.getElementById("r1030"); if (value) { value.textContent = String(1030 * 2); } }
+function handler1031(event) { const value = document.getElementById("r1031"); if (value) { value.textContent = String(1031 * 2); } }
+function handler1032(event) { const value = document.getElementById("r1032"); if (value) { value.textContent = String(1032 * 2); } }
+function handler1033(event) { const value = document.getElementById("r1033"); if (value) { value.textContent = String(1033 * 2); } }
+function handler1034(event) { const value = document.getElementById("r1034"); if (value) { value.textContent = String(1034 * 2); } }
+function handler1035(event) { const value = document.getElementById("r1035"); if (value) { value.textContent = String(1035 * 2); } }
+function handler1036(event) { const value = document.getElementById("r1036"); if (value) { value.textContent = String(1036 * 2); } }
+function handler1037(event) { const value = document.getElementById("r1037"); if (value) { value.textContent = String(1037 * 2); } }
+function handler1038(event) { const value = document.getElementById("r1038"); if (value) { value.textContent = String(1038 * 2); } }
+function handler1039(event) { const value = document.getElementById("r1039"); if (value) { value.textContent = String(1039 * 2); } }
+function handler1040(event) { const value = document.getElementById("r1040"); if (value) { value.textContent = String(1040 * 2); } }
+function handler1041(event) { const value = document.getElementById("r1041"); if (value) { value.textContent = String(1041 * 2); } }
+function handler1042(event) { const value = document.getElementById("r1042"); if (value) { value.textContent = String(1042 * 2); } }
+function handler1043(event) { const value = document.getElementById("r1043"); if (value) { value.textContent = String(1043 * 2); } }
+function handler1044(event) { const value = document.getElementById("r1044"); if (value) { value.textContent = String(1044 * 2); } }
+function handler1045(event) { const value = document.getElementById("r1045"); if (value) { value.textContent = String(1045 * 2); } }
+function handler1046(event) { const value = document.getElementById("r1046"); if (value) { value.textContent = String(1046 * 2); } }
+function handler1047(event) { const value = document.getElementById("r1047"); if (value) { value.textContent = String(1047 * 2); } }
+function handler1048(event) { const value = document.getElementById("r1048"); if (value) { value.textContent = String(1048 * 2); } }
+function handler1049(event) { const value = document.getElementById("r1049"); if (value) { value.textContent = String(1049 * 2); } }
+function handler1050(event) { const value = document.getElementById("r1050"); if (value) { value.textContent = String(1050 * 2); } }
+function handler1051(event) { const value = document.getElementById("r1051"); if (value) { value.textContent = String(1051 * 2); } }
+function handler1052(event) { const value = document.getElementById("r1052"); if (value) { value.textContent = String(1052 * 2); } }
+function handler1053(event) { const value = document.getElementById("r1053"); if (value) { value.textContent = String(1053 * 2); } }
+function handler1054(event) { const value = document.getElementById("r1054"); if (value) { value.textContent = String(1054 * 2); } }
+function handler1055(event) { const value = document.getElementById("r1055"); if (value) { value.textContent = String(1055 * 2); } }
+function handler1056(event) { const value = document.getElementById("r1056"); if (value) { value.textContent = String(1056 * 2); } }
+function handler1057(event) { const value = document.getElementById("r1057"); if (value) { value.textContent = String(1057 * 2); } }
+function handler1058(event) { const value = document.getElementById("r1058"); if (value) { value.textContent = String(1058 * 2); } }
+function handler1059(event) { const value = document.getElementById("r1059"); if (value) { value.textContent = String(1059 * 2); } }
+function handler1060(event) { const value = document.getElementById("r1060"); if (value) { value.textContent = String(1060 * 2); } }
+function handler1061(event) { const value = document.getElementById("r1061"); if (value) { value.textContent = String(1061 * 2); } }
+function handler1062(event) { const value = document.getElementById("r1062"); if (value) { value.textContent = String(1062 * 2); } }
+function handler1063(event) { const value = document.getElementById("r1063"); if (value) { value.textContent = String(1063 * 2); } }
+function handler1064(event) { const value = document.getElementById("r1064"); if (value) { value.textContent = String(1064 * 2); } }
+function handler1065(event) { const value = document.getElementById("r1065"); if (value) { value.textContent = String(1065 * 2); } }
+function handler1066(event) { const value = document.getElementById("r1066"); if (value) { value.textContent = String(1066 * 2); } }
+function handler1067(event) { const value = document.getElementById("r1067"); if (value) { value.textContent = String(1067 * 2); } }
+function handler1068(event) { const value = document.getElementById("r1068"); if (value) { value.textContent = String(1068 * 2); } }
+function handler1069(event) { const value = document.getElementById("r1069"); if (value) { value.textContent = String(1069 * 2); } }
+function handler1070(event) { const value = document.getElementById("r1070"); if (value) { value.textContent = String(1070 * 2); } }
+function handler1071(event) { const value = document.getElementById("r1071"); if (value) { value.textContent = String(1071 * 2); } }
+function handler1072(event) { const value = document.getElementById("r1072"); if (value) { value.textContent = String(1072 * 2); } }
+function handler1073(event) { const value = document.getElementById("r1073"); if (value) { value.textContent = String(1073 * 2); } }
+function handler1074(event) { const value = document.getElementById("r1074"); if (value) { value.textContent = String(1074 * 2); } }
+function handler1075(event) { const value = document.getElementById("r1075"); if (value) { value.textContent = String(1075 * 2); } }
+function handler1076(event) { const value = document.getElementById("r1076"); if (value) { value.textContent = String(1076 * 2); } }
+function handler1077(event) { const value = document.getElementById("r1077"); if (value) { value.textContent = String(1077 * 2); } }
+function handler1078(event) { const value = document.getElementById("r1078"); if (value) { value.textContent = String(1078 * 2); } }
+function handler1079(event) { const value = document.getElementById("r1079"); if (value) { value.textContent = String(1079 * 2); } }
+function handler1080(event) { const value = document.getElementById("r1080"); if (value) { value.textContent = String(1080 * 2); } }
+function handler1081(event) { const value = document.getElementById("r1081"); if (value) { value.textContent = String(1081 * 2); } }
+function handler1082(event) { const value = document.getElementById("r1082"); if (value) { value.textContent = String(1082 * 2); } }
+function handler1083(event) { const value = document.getElementById("r1083"); if (value) { value.textContent = String(1083 * 2); } }
+function handler1084(event) { const value = document.getElementById("r1084"); if (value) { value.textContent = String(1084 * 2); } }
+function handler1085(event) { const value = document.getElementById("r1085"); if (value) { value.textContent = String(1085 * 2); } }
+function handler1086(event) { const value = document.getElementById("r1086"); if (value) { value.textContent = String(1086 * 2); } }
+function handler1087(event) { const value = document.getElementById("r1087"); if (value) { value.textContent = String(1087 * 2); } }
+function handler1088(event) { const value = document.getElementById("r1088"); if (value) { value.textContent = String(1088 * 2); } }
+function handler1089(event) { const value = document.getElementById("r1089"); if (value) { value.textContent = String(1089 * 2); } }
+function handler1090(event) { const value = document.getElementById("r1090"); if (value) { value.textContent = String(1090 * 2); } }
+function handler1091(event) { const value = document.getElementById("r1091"); if (value) { value.textContent = String(1091 * 2); } }
+function handler1092(event) { const value = document.getElementById("r1092"); if (value) { value.textContent = String(1092 * 2); } }
+function handler1093(event) { const value = document.getElementById("r1093"); if (value) { value.textContent = String(1093 * 2); } }
+function handler1094(event) { const value = document.getElementById("r1094"); if (value) { value.textContent = String(1094 * 2); } }
+function handler1095(event) { const value = document.getElementById("r1095"); if (value) { value.textContent = String(1095 * 2); } }
+function handler1096(event) { const value = document.getElementById("r1096"); if (value) { value.textContent = String(1096 * 2); } }
+function handler1097(event) { const value = document.getElementById("r1097"); if (value) { value.textContent = String(1097 * 2); } }
+function handler1098(event) { const value = document.getElementById("r1098"); if (value) { value.textContent = String(1098 * 2); } }
+function handler1099(event) { const value = document.getElementById("r1099"); if (value) { value.textContent = String(1099 * 2); } }
+function handler1100(event) { const value = document.getElementById("r1100"); if (value) { value.textContent = String(1100 * 2); } }
+function handler1101(event) { const value = document.getElementById("r1101"); if (value) { value.textContent = String(1101 * 2); } }
+function handler1102(event) { const value = document.getElementById("r1102"); if (value) { value.textContent = String(1102 * 2); } }
+function handler1103(event) { const value = document.getElementById("r1103"); if (value) { value.textContent = String(1103 * 2); } }
+function handler1104(event) { const value = document.getElementById("r1104"); if (value) { value.textContent = String(1104 * 2); } }
+function handler1105(event) { const value = document.getElementById("r1105"); if (value) { value.textContent = String(1105 * 2); } }
+function handler1106(event) { const value = document.getElementById("r1106"); if (value) { value.textContent = String(1106 * 2); } }
+function handler1107(event) { const value = document.getElementById("r1107"); if (value) { value.textContent = String(1107 * 2); } }
+function handler1108(event) { const value = document.getElementById("r1108"); if (value) { value.textContent = String(1108 * 2); } }
+function handler1109(event) { const value = document.getElementById("r1109"); if (value) { value.textContent = String(1109 * 2); } }
+function handler1110(event) { const value = document.getElementById("r1110"); if (value) { value.textContent = String(1110 * 2); } }
+function handler1111(event) { const value = document.getElementById("r1111"); if (value) { value.textContent = String(1111 * 2); } }
+function handler1112(event) { const value = document.getElementById("r1112"); if (value) { value.textContent = String(1112 * 2); } }
+function handler1113(event) { const value = document.getElementById("r1113"); if (value) { value.textContent = String(1113 * 2); } }
+function handler1114(event) { const value = document.getElementById("r1114"); if (value) { value.textContent = String(1114 * 2); } }
+function handler1115(event) { const value = document.getElementById("r1115"); if (value) { value.textContent = String(1115 * 2); } }
+function handler1116(event) { const value = document.getElementById("r1116"); if (value) { value.textContent = String(1116 * 2); } }
+function handler1117(event) { const value = document.getElementById("r1117"); if (value) { value.textContent = String(1117 * 2); } }
+function handler1118(event) { const value = document.getElementById("r1118"); if (value) { value.textContent = String(1118 * 2); } }
+function handler1119(event) { const value = document.getElementById("r1119"); if (value) { value.textContent = String(1119 * 2); } }
+function handler1120(event) { const value = document.getElementById("r1120"); if (value) { value.textContent = String(1120 * 2); } }
+function handler1121(event) { const value = document.getElementById("r1121"); if (value) { value.textContent = String(1121 * 2); } }
+function handler1122(event) { const value = document.getElementById("r1122"); if (value) { value.textContent = String(1122 * 2); } }
+function handler1123(event) { const value = document.getElementById("r1123"); if (value) { value.textContent = String(1123 * 2); } }
+function handler1124(event) { const value = document.getElementById("r1124"); if (value) { value.textContent = String(1124 * 2); } }
+function handler1125(event) { const value = document.getElementById("r1125"); if (value) { value.textContent = String(1125 * 2); } }
+function handler1126(event) { const value = document.getElementById("r1126"); if (value) { value.textContent = String(1126 * 2); } }
+function handler1127(event) { const value = document.getElementById("r1127"); if (value) { value.textContent = String(1127 * 2); } }
+function handler1128(event) { const value = document.getElementById("r1128"); if (value) { value.textContent = String(1128 * 2); } }
+function handler1129(event) { const value = document.getElementById("r1129"); if (value) { value.textContent = String(1129 * 2); } }
+function handler1130(event) { const value = document.getElementById("r1130"); if (value) { value.textContent = String(1130 * 2); } }
+function handler1131(event) { const value = document.getElementById("r1131"); if (value) { value.textContent = String(1131 * 2); } }
+function handler1132(event) { const value = document.getElementById("r1132"); if (value) { value.textContent = String(1132 * 2); } }
+function handler1133(event) { const value = document.getElementById("r1133"); if (value) { value.textContent = String(1133 * 2); } }
+function handler1134(event) { const value = document.getElementById("r1134"); if (value) { value.textContent = String(1134 * 2); } }
+function handler1135(event) { const value = document.getElementById("r1135"); if (value) { value.textContent = String(1135 * 2); } }
+function handler1136(event) { const value = document.getElementById("r1136"); if (value) { value.textContent = String(1136 * 2); } }
+function handler1137(event) { const value = document.getElementById("r1137"); if (value) { value.textContent = String(1137 * 2); } }
+function handler1138(event) { const value = document.getElementById("r1138"); if (value) { value.textContent = String(1138 * 2); } }
+function handler1139(event) { const value = document.getElementById("r1139"); if (value) { value.textContent = String(1139 * 2); } }
+function handler1140(event) { const value = document.getElementById("r1140"); if (value) { value.textContent = String(1140 * 2); } }
+function handler1141(event) { const value = document.getElementById("r1141"); if (value) { value.textContent = String(1141 * 2); } }
+function handler1142(event) { const value = document.getElementById("r1142"); if (value) { value.textContent = String(1142 * 2); } }
+function handler1143(event) { const value = document.getElementById("r1143"); if (value) { value.textContent = String(1143 * 2); } }
+function handler1144(event) { const value = document.getElementById("r1144"); if (value) { value.textContent = String(1144 * 2); } }
+function handler1145(event) { const value = document.getElementById("r1145"); if (value) { value.textContent = String(1145 * 2); } }
+function handler1146(event) { const value = document.getElementById("r1146"); if (value) { value.textContent = String(1146 * 2); } }
+function handler1147(event) { const value = document.getElementById("r1147"); if (value) { value.textContent = String(1147 * 2); } }
+function handler1148(event) { const value = document.getElementById("r1148"); if (value) { value.textContent = String(1148 * 2); } }
+function handler1149(event) { const value = document.getElementById("r1149"); if (value) { value.textContent = String(1149 * 2); } }
+function handler1150(event) { const value = document.getElementById("r1150"); if (value) { value.textContent = String(1150 * 2); } }
+function handler1151(event) { const value = document.getElementById("r1151"); if (value) { value.textContent = String(1151 * 2); } }
+function handler1152(event) { const value = document.getElementById("r1152"); if (value) { value.textContent = String(1152 * 2); } }
+function handler1153(event) { const value = document.getElementById("r1153"); if (value) { value.textContent = String(1153 * 2); } }
+function handler1154(event) { const value = document.getElementById("r1154"); if (value) { value.textContent = String(1154 * 2); } }
+function handler1155(event) { const value = document.getElementById("r1155"); if (value) { value.textContent = String(1155 * 2); } }
+function handler1156(event) { const value = document.getElementById("r1156"); if (value) { value.textContent = String(1156 * 2); } }
+function handler1157(event) { const value = document.getElementById("r1157"); if (value) { value.textContent = String(1157 * 2); } }
+function handler1158(event) { const value = document.getElementById("r1158"); if (value) { value.textContent = String(1158 * 2); } }
+function handler1159(event) { const value = document.getElementById("r1159"); if (value) { value.textContent = String(1159 * 2); } }
+function handler1160(event) { const value = document.getElementById("r1160"); if (value) { value.textContent = String(1160 * 2); } }
+function handler1161(event) { const value = document.getElementById("r1161"); if (value) { value.textContent = String(1161 * 2); } }
+function handler1162(event) { const value = document.getElementById("r1162"); if (value) { value.textContent = String(1162 * 2); } }
+function handler1163(event) { const value = document.getElementById("r1163"); if (value) { value.textContent = String(1163 * 2); } }
+function handler1164(event) { const value = document.getElementById("r1164"); if (value) { value.textContent = String(1164 * 2); } }
+function handler1165(event) { const value = document.getElementById("r1165"); if (value) { value.textContent = String(1165 * 2); } }
+function handler1166(event) { const value = document.getElementById("r1166"); if (value) { value.textContent = String(1166 * 2); } }
+function handler1167(event) { const value = document.getElementById("r1167"); if (value) { value.textContent = String(1167 * 2); } }
+function handler1168(event) { const value = document.getElementById("r1168"); if (value) { value.textContent = String(1168 * 2); } }
+function handler1169(event) { const value = document.getElementById("r1169"); if (value) { value.textContent = String(1169 * 2); } }
+function handler1170(event) { const value = document.getElementById("r1170"); if (value) { value.textContent = String(1170 * 2); } }
+function handler1171(event) { const value = document.getElementById("r1171"); if (value) { value.textContent = String(1171 * 2); } }
+function handler1172(event) { const value = document.getElementById("r1172"); if (value) { value.textContent = String(1172 * 2); } }
+function handler1173(event) { const value = document.getElementById("r1173"); if (value) { value.textContent = String(1173 * 2); } }
+function handler1174(event) { const value = document.getElementById("r1174"); if (value) { value.textContent = String(1174 * 2); } }
+function handler1175(event) { const value = document.getElementById("r1175"); if (value) { value.textContent = String(1175 * 2); } }
+function handler1176(event) { const value = document.getElementById("r1176"); if (value) { value.textContent = String(1176 * 2); } }
+function handler1177(event) { const value = document.getElementById("r1177"); if (value) { value.textContent = String(1177 * 2); } }
+function handler1178(event) { const value = document.getElementById("r1178"); if (value) { value.textContent = String(1178 * 2); } }
+function handler1179(event) { const value = document.getElementById("r1179"); if (value) { value.textContent = String(1179 * 2); } }
+function handler1180(event) { const value = document.getElementById("r1180"); if (value) { value.textContent = String(1180 * 2); } }
+function handler1181(event) { const value = document.getElementById("r1181"); if (value) { value.textContent = String(1181 * 2); } }
+function handler1182(event) { const value = document.getElementById("r1182"); if (value) { value.textContent = String(1182 * 2); } }
+function handler1183(event) { const value = document.getElementById("r1183"); if (value) { value.textContent = String(1183 * 2); } }
+function handler1184(event) { const value = document.getElementById("r1184"); if (value) { value.textContent = String(1184 * 2); } }
+function handler1185(event) { const value = document.getElementById("r1185"); if (value) { value.textContent = String(1185 * 2); } }
+function handler1186(event) { const value = document.getElementById("r1186"); if (value) { value.textContent = String(1186 * 2); } }
+function handler1187(event) { const value = document.getElementById("r1187"); if (value) { value.textContent = String(1187 * 2); } }
+function handler1188(event) { const value = document.getElementById("r1188"); if (value) { value.textContent = String(1188 * 2); } }
+function handler1189(event) { const value = document.getElementById("r1189"); if (value) { value.textContent = String(1189 * 2); } }
+function handler1190(event) { const value = document.getElementById("r1190"); if (value) { value.textContent = String(1190 * 2); } }
+function handler1191(event) { const value = document.getElementById("r1191"); if (value) { value.textContent = String(1191 * 2); } }
+function handler1192(event) { const value = document.getElementById("r1192"); if (value) { value.textContent = String(1192 * 2); } }
+function handler1193(event) { const value = document.getElementById("r1193"); if (value) { value.textContent = String(1193 * 2); } }
+function handler1194(event) { const value = document.getElementById("r1194"); if (value) { value.textContent = String(1194 * 2); } }
+function handler1195(event) { const value = document.getElementById("r1195"); if (value) { value.textContent = String(1195 * 2); } }
+function handler1196(event) { const value = document.getElementById("r1196"); if (value) { value.textContent = String(1196 * 2); } }
+function handler1197(event) { const value = document.getElementById("r1197"); if (value) { value.textContent = String(1197 * 2); } }
+function handler1198(event) { const value = document.getElementById("r1198"); if (value) { value.textContent = String(1198 * 2); } }
+function handler1199(event) { const value = document.getElementById("r1199"); if (value) { value.textContent = String(1199 * 2); } }
+function handler1200(event) { const value = document.getElementById("r1200"); if (value) { value.textContent = String(1200 * 2); } }
+function handler1201(event) { const value = document.getElementById("r1201"); if (value) { value.textContent = String(1201 * 2); } }
+function handler1202(event) { const value = document.getElementById("r1202"); if (value) { value.textContent = String(1202 * 2); } }
+function handler1203(event) { const value = document.getElementById("r1203"); if (value) { value.textContent = String(1203 * 2); } }
+function handler1204(event) { const value = document.getElementById("r1204"); if (value) { value.textContent = String(1204 * 2); } }
+function handler1205(event) { const value = document.getElementById("r1205"); if (value) { value.textContent = String(1205 * 2); } }
+function handler1206(event) { const value = document.getElementById("r1206"); if (value) { value.textContent = String(1206 * 2); } }
+function handler1207(event) { const value = document.getElementById("r1207"); if (value) { value.textContent = String(1207 * 2); } }
+function handler1208(event) { const value = document.getElementById("r1208"); if (value) { value.textContent = String(1208 * 2); } }
+function handler1209(event) { const value = document.getElementById("r1209"); if (value) { value.textContent = String(1209 * 2); } }
+function handler1210(event) { const value = document.getElementById("r1210"); if (value) { value.textContent = String(1210 * 2); } }
+function handler1211(event) { const value = document.getElementById("r1211"); if (value) { value.textContent = String(1211 * 2); } }
+function handler1212(event) { const value = document.getElementById("r1212"); if (value) { value.textContent = String(1212 * 2); } }
+function handler1213(event) { const value = document.getElementById("r1213"); if (value) { value.textContent = String(1213 * 2); } }
+function handler1214(event) { const value = document.getElementById("r1214"); if (value) { value.textContent = String(1214 * 2); } }
+function handler1215(event) { const value = document.getElementById("r1215"); if (value) { value.textContent = String(1215 * 2); } }
+function handler1216(event) { const value = document.getElementById("r1216"); if (value) { value.textContent = String(1216 * 2); } }
+function handler1217(event) { const value = document.getElementById("r1217"); if (value) { value.textContent = String(1217 * 2); } }
+function handler1218(event) { const value = document.getElementById("r1218"); if (value) { value.textContent = String(1218 * 2); } }
+function handler1219(event) { const value = document.getElementById("r1219"); if (value) { value.textContent = String(1219 * 2); } }
+function handler1220(event) { const value = document.getElementById("r1220"); if (value) { value.textContent = String(1220 * 2); } }
+function handler1221(event) { const value = document.getElementById("r1221"); if (value) { value.textContent = String(1221 * 2); } }
+function handler1222(event) { const value = document.getElementById("r1222"); if (value) { value.textContent = String(1222 * 2); } }
+function handler1223(event) { const value = document.getElementById("r1223"); if (value) { value.textContent = String(1223 * 2); } }
+function handler1224(event) { const value = document.getElementById("r1224"); if (value) { value.textContent = String(1224 * 2); } }
+function handler1225(event) { const value = document.getElementById("r1225"); if (value) { value.textContent = String(1225 * 2); } }
+function handler1226(event) { const value = document.getElementById("r1226"); if (value) { value.textContent = String(1226 * 2); } }
+function handler1227(event) { const value = document.getElementById("r1227"); if (value) { value.textContent = String(1227 * 2); } }
+function handler1228(event) { const value = document.getElementById("r1228"); if (value) { value.textContent = String(1228 * 2); } }
+function handler1229(event) { const value = document.getElementById("r1229"); if (value) { value.textContent = String(1229 * 2); } }
+function handler1230(event) { const value = document.getElementById("r1230"); if (value) { value.textContent = String(1230 * 2); } }
+function handler1231(event) { const value = document.getElementById("r1231"); if (value) { value.textContent = String(1231 * 2); } }
+function handler1232(event) { const value = document.getElementById("r1232"); if (value) { value.textContent = String(1232 * 2); } }
+function handler1233(event) { const value = document.getElementById("r1233"); if (value) { value.textContent = String(1233 * 2); } }
+function handler1234(event) { const value = document.getElementById("r1234"); if (value) { value.textContent = String(1234 * 2); } }
+function handler1235(event) { const value = document.getElementById("r1235"); if (value) { value.textContent = String(1235 * 2); } }
+function handler1236(event) { const value = document.getElementById("r1236"); if (value) { value.textContent = String(1236 * 2); } }
+function handler1237(event) { const value = document.getElementById("r1237"); if (value) { value.textContent = String(1237 * 2); } }
+function handler1238(event) { const value = document.getElementById("r1238"); if (value) { value.textContent = String(1238 * 2); } }
+function handler1239(event) { const value = document.getElementById("r1239"); if (value) { value.textContent = String(1239 * 2); } }
+function handler1240(event) { const value = document.getElementById("r1240"); if (value) { value.textContent = String(1240 * 2); } }
+function handler1241(event) { const value = document.getElementById("r1241"); if (value) { value.textContent = String(1241 * 2); } }
+function handler1242(event) { const value = document.getElementById("r1242"); if (value) { value.textContent = String(1242 * 2); } }
+function handler1243(event) { const value = document.getElementById("r1243"); if (value) { value.textContent = String(1243 * 2); } }
+function handler1244(event) { const value = document.getElementById("r1244"); if (value) { value.textContent = String(1244 * 2); } }
+function handler1245(event) { const value = document.getElementById("r1245"); if (value) { value.textContent = String(1245 * 2); } }
+function handler1246(event) { const value = document.getElementById("r1246"); if (value) { value.textContent = String(1246 * 2); } }
+function handler1247(event) { const value = document.getElementById("r1247"); if (value) { value.textContent = String(1247 * 2); } }
+function handler1248(event) { const value = document.getElementById("r1248"); if (value) { value.textContent = String(1248 * 2); } }
+function handler1249(event) { const value = document.getElementById("r1249"); if (value) { value.textContent = String(1249 * 2); } }
+function handler1250(event) { const value = document.getElementById("r1250"); if (value) { value.textContent = String(1250 * 2); } }
+function handler1251(event) { const value = document.getElementById("r1251"); if (value) { value.textContent = String(1251 * 2); } }
+function handler1252(event) { const value = document.getElementById("r1252"); if (value) { value.textContent = String(1252 * 2); } }
+function handler1253(event) { const value = document.getElementById("r1253"); if (value) { value.textContent = String(1253 * 2); } }
+function handler1254(event) { const value = document.getElementById("r1254"); if (value) { value.textContent = String(1254 * 2); } }
+function handler1255(event) { const value = document.getElementById("r1255"); if (value) { value.textContent = String(1255 * 2); } }
+function handler1256(event) { const value = document.getElementById("r1256"); if (value) { value.textContent = String(1256 * 2); } }
+function handler1257(event) { const value = document.getElementById("r1257"); if (value) { value.textContent = String(1257 * 2); } }
+function handler1258(event) { const value = document.getElementById("r1258"); if (value) { value.textContent = String(1258 * 2); } }
+function handler1259(event) { const value = document.getElementById("r1259"); if (value) { value.textContent = String(1259 * 2); } }
+function handler1260(event) { const value = document.getElementById("r1260"); if (value) { value.textContent = String(1260 * 2); } }
+function handler1261(event) { const value = document.getElementById("r1261"); if (value) { value.textContent = String(1261 * 2); } }
+function handler1262(event) { const value = document.getElementById("r1262"); if (value) { value.textContent = String(1262 * 2); } }
+function handler1263(event) { const value = document.getElementById("r1263"); if (value) { value.textContent = String(1263 * 2); } }
+function handler1264(event) { const value = document.getElementById("r1264"); if (value) { value.textContent = String(1264 * 2); } }
+function handler1265(event) { const value = document.getElementById("r1265"); if (value) { value.textContent = String(1265 * 2); } }
+function handler1266(event) { const value = document.getElementById("r1266"); if (value) { value.textContent = String(1266 * 2); } }
+function handler1267(event) { const value = document.getElementById("r1267"); if (value) { value.textContent = String(1267 * 2); } }
+function handler1268(event) { const value = document.getElementById("r1268"); if (value) { value.textContent = String(1268 * 2); } }
+function handler1269(event) { const value = document.getElementById("r1269"); if (value) { value.textContent = String(1269 * 2); } }
+function handler1270(event) { const value = document.getElementById("r1270"); if (value) { value.textContent = String(1270 * 2); } }
+function handler1271(event) { const value = document.getElementById("r1271"); if (value) { value.textContent = String(1271 * 2); } }
+function handler1272(event) { const value = document.getElementById("r1272"); if (value) { value.textContent = String(1272 * 2); } }
+function handler1273(event) { const value = document.getElementById("r1273"); if (value) { value.textContent = String(1273 * 2); } }
+function handler1274(event) { const value = document.getElementById("r1274"); if (value) { value.textContent = String(1274 * 2); } }
+function handler1275(event) { const value = document.getElementById("r1275"); if (value) { value.textContent = String(1275 * 2); } }
+function handler1276(event) { const value = document.getElementById("r1276"); if (value) { value.textContent = String(1276 * 2); } }
+function handler1277(event) { const value = document.getElementById("r1277"); if (value) { value.textContent = String(1277 * 2); } }
+function handler1278(event) { const value = document.getElementById("r1278"); if (value) { value.textContent = String(1278 * 2); } }
+function handler1279(event) { const value = document.getElementById("r1279"); if (value) { value.textContent = String(1279 * 2); } }
+function handler1280(event) { const value = document.getElementById("r1280"); if (value) { value.textContent = String(1280 * 2); } }
+function handler1281(event) { const value = document.getElementById("r1281"); if (value) { value.textContent = String(1281 * 2); } }
+function handler1282(event) { const value = document.getElementById("r1282"); if (value) { value.textContent = String(1282 * 2); } }
+function handler1283(event) { const value = document.getElementById("r1283"); if (value) { value.textContent = String(1283 * 2); } }
+function handler1284(event) { const value = document.getElementById("r1284"); if (value) { value.textContent = String(1284 * 2); } }
+function handler1285(event) { const value = document.getElementById("r1285"); if (value) { value.textContent = String(1285 * 2); } }
+function handler1286(event) { const value = document.getElementById("r1286"); if (value) { value.textContent = String(1286 * 2); } }
+function handler1287(event) { const value = document.getElementById("r1287"); if (value) { value.textContent = String(1287 * 2); } }
+function handler1288(event) { const value = document.getElementById("r1288"); if (value) { value.textContent = String(1288 * 2); } }
+function handler1289(event) { const value = document.getElementById("r1289"); if (value) { value.textContent = String(1289 * 2); } }
+function handler1290(event) { const value = document.getElementById("r1290"); if (value) { value.textContent = String(1290 * 2); } }
+function handler1291(event) { const value = document.getElementById("r1291"); if (value) { value.textContent = String(1291 * 2); } }
+function handler1292(event) { const value = document.getElementById("r1292"); if (value) { value.textContent = String(1292 * 2); } }
+function handler1293(event) { const value = document.getElementById("r1293"); if (value) { value.textContent = String(1293 * 2); } }
+function handler1294(event) { const value = document.getElementById("r1294"); if (value) { value.textContent = String(1294 * 2); } }
+function handler1295(event) { const value = document.getElementById("r1295"); if (value) { value.textContent = String(1295 * 2); } }
+function handler1296(event) { const value = document.getElementById("r1296"); if (value) { value.textContent = String(1296 * 2); } }
+function handler1297(event) { const value = document.getElementById("r1297"); if (value) { value.textContent = String(1297 * 2); } }
+function handler1298(event) { const value = document.getElementById("r1298"); if (value) { value.textContent = String(1298 * 2); } }
+function handler1299(event) { const value = document.getElementById("r1299"); if (value) { value.textContent = String(1299 * 2); } }
+function handler1300(event) { const value = document.getElementById("r1300"); if (value) { value.textContent = String(1300 * 2); } }
+function handler1301(event) { const value = document.getElementById("r1301"); if (value) { value.textContent = String(1301 * 2); } }
+function handler1302(event) { const value = document.getElementById("r1302"); if (value) { value.textContent = String(1302 * 2); } }
+function handler1303(event) { const value = document.getElementById("r1303"); if (value) { value.textContent = String(1303 * 2); } }
+function handler1304(event) { const value = document.getElementById("r1304"); if (value) { value.textContent = String(1304 * 2); } }
+function handler1305(event) { const value = document.getElementById("r1305"); if (value) { value.textContent = String(1305 * 2); } }
+function handler1306(event) { const value = document.getElementById("r1306"); if (value) { value.textContent = String(1306 * 2); } }
+function handler1307(event) { const value = document.getElementById("r1307"); if (value) { value.textContent = String(1307 * 2); } }
+function handler1308(event) { const value = document.getElementById("r1308"); if (value) { value.textContent = String(1308 * 2); } }
+function handler1309(event) { const value = document.getElementById("r1309"); if (value) { value.textContent = String(1309 * 2); } }
+function handler1310(event) { const value = document.getElementById("r1310"); if (value) { value.textContent = String(1310 * 2); } }
+function handler1311(event) { const value = document.getElementById("r1311"); if (value) { value.textContent = String(1311 * 2); } }
+function handler1312(event) { const value = document.getElementById("r1312"); if (value) { value.textContent = String(1312 * 2); } }
+function handler1313(event) { const value = document.getElementById("r1313"); if (value) { value.textContent = String(1313 * 2); } }
+function handler1314(event) { const value = document.getElementById("r1314"); if (value) { value.textContent = String(1314 * 2); } }
+function handler1315(event) { const value = document.getElementById("r1315"); if (value) { value.textContent = String(1315 * 2); } }
+function handler1316(event) { const value = document.getElementById("r1316"); if (value) { value.textContent = String(1316 * 2); } }
+function handler1317(event) { const value = document.getElementById("r1317"); if (value) { value.textContent = String(1317 * 2); } }
+function handler1318(event) { const value = document.getElementById("r1318"); if (value) { value.textContent = String(1318 * 2); } }
+function handler1319(event) { const value = document.getElementById("r1319"); if (value) { value.textContent = String(1319 * 2); } }
+function handler1320(event) { const value = document.getElementById("r1320"); if (value) { value.textContent = String(1320 * 2); } }
+function handler1321(event) { const value = document.getElementById("r1321"); if (value) { value.textContent = String(1321 * 2); } }
+function handler1322(event) { const value = document.getElementById("r1322"); if (value) { value.textContent = String(1322 * 2); } }
+function handler1323(event) { const value = document.getElementById("r1323"); if (value) { value.textContent = String(1323 * 2); } }
+function handler1324(event) { const value = document.getElementById("r1324"); if (value) { value.textContent = String(1324 * 2); } }
+function handler1325(event) { const value = document.getElementById("r1325"); if (value) { value.textContent = String(1325 * 2); } }
+function handler1326(event) { const value = document.getElementById("r1326"); if (value) { value.textContent = String(1326 * 2); } }
+function handler1327(event) { const value = document.getElementById("r1327"); if (value) { value.textContent = String(1327 * 2); } }
+function handler1328(event) { const value = document.getElementById("r1328"); if (value) { value.textContent = String(1328 * 2); } }
+function handler1329(event) { const value = document.getElementById("r1329"); if (value) { value.textContent = String(1329 * 2); } }
+function handler1330(event) { const value = document.getElementById("r1330"); if (value) { value.textContent = String(1330 * 2); } }
+function handler1331(event) { const value = document.getElementById("r1331"); if (value) { value.textContent = String(1331 * 2); } }
+function handler1332(event) { const value = document.getElementById("r1332"); if (value) { value.textContent = String(1332 * 2); } }
+function handler1333(event) { const value = document.getElementById("r1333"); if (value) { value.textContent = String(1333 * 2); } }
+function handler1334(event) { const value = document.getElementById("r1334"); if (value) { value.textContent = String(1334 * 2); } }
+function handler1335(event) { const value = document.getElementById("r1335"); if (value) { value.textContent = String(1335 * 2); } }
+function handler1336(event) { const value = document.getElementById("r1336"); if (value) { value.textContent = String(1336 * 2); } }
+function handler1337(event) { const value = document.getElementById("r1337"); if (value) { value.textContent = String(1337 * 2); } }
+function handler1338(event) { const value = document.getElementById("r1338"); if (value) { value.textContent = String(1338 * 2); } }
+function handler1339(event) { const value = document.getElementById("r1339"); if (value) { value.textContent = String(1339 * 2); } }
+function handler1340(event) { const value = document.getElementById("r1340"); if (value) { value.textContent = String(1340 * 2); } }
+function handler1341(event) { const value = document.getElementById("r1341"); if (value) { value.textContent = String(1341 * 2); } }
+function handler1342(event) { const value = document.getElementById("r1342"); if (value) { value.textContent = String(1342 * 2); } }
+function handler1343(event) { const value = document.getElementById("r1343"); if (value) { value.textContent = String(1343 * 2); } }
+function handler1344(event) { const value = document.getElementById("r1344"); if (value) { value.textContent = String(1344 * 2); } }
+function handler1345(event) { const value = document.getElementById("r1345"); if (value) { value.textContent = String(1345 * 2); } }
+function handler1346(event) { const value = document.getElementById("r1346"); if (value) { value.textContent = String(1346 * 2); } }
+function handler1347(event) { const value = document.getElementById("r1347"); if (value) { value.textContent = String(1347 * 2); } }
+function handler1348(event) { const value = document.getElementById("r1348"); if (value) { value.textContent = String(1348 * 2); } }
+function handler1349(event) { const value = document.getElementById("r1349"); if (value) { value.textContent = String(1349 * 2); } }
+function handler1350(event) { const value = document.getElementById("r1350"); if (value) { value.textContent = String(1350 * 2); } }
+function handler1351(event) { const value = document.getElementById("r1351"); if (value) { value.textContent = String(1351 * 2); } }
+function handler1352(event) { const value = document.getElementById("r1352"); if (value) { value.textContent = String(1352 * 2); } }
+function handler1353(event) { const value = document.getElementById("r1353"); if (value) { value.textContent = String(1353 * 2); } }
+function handler1354(event) { const value = document.getElementById("r1354"); if (value) { value.textContent = String(1354 * 2); } }
+function handler1355(event) { const value = document.getElementById("r1355"); if (value) { value.textContent = String(1355 * 2); } }
+function handler1356(event) { const value = document.getElementById("r1356"); if (value) { value.textContent = String(1356 * 2); } }
+function handler1357(event) { const value = document.getElementById("r1357"); if (value) { value.textContent = String(1357 * 2); } }
+function handler1358(event) { const value = document.getElementById("r1358"); if (value) { value.textContent = String(1358 * 2); } }
+function handler1359(event) { const value = document.getElementById("r1359"); if (value) { value.textContent = String(1359 * 2); } }
+function handler1360(event) { const value = document.getElementById("r1360"); if (value) { value.textContent = String(1360 * 2); } }
+function handler1361(event) { const value = document.getElementById("r1361"); if (value) { value.textContent = String(1361 * 2); } }
+function handler1362(event) { const value = document.getElementById("r1362"); if (value) { value.textContent = String(1362 * 2); } }
+function handler1363(event) { const value = document.getElementById("r1363"); if (value) { value.textContent = String(1363 * 2); } }
+function handler1364(event) { const value = document.getElementById("r1364"); if (value) { value.textContent = String(1364 * 2); } }
+function handler1365(event) { const value = document.getElementById("r1365"); if (value) { value.textContent = String(1365 * 2); } }
+function handler1366(event) { const value = document.getElementById("r1366"); if (value) { value.textContent = String(1366 * 2); } }
+function handler1367(event) { const value = document.getElementById("r1367"); if (value) { value.textContent = String(1367 * 2); } }
+function handler1368(event) { const value = document.getElementById("r1368"); if (value) { value.textContent = String(1368 * 2); } }
+function handler1369(event) { const value = document.getElementById("r1369"); if (value) { value.textContent = String(1369 * 2); } }
+function handler1370(event) { const value = document.getElementById("r1370"); if (value) { value.textContent = String(1370 * 2); } }
+function handler1371(event) { const value = document.getElementById("r1371"); if (value) { value.textContent = String(1371 * 2); } }
+function handler1372(event) { const value = document.getElementById("r1372"); if (value) { value.textContent = String(1372 * 2); } }
+function handler1373(event) { const value = document.getElementById("r1373"); if (value) { value.textContent = String(1373 * 2); } }
+function handler1374(event) { const value = document.getElementById("r1374"); if (value) { value.textContent = String(1374 * 2); } }
+function handler1375(event) { const value = document.getElementById("r1375"); if (value) { value.textContent = String(1375 * 2); } }
+function handler1376(event) { const value = document.getElementById("r1376"); if (value) { value.textContent = String(1376 * 2); } }
+function handler1377(event) { const value = document.getElementById("r1377"); if (value) { value.textContent = String(1377 * 2); } }
+function handler1378(event) { const value = document.getElementById("r1378"); if (value) { value.textContent = String(1378 * 2); } }
+function handler1379(event) { const value = document.getElementById("r1379"); if (value) { value.textContent = String(1379 * 2); } }
+function handler1380(event) { const value = document.getElementById("r1380"); if (value) { value.textContent = String(1380 * 2); } }
+function handler1381(event) { const value = document.getElementById("r1381"); if (value) { value.textContent = String(1381 * 2); } }
+function handler1382(event) { const value = document.getElementById("r1382"); if (value) { value.textContent = String(1382 * 2); } }
+function handler1383(event) { const value = document.getElementById("r1383"); if (value) { value.textContent = String(1383 * 2); } }
+function handler1384(event) { const value = document.getElementById("r1384"); if (value) { value.textContent = String(1384 * 2); } }
+function handler1385(event) { const value = document.getElementById("r1385"); if (value) { value.textContent = String(1385 * 2); } }
+function handler1386(event) { const value = document.getElementById("r1386"); if (value) { value.textContent = String(1386 * 2); } }
+function handler1387(event) { const value = document.getElementById("r1387"); if (value) { value.textContent = String(1387 * 2); } }
+function handler1388(event) { const value = document.getElementById("r1388"); if (value) { value.textContent = String(1388 * 2); } }
+function handler1389(event) { const value = document.getElementById("r1389"); if (value) { value.textContent = String(1389 * 2); } }
+function handler1390(event) { const value = document.getElementById("r1390"); if (value) { value.textContent = String(1390 * 2); } }
+function handler1391(event) { const value = document.getElementById("r1391"); if (value) { value.textContent = String(1391 * 2); } }
+function handler1392(event) { const value = document.getElementById("r1392"); if (value) { value.textContent = String(1392 * 2); } }
+function handler1393(event) { const value = document.getElementById("r1393"); if (value) { value.textContent = String(1393 * 2); } }
+function handler1394(event) { const value = document.getElementById("r1394"); if (value) { value.textContent = String(1394 * 2); } }
+function handler1395(event) { const value = document.getElementById("r1395"); if (value) { value.textContent = String(1395 * 2); } }
+function handler1396(event) { const value = document.getElementById("r1396"); if (value) { value.textContent = String(1396 * 2); } }
+function handler1397(event) { const value = document.getElementById("r1397"); if (value) { value.textContent = String(1397 * 2); } }
+function handler1398(event) { const value = document.getElementById("r1398"); if (value) { value.textContent = String(1398 * 2); } }
+function handler1399(event) { const value = document.getElementById("r1399"); if (value) { value.textContent = String(1399 * 2); } }
+function handler1400(event) { const value = document.getElementById("r1400"); if (value) { value.textContent = String(1400 * 2); } }
+function handler1401(event) { const value = document.getElementById("r1401"); if (value) { value.textContent = String(1401 * 2); } }
+function handler1402(event) { const value = document.getElementById("r1402"); if (value) { value.textContent = String(1402 * 2); } }
+function handler1403(event) { const value = document.getElementById("r1403"); if (value) { value.textContent = String(1403 * 2); } }
+function handler1404(event) { const value = document.getElementById("r1404"); if (value) { value.textContent = String(1404 * 2); } }
+function handler1405(event) { const value = document.getElementById("r1405"); if (value) { value.textContent = String(1405 * 2); } }
+function handler1406(event) { const value = document.getElementById("r1406"); if (value) { value.textContent = String(1406 * 2); } }
+function handler1407(event) { const value = document.getElementById("r1407"); if (value) { value.textContent = String(1407 * 2); } }
+function handler1408(event) { const value = document.getElementById("r1408"); if (value) { value.textContent = String(1408 * 2); } }
+function handler1409(event) { const value = document.getElementById("r1409"); if (value) { value.textContent = String(1409 * 2); } }
+function handler1410(event) { const value = document.getElementById("r1410"); if (value) { value.textContent = String(1410 * 2); } }
+function handler1411(event) { const value = document.getElementById("r1411"); if (value) { value.textContent = String(1411 * 2); } }
+function handler1412(event) { const value = document.getElementById("r1412"); if (value) { value.textContent = String(1412 * 2); } }
+function handler1413(event) { const value = document.getElementById("r1413"); if (value) { value.textContent = String(1413 * 2); } }
+function handler1414(event) { const value = document.getElementById("r1414"); if (value) { value.textContent = String(1414 * 2); } }
+function handler1415(event) { const value = document.getElementById("r1415"); if (value) { value.textContent = String(1415 * 2); } }
+function handler1416(event) { const value = document.getElementById("r1416"); if (value) { value.textContent = String(1416 * 2); } }
+function handler1417(event) { const value = document.getElementById("r1417"); if (value) { value.textContent = String(1417 * 2); } }
+function handler1418(event) { const value = document.getElementById("r1418"); if (value) { value.textContent = String(1418 * 2); } }
+function handler1419(event) { const value = document.getElementById("r1419"); if (value) { value.textContent = String(1419 * 2); } }
+function handler1420(event) { const value = document.getElementById("r1420"); if (value) { value.textContent = String(1420 * 2); } }
+function handler1421(event) { const value = document.getElementById("r1421"); if (value) { value.textContent = String(1421 * 2); } }
+function handler1422(event) { const value = document.getElementById("r1422"); if (value) { value.textContent = String(1422 * 2); } }
+function handler1423(event) { const value = document.getElementById("r1423"); if (value) { value.textContent = String(1423 * 2); } }
+function handler1424(event) { const value = document.getElementById("r1424"); if (value) { value.textContent = String(1424 * 2); } }
+function handler1425(event) { const value = document.getElementById("r1425"); if (value) { value.textContent = String(1425 * 2); } }
+function handler1426(event) { const value = document.getElementById("r1426"); if (value) { value.textContent = String(1426 * 2); } }
+function handler1427(event) { const value = document.getElementById("r1427"); if (value) { value.textContent = String(1427 * 2); } }
+function handler1428(event) { const value = document.getElementById("r1428"); if (value) { value.textContent = String(1428 * 2); } }
+function handler1429(event) { const value = document.getElementById("r1429"); if (value) { value.textContent = String(1429 * 2); } }
+function handler1430(event) { const value = document.getElementById("r1430"); if (value) { value.textContent = String(1430 * 2); } }
+function handler1431(event) { const value = document.getElementById("r1431"); if (value) { value.textContent = String(1431 * 2); } }
+function handler1432(event) { const value = document.getElementById("r1432"); if (value) { value.textContent = String(1432 * 2); } }
+function handler1433(event) { const value = document.getElementById("r1433"); if (value) { value.textContent = String(1433 * 2); } }
+function handler1434(event) { const value = document.getElementById("r1434"); if (value) { value.textContent = String(1434 * 2); } }
+function handler1435(event) { const value = document.getElementById("r1435"); if (value) { value.textContent = String(1435 * 2); } }
+function handler1436(event) { const value = document.getElementById("r1436"); if (value) { value.textContent = String(1436 * 2); } }
+function handler1437(event) { const value = document.getElementById("r1437"); if (value) { value.textContent = String(1437 * 2); } }
+function handler1438(event) { const value = document.getElementById("r1438"); if (value) { value.textContent = String(1438 * 2); } }
+function handler1439(event) { const value = document.getElementById("r1439"); if (value) { value.textContent = String(1439 * 2); } }
+function handler1440(event) { const value = document.getElementById("r1440"); if (value) { value.textContent = String(1440 * 2); } }
+function handler1441(event) { const value = document.getElementById("r1441"); if (value) { value.textContent = String(1441 * 2); } }
+function handler1442(event) { const value = document.getElementById("r1442"); if (value) { value.textContent = String(1442 * 2); } }
+function handler1443(event) { const value = document.getElementById("r1443"); if (value) { value.textContent = String(1443 * 2); } }
+function handler1444(event) { const value = document.getElementById("r1444"); if (value) { value.textContent = String(1444 * 2); } }
+function handler1445(event) { const value = document.getElementById("r1445"); if (value) { value.textContent = String(1445 * 2); } }
+function handler1446(event) { const value = document.getElementById("r1446"); if (value) { value.textContent = String(1446 * 2); } }
+function handler1447(event) { const value = document.getElementById("r1447"); if (value) { value.textContent = String(1447 * 2); } }
+function handler1448(event) { const value = document.getElementById("r1448"); if (value) { value.textContent = String(1448 * 2); } }
+function handler1449(event) { const value = document.getElementById("r1449"); if (value) { value.textContent = String(1449 * 2); } }
+function handler1450(event) { const value = document.getElementById("r1450"); if (value) { value.textContent = String(1450 * 2); } }
+function handler1451(event) { const value = document.getElementById("r1451"); if (value) { value.textContent = String(1451 * 2); } }
+function handler1452(event) { const value = document.getElementById("r1452"); if (value) { value.textContent = String(1452 * 2); } }
+function handler1453(event) { const value = document.getElementById("r1453"); if (value) { value.textContent = String(1453 * 2); } }
+function handler1454(event) { const value = document.getElementById("r1454"); if (value) { value.textContent = String(1454 * 2); } }
+function handler1455(event) { const value = document.getElementById("r1455"); if (value) { value.textContent = String(1455 * 2); } }
+function handler1456(event) { const value = document.getElementById("r1456"); if (value) { value.textContent = String(1456 * 2); } }
+function handler1457(event) { const value = document.getElementById("r1457"); if (value) { value.textContent = String(1457 * 2); } }
+function handler1458(event) { const value = document.getElementById("r1458"); if (value) { value.textContent = String(1458 * 2); } }
+function handler1459(event) { const value = document.getElementById("r1459"); if (value) { value.textContent = String(1459 * 2); } }
+function handler1460(event) { const value = document.getElementById("r1460"); if (value) { value.textContent = String(1460 * 2); } }
+function handler1461(event) { const value = document.getElementById("r1461"); if (value) { value.textContent = String(1461 * 2); } }
+function handler1462(event) { const value = document.getElementById("r1462"); if (value) { value.textContent = String(1462 * 2); } }
+function handler1463(event) { const value = document.getElementById("r1463"); if (value) { value.textContent = String(1463 * 2); } }
+function handler1464(event) { const value = document.getElementById("r1464"); if (value) { value.textContent = String(1464 * 2); } }
+function handler1465(event) { const value = document.getElementById("r1465"); if (value) { value.textContent = String(1465 * 2); } }
+function handler1466(event) { const value = document.getElementById("r1466"); if (value) { value.textContent = String(1466 * 2); } }
+function handler1467(event) { const value = document.getElementById("r1467"); if (value) { value.textContent = String(1467 * 2); } }
+function handler1468(event) { const value = document.getElementById("r1468"); if (value) { value.textContent = String(1468 * 2); } }
+function handler1469(event) { const value = document.getElementById("r1469"); if (value) { value.textContent = String(1469 * 2); } }
+function handler1470(event) { const value = document.getElementById("r1470"); if (value) { value.textContent = String(1470 * 2); } }
+function handler1471(event) { const value = document.getElementById("r1471"); if (value) { value.textContent = String(1471 * 2); } }
+function handler1472(event) { const value = document.getElementById("r1472"); if (value) { value.textContent = String(1472 * 2); } }
+function handler1473(event) { const value = document.getElementById("r1473"); if (value) { value.textContent = String(1473 * 2); } }
+function handler1474(event) { const value = document.getElementById("r1474"); if (value) { value.textContent = String(1474 * 2); } }
+function handler1475(event) { const value = document.getElementById("r1475"); if (value) { value.textContent = String(1475 * 2); } }
+function handler1476(event) { const value = document.getElementById("r1476"); if (value) { value.textContent = String(1476 * 2); } }
+function handler1477(event) { const value = document.getElementById("r1477"); if (value) { value.textContent = String(1477 * 2); } }
+function handler1478(event) { const value = document.getElementById("r1478"); if (value) { value.textContent = String(1478 * 2); } }
+function handler1479(event) { const value = document.getElementById("r1479"); if (value) { value.textContent = String(1479 * 2); } }
+function handler1480(event) { const value = document.getElementById("r1480"); if (value) { value.textContent = String(1480 * 2); } }
+function handler1481(event) { const value = document.getElementById("r1481"); if (value) { value.textContent = String(1481 * 2); } }
+function handler1482(event) { const value = document.getElementById("r1482"); if (value) { value.textContent = String(1482 * 2); } }
+function handler1483(event) { const value = document.getElementById("r1483"); if (value) { value.textContent = String(1483 * 2); } }
+function handler1484(event) { const value = document.getElementById("r1484"); if (value) { value.textContent = String(1484 * 2); } }
+function handler1485(event) { const value = document.getElementById("r1485"); if (value) { value.textContent = String(1485 * 2); } }
+function handler1486(event) { const value = document.getElementById("r1486"); if (value) { value.textContent = String(1486 * 2); } }
+function handler1487(event) { const value = document.getElementById("r1487"); if (value) { value.textContent = String(1487 * 2); } }
+function handler1488(event) { const value = document.getElementById("r1488"); if (value) { value.textContent = String(1488 * 2); } }
+function handler1489(event) { const value = document.getElementById("r1489"); if (value) { value.textContent = String(1489 * 2); } }
+function handler1490(event) { const value = document.getElementById("r1490"); if (value) { value.textContent = String(1490 * 2); } }
+function handler1491(event) { const value = document.getElementById("r1491"); if (value) { value.textContent = String(1491 * 2); } }
+function handler1492(event) { const value = document.getElementById("r1492"); if (value) { value.textContent = String(1492 * 2); } }
+function handler1493(event) { const value = document.getElementById("r1493"); if (value) { value.textContent = String(1493 * 2); } }
+function handler1494(event) { const value = document.getElementById("r1494"); if (value) { value.textContent = String(1494 * 2); } }
+function handler1495(event) { const value = document.getElementById("r1495"); if (value) { value.textContent = String(1495 * 2); } }
+function handler1496(event) { const value = document.getElementById("r1496"); if (value) { value.textContent = String(1496 * 2); } }
+function handler1497(event) { const value = document.getElementById("r1497"); if (value) { value.textContent = String(1497 * 2); } }
+function handler1498(event) { const value = document.getElementById("r1498"); if (value) { value.textContent = String(1498 * 2); } }
+function handler1499(event) { const value = document.getElementById("r1499"); if (value) { value.textContent = String(1499 * 2); } }
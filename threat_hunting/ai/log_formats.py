@@ -0,0 +1,121 @@
+"""Lecture des journaux locaux : NDJSON, CSV et syslog, éventuellement compressés en gzip.
+
+Chaque format est lu au fil de l'eau et produit des entrées (dictionnaires)
+directement utilisables par SigmaAnalyzer :
+
+* NDJSON : un objet JSON par ligne (read_ndjson, lignes de longueur bornée) ;
+* CSV : une entrée par ligne, clés de l'en-tête, cellules vides omises (le
+  champ est absent, comme pour 'champ: null') ;
+* syslog : RFC 3164 (« <PRI>Mmm jj hh:mm:ss hôte programme[pid]: message »,
+  avec ou sans <PRI>, comme dans /var/log) et RFC 5424 ; une ligne non
+  reconnue donne une entrée {'message': ligne}.
+
+La compression gzip est détectée d'après les premiers octets ; le format,
+d'après l'extension du fichier puis, à défaut, d'après son contenu. Un
+fichier gzip tronqué ou corrompu lève ValueError à l'endroit où la lecture
+s'interrompt : les entrées déjà produites restent valables.
+"""
+import csv
+import io
+import re
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional
+
+from .sigma_analyzer import read_blocks, read_ndjson, read_stream_lines
+
+FORMATS = ('ndjson', 'csv', 'syslog')
+
+_EXTENSIONS = {'.ndjson': 'ndjson', '.jsonl': 'ndjson', '.json': 'ndjson', '.csv': 'csv',
+               '.syslog': 'syslog', '.log': 'syslog'}
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+_SYSLOG_FACILITIES = ('kern', 'user', 'mail', 'daemon', 'auth', 'syslog', 'lpr', 'news', 'uucp', 'cron',
+                      'authpriv', 'ftp', 'ntp', 'security', 'console', 'solaris-cron',
+                      'local0', 'local1', 'local2', 'local3', 'local4', 'local5', 'local6', 'local7')
+_SYSLOG_SEVERITIES = ('emerg', 'alert', 'crit', 'err', 'warning', 'notice', 'info', 'debug')
+
+_RFC5424_RE = re.compile(
+    r'<(?P<pri>\d{1,3})>1 (?P<timestamp>\S+) (?P<hostname>\S+) (?P<program>\S+) (?P<pid>\S+) (?P<msgid>\S+) '
+    r'(?P<sd>-|(?:\[(?:[^\]\\]|\\.)*\])+) ?(?P<message>.*)', re.DOTALL)
+_RFC3164_RE = re.compile(
+    r'(?:<(?P<pri>\d{1,3})>)?(?P<timestamp>[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d|\d{4}-\d\d-\d\dT\S+) '
+    r'(?P<hostname>\S+) (?P<program>[^\s:\[]+)(?:\[(?P<pid>[^\]]*)\])?: ?(?P<message>.*)', re.DOTALL)
+
+
+def parse_syslog_line(line: str) -> Dict:
+    """Entrée d'une ligne syslog : timestamp, hostname, program, pid, message, et facility / severity si <PRI>."""
+    match = _RFC5424_RE.match(line) or _RFC3164_RE.match(line)
+    if match is None:
+        return {'message': line}
+    entry = {key: value for key, value in match.groupdict().items() if value not in (None, '-')}
+    pri = entry.pop('pri', None)
+    if pri is not None:
+        facility, severity = divmod(int(pri), 8)
+        if facility < len(_SYSLOG_FACILITIES):
+            entry['facility'] = _SYSLOG_FACILITIES[facility]
+        entry['severity'] = _SYSLOG_SEVERITIES[severity]
+    return entry
+
+
+def read_syslog(lines: Iterable[str]) -> Iterator[Dict]:
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line.strip():
+            yield parse_syslog_line(line)
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[Dict]:
+    """Entrées d'un CSV avec en-tête ; les cellules vides sont omises."""
+    for row in csv.DictReader(lines):
+        yield {key: value for key, value in row.items() if key is not None and value not in (None, '')}
+
+
+def detect_format(name: str, head: bytes) -> str:
+    """Format d'après l'extension (hors .gz), à défaut d'après le début du contenu décompressé."""
+    name = name[:-3] if name.endswith('.gz') else name
+    for extension, log_format in _EXTENSIONS.items():
+        if name.endswith(extension):
+            if log_format == 'syslog' and head.lstrip()[:1] == b'{':
+                # Fichier .log contenant du NDJSON
+                return 'ndjson'
+            return log_format
+    return 'ndjson' if head.lstrip()[:1] == b'{' else 'syslog'
+
+
+class _BlockStream(io.RawIOBase):
+    """Flux binaire en lecture seule sur un itérateur de blocs (read_blocks)."""
+
+    def __init__(self, blocks: Iterator[bytes]):
+        self._blocks = blocks
+        self._pending = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._blocks, b'')
+            if not self._pending:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def read_log_entries(stream: BinaryIO, log_format: Optional[str] = None, name: str = '') -> Iterator[Dict]:
+    """Entrées d'un flux binaire (fichier, sys.stdin.buffer) ; log_format None : détection automatique."""
+    stream = stream if hasattr(stream, 'peek') else io.BufferedReader(stream)
+    if stream.peek(2)[:2] == _GZIP_MAGIC:
+        # Décompression de read_blocks : une archive tronquée lève ValueError, pas EOFError
+        stream = io.BufferedReader(_BlockStream(read_blocks(stream, gzipped=True)))
+    if log_format is None:
+        log_format = detect_format(name, stream.peek(64))
+    if log_format == 'ndjson':
+        return read_ndjson(read_stream_lines(stream, gzipped=False))
+    text = io.TextIOWrapper(stream, encoding='utf-8', errors='replace', newline='')
+    if log_format == 'csv':
+        return read_csv(text)
+    if log_format == 'syslog':
+        return read_syslog(text)
+    raise ValueError(f"Format de journal inconnu : {log_format} (attendu : {', '.join(FORMATS)})")
@@ -0,0 +1,266 @@
+"""Coût marginal d'une règle SIGMA ou YARA, mesuré avant sa publication.
+
+Une seule règle mal écrite (expression régulière commençant par '.*', chaîne
+YARA de deux octets...) ralentit toutes les analyses qui suivent. Avant
+d'enregistrer une règle, on mesure ce qu'elle ajoute au jeu de règles
+courant sur le corpus de référence livré dans benchmark/ :
+
+* SIGMA : sigma_events.ndjson.gz, quelques milliers d'entrées Windows
+  (Security, Sysmon, PowerShell) et syslog. Le jeu courant, déjà compilé,
+  n'est pas recompilé : la règle candidate est compilée seule (expressions
+  régulières du jeu reprises) et le temps de son évaluation, index compris,
+  est relevé sur chaque entrée. Unité : µs par entrée du corpus. Le coût du
+  jeu courant est mesuré une fois par version du jeu.
+* YARA : les fichiers de benchmark/yara (textes, scripts, page HTML, binaire
+  PE factice). Le corpus est analysé avec le jeu courant seul puis avec la
+  candidate en plus (espace de noms distinct) ; le coût marginal est la
+  différence des meilleurs temps. Unité : ms par Mio analysé. Les
+  avertissements du compilateur YARA (« may slow down scanning ») sont
+  joints au bilan.
+
+Chaque mesure est précédée d'une passe de chauffe et répétée : la médiane
+(SIGMA) ou le minimum (YARA) des passes est retenu.
+
+Une règle SIGMA peut être soumise par n'importe qui : elle n'est jamais
+exécutée sans garde-fous.
+
+* Une expression '|re' à quantificateurs imbriqués (rule_lint.backtracking_risk)
+  n'est pas exécutée : RuleCostError.
+* La mesure s'arrête dès que le temps cumulé de la candidate dépasse le
+  budget de la passe : son coût moyen est alors déjà hors budget.
+* La mesure s'exécute dans un processus fils (fork), tué après timeout
+  secondes ; le bilan est alors marqué timed_out, avec pour coût la borne
+  inférieure timeout / nombre d'entrées. Sans fork (Windows), la mesure
+  s'exécute dans le processus courant, sans limite de durée.
+"""
+import multiprocessing
+import statistics
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import yara
+
+from .rule_lint import backtracking_risk
+from .sigma_analyzer import RuleSet, read_ndjson, read_stream_lines
+from .sigma_compiler import CompileContext, EventView, RegexFieldNode, SigmaCompileError, compile_rule, parse_rule
+from .sigma_index import RuleIndex
+from .sigma_timing import elapsed_since
+
+CORPUS_DIR = Path(__file__).parent / 'benchmark'
+SIGMA_CORPUS = CORPUS_DIR / 'sigma_events.ndjson.gz'
+YARA_CORPUS = CORPUS_DIR / 'yara'
+
+DEFAULT_SIGMA_BUDGET_US = 20.0
+DEFAULT_YARA_BUDGET_MS = 5.0
+DEFAULT_TIMEOUT_S = 10.0
+
+# Coût du jeu courant (µs par entrée), par jeu compilé
+_baseline_costs: 'weakref.WeakKeyDictionary[RuleSet, float]' = weakref.WeakKeyDictionary()
+
+
+class RuleCostError(ValueError):
+    """Règle candidate illisible ou non compilable : son coût ne peut pas être mesuré."""
+
+
+class CostReport(NamedTuple):
+    """Coût marginal d'une règle candidate et coût du jeu courant, dans la même unité."""
+    kind: str
+    marginal: float
+    baseline: float
+    unit: str
+    budget: float
+    corpus: str
+    warnings: List[str] = []
+    timed_out: bool = False
+
+    @property
+    def over_budget(self) -> bool:
+        # Interrompue par le délai : coût réel inconnu, mais excessif
+        return self.timed_out or self.marginal > self.budget
+
+    def as_dict(self) -> Dict:
+        return {
+            'type': self.kind,
+            'marginal': round(self.marginal, 3),
+            'baseline': round(self.baseline, 3),
+            'relative': round(self.marginal / self.baseline, 4) if self.baseline else None,
+            'unit': self.unit,
+            'budget': self.budget,
+            'over_budget': self.over_budget,
+            'corpus': self.corpus,
+            'warnings': self.warnings,
+            'timed_out': self.timed_out,
+        }
+
+
+@lru_cache(maxsize=1)
+def _sigma_events() -> Tuple[Dict, ...]:
+    with open(SIGMA_CORPUS, 'rb') as f:
+        return tuple(read_ndjson(read_stream_lines(f)))
+
+
+@lru_cache(maxsize=1)
+def _yara_samples() -> Tuple[bytes, ...]:
+    return tuple(path.read_bytes() for path in sorted(YARA_CORPUS.iterdir()) if path.is_file())
+
+
+def measure_sigma_rule(rule: Dict, baseline: RuleSet, budget: float = DEFAULT_SIGMA_BUDGET_US,
+                       passes: int = 3, timeout: float = DEFAULT_TIMEOUT_S) -> CostReport:
+    """Coût marginal (µs par entrée) de rule évaluée à côté du jeu baseline, déjà compilé.
+
+    Lève RuleCostError si la règle n'est pas compilable ou si une de ses
+    expressions risque un retour arrière catastrophique.
+    """
+    try:
+        tree, aggregation = parse_rule(rule)
+        for pattern in _regex_patterns(tree):
+            if backtracking_risk(pattern):
+                raise RuleCostError(f"Expression '{pattern}' à quantificateurs imbriqués : règle non exécutée")
+        context = CompileContext(baseline.context)
+        candidate = compile_rule(rule, context, (tree, aggregation))
+        context.finalize()
+    except SigmaCompileError as e:
+        raise RuleCostError(f"Règle SIGMA non compilable : {e}")
+
+    events = _sigma_events()
+    baseline_cost = _baseline_costs.get(baseline)
+    result = _run_limited(_sigma_costs, (RuleIndex([candidate], context.accessor),
+                                         baseline if baseline_cost is None else None, events, budget, passes), timeout)
+    unit = 'µs/entrée'
+    corpus = f'{len(events)} entrées'
+    if result is None:
+        return CostReport('SIGMA', timeout * 1e6 / len(events), baseline_cost or 0.0, unit, budget, corpus,
+                          timed_out=True)
+    marginal, measured = result
+    if measured is not None:
+        baseline_cost = _baseline_costs[baseline] = measured
+    return CostReport('SIGMA', marginal, baseline_cost, unit, budget, corpus)
+
+
+def _regex_patterns(node) -> List[str]:
+    patterns = list(node.patterns) if isinstance(node, RegexFieldNode) else []
+    for child in node.children():
+        patterns.extend(_regex_patterns(child))
+    return patterns
+
+
+def _sigma_costs(candidate: RuleIndex, baseline: Optional[RuleSet], events: Tuple[Dict, ...], budget: float,
+                 passes: int) -> Tuple[float, Optional[float]]:
+    """(coût de la candidate, coût de baseline si fourni) en µs par entrée ; exécuté dans le processus fils."""
+    per_event = 1e6 / len(events)
+    # Temps cumulé au-delà duquel le coût moyen de la passe dépasse le budget
+    limit = budget / per_event
+    partitions = candidate.partitions()
+    costs = []
+    for number in range(passes + 1):
+        total = 0.0
+        for event in events:
+            view = EventView(event)
+            start = perf_counter()
+            for compiled in candidate.candidates(view, partitions):
+                compiled.match(view)
+            total += elapsed_since(start)
+            if total > limit:
+                # Déjà hors budget : inutile de poursuivre la mesure
+                return total * per_event, _ruleset_cost(baseline, events, passes)
+        # La première passe sert de chauffe (expressions compilées, caches)
+        if number:
+            costs.append(total)
+    return statistics.median(costs) * per_event, _ruleset_cost(baseline, events, passes)
+
+
+def _ruleset_cost(ruleset: Optional[RuleSet], events: Tuple[Dict, ...], passes: int) -> Optional[float]:
+    if ruleset is None:
+        return None
+    index = ruleset.index
+    partitions = index.partitions()
+    totals = []
+    for _ in range(passes + 1):
+        start = perf_counter()
+        for event in events:
+            view = EventView(event)
+            for compiled in index.candidates(view, partitions):
+                compiled.match(view)
+        totals.append(perf_counter() - start)
+    return statistics.median(totals[1:]) * 1e6 / len(events)
+
+
+def _run_limited(function: Callable, args: Tuple, timeout: float):
+    """function(*args) dans un processus fils tué après timeout secondes ; None s'il a été interrompu.
+
+    Le fils hérite des objets du parent (fork) : règles compilées et corpus
+    ne sont pas sérialisés, seul le résultat l'est.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return function(*args)
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_run_child, args=(sender, function, args))
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            return None
+        failed, value = receiver.recv()
+    except EOFError:
+        raise RuleCostError("Mesure interrompue : le processus de mesure s'est arrêté")
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+    if failed:
+        raise RuleCostError(f"Mesure impossible : {value}")
+    return value
+
+
+def _run_child(sender, function: Callable, args: Tuple):
+    try:
+        sender.send((False, function(*args)))
+    except Exception as e:
+        sender.send((True, str(e)))
+    finally:
+        sender.close()
+
+
+@lru_cache(maxsize=4)
+def _compiled_yara(baseline_path: str, mtime_ns: int) -> Tuple[str, 'yara.Rules']:
+    """Source et règles compilées du fichier baseline_path, recompilées seulement s'il change."""
+    source = Path(baseline_path).read_text(encoding='utf-8')
+    return source, yara.compile(sources={'baseline': source})
+
+
+def measure_yara_rule(source: str, baseline_path: Path, budget: float = DEFAULT_YARA_BUDGET_MS,
+                      passes: int = 5) -> CostReport:
+    """Coût marginal (ms par Mio) de la règle YARA source ajoutée aux règles du fichier baseline_path."""
+    try:
+        candidate = yara.compile(source=source)
+    except yara.Error as e:
+        raise RuleCostError(f"Règle YARA non compilable : {e}")
+    baseline_source, baseline = _compiled_yara(str(baseline_path), Path(baseline_path).stat().st_mtime_ns)
+    combined = yara.compile(sources={'baseline': baseline_source, 'candidate': source})
+
+    samples = _yara_samples()
+
+    def scan(rules) -> float:
+        start = perf_counter()
+        for data in samples:
+            rules.match(data=data)
+        return perf_counter() - start
+
+    scan(baseline)
+    scan(combined)
+    baseline_times = []
+    combined_times = []
+    # Passes alternées : une dérive de la machine pèse autant sur les deux jeux
+    for _ in range(passes):
+        baseline_times.append(scan(baseline))
+        combined_times.append(scan(combined))
+    mebibytes = sum(map(len, samples)) / 2 ** 20
+    best_baseline = min(baseline_times)
+    return CostReport('YARA', max(min(combined_times) - best_baseline, 0.0) * 1e3 / mebibytes,
+                      best_baseline * 1e3 / mebibytes, 'ms/Mio', budget,
+                      f'{len(samples)} fichiers, {mebibytes:.2f} Mio', list(candidate.warnings))
@@ -0,0 +1,358 @@
+"""Analyse statique des performances des règles YARA et SIGMA.
+
+Complément de la mesure de rule_budget : sans corpus ni exécution, on
+signale les constructions connues pour ralentir les analyses.
+
+YARA (texte d'un fichier .yar ou d'une règle) :
+
+* short-atom : chaîne littérale ou suite d'octets fixes de moins de
+  MIN_ATOM_LENGTH octets ; YARA cherche d'abord des atomes de 4 octets au
+  plus, un atome court se retrouve partout ;
+* low-entropy-atom : atome fait d'un seul octet répété ou d'octets très
+  fréquents (00, 20, 90, CC, FF) ;
+* unanchored-regex : expression régulière sans littéral d'au moins
+  MIN_ATOM_LENGTH caractères (aucun atome exploitable), ou avec une répétition
+  non bornée (.*, .+, {n,}) ;
+* filesize-loop : boucle 'for ... in (... filesize ...)' dont le nombre
+  d'itérations croît avec la taille du fichier ;
+* yara-warning : avertissements du compilateur YARA (« may slow down
+  scanning »...).
+
+SIGMA (règle déjà lue en dictionnaire) :
+
+* leading-wildcard : motif générique commençant par '*' ou '?' qui n'est pas
+  réductible à un atome contains / endswith (sigma_literals) : il est évalué
+  par une expression régulière non ancrée ;
+* unbounded-regex : '|re' non ancrée (sans ^) avec une répétition non
+  bornée (.*, .+, \\S+, {n,}) ;
+* catastrophic-regex : '|re' avec des quantificateurs imbriqués ((a+)+),
+  risque de retour arrière catastrophique ; rule_budget refuse d'exécuter
+  une telle règle ;
+* keyword-search : recherche par mots-clés sur toutes les valeurs de l'entrée ;
+* no-discriminating-field : aucun champ à valeur exacte (ex. EventID) ne
+  permet à l'index (sigma_index) d'écarter la règle ; sans aucun champ requis,
+  elle est évaluée sur chaque entrée de sa source de logs.
+
+Une règle illisible ou non compilable donne un avertissement syntax-error.
+"""
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import yaml
+import yara
+
+from .sigma_compiler import FieldNode, KeywordNode, Node, RegexFieldNode, SigmaCompileError, parse_rule
+
+MIN_ATOM_LENGTH = 4
+
+# Octets trop fréquents dans les fichiers pour faire de bons atomes
+_COMMON_BYTES = frozenset((0x00, 0x20, 0x90, 0xcc, 0xff))
+
+# Répétition non bornée d'un caractère quelconque ou d'une classe
+_UNBOUNDED_RE = re.compile(r'(?:\.|\\[sSwWdD]|\[[^\]]*\])(?:\*|\+|\{\d+,\})')
+# Échappements de caractères littéraux (\\, \., \x41...), neutralisés avant la recherche des répétitions
+_LITERAL_ESCAPE_RE = re.compile(r'\\x[0-9A-Fa-f]{2}|\\[^sSwWdD]')
+# Groupe répété contenant lui-même une répétition : (a+)+, (\w*)*
+_NESTED_QUANTIFIER_RE = re.compile(r'\((?:[^()\\]|\\.)*[*+](?:[^()\\]|\\.)*\)(?:\*|\+|\{\d+,\})')
+_REGEX_SYNTAX = frozenset('.^$*+?{}[]|()')
+
+_YARA_RULE_RE = re.compile(r'\brule\s+(\w+)[^{]*\{')
+_YARA_FILESIZE_LOOP_RE = re.compile(r'\bfor\b[^:]*?\bin\s*\([^)]*\bfilesize\b')
+
+
+class LintWarning(NamedTuple):
+    """Avertissement : code, emplacement (règle, chaîne ou champ) et message."""
+    code: str
+    location: str
+    message: str
+
+    def as_dict(self) -> Dict:
+        return self._asdict()
+
+    def __str__(self) -> str:
+        return f"{self.location} : [{self.code}] {self.message}"
+
+
+# --- SIGMA ------------------------------------------------------------------
+
+def lint_sigma_rule(rule: Dict) -> List[LintWarning]:
+    """Avertissements de performance d'une règle SIGMA (dictionnaire)."""
+    title = str(rule.get('title', 'Sans titre'))
+    try:
+        tree, _ = parse_rule(rule)
+    except SigmaCompileError as e:
+        return [LintWarning('syntax-error', title, str(e))]
+
+    warnings = []
+    for node in _walk(tree):
+        if isinstance(node, FieldNode):
+            for pattern in node.wildcards:
+                if pattern[:1] in ('*', '?'):
+                    warnings.append(LintWarning(
+                        'leading-wildcard', f'{title} / {node.field}',
+                        f"Motif '{pattern}' commençant par un joker : expression régulière non ancrée "
+                        f"évaluée sur chaque valeur ; préférer contains / endswith ou un motif ancré"))
+        elif isinstance(node, RegexFieldNode):
+            for pattern in node.patterns:
+                problem = regex_problem(pattern)
+                if problem:
+                    code = 'catastrophic-regex' if backtracking_risk(pattern) else 'unbounded-regex'
+                    warnings.append(LintWarning(code, f'{title} / {node.field}',
+                                                f"Expression '{pattern}' : {problem}"))
+        elif isinstance(node, KeywordNode):
+            warnings.append(LintWarning(
+                'keyword-search', title,
+                "Recherche par mots-clés sur toutes les valeurs de chaque entrée ; préférer un champ précis"))
+
+    requirements = tree.requirements()
+    if not requirements:
+        warnings.append(LintWarning(
+            'no-discriminating-field', title,
+            "Aucun champ requis : la règle est évaluée sur chaque entrée de sa source de logs"))
+    elif all(values is None for values in requirements.values()):
+        warnings.append(LintWarning(
+            'no-discriminating-field', title,
+            "Aucun champ à valeur exacte (ex. EventID) pour écarter la règle sans l'évaluer"))
+    return warnings
+
+
+def lint_sigma_text(text: str) -> List[LintWarning]:
+    try:
+        rule = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        return [LintWarning('syntax-error', 'YAML', str(e))]
+    if not isinstance(rule, dict):
+        return [LintWarning('syntax-error', 'YAML', "La règle SIGMA doit être un objet YAML")]
+    return lint_sigma_rule(rule)
+
+
+def backtracking_risk(pattern: str) -> bool:
+    """Vrai si l'expression contient des quantificateurs imbriqués ((a+)+) : durée exponentielle possible."""
+    return bool(_NESTED_QUANTIFIER_RE.search(_LITERAL_ESCAPE_RE.sub('x', pattern)))
+
+
+def regex_problem(pattern: str) -> Optional[str]:
+    """Description du risque d'une expression régulière, None si elle paraît raisonnable.
+
+    Une expression ancrée au début (^) n'est essayée qu'à une position : une
+    répétition non bornée n'y est pas signalée.
+    """
+    if backtracking_risk(pattern):
+        return "quantificateurs imbriqués, risque de retour arrière catastrophique"
+    pattern = _LITERAL_ESCAPE_RE.sub('x', pattern)
+    if not pattern.startswith('^') and _UNBOUNDED_RE.search(pattern):
+        return "répétition non bornée (.*, .+, {n,}) dans une expression non ancrée ; la borner ({0,N}) ou l'ancrer (^)"
+    return None
+
+
+def _walk(node: Node) -> Iterator[Node]:
+    yield node
+    for child in node.children():
+        yield from _walk(child)
+
+
+# --- YARA -------------------------------------------------------------------
+
+class _YaraString(NamedTuple):
+    identifier: str
+    kind: str  # 'text', 'hex' ou 'regex'
+    value: str
+    modifiers: str
+
+
+def lint_yara_text(source: str) -> List[LintWarning]:
+    """Avertissements de performance des règles YARA d'un texte (fichier .yar ou règle seule)."""
+    try:
+        compiled = yara.compile(source=source)
+    except yara.Error as e:
+        return [LintWarning('syntax-error', 'YARA', str(e))]
+
+    warnings = [LintWarning('yara-warning', 'YARA', message) for message in compiled.warnings]
+    for name, strings, condition in _yara_rules(_strip_comments(source)):
+        for string in strings:
+            location = f'{name} / {string.identifier}'
+            if string.kind == 'regex':
+                warnings.extend(_lint_yara_regex(location, string.value))
+                continue
+            atom = _best_atom(string)
+            if len(atom) < MIN_ATOM_LENGTH:
+                warnings.append(LintWarning(
+                    'short-atom', location,
+                    f"Atome de {len(atom)} octet(s) : correspond partout, chaque occurrence est vérifiée"))
+            if atom and (len(set(atom)) == 1 or set(atom) <= _COMMON_BYTES):
+                warnings.append(LintWarning(
+                    'low-entropy-atom', location,
+                    f"Atome peu discriminant ({atom.hex(' ')}) : octets répétés ou très fréquents"))
+        if _YARA_FILESIZE_LOOP_RE.search(condition):
+            warnings.append(LintWarning(
+                'filesize-loop', name,
+                "Boucle sur un intervalle dépendant de filesize : coût proportionnel à la taille du fichier"))
+    return warnings
+
+
+def _lint_yara_regex(location: str, pattern: str) -> List[LintWarning]:
+    warnings = []
+    longest = max((len(run) for run in _literal_runs(pattern)), default=0)
+    if longest < MIN_ATOM_LENGTH:
+        warnings.append(LintWarning(
+            'unanchored-regex', location,
+            f"Expression /{pattern}/ sans littéral d'au moins {MIN_ATOM_LENGTH} caractères : aucun atome exploitable"))
+    problem = regex_problem(pattern)
+    if problem:
+        warnings.append(LintWarning('unanchored-regex', location, f"Expression /{pattern}/ : {problem}"))
+    return warnings
+
+
+def _literal_runs(pattern: str) -> Iterator[str]:
+    """Suites de caractères littéraux d'une expression régulière (hors classes, alternatives et répétitions)."""
+    run = []
+    i = 0
+    depth = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped.isalnum():
+                # \d, \w, \x41... : classe ou caractère codé, fin de la suite
+                yield ''.join(run)
+                run = []
+            else:
+                run.append(escaped)
+            i += 2
+            continue
+        if char == '[':
+            yield ''.join(run)
+            run = []
+            depth += 1
+        elif char == ']' and depth:
+            depth -= 1
+        elif depth:
+            pass
+        elif char in '*+?{':
+            # La répétition porte sur le dernier caractère : il n'est pas garanti
+            if run:
+                run.pop()
+            yield ''.join(run)
+            run = []
+            if char == '{':
+                end = pattern.find('}', i)
+                i = len(pattern) if end < 0 else end
+        elif char in _REGEX_SYNTAX:
+            yield ''.join(run)
+            run = []
+        else:
+            run.append(char)
+        i += 1
+    yield ''.join(run)
+
+
+def _best_atom(string: _YaraString) -> bytes:
+    """Plus longue suite d'octets fixes d'une chaîne texte ou hexadécimale."""
+    if string.kind == 'text':
+        return _unescape(string.value)
+    best = b''
+    run = bytearray()
+    depth = 0
+    negated = False
+    for token in re.findall(r'\[[^\]]*\]|[()|~]|[0-9A-Fa-f?]{2}', string.value):
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        # Alternatives, sauts, jokers et octets niés (~00) interrompent la suite d'octets fixes
+        if depth or negated or token in '()|~' or token.startswith('[') or '?' in token:
+            negated = token == '~'
+            if len(run) > len(best):
+                best = bytes(run)
+            run = bytearray()
+            continue
+        run.append(int(token, 16))
+    return max(best, bytes(run), key=len)
+
+
+_ESCAPES = {b'n': b'\n', b't': b'\t', b'r': b'\r'}
+
+
+def _unescape(text: str) -> bytes:
+    """Octets d'une chaîne texte YARA (échappements \\xNN, \\n, \\t, \\r, \\", \\\\)."""
+    return re.sub(
+        rb'\\(x[0-9A-Fa-f]{2}|.)',
+        lambda m: bytes([int(m.group(1)[1:], 16)]) if m.group(1)[:1] == b'x' else _ESCAPES.get(m.group(1), m.group(1)),
+        text.encode('utf-8'),
+    )
+
+
+def _strip_comments(source: str) -> str:
+    """Texte sans commentaires // et /* */, les chaînes et expressions régulières étant préservées."""
+    return re.sub(r'"(?:[^"\\\n]|\\.)*"|/\*.*?\*/|//[^\n]*',
+                  lambda m: m.group(0) if m.group(0).startswith('"') else ' ', source, flags=re.DOTALL)
+
+
+def _yara_rules(source: str) -> Iterator[Tuple[str, List[_YaraString], str]]:
+    """(nom, chaînes, condition) de chaque règle du texte."""
+    for match in _YARA_RULE_RE.finditer(source):
+        body = _rule_body(source, match.end())
+        strings_part, _, condition = body.partition('condition:')
+        strings_part = strings_part.split('strings:', 1)[1] if 'strings:' in strings_part else ''
+        yield match.group(1), list(_yara_strings(strings_part)), condition
+
+
+def _rule_body(source: str, start: int) -> str:
+    """Corps d'une règle jusqu'à l'accolade fermante, en ignorant les chaînes, hexadécimaux et expressions."""
+    depth = 1
+    i = start
+    previous = ''
+    while i < len(source) and depth:
+        char = source[i]
+        if char == '"' or (char == '/' and previous == '='):
+            i = _skip_quoted(source, i, char)
+            previous = char
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        if not char.isspace():
+            previous = char
+        i += 1
+    return source[start:i - 1]
+
+
+def _skip_quoted(source: str, start: int, quote: str) -> int:
+    i = start + 1
+    while i < len(source) and source[i] != quote:
+        i += 2 if source[i] == '\\' else 1
+    return i + 1
+
+
+_YARA_STRING_RE = re.compile(
+    r'(\$\w*)\s*=\s*(?:"(?P<text>(?:[^"\\]|\\.)*)"|\{(?P<hex>[^}]*)\}|/(?P<regex>(?:[^/\\\n]|\\.)*)/[is]*)'
+    r'(?P<modifiers>[^\n$]*)')
+
+
+def _yara_strings(section: str) -> Iterator[_YaraString]:
+    for match in _YARA_STRING_RE.finditer(section):
+        for kind in ('text', 'hex', 'regex'):
+            if match.group(kind) is not None:
+                yield _YaraString(match.group(1), kind, match.group(kind), match.group('modifiers').strip())
+                break
+
+
+# --- Fichiers ---------------------------------------------------------------
+
+def lint_file(path: Path) -> List[LintWarning]:
+    """Avertissements d'un fichier de règles, d'après son extension (.yar / .yara ou .yml / .yaml)."""
+    text = Path(path).read_text(encoding='utf-8')
+    if Path(path).suffix in ('.yar', '.yara'):
+        return lint_yara_text(text)
+    return lint_sigma_text(text)
+
+
+def lint_rule_content(type_regle: str, contenu: str) -> List[LintWarning]:
+    """Avertissements du contenu d'une Regle selon son type (YARA ou SIGMA)."""
+    if type_regle == 'YARA':
+        return lint_yara_text(contenu)
+    if type_regle == 'SIGMA':
+        return lint_sigma_text(contenu)
+    return []
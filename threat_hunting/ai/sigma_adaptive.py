@@ -0,0 +1,235 @@
+"""Ordre adaptatif des opérandes des ET et des OU selon leur sélectivité observée.
+
+Une sélection est compilée dans l'ordre du YAML : un motif générique coûteux
+sur CommandLine peut être évalué avant un test d'EventID presque toujours
+faux. Chaque ET/OU compilé (Junction) lit l'ordre de ses opérandes dans une
+cellule que le PredicateOptimizer remplace périodiquement :
+
+* pendant une courte fenêtre de mesure (quelques centaines d'entrées toutes
+  les quelques milliers), chaque jonction évalue tous ses opérandes, sans
+  court-circuit, et relève pour chacun le nombre de succès et le temps
+  passé : les statistiques ne dépendent pas de l'ordre courant ;
+* à la fin de la fenêtre, les opérandes d'un ET sont triés par coût / taux
+  d'échec croissant (les tests bon marché qui éliminent le plus d'abord),
+  ceux d'un OU par coût / taux de succès croissant (les plus probables
+  d'abord). Le nouvel ordre n'est retenu que si son coût attendu est
+  nettement inférieur à celui de l'ordre courant ; les statistiques sont
+  ensuite atténuées pour suivre l'évolution du flux d'entrées.
+
+Une fenêtre de mesure coûte cher (aucun court-circuit) : tant qu'elles ne
+changent l'ordre que de quelques jonctions (moins de STABLE_RATIO), leur
+intervalle double, jusqu'à MAX_PROFILE_INTERVAL. C'est pourquoi l'ordre
+adaptatif n'est activé qu'à la demande (SIGMA_ADAPTIVE_ORDERING).
+
+Un même jeu de règles peut être évalué par plusieurs threads : les
+statistiques d'une jonction sont relevées et lues sous son verrou, pris
+seulement pendant les fenêtres de mesure.
+
+Les prédicats n'ont pas d'effet de bord : l'ordre ne change que le coût de
+l'évaluation, jamais son résultat. Hors fenêtre de mesure, le surcoût est
+d'une lecture de liste par jonction évaluée.
+"""
+import threading
+from time import perf_counter
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .sigma_timing import TIMER_OVERHEAD
+
+DEFAULT_PROFILE_INTERVAL = 10000
+DEFAULT_PROFILE_WINDOW = 100
+MAX_PROFILE_INTERVAL = 640000
+
+# Part des jonctions réordonnées en deçà de laquelle les ordres sont considérés stables
+STABLE_RATIO = 0.01
+
+# Évaluations mesurées nécessaires avant de réordonner une jonction
+MIN_PROFILED_CALLS = 8
+
+# Poids des statistiques passées après chaque réordonnancement
+DECAY = 0.5
+
+# Gain relatif de coût attendu en deçà duquel l'ordre courant est conservé
+MIN_GAIN = 0.1
+
+_INFINITY = float('inf')
+
+
+class Junction:
+    """ET (conjunction vrai) ou OU compilé : opérandes, ordre courant et statistiques de chaque opérande."""
+
+    __slots__ = ('conjunction', 'operands', 'current', 'order', 'calls', 'hits', 'costs', '_profiler', '_lock')
+
+    def __init__(self, conjunction: bool, operands: Tuple[Callable, ...]):
+        self.conjunction = conjunction
+        self.operands = operands
+        # Ordre appliqué hors mesure, et cellule lue par la fermeture du nœud à chaque évaluation
+        self.current = operands
+        self.order: List[Tuple[Callable, ...]] = [operands]
+        self.calls = 0.0
+        self.hits = [0.0] * len(operands)
+        self.costs = [0.0] * len(operands)
+        self._profiler = None
+        self._lock = threading.Lock()
+
+    def start_profiling(self):
+        """Remplace les opérandes par un seul opérande qui les évalue et les mesure tous."""
+        if self._profiler is None:
+            self._profiler = self._build_profiler()
+        self.order[0] = (self._profiler,)
+
+    def _build_profiler(self) -> Callable:
+        operands = tuple(enumerate(self.operands))
+        conjunction = self.conjunction
+        hits = self.hits
+        costs = self.costs
+        lock = self._lock
+
+        def profile(view) -> bool:
+            result = conjunction
+            measures = []
+            for i, operand in operands:
+                start = perf_counter()
+                value = operand(view)
+                measures.append((i, perf_counter() - start, value))
+                if value:
+                    if not conjunction:
+                        result = True
+                elif conjunction:
+                    result = False
+            # Relevé groupé : une seule prise du verrou par évaluation
+            with lock:
+                for i, elapsed, value in measures:
+                    costs[i] += elapsed
+                    if value:
+                        hits[i] += 1
+                self.calls += 1
+            return result
+        return profile
+
+    def _estimates(self) -> Dict[int, Tuple[float, float]]:
+        """(coût moyen, probabilité de poursuivre l'évaluation) de chaque opérande, par id.
+
+        Un ET continue tant que ses opérandes sont vrais, un OU tant qu'ils
+        sont faux.
+        """
+        estimates = {}
+        for operand, hits, cost in zip(self.operands, self.hits, self.costs):
+            passed = hits / self.calls
+            estimates[id(operand)] = (
+                max(cost / self.calls - TIMER_OVERHEAD, 0.0),
+                passed if self.conjunction else 1.0 - passed,
+            )
+        return estimates
+
+    @staticmethod
+    def _expected_cost(order: Tuple[Callable, ...], estimates: Dict[int, Tuple[float, float]]) -> float:
+        expected = 0.0
+        reached = 1.0
+        for operand in order:
+            cost, proceed = estimates[id(operand)]
+            expected += reached * cost
+            reached *= proceed
+        return expected
+
+    def reorder(self) -> bool:
+        """Termine la mesure et applique l'ordre le moins coûteux ; retourne vrai si l'ordre a changé."""
+        with self._lock:
+            return self._reorder()
+
+    def _reorder(self) -> bool:
+        current = self.current
+        order = current
+        if self.calls >= MIN_PROFILED_CALLS:
+            estimates = self._estimates()
+
+            def rank(operand: Callable) -> float:
+                # Coût par chance de conclure (échec d'un ET, succès d'un OU)
+                cost, proceed = estimates[id(operand)]
+                return cost / (1.0 - proceed) if proceed < 1.0 else _INFINITY
+
+            # Tri stable : à rang égal, l'ordre courant est conservé
+            candidate = tuple(sorted(current, key=rank))
+            if self._expected_cost(candidate, estimates) < (1.0 - MIN_GAIN) * self._expected_cost(current, estimates):
+                order = candidate
+            self.calls *= DECAY
+            for i in range(len(self.operands)):
+                self.hits[i] *= DECAY
+                self.costs[i] *= DECAY
+        self.current = order
+        self.order[0] = order
+        return order != current
+
+    def statistics(self) -> List[Dict]:
+        """Taux de succès et coût moyen (µs) mesurés de chaque opérande, dans l'ordre de la règle."""
+        with self._lock:
+            calls = self.calls or 1
+            return [
+                {'hit_rate': round(hits / calls, 4), 'cost_us': round(cost / calls * 1e6, 3)}
+                for hits, cost in zip(self.hits, self.costs)
+            ]
+
+
+class PredicateOptimizer:
+    """Alterne fenêtres de mesure et réordonnancement des jonctions d'un jeu de règles compilé.
+
+    tick() est appelé une fois par entrée évaluée ; les changements de phase
+    sont pris sous verrou, un seul thread les applique.
+    """
+
+    def __init__(self, junctions: Sequence[Junction], interval: int = DEFAULT_PROFILE_INTERVAL,
+                 window: int = DEFAULT_PROFILE_WINDOW):
+        self.junctions = junctions
+        self.base_interval = interval
+        self.interval = interval
+        self.window = window
+        self.profiling = False
+        self.windows = 0
+        self.reordered = 0
+        # La première fenêtre de mesure commence dès la première entrée
+        self._countdown = 1
+        self._lock = threading.Lock()
+
+    def tick(self):
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self._advance()
+
+    def _advance(self):
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._countdown > 0:
+                return
+            if self.profiling:
+                changed = sum(junction.reorder() for junction in self.junctions)
+                self.reordered += changed
+                self.windows += 1
+                if changed > STABLE_RATIO * len(self.junctions):
+                    self.interval = self.base_interval
+                else:
+                    self.interval = min(self.interval * 2, MAX_PROFILE_INTERVAL)
+                self._countdown = self.interval
+            else:
+                for junction in self.junctions:
+                    junction.start_profiling()
+                self._countdown = self.window
+            self.profiling = not self.profiling
+        finally:
+            self._lock.release()
+
+    def stats(self, top: int = 0) -> Dict:
+        """Bilan des réordonnancements ; top donne les statistiques des jonctions les plus coûteuses."""
+        stats = {
+            'junctions': len(self.junctions),
+            'windows': self.windows,
+            'reordered': self.reordered,
+            'interval': self.interval,
+            'profiling': self.profiling,
+        }
+        if top:
+            costly = sorted(self.junctions, key=lambda j: sum(j.costs) / (j.calls or 1), reverse=True)[:top]
+            stats['costliest'] = [
+                {'kind': 'and' if junction.conjunction else 'or', 'operands': junction.statistics()}
+                for junction in costly
+            ]
+        return stats
@@ -0,0 +1,333 @@
+"""Conditions d'agrégation SIGMA évaluées au fil d'un flux d'entrées.
+
+Une condition telle que
+
+    condition: selection | count() by TargetUserName > 5
+    timeframe: 10m
+
+se déclenche lorsqu'au moins 6 entrées correspondant à 'selection', pour un
+même TargetUserName, tombent dans une fenêtre glissante de 10 minutes.
+Fonctions prises en charge : count(), count(champ) (valeurs distinctes),
+sum, avg, min et max d'un champ numérique ; comparateurs >, >=, =.
+Les comparateurs < et <= ne peuvent être décidés qu'en fin de fenêtre et ne
+sont pas pris en charge en flux.
+
+La mémoire est bornée quelle que soit la durée du flux :
+
+* count() : tampon circulaire des horodatages, limité au seuil + 1 ;
+* count(champ) : valeurs distinctes les plus récentes, limitées au seuil + 1 ;
+* sum/avg/min/max : compteurs par tranche de temps (BUCKETS tranches par
+  fenêtre), les tranches sorties de la fenêtre étant évincées ;
+* groupes : au plus max_groups clés, les moins récemment vues sont évincées,
+  ainsi que celles dont la dernière entrée est sortie de la fenêtre.
+
+Lorsqu'un groupe déclenche, son état est remis à zéro : une nouvelle alerte
+exige une nouvelle série d'entrées.
+
+L'horodatage d'une entrée est lu dans le premier champ de TIMESTAMP_FIELDS
+présent (nombre, éventuellement écrit en texte, de secondes ou millisecondes
+depuis l'époque, ou date ISO 8601, suffixe Z compris) ; à défaut, l'heure de
+traitement est utilisée.
+"""
+import math
+import operator
+import re
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .sigma_fields import Accessor, resolve
+
+TIMESTAMP_FIELDS = ('@timestamp', 'timestamp', 'TimeCreated', 'UtcTime', 'EventTime', 'time')
+BUCKETS = 16
+DEFAULT_MAX_GROUPS = 100_000
+
+_FUNCTIONS = ('count', 'sum', 'avg', 'min', 'max')
+_COMPARATORS = {'>': operator.gt, '>=': operator.ge, '=': operator.eq, '==': operator.eq}
+_AGGREGATION_RE = re.compile(
+    r'^(?P<function>\w+)\(\s*(?P<field>[^\s()]*)\s*\)'
+    r'(?:\s+by\s+(?P<group_by>[^\s,<>=]+(?:\s*,\s*[^\s,<>=]+)*))?'
+    r'\s*(?P<comparator><=|>=|==|=|<|>)\s*(?P<threshold>-?\d+(?:\.\d+)?)$',
+    re.IGNORECASE,
+)
+_TIMEFRAME_RE = re.compile(r'^(\d+)\s*([smhdM])$')
+_TIMEFRAME_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'M': 30 * 86400}
+
+
+def parse_timeframe(timeframe: Any) -> float:
+    """Convertit une durée SIGMA ('30s', '5m', '1h', '2d') en secondes ; lève ValueError sinon."""
+    match = _TIMEFRAME_RE.match(str(timeframe).strip())
+    if not match:
+        raise ValueError(f"Durée 'timeframe' invalide : {timeframe!r} (attendu : 30s, 5m, 1h, 2d...)")
+    return int(match.group(1)) * _TIMEFRAME_UNITS[match.group(2)]
+
+
+class Aggregation:
+    """Condition d'agrégation analysée : fonction(champ) by groupes comparateur seuil, sur timeframe."""
+
+    def __init__(self, function: str, field: Optional[str], group_by: Tuple[str, ...],
+                 comparator: str, threshold: float, timeframe: Optional[float]):
+        self.function = function
+        self.field = field
+        self.group_by = group_by
+        self.comparator = comparator
+        self.threshold = threshold
+        self.timeframe = timeframe
+        # Accesseurs des champs dans les entrées (sigma_fields), fixés à la compilation
+        self.field_accessor: Optional[Accessor] = field
+        self.group_accessors: Tuple[Accessor, ...] = group_by
+
+    def resolved(self, accessor: Callable[[str], Accessor]) -> 'Aggregation':
+        """Copie dont les champs sont lus par les accesseurs donnés (self si rien ne change)."""
+        field_accessor = accessor(self.field) if self.field else None
+        group_accessors = tuple(accessor(name) for name in self.group_by)
+        if field_accessor == self.field and group_accessors == self.group_by:
+            return self
+        resolved = Aggregation(self.function, self.field, self.group_by, self.comparator,
+                               self.threshold, self.timeframe)
+        resolved.field_accessor = field_accessor
+        resolved.group_accessors = group_accessors
+        return resolved
+
+    def __repr__(self):
+        by = f" by {', '.join(self.group_by)}" if self.group_by else ''
+        return f"{self.function}({self.field or ''}){by} {self.comparator} {self.threshold:g}"
+
+
+def parse_aggregation(expression: str, timeframe: Any = None) -> Aggregation:
+    """Analyse la partie d'une condition qui suit '|' ; lève ValueError si elle n'est pas prise en charge."""
+    match = _AGGREGATION_RE.match(expression.strip())
+    if not match:
+        raise ValueError(f"Agrégation non prise en charge : {expression}")
+    function = match.group('function').lower()
+    if function not in _FUNCTIONS:
+        raise ValueError(f"Fonction d'agrégation non prise en charge : {function}")
+    field = match.group('field') or None
+    if function != 'count' and field is None:
+        raise ValueError(f"La fonction {function}() exige un champ : {expression}")
+    comparator = match.group('comparator')
+    if comparator not in _COMPARATORS:
+        raise ValueError(f"Comparateur '{comparator}' non pris en charge en flux : {expression}")
+    group_by = tuple(name.strip() for name in (match.group('group_by') or '').split(',') if name.strip())
+    return Aggregation(
+        function, field, group_by, comparator, float(match.group('threshold')),
+        parse_timeframe(timeframe) if timeframe is not None else None,
+    )
+
+
+# Suffixe 'Z' et décalage sans deux-points (+0000), refusés par fromisoformat avant Python 3.11
+_ISO_UTC_SUFFIX = re.compile(r'[zZ]$')
+_ISO_COMPACT_OFFSET = re.compile(r'([+-]\d{2})(\d{2})$')
+# Fractions de seconde : fromisoformat (3.10) n'accepte que 3 ou 6 chiffres
+_ISO_FRACTION = re.compile(r'(\.\d+)')
+
+
+def _iso_for_python(value: str) -> str:
+    """Date ISO 8601 réécrite dans la forme lue par datetime.fromisoformat de Python 3.10."""
+    value = _ISO_UTC_SUFFIX.sub('+00:00', value)
+    if 'T' in value or ' ' in value:
+        value = _ISO_COMPACT_OFFSET.sub(r'\1:\2', value)
+    return _ISO_FRACTION.sub(lambda match: match.group(1)[:7].ljust(7, '0'), value, count=1)
+
+
+def event_timestamp(event: Dict) -> float:
+    """Horodatage d'une entrée en secondes depuis l'époque (heure courante à défaut)."""
+    for name in TIMESTAMP_FIELDS:
+        value = event.get(name)
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            try:
+                value = float(value)
+            except ValueError:
+                pass
+        if isinstance(value, (int, float)):
+            if not math.isfinite(value):
+                continue
+            # Au-delà de l'an 5000 en secondes : valeur exprimée en millisecondes
+            return value / 1000 if value > 1e11 else float(value)
+        try:
+            parsed = datetime.fromisoformat(_iso_for_python(str(value)))
+        except ValueError:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return time.time()
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+class _CountWindow:
+    """count() : horodatages des dernières entrées, au plus seuil + 1."""
+
+    __slots__ = ('stamps',)
+
+    def __init__(self, capacity: int):
+        self.stamps = deque(maxlen=capacity)
+
+    def add(self, timestamp: float, value: Any):
+        self.stamps.append(timestamp)
+
+    def evict(self, horizon: float):
+        stamps = self.stamps
+        while stamps and stamps[0] < horizon:
+            stamps.popleft()
+
+    def value(self) -> Optional[float]:
+        return len(self.stamps)
+
+
+class _DistinctWindow:
+    """count(champ) : dernière apparition des valeurs distinctes les plus récentes, au plus seuil + 1."""
+
+    __slots__ = ('seen', 'capacity')
+
+    def __init__(self, capacity: int):
+        self.seen: OrderedDict = OrderedDict()
+        self.capacity = capacity
+
+    def add(self, timestamp: float, value: Any):
+        if value is None:
+            return
+        key = str(value)
+        self.seen[key] = timestamp
+        self.seen.move_to_end(key)
+        if len(self.seen) > self.capacity:
+            self.seen.popitem(last=False)
+
+    def evict(self, horizon: float):
+        seen = self.seen
+        while seen and next(iter(seen.values())) < horizon:
+            seen.popitem(last=False)
+
+    def value(self) -> Optional[float]:
+        return len(self.seen)
+
+
+class _NumericWindow:
+    """sum/avg/min/max : (début de tranche, somme, nombre, min, max) par tranche de temps."""
+
+    __slots__ = ('function', 'width', 'buckets')
+
+    def __init__(self, function: str, width: Optional[float]):
+        self.function = function
+        self.width = width
+        self.buckets = deque()
+
+    def add(self, timestamp: float, value: Any):
+        number = _number(value)
+        if number is None:
+            return
+        start = timestamp - timestamp % self.width if self.width else 0.0
+        buckets = self.buckets
+        if buckets and buckets[-1][0] == start:
+            _, total, count, low, high = buckets[-1]
+            buckets[-1] = (start, total + number, count + 1, min(low, number), max(high, number))
+        else:
+            buckets.append((start, number, 1, number, number))
+            if len(buckets) > BUCKETS + 1:
+                buckets.popleft()
+
+    def evict(self, horizon: float):
+        buckets = self.buckets
+        # Une tranche est évincée dès que sa fin est sortie de la fenêtre
+        while buckets and buckets[0][0] + self.width <= horizon:
+            buckets.popleft()
+
+    def value(self) -> Optional[float]:
+        if not self.buckets:
+            return None
+        if self.function == 'sum':
+            return sum(bucket[1] for bucket in self.buckets)
+        if self.function == 'avg':
+            return sum(bucket[1] for bucket in self.buckets) / sum(bucket[2] for bucket in self.buckets)
+        if self.function == 'min':
+            return min(bucket[3] for bucket in self.buckets)
+        return max(bucket[4] for bucket in self.buckets)
+
+
+class AggregationState:
+    """État glissant d'une règle d'agrégation, par clé de regroupement, à mémoire bornée."""
+
+    def __init__(self, aggregation: Aggregation, max_groups: int = DEFAULT_MAX_GROUPS):
+        self.aggregation = aggregation
+        self.max_groups = max_groups
+        self.compare = _COMPARATORS[aggregation.comparator]
+        self.capacity = max(int(aggregation.threshold), 0) + 1
+        # clé -> (horodatage de la dernière entrée, fenêtre), de la moins à la plus récemment vue
+        self.groups: OrderedDict = OrderedDict()
+
+    def _window(self):
+        aggregation = self.aggregation
+        if aggregation.function == 'count':
+            if aggregation.field:
+                return _DistinctWindow(self.capacity)
+            return _CountWindow(self.capacity)
+        width = aggregation.timeframe / BUCKETS if aggregation.timeframe else None
+        return _NumericWindow(aggregation.function, width)
+
+    def update(self, event: Dict, timestamp: Optional[float] = None) -> Optional[Dict]:
+        """Prend en compte une entrée qui correspond à la recherche ; retourne le détail si la condition est atteinte."""
+        aggregation = self.aggregation
+        if timestamp is None:
+            timestamp = event_timestamp(event)
+        horizon = timestamp - aggregation.timeframe if aggregation.timeframe else None
+        groups = self.groups
+
+        if horizon is not None:
+            # Groupes dont la dernière entrée est sortie de la fenêtre : plus rien à compter
+            while groups:
+                oldest_key = next(iter(groups))
+                if groups[oldest_key][0] >= horizon:
+                    break
+                del groups[oldest_key]
+
+        key = tuple(str(resolve(event, accessor)) for accessor in aggregation.group_accessors)
+        entry = groups.pop(key, None)
+        window = entry[1] if entry is not None else self._window()
+        groups[key] = (timestamp, window)
+        if len(groups) > self.max_groups:
+            groups.popitem(last=False)
+
+        window.add(timestamp, resolve(event, aggregation.field_accessor) if aggregation.field else None)
+        if horizon is not None:
+            window.evict(horizon)
+        value = window.value()
+        if value is None or not self.compare(value, aggregation.threshold):
+            return None
+
+        del groups[key]
+        return {
+            'condition': repr(aggregation),
+            'group': dict(zip(aggregation.group_by, key)),
+            'value': value,
+            'timeframe': aggregation.timeframe,
+        }
+
+    def __len__(self):
+        return len(self.groups)
+
+
+class AggregationTracker:
+    """États d'agrégation des règles d'une analyse en flux, créés à la première correspondance."""
+
+    def __init__(self, max_groups: int = DEFAULT_MAX_GROUPS):
+        self.max_groups = max_groups
+        self.states: Dict[str, AggregationState] = {}
+
+    def update(self, rule_key: str, aggregation: Aggregation, event: Dict) -> Optional[Dict]:
+        state = self.states.get(rule_key)
+        if state is None or state.aggregation is not aggregation:
+            state = self.states[rule_key] = AggregationState(aggregation, self.max_groups)
+        return state.update(event)
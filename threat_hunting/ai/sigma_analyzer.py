@@ -1,135 +1,745 @@
 import yaml
+import json
 import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import BinaryIO, Dict, List, Any, Optional, Iterable, Iterator, AsyncIterable, AsyncIterator, Sequence, Tuple, Union
+
+from .sigma_adaptive import PredicateOptimizer
+from .sigma_aggregation import AggregationTracker
+from .sigma_fields import Accessor, FieldMapping, resolve
+from .sigma_cache import CachedRuleFile, content_digest, load_cache, save_cache
+from .sigma_grouping import DEFAULT_MAX_SAMPLES, MatchGrouper
+from .sigma_compiler import CompileContext, CompiledRule, EventView, SigmaCompileError, compile_rule, parse_rule
+from .sigma_index import LOGSOURCE_KEYS, RuleIndex
+from .sigma_metadata import RuleHeader, clear_metadata_cache
+from .sigma_profiler import RuleProfiler
+from .sigma_verdicts import VerdictCache
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_RELOAD_INTERVAL = 2.0
+
+# Lecture d'un flux NDJSON : taille des blocs lus (et décompressés), longueur maximale d'une ligne
+NDJSON_CHUNK_SIZE = 64 * 1024
+MAX_NDJSON_LINE = 1024 * 1024
+
+# Règles compilées à la demande par _matches_rule (hors jeu chargé), les plus récentes
+MATCH_RULE_MEMO_SIZE = 256
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# Chargeur YAML sûr implémenté en C (libyaml) s'il est disponible, environ 8 fois plus rapide
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class RuleSet:
+    """Jeu de règles compilé et indexé.
+
+    Un rechargement construit un nouveau RuleSet puis le substitue à l'ancien
+    en une seule affectation : une analyse en cours, qui a pris une référence
+    au jeu courant, ne voit jamais un jeu à moitié chargé.
+
+    Avec adaptive, l'ordre des opérandes des ET et des OU est adapté à la
+    sélectivité observée sur les entrées analysées (voir sigma_adaptive).
+    """
+
+    def __init__(self, compiled_rules: List[CompiledRule],
+                 context: Optional[CompileContext] = None, version: int = 0, adaptive: bool = False):
+        self.compiled_rules = compiled_rules
+        self.context = context
+        self.optimizer = (
+            PredicateOptimizer(context.junctions) if adaptive and context is not None and context.junctions else None
+        )
+        self.index = RuleIndex(compiled_rules, self.accessor)
+        self.version = version
+        fields = _referenced_fields(compiled_rules)
+        self.fields = None if fields is None else tuple(self.accessor(field) for field in fields)
+        self._batch_evaluator = None
+        self._by_source: Optional[Dict[int, CompiledRule]] = None
+
+    def compiled_for(self, rule: Dict) -> Optional[CompiledRule]:
+        """Règle compilée du jeu pour une règle fournie en mémoire (même objet), None sinon."""
+        if self._by_source is None:
+            self._by_source = {
+                id(compiled.header.source): compiled
+                for compiled in self.compiled_rules if isinstance(compiled.header.source, dict)
+            }
+        compiled = self._by_source.get(id(rule))
+        return compiled if compiled is not None and compiled.header.source is rule else None
+
+    def accessor(self, field: str) -> Accessor:
+        """Accesseur d'un nom de champ dans les entrées, selon la correspondance de champs du jeu."""
+        return self.context.accessor(field) if self.context is not None else field
+
+    @property
+    def rules(self) -> List[Dict]:
+        """Règles YAML complètes ; les métadonnées sont relues depuis les fichiers (voir sigma_metadata)."""
+        return [compiled.rule for compiled in self.compiled_rules]
+
+    def compact_rules(self) -> List[Tuple[RuleHeader, Tuple]]:
+        """(en-tête, (arbre, agrégation)) de chaque règle : de quoi recompiler le jeu sans relire le YAML."""
+        return [(compiled.header, (compiled.tree, compiled.aggregation)) for compiled in self.compiled_rules]
+
+    @property
+    def batch_evaluator(self):
+        """Fonctions de masque du mode colonnes (sigma_columnar), construites au premier lot."""
+        if self._batch_evaluator is None:
+            from .sigma_columnar import BatchEvaluator
+            self._batch_evaluator = BatchEvaluator(self.compiled_rules, self.context)
+        return self._batch_evaluator
+
+
+def _referenced_fields(compiled_rules: List[CompiledRule]) -> Optional[Tuple[str, ...]]:
+    """Noms des champs référencés par au moins une règle (None si une règle porte sur toute l'entrée)."""
+    fields = set()
+    for compiled in compiled_rules:
+        rule_fields = compiled.tree.fields()
+        if rule_fields is None:
+            return None
+        fields |= rule_fields
+    return tuple(sorted(fields))
+
+
 class SigmaAnalyzer:
     """Classe pour analyser les logs système avec des règles SIGMA."""
     
-    def __init__(self, rules_dir: str = None):
-        """Initialise l'analyseur SIGMA."""
+    def __init__(self, rules_dir: str = None, rules: Optional[List[Union[Dict, Tuple[RuleHeader, Tuple]]]] = None,
+                 cache_path: Optional[str] = None, verdict_cache_size: int = 0,
+                 field_mapping: Optional[FieldMapping] = None, adaptive_ordering: bool = False,
+                 profile_sample_every: int = 0):
+        """Initialise l'analyseur SIGMA.
+
+        Si rules est fourni (règles YAML déjà lues, ou règles compactes
+        RuleSet.compact_rules() transmises à un processus de travail), elles
+        sont compilées sans relire le répertoire.
+        Si cache_path est fourni, les règles déjà analysées y sont reprises au
+        démarrage (voir sigma_cache) et le cache est mis à jour après chaque
+        chargement qui a dû relire des fichiers.
+        Si verdict_cache_size est non nul, les verdicts des entrées répétées
+        sont mis en cache (voir sigma_verdicts).
+        field_mapping traduit les noms de champs des règles en chemins dans les
+        entrées (voir sigma_fields) ; les noms pointés sont toujours acceptés.
+        Si adaptive_ordering est vrai, les tests de chaque sélection sont
+        réordonnés selon leur coût et leur sélectivité observés (voir
+        sigma_adaptive) ; les résultats ne changent pas, mais les fenêtres de
+        mesure évaluent chaque test sans court-circuit.
+        Si profile_sample_every est non nul, le coût de chaque règle est mesuré
+        sur une entrée sur profile_sample_every en moyenne (voir sigma_profiler).
+        """
         self.rules_dir = Path(rules_dir) if rules_dir else Path(__file__).parent / 'sigma_rules'
-        logger.info(f"Initialisation de l'analyseur SIGMA avec le répertoire : {self.rules_dir}")
-        self.rules = self._load_rules()
-        logger.info(f"Nombre de règles chargées : {len(self.rules)}")
-    
-    def _load_rules(self) -> List[Dict]:
-        """Charge les règles SIGMA depuis le répertoire des règles."""
-        rules = []
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.verdict_cache = VerdictCache(verdict_cache_size) if verdict_cache_size else None
+        self.field_mapping = field_mapping or FieldMapping()
+        self.adaptive_ordering = adaptive_ordering
+        self.profiler = RuleProfiler(profile_sample_every) if profile_sample_every else None
+        self._files: Dict[str, CachedRuleFile] = {}
+        self._context: Optional[CompileContext] = None
+        self._reload_lock = threading.Lock()
+        self._rule_memo: OrderedDict = OrderedDict()
+        self._rule_memo_lock = threading.Lock()
+        if rules is None:
+            logger.info(f"Initialisation de l'analyseur SIGMA avec le répertoire : {self.rules_dir}")
+            self.ruleset = RuleSet(*self._load_rules(), adaptive=adaptive_ordering)
+        else:
+            self.ruleset = RuleSet(*self._compile_rules([
+                rule if isinstance(rule, tuple) else (rule, None) for rule in rules
+            ]), adaptive=adaptive_ordering)
+        logger.info(f"Nombre de règles chargées : {len(self.compiled_rules)}")
+
+    @property
+    def rules(self) -> List[Dict]:
+        """Règles YAML complètes, relues à la demande : pour l'affichage, pas pour l'évaluation."""
+        return self.ruleset.rules
+
+    @property
+    def compiled_rules(self) -> List[CompiledRule]:
+        return self.ruleset.compiled_rules
+
+    @property
+    def index(self) -> RuleIndex:
+        return self.ruleset.index
+
+    def _load_rules(self) -> Tuple[List[CompiledRule], Optional[CompileContext]]:
+        """Charge les règles SIGMA et les compile une fois pour toutes.
+
+        Seuls les fichiers nouveaux ou modifiés (date de modification, taille)
+        depuis la lecture précédente, ou depuis l'écriture du cache au premier
+        chargement, sont relus et réanalysés.
+        """
         logger.info(f"Chargement des règles depuis : {self.rules_dir}")
         
         if not self.rules_dir.exists():
             logger.error(f"ERREUR: Le répertoire n'existe pas : {self.rules_dir}")
-            return rules
-            
-        yml_files = list(self.rules_dir.glob('**/*.yml'))
-        logger.info(f"Fichiers YAML trouvés : {[str(f) for f in yml_files]}")
-        
-        for rule_file in yml_files:
+            self._files = {}
+            return [], None
+
+        known = self._files
+        if not known and self.cache_path is not None:
+            known = load_cache(self.cache_path)
+        files = {}
+        entries = []
+        read = 0
+        for path, signature in self._scan_rules_dir().items():
+            rule_file = known.get(path)
+            if rule_file is None or rule_file.signature != signature:
+                rule_file = self._read_rule_file(path, signature, rule_file)
+                read += 1
+            files[path] = rule_file
+            if rule_file.rule is not None:
+                entries.append((rule_file.rule, rule_file.parsed))
+        logger.info(f"Fichiers YAML trouvés : {len(files)} ({read} relus)")
+        if read:
+            clear_metadata_cache()
+
+        self._files = files
+        loaded = self._compile_rules(entries)
+        if self.cache_path is not None and (read or files.keys() != known.keys()):
+            self.save_cache()
+        return loaded
+
+    def save_cache(self, path: Optional[str] = None) -> bool:
+        """Écrit les règles lues et analysées dans le cache disque (cache_path par défaut)."""
+        path = Path(path) if path else self.cache_path
+        if path is None:
+            return False
+        return save_cache(path, self._files)
+
+    def _scan_rules_dir(self) -> Dict[str, Tuple[int, int]]:
+        """Signature (date de modification en ns, taille) de chaque fichier de règle, triés par chemin."""
+        signatures = {}
+        for rule_file in sorted(self.rules_dir.glob('**/*.yml')):
             try:
-                with open(rule_file, 'r', encoding='utf-8') as f:
-                    rule = yaml.safe_load(f)
-                    if rule and isinstance(rule, dict):
-                        rule['file'] = str(rule_file)
-                        rules.append(rule)
-                        logger.debug(f"Règle chargée depuis {rule_file}: {rule.get('title')}")
-            except Exception as e:
-                logger.error(f"Erreur lors du chargement de la règle {rule_file}: {e}")
-        
-        return rules
+                stat = rule_file.stat()
+            except OSError:
+                continue
+            signatures[str(rule_file)] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def _read_rule_file(self, path: str, signature: Tuple[int, int],
+                        previous: Optional[CachedRuleFile] = None) -> CachedRuleFile:
+        """Lit un fichier de règle ; l'analyse YAML est évitée si son contenu n'a pas changé.
+
+        Seuls l'en-tête compact et l'arbre de détection sont conservés : la
+        règle YAML complète est abandonnée dès l'arbre construit.
+        """
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.error(f"Erreur lors du chargement de la règle {path}: {e}")
+            return CachedRuleFile(signature, b'', None)
+        digest = content_digest(content)
+        if previous is not None and previous.digest == digest:
+            return CachedRuleFile(signature, digest, previous.rule, previous.parsed)
+
+        try:
+            rule = yaml.load(content.decode('utf-8'), Loader=_YAML_LOADER)
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement de la règle {path}: {e}")
+            return CachedRuleFile(signature, digest, None)
+        if not rule or not isinstance(rule, dict):
+            return CachedRuleFile(signature, digest, None)
+        try:
+            parsed = parse_rule(rule)
+        except SigmaCompileError as e:
+            logger.error(f"Règle {path} non compilable : {e}")
+            return CachedRuleFile(signature, digest, None)
+        logger.debug(f"Règle chargée depuis {path}: {rule.get('title')}")
+        return CachedRuleFile(signature, digest, RuleHeader(rule, path, digest), parsed)
+
+    def _compile_rules(self, entries: List[Tuple[Union[Dict, RuleHeader], Optional[Tuple]]]
+                       ) -> Tuple[List[CompiledRule], CompileContext]:
+        """Compile les règles lues ; retourne leur forme compilée et le contexte de compilation.
+
+        entries contient des couples (règle YAML, None) ou (en-tête, arbre
+        déjà construit par parse_rule).
+
+        L'arbre de détection d'un fichier inchangé est réutilisé : seules les
+        fermetures sont régénérées dans le nouveau contexte de compilation.
+        Tous les arbres sont enregistrés dans le contexte avant la compilation,
+        pour que les sous-expressions communes à plusieurs règles soient
+        partagées et mémorisées (voir sigma_compiler).
+        """
+        parsed_rules = []
+        for rule, parsed in entries:
+            if parsed is None:
+                try:
+                    parsed = parse_rule(rule)
+                except SigmaCompileError as e:
+                    logger.error(f"Règle {rule.get('file', rule.get('title'))} non compilable : {e}")
+                    continue
+                rule = RuleHeader(rule)
+            parsed_rules.append((rule, parsed))
+
+        context = CompileContext(self._context, self.field_mapping)
+        for _, (tree, _) in parsed_rules:
+            context.register(tree)
+
+        compiled_rules = []
+        for header, parsed in parsed_rules:
+            try:
+                compiled_rules.append(compile_rule(header, context, parsed))
+            except SigmaCompileError as e:
+                logger.error(f"Règle {header.label} non compilable : {e}")
+
+        context.finalize()
+        self._context = context
+        return compiled_rules, context
+
+    def reload_if_changed(self) -> bool:
+        """Recharge les règles si un fichier a été ajouté, modifié ou supprimé.
+
+        Le nouveau jeu est compilé à côté de l'ancien puis substitué d'un bloc.
+        Si un rechargement est déjà en cours dans un autre thread, l'appel
+        retourne immédiatement et l'ancien jeu reste utilisé.
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            current = self._scan_rules_dir() if self.rules_dir.exists() else {}
+            known = {path: rule_file.signature for path, rule_file in self._files.items()}
+            if current == known:
+                return False
+            version = self.ruleset.version + 1
+            self.ruleset = RuleSet(*self._load_rules(), version=version, adaptive=self.adaptive_ordering)
+            logger.info(f"Règles SIGMA rechargées (version {version}) : {len(self.compiled_rules)} règles")
+            return True
+        finally:
+            self._reload_lock.release()
     
-    def analyze_logs(self, log_data: List[Dict], log_source: str = None) -> List[Dict]:
-        """Analyse les logs avec les règles SIGMA chargées."""
-        if not self.rules:
+    def analyze_logs(self, log_data: List[Dict], log_source: Any = None) -> List[Dict]:
+        """Analyse les logs avec les règles SIGMA chargées.
+
+        log_source peut être un nom de produit ('windows') ou un dictionnaire
+        {'product': ..., 'category': ..., 'service': ...} ; seules les règles
+        dont la logsource correspond aux clés renseignées sont évaluées.
+        """
+        if not self.compiled_rules:
             logger.warning("Aucune règle n'a été chargée pour l'analyse")
             return []
-            
-        results = []
+
         logger.info(f"Début de l'analyse de {len(log_data)} entrées de log")
-        
-        for log_entry in log_data:
-            logger.debug(f"\nAnalyse de l'entrée de log : {log_entry}")
-            
-            for rule in self.rules:
-                if log_source and rule.get('logsource', {}).get('product') != log_source:
-                    continue
-                
-                if self._matches_rule(log_entry, rule):
-                    result = {
-                        'rule_id': rule.get('id', 'N/A'),
-                        'title': rule.get('title', 'Sans titre'),
-                        'description': rule.get('description', ''),
-                        'severity': rule.get('level', 'medium').upper(),
-                        'log_entry': log_entry,
-                        'rule_details': rule
-                    }
-                    logger.info(f"Correspondance trouvée avec la règle: {result['title']}")
-                    results.append(result)
-        
+        results = list(self.iter_matches(log_data, log_source))
         logger.info(f"Analyse terminée. {len(results)} correspondances trouvées.")
+        if self.verdict_cache is not None:
+            logger.info(f"Cache des verdicts : {self.verdict_cache.stats()}")
         return results
-    
+
+    def analyze_logs_grouped(self, log_data: Iterable[Dict], log_source: Any = None,
+                             group_by: Sequence[str] = (), max_samples: int = DEFAULT_MAX_SAMPLES) -> List[Dict]:
+        """Analyse les logs et regroupe les correspondances par (règle, valeurs des champs group_by).
+
+        Chaque groupe donne le nombre de correspondances, la première et la
+        dernière occurrence et au plus max_samples entrées d'exemple (voir
+        sigma_grouping). Aucun résultat individuel n'est construit.
+        """
+        grouper = MatchGrouper(group_by, max_samples, self.ruleset.accessor)
+        for _, log_entry, compiled, _ in self.iter_hits(log_data, log_source, AggregationTracker()):
+            grouper.add(compiled, log_entry)
+        return grouper.results()
+
+    def analyze_logs_compact(self, log_data: Iterable[Dict], log_source: Any = None,
+                             fields: Optional[List[str]] = None) -> Dict[str, List]:
+        """Analyse les logs et retourne les résultats au format compact.
+
+        {'rules': [...], 'results': [...]} : chaque règle déclenchée figure une
+        seule fois dans 'rules' ; chaque correspondance ne contient que des
+        références entières (voir iter_compact_matches).
+        """
+        rules, results = [], []
+        for item in self.iter_compact_matches(log_data, log_source, fields):
+            (rules if 'ref' in item else results).append(item)
+        return {'rules': rules, 'results': results}
+
+    def iter_compact_matches(self, log_data: Iterable[Dict], log_source: Any = None,
+                             fields: Optional[List[str]] = None,
+                             tracker: Optional[AggregationTracker] = None) -> Iterator[Dict]:
+        """Équivalent compact de iter_matches, pour les réponses volumineuses.
+
+        Produit, dans l'ordre du flux :
+
+        * à la première correspondance d'une règle, son entrée de la table des
+          règles : {'ref': n, 'rule_id', 'title', 'description', 'severity'} ;
+        * pour chaque correspondance : {'rule': n, 'log': rang de l'entrée dans
+          log_data}, plus 'fields' (valeurs des seuls champs demandés, si fields
+          est fourni) et 'aggregation' pour une règle d'agrégation.
+
+        Ni la règle YAML complète ni l'entrée de log ne sont recopiées.
+        """
+        if tracker is None:
+            tracker = AggregationTracker()
+        refs: Dict[int, int] = {}
+        accessors = [(field, self.ruleset.accessor(field)) for field in fields or ()]
+        for offset, log_entry, compiled, aggregated in self.iter_hits(log_data, log_source, tracker):
+            ref = refs.get(id(compiled))
+            if ref is None:
+                ref = refs[id(compiled)] = len(refs)
+                yield {
+                    'ref': ref,
+                    'rule_id': compiled.id,
+                    'title': compiled.title,
+                    'description': compiled.description,
+                    'severity': compiled.severity,
+                }
+            match = {'rule': ref, 'log': offset}
+            if fields:
+                match['fields'] = {field: resolve(log_entry, accessor) for field, accessor in accessors}
+            if aggregated is not None:
+                match['aggregation'] = aggregated
+            yield match
+
+    def iter_matches(self, log_data: Iterable[Dict], log_source: Any = None,
+                     tracker: Optional[AggregationTracker] = None) -> Iterator[Dict]:
+        """Analyse un flux d'entrées de log et produit les correspondances au fil de l'eau.
+
+        log_data peut être n'importe quel itérable (liste, générateur, lecture
+        NDJSON d'un fichier...) : aucune entrée ni aucun résultat n'est conservé,
+        la mémoire utilisée ne dépend donc pas de la taille du flux.
+
+        Les règles d'agrégation ('| count() by ... > N') conservent un état
+        glissant borné dans tracker ; en passer un permet de poursuivre les
+        fenêtres d'un appel à l'autre (flux découpé en plusieurs requêtes).
+        """
+        if tracker is None:
+            tracker = AggregationTracker()
+        details = {}
+        for _, log_entry, compiled, aggregated in self.iter_hits(log_data, log_source, tracker):
+            logger.debug("Correspondance trouvée avec la règle: %s", compiled.title)
+            yield self._build_result(compiled, log_entry, aggregated, details)
+
+    async def aiter_matches(self, log_data: AsyncIterable[Dict], log_source: Any = None) -> AsyncIterator[Dict]:
+        """Équivalent asynchrone de iter_matches pour un flux d'entrées asynchrone."""
+        tracker = AggregationTracker()
+        async for log_entry in log_data:
+            for result in self.iter_matches((log_entry,), log_source, tracker):
+                yield result
+
+    def analyze_batch(self, log_data: List[Dict], log_source: Any = None) -> List[Dict]:
+        """Équivalent de analyze_logs évalué en colonnes NumPy (mêmes résultats, même ordre)."""
+        return list(self.iter_batch_matches(log_data, log_source))
+
+    def iter_batch_matches(self, log_data: Iterable[Dict], log_source: Any = None,
+                           batch_size: int = None, tracker: Optional[AggregationTracker] = None) -> Iterator[Dict]:
+        """Équivalent de iter_matches qui évalue le flux par lots de batch_size entrées, en colonnes.
+
+        Adapté aux grands lots homogènes (ex. événements 4688) et aux règles
+        à égalités : chaque valeur distincte d'un champ n'est testée qu'une fois
+        par lot. Sans NumPy, l'évaluation se fait entrée par entrée.
+        """
+        from . import sigma_columnar
+        if tracker is None:
+            tracker = AggregationTracker()
+        if not sigma_columnar.available():
+            logger.warning("NumPy indisponible : évaluation SIGMA entrée par entrée")
+            yield from self.iter_matches(log_data, log_source, tracker)
+            return
+
+        ruleset = self.ruleset
+        evaluator = ruleset.batch_evaluator
+        positions = ruleset.index.positions(self._logsource_filter(log_source))
+        events = iter(log_data)
+        details = {}
+        while True:
+            chunk = list(islice(events, batch_size or sigma_columnar.DEFAULT_BATCH_SIZE))
+            if not chunk:
+                return
+            for offset, compiled in evaluator.evaluate(sigma_columnar.ColumnBatch(chunk), positions):
+                log_entry = chunk[offset]
+                if compiled.aggregation is None:
+                    yield self._build_result(compiled, log_entry, details=details)
+                    continue
+                for _, _, _, aggregated in self._aggregate(offset, log_entry, compiled, tracker):
+                    yield self._build_result(compiled, log_entry, aggregated, details)
+
+    def iter_hits(self, log_data: Iterable[Dict], log_source: Any = None,
+                  tracker: Optional[AggregationTracker] = None) -> Iterator[Tuple[int, Dict, CompiledRule, Optional[Dict]]]:
+        """Produit (rang de l'entrée, entrée, règle compilée, détail de l'agrégation) pour chaque correspondance.
+
+        Forme brute d'iter_matches, sans construction des résultats. tracker
+        conserve l'état des agrégations d'un appel à l'autre (flux découpé en
+        plusieurs parties) ; à défaut, un état propre à cet appel est utilisé.
+        """
+        if tracker is None:
+            tracker = AggregationTracker()
+        for offset, log_entry, compiled in self._iter_search_hits(log_data, log_source):
+            if compiled.aggregation is None:
+                yield offset, log_entry, compiled, None
+            else:
+                yield from self._aggregate(offset, log_entry, compiled, tracker)
+
+    @staticmethod
+    def _aggregate(offset: int, log_entry: Dict, compiled: CompiledRule,
+                   tracker: AggregationTracker) -> Iterator[Tuple[int, Dict, CompiledRule, Optional[Dict]]]:
+        """Applique l'agrégation éventuelle de la règle à une entrée qui satisfait sa recherche."""
+        if compiled.aggregation is None:
+            yield offset, log_entry, compiled, None
+            return
+        aggregated = tracker.update((compiled.id, compiled.title), compiled.aggregation, log_entry)
+        if aggregated is not None:
+            yield offset, log_entry, compiled, aggregated
+
+    def _iter_search_hits(self, log_data: Iterable[Dict], log_source: Any = None) -> Iterator[Tuple[int, Dict, CompiledRule]]:
+        """Produit (rang de l'entrée, entrée, règle compilée) pour chaque recherche satisfaite, dans l'ordre des entrées puis des règles.
+
+        Sans état : les agrégations ne sont pas appliquées ici.
+        """
+        # Référence unique au jeu courant : un rechargement concurrent n'affecte pas cette analyse
+        ruleset = self.ruleset
+        index = ruleset.index
+        logsource = self._logsource_filter(log_source)
+        partitions = index.partitions(logsource)
+        cache = self.verdict_cache
+        optimizer = ruleset.optimizer
+        profiler = self.profiler
+
+        if cache is None:
+            for offset, log_entry in enumerate(log_data):
+                if optimizer is not None:
+                    optimizer.tick()
+                view = EventView(log_entry)
+                if profiler is not None:
+                    if profiler.sample():
+                        verdict = profiler.evaluate(view, index.candidates(view, partitions))
+                    else:
+                        verdict = [compiled for compiled in index.candidates(view, partitions) if compiled.match(view)]
+                    for compiled in verdict:
+                        profiler.matched(compiled)
+                        yield offset, log_entry, compiled
+                    continue
+                for compiled in index.candidates(view, partitions):
+                    if compiled.match(view):
+                        yield offset, log_entry, compiled
+            return
+
+        cache.bind(ruleset.version)
+        fields = ruleset.fields
+        scope = (ruleset.version, tuple((logsource or {}).get(name) for name in LOGSOURCE_KEYS))
+        for offset, log_entry in enumerate(log_data):
+            key = cache.key(log_entry, scope, fields)
+            verdict = cache.get(key)
+            if verdict is None:
+                if optimizer is not None:
+                    optimizer.tick()
+                view = EventView(log_entry)
+                if profiler is not None and profiler.sample():
+                    verdict = tuple(profiler.evaluate(view, index.candidates(view, partitions)))
+                else:
+                    verdict = tuple(compiled for compiled in index.candidates(view, partitions) if compiled.match(view))
+                cache.put(key, verdict)
+            for compiled in verdict:
+                if profiler is not None:
+                    profiler.matched(compiled)
+                yield offset, log_entry, compiled
+
+    @staticmethod
+    def _logsource_filter(log_source: Any) -> Optional[Dict]:
+        if isinstance(log_source, str):
+            return {'product': log_source}
+        return log_source or None
+
+    def _build_result(self, compiled: CompiledRule, log_entry: Dict, aggregated: Optional[Dict] = None,
+                      details: Optional[Dict[int, Dict]] = None) -> Dict:
+        """Construit le résultat d'une correspondance (log_entry est l'entrée qui a déclenché une agrégation).
+
+        details conserve la règle complète de chaque règle déjà déclenchée
+        pendant une analyse : elle n'est relue qu'une fois par règle, et
+        partagée par les résultats de cette règle.
+        """
+        if details is None:
+            rule_details = compiled.rule
+        else:
+            rule_details = details.get(id(compiled))
+            if rule_details is None:
+                rule_details = details[id(compiled)] = compiled.rule
+        result = {
+            'rule_id': compiled.id,
+            'title': compiled.title,
+            'description': compiled.description,
+            'severity': compiled.severity,
+            'log_entry': log_entry,
+            'rule_details': rule_details
+        }
+        if aggregated is not None:
+            result['aggregation'] = aggregated
+        return result
+
     def _matches_rule(self, log_entry: Dict, rule: Dict) -> bool:
-        """Vérifie si une entrée de log correspond à une règle SIGMA."""
-        if 'detection' not in rule:
-            logger.debug(f"Règle {rule.get('title')} ignorée - aucune section 'detection' trouvée")
-            return False
-            
-        detection = rule['detection']
-        
-        # Vérification de la condition
-        condition = detection.get('condition', 'selection')
-        if ' or ' in condition.lower():
-            parts = [p.strip() for p in condition.lower().split(' or ')]
-            return any(self._check_condition(part, detection, log_entry) for part in parts)
+        """Vérifie si une entrée de log correspond à la recherche d'une règle SIGMA (hors agrégation).
+
+        Une règle du jeu chargé est évaluée par sa forme déjà compilée ; une
+        autre règle est compilée une fois et gardée, indexée par son contenu,
+        parmi les MATCH_RULE_MEMO_SIZE plus récentes.
+        """
+        compiled = self.ruleset.compiled_for(rule)
+        if compiled is None:
+            compiled = self._memoized_rule(rule)
+            if compiled is None:
+                return False
+        return compiled.match(EventView(log_entry))
+
+    def _memoized_rule(self, rule: Dict) -> Optional[CompiledRule]:
+        key = json.dumps(rule, sort_keys=True, default=str)
+        memo = self._rule_memo
+        with self._rule_memo_lock:
+            if key in memo:
+                memo.move_to_end(key)
+                return memo[key]
+        try:
+            context = CompileContext(fields=self.field_mapping)
+            compiled = compile_rule(rule, context)
+            context.finalize()
+        except SigmaCompileError as e:
+            logger.debug(f"Règle {rule.get('title')} ignorée - {e}")
+            compiled = None
+        with self._rule_memo_lock:
+            memo[key] = compiled
+            while len(memo) > MATCH_RULE_MEMO_SIZE:
+                memo.popitem(last=False)
+        return compiled
+
+
+def read_ndjson(lines: Iterable[Union[str, bytes]]) -> Iterator[Dict]:
+    """Lit des entrées de log au format NDJSON (un objet JSON par ligne) au fil de l'eau.
+
+    Accepte un fichier ouvert en mode texte ou binaire, ou tout itérable de
+    lignes. Les lignes vides sont ignorées, les lignes invalides journalisées.
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError as e:
+            logger.warning(f"Ligne NDJSON {number} ignorée : {e}")
+            continue
+        if isinstance(entry, dict):
+            yield entry
         else:
-            return self._check_condition(condition, detection, log_entry)
-    
-    def _check_condition(self, condition: str, detection: Dict, log_entry: Dict) -> bool:
-        """Vérifie une condition individuelle."""
-        if condition == 'selection':
-            selection = detection.get('selection', {})
-            return all(
-                self._field_matches(log_entry.get(field), patterns)
-                for field, patterns in selection.items()
-                if field != 'condition'
-            )
-        return False
-    def _field_matches(self, field_value: Any, patterns: Any) -> bool:
-        """Vérifie si une valeur de champ correspond aux motifs donnés."""
-        if field_value is None:
-            return False
-            
-        field_str = str(field_value).lower()
-        
-        # Si patterns est un dictionnaire (pour les opérateurs)
-        if isinstance(patterns, dict):
-            for operator, value in patterns.items():
-                if operator == 'contains':
-                    if isinstance(value, list):
-                        return any(str(v).lower() in field_str for v in value)
-                    return str(value).lower() in field_str
-                    
-        # Si patterns est une liste
-        elif isinstance(patterns, list):
-            return any(self._field_matches(field_value, p) for p in patterns)
-            
-        # Si patterns est une chaîne simple avec caractères génériques
-        pattern = str(patterns).lower()
-        
-        # Gestion des caractères génériques
-        if '*' in pattern:
-            import re
-            # Échapper les autres caractères spéciaux de regex
-            pattern = re.escape(pattern)
-            # Remplacer \* (l'astérisque échappé) par .*
-            pattern = pattern.replace('\\*', '.*')
-            # Ajouter les ancres de début et de fin
-            pattern = f'^{pattern}$'
-            return bool(re.match(pattern, field_str))
+            logger.warning(f"Ligne NDJSON {number} ignorée : un objet JSON est attendu")
+
+
+def read_stream_lines(stream: BinaryIO, gzipped: Optional[bool] = None, chunk_size: int = NDJSON_CHUNK_SIZE,
+                      max_line: int = MAX_NDJSON_LINE) -> Iterator[bytes]:
+    """Découpe en lignes un flux binaire (corps de requête, fichier) lu par blocs, décompressé au fil de l'eau s'il est gzip.
+
+    Si gzipped vaut None, la compression est détectée d'après les premiers
+    octets ; les membres gzip concaténés sont lus à la suite. La mémoire
+    utilisée est bornée par chunk_size et max_line quelle que soit la taille
+    du flux : une ligne plus longue que max_line est abandonnée au fil de la
+    lecture et remplacée par une ligne vide (la numérotation de read_ndjson
+    est conservée). Un flux gzip corrompu ou tronqué lève ValueError.
+    """
+    pending = b''
+    skipping = False
+    for block in read_blocks(stream, gzipped, chunk_size):
+        lines = block.split(b'\n')
+        if skipping:
+            # Suite d'une ligne trop longue, abandonnée jusqu'à sa fin
+            if len(lines) == 1:
+                continue
+            del lines[0]
+            skipping = False
         else:
-            return pattern in field_str
\ No newline at end of file
+            lines[0] = pending + lines[0]
+        pending = lines.pop()
+        for line in lines:
+            if len(line) > max_line:
+                logger.warning(f"Ligne NDJSON de plus de {max_line} octets ignorée")
+                line = b''
+            yield line
+        if len(pending) > max_line:
+            logger.warning(f"Ligne NDJSON de plus de {max_line} octets ignorée")
+            pending = b''
+            skipping = True
+            yield b''
+    if pending:
+        yield pending
+
+
+def read_blocks(stream: BinaryIO, gzipped: Optional[bool] = None,
+                chunk_size: int = NDJSON_CHUNK_SIZE) -> Iterator[bytes]:
+    """Blocs d'au plus chunk_size octets du flux, décompressés s'il est gzip.
+
+    Si gzipped vaut None, la compression est détectée d'après les premiers
+    octets. Un flux gzip corrompu ou tronqué lève ValueError.
+    """
+    chunk = stream.read(chunk_size)
+    if gzipped is None:
+        gzipped = chunk[:2] == _GZIP_MAGIC
+    if not gzipped:
+        while chunk:
+            yield chunk
+            chunk = stream.read(chunk_size)
+        return
+
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    fed = False
+    try:
+        while chunk:
+            data = chunk
+            while data:
+                fed = True
+                # max_length : une petite entrée très compressée ne se décompresse pas d'un bloc
+                block = decompressor.decompress(data, chunk_size)
+                if block:
+                    yield block
+                if decompressor.eof:
+                    # Membre gzip suivant (fichiers concaténés)
+                    data = decompressor.unused_data
+                    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                    fed = False
+                else:
+                    data = decompressor.unconsumed_tail
+            chunk = stream.read(chunk_size)
+        # Données retenues par le décompresseur en fin de flux
+        block = decompressor.flush()
+        if block:
+            yield block
+    except zlib.error as e:
+        raise ValueError(f"Flux gzip invalide : {e}") from e
+    if fed and not decompressor.eof:
+        raise ValueError("Flux gzip tronqué")
+
+
+_shared_analyzer: Optional[SigmaAnalyzer] = None
+_shared_lock = threading.Lock()
+_shared_checked_at = 0.0
+
+
+def get_shared_analyzer(reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+                        cache_path: Optional[str] = None, verdict_cache_size: int = 0,
+                        field_mapping: Optional[str] = None, adaptive_ordering: bool = False,
+                        profile_sample_every: int = 0) -> SigmaAnalyzer:
+    """Retourne l'analyseur SIGMA partagé par tout le processus.
+
+    Il est construit au premier appel (cache_path, verdict_cache_size,
+    field_mapping, chemin d'une correspondance de champs YAML,
+    adaptive_ordering et profile_sample_every ne sont utilisés qu'à ce
+    moment-là) ; ensuite, au plus une fois toutes les reload_interval
+    secondes, le répertoire des règles est vérifié (dates de modification) et
+    seuls les fichiers modifiés sont relus et recompilés.
+    """
+    global _shared_analyzer, _shared_checked_at
+    if _shared_analyzer is None:
+        with _shared_lock:
+            if _shared_analyzer is None:
+                _shared_analyzer = SigmaAnalyzer(
+                    cache_path=cache_path, verdict_cache_size=verdict_cache_size,
+                    field_mapping=FieldMapping.from_file(field_mapping) if field_mapping else None,
+                    adaptive_ordering=adaptive_ordering, profile_sample_every=profile_sample_every,
+                )
+                _shared_checked_at = time.monotonic()
+        return _shared_analyzer
+
+    now = time.monotonic()
+    if now - _shared_checked_at >= reload_interval:
+        _shared_checked_at = now
+        _shared_analyzer.reload_if_changed()
+    return _shared_analyzer
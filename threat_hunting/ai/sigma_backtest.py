@@ -0,0 +1,171 @@
+"""Rétro-analyse (backtesting) de règles SIGMA sur des journaux archivés.
+
+Avant de publier une règle, on veut savoir ce qu'elle aurait détecté sur les
+journaux des dernières semaines : des fichiers NDJSON, souvent compressés en
+gzip, rangés dans un répertoire. Chaque fichier est une tâche d'un pool de
+processus (un fichier par processus à la fois, les plus gros d'abord) :
+
+* les processus reçoivent les règles une seule fois, sous forme compacte,
+  comme ceux de sigma_parallel ;
+* un processus lit son fichier au fil de l'eau (read_stream_lines), écrit
+  ses correspondances en NDJSON dans un fichier temporaire et ne renvoie
+  qu'un bilan (entrées lues, correspondances par règle, durée) ;
+* le processus parent recopie chaque fichier temporaire dans la sortie dès
+  que son fichier est terminé : la mémoire utilisée ne dépend ni de la
+  taille des journaux ni du nombre de correspondances.
+
+Les agrégations sont évaluées fichier par fichier : une fenêtre à cheval
+sur deux fichiers n'est pas vue.
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+import yaml
+
+from . import sigma_parallel
+from .sigma_analyzer import SigmaAnalyzer, read_ndjson, read_stream_lines
+from .sigma_compiler import CompiledRule
+
+# Extensions des journaux archivés reconnues (éventuellement suivies de .gz)
+ARCHIVE_SUFFIXES = ('.ndjson', '.jsonl', '.json', '.log')
+
+
+class FileReport(NamedTuple):
+    """Bilan de l'analyse d'un fichier ; matches : position de la règle -> nombre de correspondances."""
+    path: str
+    events: int
+    matches: Dict[int, int]
+    elapsed: float
+    error: Optional[str] = None
+
+
+class BacktestSummary(NamedTuple):
+    """Bilan global ; matches donne chaque règle du jeu et son nombre de correspondances, décroissant."""
+    files: int
+    events: int
+    matches: List[Tuple[CompiledRule, int]]
+    elapsed: float
+    errors: List[FileReport]
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+
+def archive_files(directory: Path, since: Optional[float] = None) -> List[Path]:
+    """Journaux archivés du répertoire (récursivement), modifiés depuis since (horodatage), les plus gros d'abord."""
+    files = []
+    for path in directory.rglob('*'):
+        name = path.name[:-3] if path.name.endswith('.gz') else path.name
+        if not path.is_file() or not name.endswith(ARCHIVE_SUFFIXES):
+            continue
+        stat = path.stat()
+        if since is None or stat.st_mtime >= since:
+            files.append((stat.st_size, path))
+    # Les plus gros fichiers d'abord : le dernier processus occupé ne termine pas seul un gros fichier
+    return [path for _, path in sorted(files, key=lambda item: (-item[0], str(item[1])))]
+
+
+def load_rule_files(paths: Iterable[str]) -> List[Dict]:
+    """Règles YAML des fichiers ou répertoires donnés ; ValueError pour une règle introuvable ou illisible."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob('**/*.yml')) + sorted(path.glob('**/*.yaml')))
+        elif path.is_file():
+            files.append(path)
+        else:
+            raise ValueError(f"Règle introuvable : {path}")
+    rules = []
+    for path in files:
+        try:
+            rule = yaml.safe_load(path.read_text(encoding='utf-8'))
+        except (OSError, yaml.YAMLError) as e:
+            raise ValueError(f"Règle illisible {path} : {e}")
+        if not isinstance(rule, dict):
+            raise ValueError(f"Règle invalide : {path}")
+        rules.append(rule)
+    return rules
+
+
+def _count(events: Iterable[Dict], counter: List[int]) -> Iterator[Dict]:
+    for event in events:
+        counter[0] += 1
+        yield event
+
+
+def _backtest_file(path: str, shard: str, log_source: Any) -> FileReport:
+    """Analyse un fichier dans un processus de travail ; ses correspondances sont écrites dans shard."""
+    started = time.perf_counter()
+    counter = [0]
+    matches: Counter = Counter()
+    error = None
+    analyzer, positions = sigma_parallel.worker_state()
+    with open(shard, 'w', encoding='utf-8') as output:
+        try:
+            with open(path, 'rb') as f:
+                events = _count(read_ndjson(read_stream_lines(f)), counter)
+                for offset, log_entry, compiled, aggregated in analyzer.iter_hits(events, log_source):
+                    matches[positions[id(compiled)]] += 1
+                    result = {
+                        'file': path,
+                        'event': offset,
+                        'rule_id': compiled.id,
+                        'title': compiled.title,
+                        'severity': compiled.severity,
+                        'log_entry': log_entry,
+                    }
+                    if aggregated is not None:
+                        result['aggregation'] = aggregated
+                    output.write(json.dumps(result, default=str) + '\n')
+        except (OSError, ValueError) as e:
+            # Fichier illisible ou gzip tronqué : les correspondances déjà trouvées sont conservées
+            error = str(e)
+    return FileReport(path, counter[0], dict(matches), time.perf_counter() - started, error)
+
+
+def run_backtest(analyzer: SigmaAnalyzer, files: List[Path], output: TextIO, workers: Optional[int] = None,
+                 log_source: Any = None,
+                 progress: Optional[Callable[[FileReport, int, int], None]] = None) -> BacktestSummary:
+    """Analyse les fichiers sur un pool de processus et écrit les correspondances en NDJSON dans output.
+
+    progress(bilan du fichier, fichiers terminés, nombre de fichiers) est
+    appelé à la fin de chaque fichier, dans l'ordre où ils se terminent.
+    """
+    ruleset = analyzer.ruleset
+    compiled_rules = ruleset.compiled_rules
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files) or 1))
+    started = time.perf_counter()
+    events = 0
+    matches: Counter = Counter()
+    errors = []
+    with tempfile.TemporaryDirectory(prefix='sigma-backtest-') as shards, ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=sigma_parallel.init_worker,
+            initargs=sigma_parallel.worker_initargs(analyzer, ruleset)) as pool:
+        futures = {}
+        for number, path in enumerate(files):
+            shard = os.path.join(shards, f'{number}.ndjson')
+            futures[pool.submit(_backtest_file, str(path), shard, log_source)] = shard
+        for done, future in enumerate(as_completed(futures), 1):
+            shard = futures[future]
+            report = future.result()
+            with open(shard, encoding='utf-8') as f:
+                shutil.copyfileobj(f, output)
+            os.remove(shard)
+            events += report.events
+            matches.update(report.matches)
+            if report.error is not None:
+                errors.append(report)
+            if progress is not None:
+                progress(report, done, len(files))
+    counts = sorted(((compiled, matches[position]) for position, compiled in enumerate(compiled_rules)),
+                    key=lambda item: -item[1])
+    return BacktestSummary(len(files), events, counts, time.perf_counter() - started, errors)
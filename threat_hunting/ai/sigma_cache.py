@@ -0,0 +1,101 @@
+"""Cache disque des règles SIGMA lues et analysées.
+
+La lecture YAML représente l'essentiel du démarrage d'un analyseur (environ
+85 % pour 2000 règles). Le cache conserve, pour chaque fichier de règle, son
+chemin, sa signature (date de modification en ns, taille), l'empreinte SHA-256
+de son contenu, l'en-tête compact de la règle (sigma_metadata) et son arbre
+de détection. Un démarrage à chaud
+charge ce seul fichier au lieu de relire chaque YAML :
+
+* signature identique : l'entrée est reprise telle quelle ;
+* signature différente mais contenu identique (fichier recopié, checkout git) :
+  l'entrée est reprise après calcul de l'empreinte, sans analyse YAML ;
+* sinon le fichier est relu normalement.
+
+Seuls les arbres de détection sont conservés : les fermetures et expressions
+régulières sont recompilées à chaque démarrage. Le cache est invalidé en bloc
+si le format ou le code du compilateur (ou des agrégations, ou du modèle
+compact) change.
+
+Le fichier est désérialisé avec pickle : il doit être écrit par le déploiement
+(commande build_sigma_cache) ou l'application elle-même, jamais fourni par un tiers.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from . import sigma_aggregation, sigma_compiler, sigma_metadata
+from .sigma_metadata import RuleHeader, content_digest
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 3
+
+_fingerprint: Optional[str] = None
+
+
+def engine_fingerprint() -> str:
+    """Empreinte du format de cache et du compilateur qui produit les arbres."""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(str(CACHE_FORMAT).encode())
+        for module in (sigma_compiler, sigma_aggregation, sigma_metadata):
+            digest.update(Path(module.__file__).read_bytes())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+class CachedRuleFile:
+    """Entrée du cache pour un fichier de règle (rule : en-tête compact, None si la règle est inutilisable)."""
+
+    __slots__ = ('signature', 'digest', 'rule', 'parsed')
+
+    def __init__(self, signature: Tuple[int, int], digest: bytes, rule: Optional[RuleHeader], parsed=None):
+        self.signature = signature
+        self.digest = digest
+        self.rule = rule
+        self.parsed = parsed
+
+    def __getstate__(self):
+        return self.signature, self.digest, self.rule, self.parsed
+
+    def __setstate__(self, state):
+        self.signature, self.digest, self.rule, self.parsed = state
+
+
+def load_cache(path: Path) -> Dict[str, CachedRuleFile]:
+    """Charge le cache ; retourne un dictionnaire vide s'il est absent, illisible ou périmé."""
+    try:
+        with open(path, 'rb') as f:
+            fingerprint, entries = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Cache des règles SIGMA illisible ({path}) : {e}")
+        return {}
+    if fingerprint != engine_fingerprint():
+        logger.info(f"Cache des règles SIGMA périmé, ignoré : {path}")
+        return {}
+    return entries
+
+
+def save_cache(path: Path, entries: Dict[str, CachedRuleFile]) -> bool:
+    """Écrit le cache de façon atomique (fichier temporaire puis renommage)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((engine_fingerprint(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Impossible d'écrire le cache des règles SIGMA ({path}) : {e}")
+        return False
+    return True
@@ -0,0 +1,305 @@
+"""Évaluation SIGMA par lots, en colonnes NumPy.
+
+Pour de grands lots homogènes (événements Windows 4688...), évaluer les règles
+entrée par entrée répète les mêmes tests sur des valeurs identiques. Ici :
+
+* chaque champ utilisé est extrait une fois par lot en une colonne encodée
+  par dictionnaire : valeurs distinctes + code de chaque entrée ;
+* chaque test de champ (égalité, appartenance, contains / startswith /
+  endswith, motif générique, '|re', '|gt'..., '|cidr') est évalué une seule
+  fois par valeur distincte, vectorisé sur le tableau NumPy des valeurs distinctes, puis
+  projeté sur le lot par indexation (masque booléen d'une ligne par entrée) ;
+* les masques d'un même test sont partagés entre règles, et une règle dont
+  les valeurs exactes requises (EventID...) sont absentes du lot est écartée
+  sans être évaluée ;
+* les masques sont combinés selon la condition (&, |, ~).
+
+Un tableau NumPy de chaînes a la largeur de sa plus longue valeur : pour une
+colonne dont ce tableau dépasserait MAX_STRING_ARRAY_BYTES (une seule ligne
+de commande de 32 Kio parmi 5000 valeurs distinctes en demanderait 650 Mio),
+les tests contains / startswith / endswith et les égalités portent sur les
+valeurs distinctes en Python, sans tableau de chaînes.
+
+Les résultats sont identiques à ceux de l'évaluation entrée par entrée, dans
+le même ordre. NumPy est optionnel : sans lui, available() est faux et
+l'analyseur se replie sur l'évaluation entrée par entrée.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+from .sigma_compiler import (
+    AndNode, CompileContext, CompiledRule, EventView, FalseNode, FieldNode, KeywordNode, Node, NotNode, OrNode,
+    RegexFieldNode, ValueNode,
+)
+from .sigma_fields import Accessor, resolve
+from .sigma_literals import CONTAINS, STARTSWITH
+
+DEFAULT_BATCH_SIZE = 5000
+# Taille maximale du tableau NumPy des valeurs distinctes d'une colonne (4 octets par caractère)
+MAX_STRING_ARRAY_BYTES = 16 * 2 ** 20
+
+
+def available() -> bool:
+    return np is not None
+
+
+class Column:
+    """Colonne d'un champ encodée par dictionnaire."""
+
+    __slots__ = ('codes', 'raw', 'lowered', 'present', '_lowered_array', '_lowered_set', '_atoms')
+
+    def __init__(self, values: List):
+        # Encodage de str(valeur), sur lequel portent les tests comme dans
+        # l'évaluation entrée par entrée : 1, True et 1.0 sont égaux comme clés
+        # d'un dictionnaire mais pas comme chaînes ('1', 'True', '1.0')
+        index: Dict[Optional[str], int] = {}
+        codes = [
+            index.setdefault(value if value is None or type(value) is str else str(value), len(index))
+            for value in values
+        ]
+        self.codes = np.fromiter(codes, dtype=np.intp, count=len(codes))
+        self.raw = list(index)
+        self.present = np.fromiter((value is not None for value in self.raw), dtype=bool, count=len(self.raw))
+        self.lowered = [None if value is None else value.lower() for value in self.raw]
+        self._lowered_array = None
+        self._lowered_set = None
+        self._atoms: Dict[Tuple[str, str], object] = {}
+
+    def lowered_array(self):
+        """Valeurs distinctes en minuscules (chaîne vide pour une valeur absente).
+
+        None si le tableau dépasserait MAX_STRING_ARRAY_BYTES (voir le module).
+        """
+        if self._lowered_array is None:
+            width = max((len(value) for value in self.lowered if value is not None), default=0)
+            if 4 * width * len(self.lowered) > MAX_STRING_ARRAY_BYTES:
+                # Trop grand : mémorisé pour ne pas recalculer la largeur
+                self._lowered_array = False
+            else:
+                self._lowered_array = np.array([value or '' for value in self.lowered], dtype=str)
+        return self._lowered_array if self._lowered_array is not False else None
+
+    def lowered_set(self) -> set:
+        if self._lowered_set is None:
+            self._lowered_set = set(self.lowered)
+        return self._lowered_set
+
+    def atom(self, kind: str, literal: str):
+        """Masque d'un atome contains / startswith / endswith sur les valeurs distinctes, partagé entre règles."""
+        key = (kind, literal)
+        result = self._atoms.get(key)
+        if result is None:
+            values = self.lowered_array()
+            if values is None:
+                if kind == CONTAINS:
+                    result = self.each(lambda value: literal in value)
+                elif kind == STARTSWITH:
+                    result = self.each(lambda value: value.startswith(literal))
+                else:
+                    result = self.each(lambda value: value.endswith(literal))
+            elif kind == CONTAINS:
+                result = np.char.find(values, literal) >= 0
+            elif kind == STARTSWITH:
+                result = np.char.startswith(values, literal)
+            else:
+                result = np.char.endswith(values, literal)
+            self._atoms[key] = result
+        return result
+
+    def each(self, test: Callable[[str], bool]):
+        """Masque de test sur les valeurs distinctes en minuscules (faux pour une valeur absente)."""
+        return np.fromiter((value is not None and test(value) for value in self.lowered),
+                           dtype=bool, count=len(self.lowered))
+
+    def expand(self, distinct_mask):
+        """Projette un masque sur les valeurs distinctes en un masque sur les entrées du lot."""
+        return distinct_mask[self.codes]
+
+
+class ColumnBatch:
+    """Lot d'entrées de log, extrait en colonnes à la demande."""
+
+    def __init__(self, events: List[Dict]):
+        self.events = events
+        self.size = len(events)
+        self.columns: Dict[Accessor, Column] = {}
+        self.masks: Dict[Tuple, object] = {}
+        self._views: Optional[List[EventView]] = None
+
+    def column(self, field: Accessor) -> Column:
+        column = self.columns.get(field)
+        if column is None:
+            if type(field) is str:
+                values = [event.get(field) for event in self.events]
+            else:
+                values = [resolve(event, field) for event in self.events]
+            column = self.columns[field] = Column(values)
+        return column
+
+    def views(self) -> List[EventView]:
+        """Vues entrée par entrée, pour les rares tests non vectorisés (mots-clés)."""
+        if self._views is None:
+            self._views = [EventView(event) for event in self.events]
+        return self._views
+
+    def zeros(self):
+        return np.zeros(self.size, dtype=bool)
+
+
+Mask = Callable[[ColumnBatch], object]
+
+
+class BatchEvaluator:
+    """Fonctions de masque des règles d'un jeu, construites une fois par jeu de règles."""
+
+    def __init__(self, compiled_rules: List[CompiledRule], context: Optional[CompileContext] = None):
+        # Les expressions régulières déjà compilées pour l'évaluation par entrée sont reprises
+        self.context = CompileContext(context)
+        accessor = self.context.accessor
+        self.rules = [
+            (position, compiled, {accessor(field): values for field, values in compiled.tree.requirements().items()},
+             self._mask(compiled.tree))
+            for position, compiled in enumerate(compiled_rules)
+        ]
+        self.context.finalize()
+
+    def evaluate(self, batch: ColumnBatch, rules: Optional[set] = None) -> List[Tuple[int, CompiledRule]]:
+        """Produit (indice de l'entrée, règle) pour chaque recherche satisfaite, dans l'ordre des entrées puis des règles.
+
+        rules restreint l'évaluation à un sous-ensemble de règles (filtre de source de logs).
+        """
+        selected = []
+        masks = []
+        for position, compiled, requirements, mask in self.rules:
+            if rules is not None and position not in rules:
+                continue
+            if not _may_match(batch, requirements):
+                continue
+            result = mask(batch)
+            if result.any():
+                selected.append(compiled)
+                masks.append(result)
+        if not masks:
+            return []
+        # Parcours ligne par ligne de la matrice (entrée, règle) : même ordre que l'évaluation par entrée
+        offsets, columns = np.nonzero(np.stack(masks, axis=1))
+        return [(offset, selected[column]) for offset, column in zip(offsets.tolist(), columns.tolist())]
+
+    # -- construction des fonctions de masque --------------------------------
+
+    def _mask(self, node: Node) -> Mask:
+        if isinstance(node, FieldNode):
+            return self._field_mask(node)
+        if isinstance(node, RegexFieldNode):
+            return self._regex_mask(node)
+        if isinstance(node, ValueNode):
+            return self._value_mask(node)
+        if isinstance(node, AndNode):
+            return _and_mask(tuple(self._mask(operand) for operand in node.operands))
+        if isinstance(node, OrNode):
+            return _or_mask(tuple(self._mask(operand) for operand in node.operands))
+        if isinstance(node, NotNode):
+            operand = self._mask(node.operand)
+            return lambda batch: ~operand(batch)
+        if isinstance(node, FalseNode):
+            return ColumnBatch.zeros
+        if isinstance(node, KeywordNode):
+            return _row_mask(node.compile(self.context))
+        raise TypeError(f"Nœud non pris en charge en mode colonnes : {type(node).__name__}")
+
+    def _field_mask(self, node: FieldNode) -> Mask:
+        field = self.context.accessor(node.field)
+        if node.is_null:
+            return _shared(('null', field), field, lambda column: ~column.present)
+
+        exact = sorted(node.exact)
+        exact_set = frozenset(exact)
+        atoms = node.atoms
+        wildcards = self.context.wildcards(node.wildcards) if node.wildcards else None
+
+        def distinct_mask(column: Column):
+            if not exact:
+                result = np.zeros(len(column.lowered), dtype=bool)
+            else:
+                values = column.lowered_array()
+                result = column.each(exact_set.__contains__) if values is None else np.isin(values, exact)
+            for kind, literal in atoms:
+                result |= column.atom(kind, literal)
+            if wildcards is not None:
+                result |= column.each(lambda value: wildcards(value) is not None)
+            return result & column.present
+        return _shared(('field', field, tuple(exact), atoms, node.wildcards), field, distinct_mask)
+
+    def _regex_mask(self, node: RegexFieldNode) -> Mask:
+        searches = tuple(self.context.regex(pattern, node.flags).search for pattern in node.patterns)
+
+        def distinct_mask(column: Column):
+            return np.fromiter(
+                (value is not None and any(search(value) for search in searches) for value in column.raw),
+                dtype=bool, count=len(column.raw),
+            )
+        field = self.context.accessor(node.field)
+        return _shared(('re', field, node.patterns, node.flags), field, distinct_mask)
+
+    def _value_mask(self, node: ValueNode) -> Mask:
+        test = node.value_test()
+
+        def distinct_mask(column: Column):
+            return np.fromiter(
+                (value is not None and test(value) for value in column.lowered),
+                dtype=bool, count=len(column.lowered),
+            )
+        return _shared(node.key(), self.context.accessor(node.field), distinct_mask)
+
+
+def _shared(key: Tuple, field: Accessor, distinct_mask: Callable[[Column], object]) -> Mask:
+    """Masque d'un test de champ, calculé une fois par lot et partagé entre règles."""
+    def mask(batch: ColumnBatch):
+        result = batch.masks.get(key)
+        if result is None:
+            column = batch.column(field)
+            result = batch.masks[key] = column.expand(distinct_mask(column))
+        return result
+    return mask
+
+
+def _and_mask(operands: Tuple[Mask, ...]) -> Mask:
+    def mask(batch: ColumnBatch):
+        result = operands[0](batch)
+        for operand in operands[1:]:
+            if not result.any():
+                break
+            result = result & operand(batch)
+        return result
+    return mask
+
+
+def _or_mask(operands: Tuple[Mask, ...]) -> Mask:
+    def mask(batch: ColumnBatch):
+        result = operands[0](batch)
+        for operand in operands[1:]:
+            result = result | operand(batch)
+        return result
+    return mask
+
+
+def _row_mask(predicate) -> Mask:
+    def mask(batch: ColumnBatch):
+        return np.fromiter((predicate(view) for view in batch.views()), dtype=bool, count=batch.size)
+    return mask
+
+
+def _may_match(batch: ColumnBatch, requirements: Dict[Accessor, Optional[frozenset]]) -> bool:
+    """Faux si une valeur exacte ou un champ requis par la règle est absent du lot entier."""
+    for field, values in requirements.items():
+        present = batch.column(field).lowered_set()
+        if values is None:
+            if present == {None}:
+                return False
+        elif values.isdisjoint(present):
+            return False
+    return True
@@ -0,0 +1,964 @@
+"""Compilation des règles SIGMA en prédicats Python.
+
+Chaque règle YAML est transformée une seule fois, au chargement, en un arbre de
+nœuds (champs, mots-clés, and/or/not) puis en fermetures précompilées.
+L'analyse d'une entrée de log ne relit donc plus jamais le YAML, ne redécoupe
+plus la condition et ne remet plus les motifs en minuscules.
+
+L'arbre reste disponible après compilation : il sert à l'indexation des règles
+(champs requis, valeurs discriminantes) sans réévaluer les fermetures.
+
+Les règles d'un même jeu sont compilées dans un CompileContext commun, qui
+regroupe par champ les littéraux contains/startswith/endswith (sigma_literals)
+et les motifs génériques de toutes les règles, et partage les expressions
+'|re' compilées (sigma_patterns).
+
+Le jeu de règles est compilé en un graphe acyclique partagé : les nœuds
+identiques (même clé canonique, key()) de règles différentes — un test de
+champ, une sélection entière — ne donnent qu'un seul prédicat. Lorsqu'un
+nœud coûteux est référencé plusieurs fois, son résultat est mémorisé dans
+l'EventView de l'entrée : il n'est évalué qu'une fois par entrée, quel que
+soit le nombre de règles qui l'utilisent.
+
+Les ET et OU compilés lisent l'ordre de leurs opérandes dans une cellule
+(sigma_adaptive.Junction) : l'analyseur le réordonne selon la sélectivité et
+le coût observés de chaque opérande.
+
+Les nœuds n'ont pas de __dict__ (__slots__) et leurs noms de champs et
+motifs sont internés : un même littéral n'existe qu'une fois en mémoire,
+quel que soit le nombre de règles qui le testent.
+"""
+import fnmatch
+import ipaddress
+import operator
+import re
+import socket
+from collections import Counter
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple, Union
+
+from .sigma_adaptive import Junction
+from .sigma_aggregation import Aggregation, parse_aggregation
+from .sigma_fields import Accessor, FieldMapping, leaf_values, resolve
+from .sigma_literals import LiteralScanner, literal_atom
+from .sigma_metadata import RuleHeader, intern
+from .sigma_modifiers import PLACEMENTS, VALUE_MODIFIERS, expand_value
+from .sigma_patterns import RegexCache, merge_wildcards, wildcard_to_regex
+
+# Clés de la section 'detection' qui ne sont pas des identifiants de recherche
+RESERVED_DETECTION_KEYS = ('condition', 'timeframe')
+
+_TOKEN_RE = re.compile(r'\(|\)|[^\s()]+')
+
+# Ensemble vide partagé par tous les nœuds sans valeur exacte (un frozenset vide occupe 216 octets)
+_NO_VALUES: FrozenSet[str] = frozenset()
+
+# Exigences d'un nœud : champ -> valeurs exactes possibles (None = toute valeur non nulle)
+Requirements = Dict[str, Optional[FrozenSet[str]]]
+
+
+class SigmaCompileError(ValueError):
+    """Erreur levée lorsqu'une règle SIGMA ne peut pas être compilée."""
+
+
+class EventView(dict):
+    """Vue d'une entrée de log partagée par toutes les règles évaluées sur elle.
+
+    Chaque champ n'est converti en chaîne minuscule qu'une seule fois par entrée,
+    au premier accès ; les accès suivants sont de simples lectures de dictionnaire.
+    Les champs sont désignés par leur accesseur (sigma_fields) : clé plate, ou
+    chemins dans une entrée imbriquée.
+    """
+    __slots__ = ('event', '_all_values', '_hits')
+
+    def __init__(self, event: Dict):
+        super().__init__()
+        self.event = event
+        self._all_values = None
+        self._hits = None
+
+    def __missing__(self, field: Accessor) -> Optional[str]:
+        value = self.event.get(field) if type(field) is str else resolve(self.event, field)
+        if value is not None:
+            value = str(value).lower()
+        self[field] = value
+        return value
+
+    def all_values(self) -> List[str]:
+        """Retourne toutes les valeurs de l'entrée en minuscules (recherche par mots-clés)."""
+        if self._all_values is None:
+            self._all_values = [str(v).lower() for v in leaf_values(self.event)]
+        return self._all_values
+
+    def raw(self, field: Accessor) -> Optional[str]:
+        """Valeur du champ sans mise en minuscules (expressions '|re', sensibles à la casse)."""
+        value = resolve(self.event, field)
+        return None if value is None else str(value)
+
+    def hits(self, scanner: LiteralScanner) -> FrozenSet[int]:
+        """Atomes littéraux trouvés dans le champ du scanner (un seul parcours par entrée)."""
+        if self._hits is None:
+            self._hits = {}
+        elif scanner in self._hits:
+            return self._hits[scanner]
+        value = self[scanner.field]
+        hits = scanner.scan(value) if value is not None else frozenset()
+        self._hits[scanner] = hits
+        return hits
+
+
+Predicate = Callable[[EventView], bool]
+
+
+def _always_false(view: EventView) -> bool:
+    return False
+
+
+def _memoized(predicate: Predicate, slot: int) -> Predicate:
+    def memoized(view: EventView) -> bool:
+        result = view.get(slot)
+        if result is None:
+            result = view[slot] = predicate(view)
+        return result
+    return memoized
+
+
+def has_wildcard(pattern: str) -> bool:
+    return '*' in pattern or '?' in pattern
+
+
+class CompileContext:
+    """État partagé par les règles d'un même jeu pendant leur compilation.
+
+    previous est le contexte de la compilation précédente du même jeu : ses
+    expressions régulières compilées sont reprises lors d'un rechargement.
+    fields traduit les noms de champs des règles en accesseurs (sigma_fields) ;
+    à défaut, celui de previous est repris.
+    """
+
+    def __init__(self, previous: Optional['CompileContext'] = None, fields: Optional[FieldMapping] = None):
+        if fields is None:
+            fields = previous.fields if previous is not None else FieldMapping()
+        self.fields = fields
+        self.scanners: Dict[str, LiteralScanner] = {}
+        self.regexes = RegexCache(previous.regexes if previous is not None else None)
+        # Clé canonique d'un nœud -> nombre de références dans le jeu, et prédicat partagé
+        self.references: Counter = Counter()
+        self.predicates: Dict[Hashable, Predicate] = {}
+        self.memoized = 0
+        self.shared = 0
+        # ET et OU compilés, dont l'ordre des opérandes peut être adapté à l'exécution
+        self.junctions: List[Junction] = []
+        self.finalized = False
+
+    def register(self, tree: 'Node'):
+        """Compte les références aux sous-expressions d'une règle, avant la compilation du jeu.
+
+        Les enfants d'un nœud déjà vu ne sont pas recomptés : ils ne sont
+        évalués qu'à travers ce nœud, dont le résultat est mémorisé.
+        """
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            key = node.key()
+            self.references[key] += 1
+            if self.references[key] == 1:
+                stack.extend(node.children())
+
+    def predicate(self, node: 'Node') -> Predicate:
+        """Prédicat partagé d'un nœud ; mémorisé par entrée s'il est coûteux et référencé plusieurs fois."""
+        key = node.key()
+        predicate = self.predicates.get(key)
+        if predicate is None:
+            predicate = node.build(self)
+            if node.memoizable and self.references[key] > 1:
+                # Clé entière : ne peut pas entrer en conflit avec un nom de champ dans l'EventView
+                predicate = _memoized(predicate, len(self.predicates))
+                self.memoized += 1
+            self.predicates[key] = predicate
+        return predicate
+
+    def junction(self, conjunction: bool, operands: Tuple[Predicate, ...]) -> List[Tuple[Predicate, ...]]:
+        """Cellule contenant l'ordre courant des opérandes d'un ET (conjunction vrai) ou d'un OU."""
+        if len(operands) < 2:
+            return [operands]
+        junction = Junction(conjunction, operands)
+        self.junctions.append(junction)
+        return junction.order
+
+    def accessor(self, field: str) -> Accessor:
+        """Accesseur d'un nom de champ des règles dans les entrées (voir sigma_fields)."""
+        return self.fields.accessor(field)
+
+    def scanner(self, field: str) -> LiteralScanner:
+        if field not in self.scanners:
+            self.scanners[field] = LiteralScanner(self.accessor(field))
+        return self.scanners[field]
+
+    def wildcards(self, patterns: Tuple[str, ...]) -> Callable[[str], Any]:
+        """Fonction de correspondance de l'alternance des motifs génériques (partagée entre règles)."""
+        return self.regexes.compile(merge_wildcards(tuple(sorted(set(patterns)))), re.DOTALL).match
+
+    def regex(self, pattern: str, flags: int = 0):
+        try:
+            return self.regexes.compile(pattern, flags)
+        except re.error as e:
+            raise SigmaCompileError(f"Expression régulière invalide '{pattern}' : {e}") from e
+
+    def finalize(self):
+        """Construit les structures partagées une fois toutes les règles compilées.
+
+        Les tables de clés canoniques ne servent qu'à la compilation : elles
+        sont libérées (elles occupaient davantage que les arbres eux-mêmes).
+        """
+        for scanner in self.scanners.values():
+            scanner.build()
+        self.regexes.release_previous()
+        self.shared = len(self.predicates)
+        self.references = Counter()
+        self.predicates = {}
+        self.finalized = True
+
+
+# ---------------------------------------------------------------------------
+# Nœuds
+# ---------------------------------------------------------------------------
+
+class Node:
+    """Nœud de l'arbre d'une détection SIGMA."""
+
+    __slots__ = ()
+
+    # Vrai si l'évaluation coûte assez pour que son résultat soit mémorisé par
+    # entrée lorsque le nœud est partagé entre plusieurs règles
+    memoizable = False
+
+    def key(self) -> Hashable:
+        """Forme canonique du nœud : deux nœuds de même clé ont toujours le même résultat."""
+        raise NotImplementedError
+
+    def children(self) -> Tuple['Node', ...]:
+        return ()
+
+    def compile(self, context: CompileContext) -> Predicate:
+        """Prédicat du nœud, partagé avec tout nœud identique du jeu de règles (voir CompileContext)."""
+        return context.predicate(self)
+
+    def build(self, context: CompileContext) -> Predicate:
+        raise NotImplementedError
+
+    def requirements(self) -> Requirements:
+        """Conditions nécessaires (champs présents, valeurs exactes) pour que le nœud soit vrai."""
+        return {}
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        """Champs dont dépend le résultat du nœud (None : toute l'entrée, recherche par mots-clés)."""
+        return frozenset()
+
+
+class FalseNode(Node):
+    """Nœud toujours faux (quantificateur sans identifiant correspondant, sélection vide)."""
+
+    __slots__ = ()
+
+    def key(self) -> Hashable:
+        return ('false',)
+
+    def build(self, context: CompileContext) -> Predicate:
+        return _always_false
+
+
+class FieldNode(Node):
+    """Test d'un champ : égalité, atome littéral (contains/startswith/endswith) ou motif générique.
+
+    patterns est la liste des motifs (déjà transformés par les modificateurs),
+    ou None pour un test d'absence du champ.
+    """
+
+    __slots__ = ('field', 'is_null', 'exact', 'atoms', 'wildcards')
+
+    def __init__(self, field: str, patterns: Optional[List[str]]):
+        self.field = intern(field)
+        self.is_null = patterns is None
+        exact = set()
+        atoms = []
+        wildcards = []
+        for pattern in patterns or ():
+            pattern = intern(str(pattern).lower())
+            if not has_wildcard(pattern):
+                exact.add(pattern)
+                continue
+            atom = literal_atom(pattern)
+            if atom:
+                atoms.append((atom[0], intern(atom[1])))
+            else:
+                wildcards.append(pattern)
+        self.exact = frozenset(exact) if exact else _NO_VALUES
+        self.atoms = tuple(atoms)
+        self.wildcards = tuple(wildcards)
+
+    @property
+    def memoizable(self) -> bool:
+        return bool(self.wildcards)
+
+    def key(self) -> Hashable:
+        return ('field', self.field, self.is_null, self.exact, frozenset(self.atoms), frozenset(self.wildcards))
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        return frozenset((self.field,))
+
+    def requirements(self) -> Requirements:
+        if self.is_null:
+            return {}
+        if self.atoms or self.wildcards:
+            return {self.field: None}
+        return {self.field: self.exact}
+
+    def build(self, context: CompileContext) -> Predicate:
+        field = context.accessor(self.field)
+        if self.is_null:
+            return lambda view: view[field] is None
+
+        exact = self.exact
+        if self.atoms:
+            scanner = context.scanner(self.field)
+            atom_ids = frozenset(scanner.add(kind, literal) for kind, literal in self.atoms)
+        else:
+            scanner = atom_ids = None
+        wildcards = context.wildcards(self.wildcards) if self.wildcards else None
+
+        if not atom_ids and not wildcards:
+            def predicate(view: EventView) -> bool:
+                return view[field] in exact
+        elif not exact and not wildcards:
+            def predicate(view: EventView) -> bool:
+                return view[field] is not None and not atom_ids.isdisjoint(view.hits(scanner))
+        else:
+            def predicate(view: EventView) -> bool:
+                value = view[field]
+                if value is None:
+                    return False
+                if value in exact:
+                    return True
+                if atom_ids and not atom_ids.isdisjoint(view.hits(scanner)):
+                    return True
+                return wildcards is not None and wildcards(value) is not None
+        return predicate
+
+
+_REGEX_FLAGS = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
+
+
+class RegexFieldNode(Node):
+    """Test d'un champ par expressions régulières ('champ|re'), sur la valeur d'origine."""
+
+    __slots__ = ('field', 'patterns', 'flags')
+
+    def __init__(self, field: str, patterns: Any, flags: int = 0):
+        self.field = intern(field)
+        self.patterns = tuple(intern(str(p)) for p in (patterns if isinstance(patterns, list) else [patterns]))
+        self.flags = flags
+
+    memoizable = True
+
+    def key(self) -> Hashable:
+        return ('re', self.field, frozenset(self.patterns), self.flags)
+
+    def requirements(self) -> Requirements:
+        return {self.field: None}
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        return frozenset((self.field,))
+
+    def build(self, context: CompileContext) -> Predicate:
+        field = context.accessor(self.field)
+        searches = tuple(context.regex(pattern, self.flags).search for pattern in self.patterns)
+
+        def predicate(view: EventView) -> bool:
+            value = view.raw(field)
+            if value is None:
+                return False
+            for search in searches:
+                if search(value):
+                    return True
+            return False
+        return predicate
+
+
+class ValueNode(Node):
+    """Test d'un champ par une fonction de valeur spécialisée, construite au chargement.
+
+    Les opérandes de la règle (seuils, réseaux) sont analysés une seule fois ;
+    seule la valeur de l'entrée est convertie à l'évaluation.
+    """
+
+    __slots__ = ('field',)
+
+    def requirements(self) -> Requirements:
+        return {self.field: None}
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        return frozenset((self.field,))
+
+    def value_test(self) -> Callable[[str], bool]:
+        """Fonction appliquée à la valeur (en minuscules) d'un champ présent."""
+        raise NotImplementedError
+
+    def build(self, context: CompileContext) -> Predicate:
+        field = context.accessor(self.field)
+        test = self.value_test()
+
+        def predicate(view: EventView) -> bool:
+            value = view[field]
+            return value is not None and test(value)
+        return predicate
+
+
+_NUMERIC_OPERATORS = {'gt': operator.gt, 'gte': operator.ge, 'lt': operator.lt, 'lte': operator.le}
+
+
+class NumericFieldNode(ValueNode):
+    """Comparaison numérique d'un champ ('champ|gt', gte, lt, lte) à un seuil."""
+
+    __slots__ = ('operator', 'threshold')
+
+    def __init__(self, field: str, operator_name: str, values: List[Any], match_all: bool = False):
+        self.field = intern(field)
+        self.operator = operator_name
+        thresholds = []
+        for value in values:
+            number = _number(value)
+            if number is None:
+                raise SigmaCompileError(f"Valeur numérique attendue pour '{field}|{operator_name}' : {value!r}")
+            thresholds.append(number)
+        if not thresholds:
+            raise SigmaCompileError(f"Aucune valeur pour '{field}|{operator_name}'")
+        # Plusieurs seuils se réduisent à un seul : le moins exigeant (l'un d'eux) ou le plus exigeant (all)
+        lower_bound = operator_name.startswith('g')
+        self.threshold = max(thresholds) if lower_bound == match_all else min(thresholds)
+
+    def key(self) -> Hashable:
+        return ('num', self.field, self.operator, self.threshold)
+
+    def value_test(self) -> Callable[[str], bool]:
+        compare = _NUMERIC_OPERATORS[self.operator]
+        threshold = self.threshold
+
+        def test(value: str) -> bool:
+            number = _number(value)
+            return number is not None and compare(number, threshold)
+        return test
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number
+
+
+class CidrFieldNode(ValueNode):
+    """Appartenance d'une adresse IP à des réseaux ('champ|cidr')."""
+
+    __slots__ = ('networks',)
+
+    memoizable = True
+
+    def __init__(self, field: str, values: List[Any]):
+        self.field = intern(field)
+        networks = []
+        for value in values:
+            try:
+                networks.append(ipaddress.ip_network(str(value).strip(), strict=False))
+            except ValueError as e:
+                raise SigmaCompileError(f"Réseau invalide pour '{field}|cidr' : {e}") from None
+        self.networks = tuple(sorted(set(networks), key=lambda net: (net.version, net.compressed)))
+
+    def key(self) -> Hashable:
+        return ('cidr', self.field, frozenset(self.networks))
+
+    def value_test(self) -> Callable[[str], bool]:
+        # (adresse du réseau, masque) en entiers, par famille : un ET binaire par réseau
+        ranges = {4: [], 6: []}
+        for network in self.networks:
+            ranges[network.version].append((int(network.network_address), int(network.netmask)))
+        ipv4, ipv6 = tuple(ranges[4]), tuple(ranges[6])
+
+        def test(value: str) -> bool:
+            value = value.strip()
+            try:
+                if ':' in value:
+                    address, candidates = int.from_bytes(socket.inet_pton(socket.AF_INET6, value), 'big'), ipv6
+                else:
+                    address, candidates = int.from_bytes(socket.inet_pton(socket.AF_INET, value), 'big'), ipv4
+            except (OSError, ValueError):
+                return False
+            for network, mask in candidates:
+                if address & mask == network:
+                    return True
+            return False
+        return test
+
+
+_POSITION_MODIFIERS = frozenset(PLACEMENTS)
+
+
+def parse_field(key: str, patterns: Any) -> Node:
+    """Construit le nœud d'un élément 'champ|modificateurs: valeurs' d'une sélection.
+
+    Chaque combinaison de modificateurs donne un nœud spécialisé au chargement :
+    modificateurs de valeur (windash, base64, base64offset, wide...) et de
+    position (contains, startswith, endswith) -> FieldNode ; re -> RegexFieldNode ;
+    gt/gte/lt/lte -> NumericFieldNode ; cidr -> CidrFieldNode. Avec 'all',
+    toutes les valeurs doivent correspondre au lieu d'une seule.
+
+    Une valeur peut être un dictionnaire {'|modificateurs': valeurs} (ou la
+    forme historique {'contains': valeurs}) : test du même champ avec ses
+    propres modificateurs, qui compte comme une valeur de la liste.
+    """
+    field, *modifiers = key.split('|')
+    return _parse_modified(field, [m for m in modifiers if m], patterns, key)
+
+
+def _parse_modified(field: str, modifiers: List[str], patterns: Any, key: str) -> Node:
+    match_all = 'all' in modifiers
+    modifiers = [m for m in modifiers if m != 'all']
+    values = patterns if isinstance(patterns, list) else [patterns]
+
+    nested = []
+    plain = []
+    for value in values:
+        if isinstance(value, dict):
+            for sub_key, sub_patterns in value.items():
+                sub_modifiers = [m for m in str(sub_key).split('|') if m]
+                nested.append(_parse_modified(field, sub_modifiers, sub_patterns, f'{field}|{sub_key}'))
+        else:
+            plain.append(value)
+
+    nodes = _value_nodes(field, modifiers, plain, match_all, key) if plain or not nested else []
+    return all_of(nodes + nested) if match_all else any_of(nodes + nested)
+
+
+def _value_nodes(field: str, modifiers: List[str], values: List[Any], match_all: bool, key: str) -> List[Node]:
+    """Nœuds des valeurs simples d'un élément : un seul nœud, ou un par valeur avec 'all'."""
+    if modifiers and modifiers[0] == 're':
+        if not all(m in _REGEX_FLAGS for m in modifiers[1:]):
+            raise SigmaCompileError(f"Modificateur non supporté : {key}")
+        flags = 0
+        for modifier in modifiers[1:]:
+            flags |= _REGEX_FLAGS[modifier]
+        if match_all:
+            return [RegexFieldNode(field, value, flags) for value in values]
+        return [RegexFieldNode(field, values, flags)]
+
+    if len(modifiers) == 1 and modifiers[0] in _NUMERIC_OPERATORS:
+        return [NumericFieldNode(field, modifiers[0], values, match_all)]
+
+    if modifiers == ['cidr']:
+        if match_all:
+            return [CidrFieldNode(field, [value]) for value in values]
+        return [CidrFieldNode(field, values)]
+
+    unknown = [m for m in modifiers if m not in VALUE_MODIFIERS and m not in _POSITION_MODIFIERS]
+    positions = [m for m in modifiers if m in _POSITION_MODIFIERS]
+    if unknown or len(positions) > 1:
+        raise SigmaCompileError(f"Modificateur non supporté : {key}")
+    transforms = [m for m in modifiers if m in VALUE_MODIFIERS]
+    template = PLACEMENTS[positions[0]] if positions else '{}'
+
+    alternatives = []
+    for value in values:
+        if value is None:
+            if modifiers:
+                raise SigmaCompileError(f"Valeur nulle non autorisée avec des modificateurs : {key}")
+            alternatives.append(None)
+            continue
+        try:
+            variants = expand_value(str(value), transforms) if transforms else [str(value)]
+        except ValueError as e:
+            raise SigmaCompileError(str(e)) from None
+        alternatives.append([template.format(variant) for variant in variants])
+
+    if match_all:
+        return [FieldNode(field, patterns) for patterns in alternatives]
+    nodes = []
+    if None in alternatives:
+        # 'champ: null' dans une liste : absence du champ, ou l'une des autres valeurs
+        nodes.append(FieldNode(field, None))
+    patterns = [pattern for variants in alternatives if variants is not None for pattern in variants]
+    if patterns or not nodes:
+        nodes.append(FieldNode(field, patterns))
+    return nodes
+
+
+class KeywordNode(Node):
+    """Recherche par mots-clés sur l'ensemble des valeurs de l'entrée."""
+
+    __slots__ = ('substrings', 'wildcards')
+
+    def __init__(self, keywords: Any):
+        keywords = [intern(str(k).lower()) for k in (keywords if isinstance(keywords, list) else [keywords])]
+        self.substrings = tuple(k for k in keywords if not has_wildcard(k))
+        self.wildcards = tuple(k for k in keywords if has_wildcard(k))
+
+    memoizable = True
+
+    def key(self) -> Hashable:
+        return ('keywords', frozenset(self.substrings), frozenset(self.wildcards))
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        return None
+
+    def build(self, context: CompileContext) -> Predicate:
+        substrings = self.substrings
+        regexes = tuple(
+            context.regex(wildcard_to_regex(k, anchored=False), re.DOTALL).search for k in self.wildcards
+        )
+
+        def predicate(view: EventView) -> bool:
+            for value in view.all_values():
+                for keyword in substrings:
+                    if keyword in value:
+                        return True
+                for search in regexes:
+                    if search(value):
+                        return True
+            return False
+        return predicate
+
+
+def _operand_fields(operands: Tuple[Node, ...]) -> Optional[FrozenSet[str]]:
+    fields = frozenset()
+    for operand in operands:
+        operand_fields = operand.fields()
+        if operand_fields is None:
+            return None
+        fields |= operand_fields
+    return fields
+
+
+class AndNode(Node):
+    __slots__ = ('operands',)
+
+    memoizable = True
+
+    def __init__(self, operands: List[Node]):
+        self.operands = tuple(operands)
+
+    def key(self) -> Hashable:
+        return ('and', frozenset(operand.key() for operand in self.operands))
+
+    def children(self) -> Tuple[Node, ...]:
+        return self.operands
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        return _operand_fields(self.operands)
+
+    def requirements(self) -> Requirements:
+        merged: Requirements = {}
+        for operand in self.operands:
+            for field, values in operand.requirements().items():
+                if field not in merged or merged[field] is None:
+                    merged[field] = values
+                elif values is not None:
+                    merged[field] = merged[field] & values
+        return merged
+
+    def build(self, context: CompileContext) -> Predicate:
+        order = context.junction(True, tuple(operand.compile(context) for operand in self.operands))
+
+        def all_of(view: EventView) -> bool:
+            for operand in order[0]:
+                if not operand(view):
+                    return False
+            return True
+        return all_of
+
+
+class OrNode(Node):
+    __slots__ = ('operands',)
+
+    memoizable = True
+
+    def __init__(self, operands: List[Node]):
+        self.operands = tuple(operands)
+
+    def key(self) -> Hashable:
+        return ('or', frozenset(operand.key() for operand in self.operands))
+
+    def children(self) -> Tuple[Node, ...]:
+        return self.operands
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        return _operand_fields(self.operands)
+
+    def requirements(self) -> Requirements:
+        branches = [operand.requirements() for operand in self.operands]
+        common: Requirements = {}
+        for field in set.intersection(*(set(b) for b in branches)):
+            values = [b[field] for b in branches]
+            common[field] = None if None in values else frozenset().union(*values)
+        return common
+
+    def build(self, context: CompileContext) -> Predicate:
+        order = context.junction(False, tuple(operand.compile(context) for operand in self.operands))
+
+        def any_of(view: EventView) -> bool:
+            for operand in order[0]:
+                if operand(view):
+                    return True
+            return False
+        return any_of
+
+
+class NotNode(Node):
+    __slots__ = ('operand',)
+
+    def __init__(self, operand: Node):
+        self.operand = operand
+
+    def key(self) -> Hashable:
+        return ('not', self.operand.key())
+
+    def children(self) -> Tuple[Node, ...]:
+        return (self.operand,)
+
+    def fields(self) -> Optional[FrozenSet[str]]:
+        return self.operand.fields()
+
+    def build(self, context: CompileContext) -> Predicate:
+        operand = self.operand.compile(context)
+        return lambda view: not operand(view)
+
+
+def all_of(operands: List[Node]) -> Node:
+    if not operands:
+        return FalseNode()
+    return operands[0] if len(operands) == 1 else AndNode(operands)
+
+
+def any_of(operands: List[Node]) -> Node:
+    if not operands:
+        return FalseNode()
+    return operands[0] if len(operands) == 1 else OrNode(operands)
+
+
+def parse_search(definition: Any) -> Node:
+    """Construit le nœud d'un identifiant de recherche (sélection, filtre ou mots-clés)."""
+    if isinstance(definition, dict):
+        return all_of([parse_field(field, patterns) for field, patterns in definition.items()])
+    if isinstance(definition, list) and definition and all(isinstance(d, dict) for d in definition):
+        return any_of([parse_search(d) for d in definition])
+    if definition is None or definition == []:
+        return FalseNode()
+    return KeywordNode(definition)
+
+
+# ---------------------------------------------------------------------------
+# Condition
+# ---------------------------------------------------------------------------
+
+class _ConditionParser:
+    """Analyseur descendant récursif de la grammaire des conditions SIGMA.
+
+    Priorités : 'not' > 'and' > 'or' ; parenthèses ; quantificateurs
+    '1 of motif*', 'all of motif*', '1 of them', 'all of them'.
+    """
+
+    def __init__(self, condition: str, searches: Dict[str, Node]):
+        self.condition = condition
+        self.tokens = _TOKEN_RE.findall(condition)
+        self.pos = 0
+        self.searches = searches
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise SigmaCompileError("Condition vide")
+        node = self._parse_or()
+        if self.pos != len(self.tokens):
+            raise SigmaCompileError(f"Jeton inattendu '{self.tokens[self.pos]}' dans la condition : {self.condition}")
+        return node
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos].lower() if self.pos < len(self.tokens) else None
+
+    def _next(self) -> str:
+        if self.pos >= len(self.tokens):
+            raise SigmaCompileError(f"Fin de condition inattendue : {self.condition}")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _parse_or(self) -> Node:
+        operands = [self._parse_and()]
+        while self._peek() == 'or':
+            self._next()
+            operands.append(self._parse_and())
+        return any_of(operands)
+
+    def _parse_and(self) -> Node:
+        operands = [self._parse_not()]
+        while self._peek() == 'and':
+            self._next()
+            operands.append(self._parse_not())
+        return all_of(operands)
+
+    def _parse_not(self) -> Node:
+        if self._peek() == 'not':
+            self._next()
+            return NotNode(self._parse_not())
+        return self._parse_primary()
+
+    def _parse_primary(self) -> Node:
+        token = self._next()
+        lowered = token.lower()
+        if token == '(':
+            node = self._parse_or()
+            if self._next() != ')':
+                raise SigmaCompileError(f"Parenthèse fermante manquante : {self.condition}")
+            return node
+        if lowered in ('1', 'any', 'all') and self._peek() == 'of':
+            self._next()
+            return self._parse_quantifier(lowered, self._next())
+        if token in self.searches:
+            return self.searches[token]
+        raise SigmaCompileError(f"Identifiant inconnu '{token}' dans la condition : {self.condition}")
+
+    def _parse_quantifier(self, quantifier: str, target: str) -> Node:
+        if target.lower() == 'them':
+            names = list(self.searches)
+        else:
+            names = [name for name in self.searches if fnmatch.fnmatchcase(name, target)]
+        # Sans identifiant correspondant au motif, le quantificateur est toujours faux
+        operands = [self.searches[name] for name in names]
+        return all_of(operands) if quantifier == 'all' else any_of(operands)
+
+
+def parse_condition(condition: str, searches: Dict[str, Node]) -> Node:
+    """Construit l'arbre de l'expression de condition (hors agrégation) d'une règle."""
+    return _ConditionParser(condition, searches).parse()
+
+
+# ---------------------------------------------------------------------------
+# Règles
+# ---------------------------------------------------------------------------
+
+class CompiledRule:
+    """Règle SIGMA compilée : en-tête compact (sigma_metadata), arbre et prédicat précompilé.
+
+    La description et la règle YAML complète (rule) sont chargées à la demande
+    depuis la table annexe des métadonnées.
+    """
+
+    __slots__ = ('header', 'tree', 'match', 'aggregation')
+
+    def __init__(self, header: RuleHeader, tree: Node, context: CompileContext,
+                 aggregation: Optional[Aggregation] = None):
+        self.header = header
+        self.tree = tree
+        self.match = tree.compile(context)
+        self.aggregation = aggregation
+
+    @property
+    def id(self) -> str:
+        return self.header.id
+
+    @property
+    def title(self) -> str:
+        return self.header.title
+
+    @property
+    def severity(self) -> str:
+        return self.header.severity
+
+    @property
+    def product(self) -> Optional[str]:
+        return self.header.product
+
+    @property
+    def category(self) -> Optional[str]:
+        return self.header.category
+
+    @property
+    def service(self) -> Optional[str]:
+        return self.header.service
+
+    @property
+    def description(self) -> str:
+        return self.header.description
+
+    @property
+    def rule(self) -> Dict:
+        """Copie de la règle YAML complète, relue à la demande (voir RuleHeader.metadata)."""
+        return self.header.metadata()
+
+    def __repr__(self):
+        return f"<CompiledRule {self.title!r}>"
+
+
+def parse_rule(rule: Dict) -> Tuple[Node, Optional[Aggregation]]:
+    """Construit l'arbre de détection d'une règle et retourne (arbre, agrégation éventuelle).
+
+    Pour une condition 'recherche | agrégation', l'arbre est celui de la
+    recherche ; l'agrégation (sigma_aggregation) est évaluée par l'analyseur
+    sur les entrées qui la satisfont, sur la fenêtre 'timeframe'.
+
+    L'arbre ne dépend d'aucun contexte de compilation : il peut être conservé
+    et recompilé dans un nouveau contexte sans relire ni réanalyser la règle.
+    """
+    detection = rule.get('detection')
+    if not isinstance(detection, dict):
+        raise SigmaCompileError("Aucune section 'detection' trouvée")
+
+    searches = {
+        name: parse_search(definition)
+        for name, definition in detection.items()
+        if name not in RESERVED_DETECTION_KEYS
+    }
+
+    conditions = detection.get('condition', 'selection')
+    if not isinstance(conditions, list):
+        conditions = [conditions]
+
+    trees = []
+    aggregates = set()
+    for condition in conditions:
+        search, _, aggregate = str(condition).partition('|')
+        aggregates.add(aggregate.strip())
+        trees.append(parse_condition(search, searches))
+    if len(aggregates) > 1:
+        raise SigmaCompileError("Conditions multiples avec des agrégations différentes non supportées")
+
+    aggregate = aggregates.pop()
+    if not aggregate:
+        return any_of(trees), None
+    try:
+        aggregation = parse_aggregation(aggregate, detection.get('timeframe'))
+    except ValueError as e:
+        raise SigmaCompileError(str(e)) from None
+    return any_of(trees), aggregation
+
+
+def compile_rule(rule: Union[Dict, RuleHeader], context: Optional[CompileContext] = None,
+                 parsed: Optional[Tuple[Node, Optional[Aggregation]]] = None) -> CompiledRule:
+    """Compile une règle SIGMA déjà chargée depuis le YAML.
+
+    rule est la règle YAML, ou son en-tête compact si parsed est fourni
+    (l'arbre a été construit lors de la lecture du fichier). Sans contexte,
+    la règle est compilée seule et immédiatement utilisable ; avec un
+    contexte partagé, l'appelant doit appeler context.finalize() après la
+    dernière règle. parsed permet de réutiliser le résultat de parse_rule.
+    """
+    header = rule if isinstance(rule, RuleHeader) else RuleHeader(rule)
+    tree, aggregation = parsed or parse_rule(rule)
+    standalone = context is None
+    if standalone:
+        context = CompileContext()
+    if aggregation is not None:
+        aggregation = aggregation.resolved(context.accessor)
+    compiled = CompiledRule(header, tree, context, aggregation)
+    if standalone:
+        context.finalize()
+    return compiled
@@ -0,0 +1,108 @@
+"""Accès aux champs des entrées de log : champs imbriqués et correspondance de noms.
+
+Les règles SIGMA nomment les champs à la manière de Windows (CommandLine,
+Image...) alors que les entrées peuvent être plates ou imbriquées à la manière
+d'ECS ({'process': {'command_line': ...}}). Plutôt que de renommer ou
+d'aplatir chaque entrée, chaque nom de champ des règles est traduit une seule
+fois, à la compilation, en un accesseur :
+
+* un nom simple sans correspondance reste une chaîne : event.get(nom) ;
+* sinon, un tuple de chemins (tuples de clés) essayés dans l'ordre, le
+  premier qui mène à une valeur non nulle l'emporte. Un nom pointé
+  'process.command_line' donne la clé plate puis le chemin imbriqué.
+
+La correspondance (FieldMapping) associe à un nom de champ SIGMA un ou
+plusieurs noms pointés ; la clé '*' donne des modèles appliqués à tous les
+champs ('winlog.event_data.{field}'). Le nom d'origine est toujours essayé en
+premier : entrées plates et imbriquées, de formats différents, sont analysées
+par le même jeu de règles.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+
+# Clé plate (cas courant, accès direct) ou chemins candidats
+Accessor = Union[str, Tuple[Tuple[str, ...], ...]]
+
+DEFAULT_TEMPLATE_KEY = '*'
+
+
+def resolve(event: Dict, accessor: Accessor) -> Any:
+    """Valeur désignée par un accesseur dans une entrée (None si aucun chemin n'aboutit)."""
+    if type(accessor) is str:
+        return event.get(accessor)
+    for path in accessor:
+        value = event
+        for key in path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+            if value is None:
+                break
+        if value is not None:
+            return value
+    return None
+
+
+def leaf_values(event: Dict) -> List[Any]:
+    """Valeurs non nulles de l'entrée, celles des objets imbriqués comprises (recherche par mots-clés)."""
+    values = []
+    stack = [event]
+    while stack:
+        for value in stack.pop().values():
+            if isinstance(value, dict):
+                stack.append(value)
+            elif value is not None:
+                values.append(value)
+    return values
+
+
+class FieldMapping:
+    """Correspondance nom de champ SIGMA -> noms pointés dans les entrées, compilée en accesseurs."""
+
+    def __init__(self, mapping: Optional[Dict[str, Union[str, List[str]]]] = None):
+        mapping = dict(mapping or {})
+        templates = mapping.pop(DEFAULT_TEMPLATE_KEY, [])
+        if not isinstance(templates, list):
+            templates = [templates]
+        self.templates: Tuple[str, ...] = tuple(str(template) for template in templates)
+        self.mapping: Dict[str, Tuple[str, ...]] = {
+            str(field): tuple(str(name) for name in (names if isinstance(names, list) else [names]))
+            for field, names in mapping.items()
+        }
+        self._accessors: Dict[str, Accessor] = {}
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> 'FieldMapping':
+        """Lit une correspondance YAML {champ: nom pointé ou liste de noms} ; lève ValueError si elle est invalide."""
+        with open(path, encoding='utf-8') as f:
+            mapping = yaml.safe_load(f) or {}
+        if not isinstance(mapping, dict):
+            raise ValueError(f"Correspondance de champs invalide (dictionnaire attendu) : {path}")
+        return cls(mapping)
+
+    def accessor(self, field: str) -> Accessor:
+        """Accesseur d'un nom de champ des règles (calculé une fois par nom)."""
+        accessor = self._accessors.get(field)
+        if accessor is None:
+            names = [field, *self.mapping.get(field, ()), *(t.format(field=field) for t in self.templates)]
+            paths = []
+            for name in names:
+                paths.append((name,))
+                if '.' in name:
+                    paths.append(tuple(name.split('.')))
+            paths = tuple(dict.fromkeys(paths))
+            accessor = self._accessors[field] = field if len(paths) == 1 else paths
+        return accessor
+
+    def __bool__(self):
+        return bool(self.mapping or self.templates)
+
+    def __getstate__(self):
+        return self.mapping, self.templates
+
+    def __setstate__(self, state):
+        self.mapping, self.templates = state
+        self._accessors = {}
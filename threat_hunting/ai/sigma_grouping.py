@@ -0,0 +1,85 @@
+"""Regroupement des correspondances SIGMA par (règle, clé).
+
+Une règle bruyante peut produire des milliers de correspondances presque
+identiques. En mode regroupé, les correspondances sont agrégées par règle et
+par valeur des champs de regroupement (hôte, utilisateur...) : nombre,
+première et dernière occurrence, et quelques entrées d'exemple.
+
+L'état d'un groupe est de taille constante (compteur, deux horodatages, au
+plus max_samples exemples) : la mémoire ne dépend que du nombre de groupes,
+pas du nombre de correspondances.
+"""
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .sigma_aggregation import event_timestamp
+from .sigma_compiler import CompiledRule
+from .sigma_fields import Accessor, resolve
+
+DEFAULT_MAX_SAMPLES = 3
+
+
+class _Group:
+    __slots__ = ('compiled', 'key', 'count', 'first_seen', 'last_seen', 'samples')
+
+    def __init__(self, compiled: CompiledRule, key: Tuple):
+        self.compiled = compiled
+        self.key = key
+        self.count = 0
+        self.first_seen: Optional[float] = None
+        self.last_seen: Optional[float] = None
+        self.samples: List[Dict] = []
+
+
+class MatchGrouper:
+    """Agrège les correspondances par règle et par valeurs des champs group_by."""
+
+    def __init__(self, group_by: Sequence[str] = (), max_samples: int = DEFAULT_MAX_SAMPLES,
+                 accessor: Optional[Callable[[str], Accessor]] = None):
+        self.group_by = tuple(group_by)
+        self.accessors = tuple(accessor(field) if accessor else field for field in self.group_by)
+        self.max_samples = max_samples
+        # Ordre d'insertion : ordre de la première correspondance de chaque groupe
+        self.groups: Dict[Tuple, _Group] = {}
+        self.matches = 0
+
+    def add(self, compiled: CompiledRule, log_entry: Dict):
+        key = tuple(resolve(log_entry, accessor) for accessor in self.accessors)
+        try:
+            group = self.groups.get((id(compiled), key))
+        except TypeError:
+            # Valeur de regroupement non hachable (liste...) : regroupement sur sa représentation
+            key = tuple(str(value) for value in key)
+            group = self.groups.get((id(compiled), key))
+        if group is None:
+            group = self.groups[(id(compiled), key)] = _Group(compiled, key)
+
+        timestamp = event_timestamp(log_entry)
+        group.count += 1
+        if group.first_seen is None or timestamp < group.first_seen:
+            group.first_seen = timestamp
+        if group.last_seen is None or timestamp > group.last_seen:
+            group.last_seen = timestamp
+        if len(group.samples) < self.max_samples:
+            group.samples.append(log_entry)
+        self.matches += 1
+
+    def results(self) -> List[Dict]:
+        return [
+            {
+                'rule_id': group.compiled.id,
+                'title': group.compiled.title,
+                'description': group.compiled.description,
+                'severity': group.compiled.severity,
+                'group': dict(zip(self.group_by, group.key)),
+                'count': group.count,
+                'first_seen': _isoformat(group.first_seen),
+                'last_seen': _isoformat(group.last_seen),
+                'samples': group.samples,
+            }
+            for group in self.groups.values()
+        ]
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
@@ -0,0 +1,138 @@
+"""Index des règles SIGMA compilées.
+
+Plutôt que d'évaluer toutes les règles sur chaque entrée de log, l'index ne
+retient pour une entrée que les règles qui peuvent lui correspondre :
+
+* par source de logs (product / category / service) ;
+* par valeur d'un champ discriminant exact (ex. EventID: 4688) ;
+* par présence d'un champ requis (ex. CommandLine).
+
+Les règles retenues sont ensuite évaluées complètement : l'index ne fait
+qu'élaguer, il ne change jamais le résultat.
+
+Les champs sont désignés par leur accesseur (sigma_fields), comme dans les
+prédicats compilés.
+"""
+from collections import Counter
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .sigma_compiler import CompiledRule, EventView
+from .sigma_fields import Accessor
+
+LOGSOURCE_KEYS = ('product', 'category', 'service')
+
+
+class _Partition:
+    """Sous-index des règles d'une même source de logs."""
+
+    def __init__(self, entries: List[Tuple[int, CompiledRule]], accessor: Callable[[str], Accessor]):
+        # Règles sans exigence exploitable, toujours candidates
+        self.always: List[Tuple[int, CompiledRule]] = []
+        # champ -> valeur -> règles
+        self.by_value: Dict[str, Dict[str, List[Tuple[int, CompiledRule]]]] = {}
+        # champ -> règles exigeant la présence du champ
+        self.by_field: Dict[str, List[Tuple[int, CompiledRule]]] = {}
+
+        requirements = [
+            (position, rule, {accessor(field): values for field, values in rule.tree.requirements().items()})
+            for position, rule in entries
+        ]
+        # On privilégie les champs discriminants partagés par le plus de règles
+        # (EventID...) : peu de recherches par entrée pour élaguer beaucoup.
+        exact_counts = Counter(
+            field for _, _, req in requirements for field, values in req.items() if values is not None
+        )
+        field_counts = Counter(field for _, _, req in requirements for field in req)
+
+        for position, rule, req in requirements:
+            entry = (position, rule)
+            exact_fields = [field for field, values in req.items() if values is not None]
+            if exact_fields:
+                field = max(exact_fields, key=lambda f: (exact_counts[f], -len(req[f])))
+                table = self.by_value.setdefault(field, {})
+                for value in req[field]:
+                    table.setdefault(value, []).append(entry)
+            elif req:
+                # Le champ requis le plus rare élague le plus
+                field = min(req, key=lambda f: field_counts[f])
+                self.by_field.setdefault(field, []).append(entry)
+            else:
+                self.always.append(entry)
+        # Champs requis tous lus par une clé plate : parcours des clés de l'entrée
+        self.flat = all(type(field) is str for field in self.by_field)
+
+    def candidates(self, view: EventView) -> List[Tuple[int, CompiledRule]]:
+        found = list(self.always)
+        for field, table in self.by_value.items():
+            value = view[field]
+            if value is not None:
+                bucket = table.get(value)
+                if bucket:
+                    found.extend(bucket)
+        if self.by_field:
+            by_field = self.by_field
+            if self.flat:
+                for field in view.event:
+                    bucket = by_field.get(field)
+                    if bucket and view[field] is not None:
+                        found.extend(bucket)
+            else:
+                for field, bucket in by_field.items():
+                    if view[field] is not None:
+                        found.extend(bucket)
+        return found
+
+
+class RuleIndex:
+    """Index des règles par source de logs, valeurs discriminantes et champs requis."""
+
+    def __init__(self, rules: List[CompiledRule], accessor: Optional[Callable[[str], Accessor]] = None):
+        self.rules = rules
+        self._partitions: Dict[Tuple, _Partition] = {}
+        self._selections: Dict[Tuple, List[_Partition]] = {}
+
+        grouped: Dict[Tuple, List[Tuple[int, CompiledRule]]] = {}
+        for position, rule in enumerate(rules):
+            key = tuple(getattr(rule, name) for name in LOGSOURCE_KEYS)
+            grouped.setdefault(key, []).append((position, rule))
+        for key, entries in grouped.items():
+            self._partitions[key] = _Partition(entries, accessor or _flat)
+
+    def partitions(self, logsource: Optional[Dict] = None) -> List[_Partition]:
+        """Sous-index compatibles avec la source de logs demandée (filtre sur les clés renseignées)."""
+        wanted = tuple((logsource or {}).get(name) for name in LOGSOURCE_KEYS)
+        if wanted not in self._selections:
+            self._selections[wanted] = [
+                partition for key, partition in self._partitions.items()
+                if all(w is None or w == k for w, k in zip(wanted, key))
+            ]
+        return self._selections[wanted]
+
+    def positions(self, logsource: Optional[Dict] = None) -> Optional[FrozenSet[int]]:
+        """Positions des règles compatibles avec la source de logs (None : toutes)."""
+        if not logsource or all(logsource.get(name) is None for name in LOGSOURCE_KEYS):
+            return None
+        return frozenset(
+            position for position, rule in enumerate(self.rules)
+            if all(logsource.get(name) in (None, getattr(rule, name)) for name in LOGSOURCE_KEYS)
+        )
+
+    def candidates(self, view: EventView, partitions: List[_Partition]) -> List[CompiledRule]:
+        """Règles pouvant correspondre à l'entrée, dans leur ordre de chargement."""
+        if len(partitions) == 1:
+            found = partitions[0].candidates(view)
+        else:
+            found = []
+            for partition in partitions:
+                found.extend(partition.candidates(view))
+        if len(found) > 1:
+            found.sort(key=_position)
+        return [rule for _, rule in found]
+
+
+def _flat(field: str) -> Accessor:
+    return field
+
+
+def _position(entry: Tuple[int, CompiledRule]) -> int:
+    return entry[0]
@@ -0,0 +1,156 @@
+"""Recherche multi-motifs des littéraux SIGMA (contains / startswith / endswith).
+
+Tous les littéraux d'un même champ, toutes règles confondues, sont regroupés
+dans un LiteralScanner. Une valeur de champ n'est parcourue qu'une seule fois
+par entrée de log, et le résultat — l'ensemble des atomes trouvés — est
+partagé par toutes les règles qui testent ce champ.
+
+Au-delà de AHO_CORASICK_MIN_LITERALS littéraux, le parcours utilise un
+automate d'Aho-Corasick, dont le coût ne dépend que de la longueur de la
+valeur. En dessous, une boucle de tests `in` (implémentés en C) reste plus
+rapide qu'un automate en Python pur.
+"""
+from collections import deque
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+CONTAINS = 'contains'
+STARTSWITH = 'startswith'
+ENDSWITH = 'endswith'
+KINDS = (CONTAINS, STARTSWITH, ENDSWITH)
+
+AHO_CORASICK_MIN_LITERALS = 150
+
+
+class AhoCorasick:
+    """Automate d'Aho-Corasick : trouve en un passage toutes les occurrences d'un ensemble de mots."""
+
+    def __init__(self, words: List[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # État -> indices des mots qui se terminent dans cet état (suffixes compris)
+        self.output: List[Tuple[int, ...]] = [()]
+
+        outputs: List[List[int]] = [[]]
+        for index, word in enumerate(words):
+            state = 0
+            for char in word:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(index)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                outputs[nxt].extend(outputs[self.fail[nxt]])
+        self.output = [tuple(out) for out in outputs]
+
+    def iter_matches(self, text: str):
+        """Produit (position de fin, indice du mot) pour chaque occurrence."""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for index in output[state]:
+                    yield position, index
+
+
+class LiteralScanner:
+    """Littéraux d'un champ, toutes règles confondues, et leur recherche en un passage."""
+
+    def __init__(self, field: str):
+        self.field = field
+        # (type, littéral) -> identifiant d'atome
+        self.atoms: Dict[Tuple[str, str], int] = {}
+        self.scan: Optional[Callable[[str], FrozenSet[int]]] = None
+
+    def add(self, kind: str, literal: str) -> int:
+        """Enregistre un atome et retourne son identifiant (partagé si déjà connu)."""
+        key = (kind, literal)
+        if key not in self.atoms:
+            self.atoms[key] = len(self.atoms)
+        return self.atoms[key]
+
+    def build(self):
+        """Construit la fonction de recherche, une fois tous les littéraux enregistrés."""
+        # littéral -> (id contains, id startswith, id endswith)
+        by_literal: Dict[str, List[Optional[int]]] = {}
+        for (kind, literal), atom in self.atoms.items():
+            by_literal.setdefault(literal, [None, None, None])[KINDS.index(kind)] = atom
+
+        always = frozenset(atom for atom in by_literal.pop('', []) if atom is not None)
+        entries = [(literal, *ids) for literal, ids in by_literal.items()]
+        if len(entries) >= AHO_CORASICK_MIN_LITERALS:
+            self.scan = self._automaton_scan(entries, always)
+        else:
+            self.scan = self._loop_scan(entries, always)
+
+    @staticmethod
+    def _loop_scan(entries, always):
+        entries = tuple(entries)
+
+        def scan(text: str) -> FrozenSet[int]:
+            hits = set(always)
+            for literal, contains, starts, ends in entries:
+                if literal in text:
+                    if contains is not None:
+                        hits.add(contains)
+                    if starts is not None and text.startswith(literal):
+                        hits.add(starts)
+                    if ends is not None and text.endswith(literal):
+                        hits.add(ends)
+            return hits
+        return scan
+
+    @staticmethod
+    def _automaton_scan(entries, always):
+        automaton = AhoCorasick([literal for literal, *_ in entries])
+        lengths = [len(literal) for literal, *_ in entries]
+        ids = [tuple(atom_ids) for _, *atom_ids in entries]
+
+        def scan(text: str) -> FrozenSet[int]:
+            hits = set(always)
+            last = len(text) - 1
+            for end, index in automaton.iter_matches(text):
+                contains, starts, ends = ids[index]
+                if contains is not None:
+                    hits.add(contains)
+                if starts is not None and end + 1 == lengths[index]:
+                    hits.add(starts)
+                if ends is not None and end == last:
+                    hits.add(ends)
+            return hits
+        return scan
+
+
+def literal_atom(pattern: str) -> Optional[Tuple[str, str]]:
+    """Réduit un motif générique simple à un atome littéral.
+
+    '*abc*' -> ('contains', 'abc'), 'abc*' -> ('startswith', 'abc'),
+    '*abc' -> ('endswith', 'abc') ; None si le motif exige une expression régulière.
+    """
+    if '?' in pattern:
+        return None
+    starts = pattern.startswith('*')
+    ends = pattern.endswith('*') and len(pattern) > 1
+    literal = pattern[1 if starts else 0:len(pattern) - 1 if ends else len(pattern)]
+    if '*' in literal or not (starts or ends):
+        return None
+    if starts and ends:
+        return CONTAINS, literal
+    return (ENDSWITH, literal) if starts else (STARTSWITH, literal)
@@ -0,0 +1,116 @@
+"""Modèle compact des règles SIGMA en mémoire et table annexe de leurs métadonnées.
+
+L'évaluation d'une règle n'utilise que son identifiant, son titre, son niveau,
+sa logsource et son arbre de détection. Le reste du YAML (références, tags,
+auteur, faux positifs...) représente l'essentiel d'une règle lue mais ne sert
+qu'à présenter un résultat :
+
+* RuleHeader ne conserve que les champs utiles à l'évaluation et à la
+  présentation courante des résultats (description comprise), dans des
+  __slots__, avec des chaînes internées (niveaux, logsources, champs et
+  motifs des arbres sont partagés entre règles) ;
+* les métadonnées complètes sont relues à la demande depuis le fichier de la
+  règle (rule_metadata) et gardées dans un cache LRU borné, indexé par le
+  chemin et l'empreinte du contenu compilé ; une règle fournie en mémoire
+  (sans fichier) conserve son dictionnaire.
+
+Si un fichier est modifié entre le chargement et la lecture de ses
+métadonnées, celles-ci ne correspondent plus à la règle compilée : seuls les
+champs de l'en-tête sont alors retournés. Chaque appel à metadata() retourne
+une copie, qu'on peut modifier sans toucher au cache.
+"""
+import copy
+import hashlib
+import logging
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+METADATA_CACHE_SIZE = 1024
+
+# Chargeur YAML sûr implémenté en C (libyaml) s'il est disponible
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def intern(value: Any) -> Any:
+    """Interne une chaîne (une seule copie en mémoire pour toutes les règles) ; autre valeur inchangée."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class RuleHeader:
+    """Champs d'une règle utiles à l'évaluation ; source est le chemin du fichier ou la règle elle-même."""
+
+    __slots__ = ('id', 'title', 'description', 'severity', 'product', 'category', 'service', 'source', 'digest')
+
+    def __init__(self, rule: Dict, source: Union[str, Dict, None] = None, digest: Optional[bytes] = None):
+        self.id = str(rule.get('id', 'N/A'))
+        self.title = str(rule.get('title', 'Sans titre'))
+        self.description = str(rule.get('description') or '')
+        self.severity = sys.intern(str(rule.get('level', 'medium')).upper())
+        logsource = rule.get('logsource') or {}
+        self.product = intern(logsource.get('product'))
+        self.category = intern(logsource.get('category'))
+        self.service = intern(logsource.get('service'))
+        self.source = source if source is not None else rule
+        # Empreinte SHA-256 du fichier compilé (voir content_digest)
+        self.digest = digest
+
+    @property
+    def label(self) -> str:
+        """Désignation de la règle dans les journaux : chemin du fichier, à défaut titre."""
+        return self.source if isinstance(self.source, str) else self.title
+
+    def metadata(self) -> Dict:
+        """Copie de la règle YAML complète (avec 'file' pour une règle lue sur disque), chargée à la demande."""
+        if isinstance(self.source, dict):
+            return copy.deepcopy(self.source)
+        metadata = rule_metadata(self.source, self.digest)
+        if metadata is None:
+            # Fichier supprimé, illisible ou modifié depuis le chargement
+            return {'id': self.id, 'title': self.title, 'description': self.description,
+                    'level': self.severity.lower(), 'file': self.source}
+        return copy.deepcopy(metadata)
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, intern(value))
+
+    def __repr__(self):
+        return f"<RuleHeader {self.title!r}>"
+
+
+def content_digest(content: bytes) -> bytes:
+    return hashlib.sha256(content).digest()
+
+
+@lru_cache(maxsize=METADATA_CACHE_SIZE)
+def rule_metadata(path: str, digest: Optional[bytes] = None) -> Optional[Dict]:
+    """Relit le fichier d'une règle (résultat partagé : ne pas le modifier).
+
+    Avec digest, retourne None si le contenu du fichier n'a plus cette empreinte.
+    """
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        if digest is not None and content_digest(content) != digest:
+            logger.warning(f"Règle {path} modifiée depuis son chargement : métadonnées limitées à l'en-tête")
+            return None
+        rule = yaml.load(content.decode('utf-8'), Loader=_YAML_LOADER)
+    except Exception as e:
+        logger.warning(f"Métadonnées de la règle {path} illisibles : {e}")
+        return None
+    if not isinstance(rule, dict):
+        return None
+    rule['file'] = path
+    return rule
+
+
+def clear_metadata_cache():
+    rule_metadata.cache_clear()
@@ -0,0 +1,93 @@
+"""Transformations de valeurs des modificateurs SIGMA.
+
+Les modificateurs de valeur ('champ|wide|base64offset|contains') sont
+appliqués une seule fois, au chargement de la règle : chaque valeur de la
+règle devient l'ensemble des chaînes équivalentes à rechercher (variantes de
+tirets, encodages base64 aux trois décalages...), puis le modificateur de
+position (contains / startswith / endswith) les transforme en motifs
+génériques. L'évaluation ne voit plus que des égalités, des littéraux et des
+motifs ordinaires (voir sigma_compiler).
+"""
+import base64
+import re
+from itertools import product
+from typing import Callable, Dict, List
+
+# Modificateurs de position : motif générique correspondant
+PLACEMENTS = {'contains': '*{}*', 'startswith': '{}*', 'endswith': '*{}'}
+
+# Caractères d'option acceptés par les outils Windows à la place de '-' ou '/'
+WINDASH_CHARACTERS = ('-', '/', '–', '—', '―')
+
+_WINDASH_RE = re.compile(r'\B[-/]\b')
+
+# Au-delà, le nombre de variantes (5 par option) rendrait la règle démesurée
+MAX_WINDASH_OPTIONS = 4
+
+
+def windash(value: str) -> List[str]:
+    """Variantes d'une ligne de commande où chaque option peut commencer par -, /, –, — ou ―."""
+    parts = _WINDASH_RE.split(value)
+    if len(parts) == 1:
+        return [value]
+    if len(parts) - 1 > MAX_WINDASH_OPTIONS:
+        raise ValueError(f"Trop d'options pour le modificateur windash : {value!r}")
+    variants = []
+    for dashes in product(WINDASH_CHARACTERS, repeat=len(parts) - 1):
+        variant = parts[0]
+        for dash, part in zip(dashes, parts[1:]):
+            variant += dash + part
+        variants.append(variant)
+    return variants
+
+
+def base64_encode(value: bytes) -> List[str]:
+    return [base64.b64encode(value).decode('ascii')]
+
+
+def base64_offsets(value: bytes) -> List[str]:
+    """Les trois encodages base64 de la valeur selon son décalage dans un texte plus long.
+
+    Les caractères qui dépendent du contexte (octets voisins) sont retirés :
+    chaque variante est un littéral à rechercher avec contains.
+    """
+    start_offsets = (0, 2, 3)
+    end_offsets = (None, -3, -2)
+    variants = []
+    for shift in range(3):
+        encoded = base64.b64encode(b' ' * shift + value).decode('ascii')
+        variants.append(encoded[start_offsets[shift]:end_offsets[(len(value) + shift) % 3]])
+    return variants
+
+
+# Encodage des chaînes avant base64 (UTF-8 par défaut)
+ENCODINGS: Dict[str, str] = {'wide': 'utf-16-le', 'utf16le': 'utf-16-le', 'utf16be': 'utf-16-be', 'utf16': 'utf-16'}
+
+# Transformations texte -> textes, et texte encodé -> textes
+TEXT_TRANSFORMS: Dict[str, Callable[[str], List[str]]] = {'windash': windash}
+BINARY_TRANSFORMS: Dict[str, Callable[[bytes], List[str]]] = {'base64': base64_encode, 'base64offset': base64_offsets}
+
+VALUE_MODIFIERS = frozenset(ENCODINGS) | frozenset(TEXT_TRANSFORMS) | frozenset(BINARY_TRANSFORMS)
+
+
+def expand_value(value: str, modifiers: List[str]) -> List[str]:
+    """Applique les modificateurs de valeur dans l'ordre de la règle ; retourne les variantes à rechercher.
+
+    Lève ValueError pour une combinaison sans objet (encodage sans base64).
+    """
+    variants = [value]
+    encoding = 'utf-8'
+    for modifier in modifiers:
+        if modifier in ENCODINGS:
+            encoding = ENCODINGS[modifier]
+        elif modifier in TEXT_TRANSFORMS:
+            transform = TEXT_TRANSFORMS[modifier]
+            variants = [expanded for variant in variants for expanded in transform(variant)]
+        else:
+            transform = BINARY_TRANSFORMS[modifier]
+            variants = [expanded for variant in variants for expanded in transform(variant.encode(encoding or 'utf-8'))]
+            encoding = None
+    if encoding not in ('utf-8', None):
+        raise ValueError(f"Le modificateur d'encodage doit précéder base64 ou base64offset : {'|'.join(modifiers)}")
+    # Variantes dans l'ordre, sans doublon
+    return list(dict.fromkeys(variants))
@@ -0,0 +1,153 @@
+"""Évaluation SIGMA parallèle sur plusieurs processus.
+
+L'évaluation des règles est du Python pur, limitée par le GIL : une analyse
+n'utilise qu'un cœur. ParallelSigmaAnalyzer découpe le flux d'entrées en lots
+et les répartit sur un pool de processus.
+
+* Chaque processus reçoit les règles une seule fois, à son démarrage
+  (initializer), sous forme compacte (en-têtes et arbres, sans le YAML), et
+  les compile localement ; les tâches ne transportent que des lots d'entrées.
+* Un processus ne renvoie que des couples (indice de l'entrée dans le lot,
+  position de la règle) ; les résultats sont reconstruits dans le processus
+  parent à partir de ses propres entrées et règles. Ils sont donc identiques,
+  et dans le même ordre, que ceux de SigmaAnalyzer.iter_matches.
+* Les agrégations, qui dépendent de l'ordre des entrées, sont appliquées dans
+  le processus parent aux recherches satisfaites renvoyées par les processus.
+* Le nombre de lots en cours est borné (read_ahead lots par processus) : un
+  flux d'entrées n'est jamais lu entièrement en mémoire, la lecture ne prend
+  que read_ahead * chunk_size entrées d'avance par processus.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .sigma_aggregation import AggregationTracker
+from .sigma_analyzer import RuleSet, SigmaAnalyzer
+from .sigma_compiler import CompiledRule
+from .sigma_fields import FieldMapping
+from .sigma_metadata import RuleHeader
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Lots en attente par processus : deux suffisent à les occuper sans tout lire
+DEFAULT_READ_AHEAD = 2
+
+# Analyseur propre à chaque processus de travail, construit par init_worker
+_worker_analyzer: Optional[SigmaAnalyzer] = None
+_worker_positions: Dict[int, int] = {}
+
+
+def worker_initargs(analyzer: SigmaAnalyzer, ruleset: RuleSet) -> Tuple:
+    """Arguments de init_worker pour un pool de processus qui évalue ruleset (règles compactes)."""
+    return ruleset.compact_rules(), str(analyzer.rules_dir), analyzer.field_mapping, analyzer.adaptive_ordering
+
+
+def init_worker(rules: List[Tuple[RuleHeader, Tuple]], rules_dir: str, field_mapping: FieldMapping,
+                adaptive_ordering: bool = False):
+    """Initialisation d'un processus de travail (pools de ParallelSigmaAnalyzer et de sigma_backtest)."""
+    global _worker_analyzer, _worker_positions
+    _worker_analyzer = SigmaAnalyzer(rules_dir, rules=rules, field_mapping=field_mapping,
+                                     adaptive_ordering=adaptive_ordering)
+    _worker_positions = {id(compiled): position for position, compiled in enumerate(_worker_analyzer.compiled_rules)}
+
+
+def worker_state() -> Tuple[SigmaAnalyzer, Dict[int, int]]:
+    """Analyseur du processus de travail et position de chaque règle compilée (par id), construits par init_worker."""
+    if _worker_analyzer is None:
+        raise RuntimeError("init_worker n'a pas été appelé dans ce processus")
+    return _worker_analyzer, _worker_positions
+
+
+def _match_chunk(log_data: List[Dict], log_source: Any) -> List[Tuple[int, int]]:
+    """Évalue un lot dans un processus de travail ; retourne (indice de l'entrée, position de la règle)."""
+    return [
+        (offset, _worker_positions[id(compiled)])
+        for offset, _, compiled in _worker_analyzer._iter_search_hits(log_data, log_source)
+    ]
+
+
+class ParallelSigmaAnalyzer:
+    """Répartit l'analyse d'un SigmaAnalyzer sur un pool de processus.
+
+    À utiliser comme gestionnaire de contexte pour réutiliser le pool entre
+    plusieurs analyses :
+
+        with ParallelSigmaAnalyzer(SigmaAnalyzer(), workers=4) as parallel:
+            results = parallel.analyze_logs(logs)
+    """
+
+    def __init__(self, analyzer: SigmaAnalyzer, workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, read_ahead: int = DEFAULT_READ_AHEAD):
+        self.analyzer = analyzer
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.read_ahead = max(1, read_ahead)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._version: Optional[int] = None
+
+    def _pool(self, ruleset: RuleSet) -> ProcessPoolExecutor:
+        """Pool dont les processus détiennent ce jeu de règles (recréé après un rechargement)."""
+        if self._executor is not None and self._version != ruleset.version:
+            self.close()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=init_worker,
+                initargs=worker_initargs(self.analyzer, ruleset),
+            )
+            self._version = ruleset.version
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def analyze_logs(self, log_data: Iterable[Dict], log_source: Any = None) -> List[Dict]:
+        """Équivalent parallèle de SigmaAnalyzer.analyze_logs (mêmes résultats, même ordre)."""
+        return list(self.iter_matches(log_data, log_source))
+
+    def iter_matches(self, log_data: Iterable[Dict], log_source: Any = None) -> Iterator[Dict]:
+        """Équivalent parallèle de SigmaAnalyzer.iter_matches."""
+        build_result = self.analyzer._build_result
+        details = {}
+        for _, log_entry, compiled, aggregated in self.iter_hits(log_data, log_source):
+            yield build_result(compiled, log_entry, aggregated, details)
+
+    def iter_hits(self, log_data: Iterable[Dict], log_source: Any = None,
+                  tracker: Optional[AggregationTracker] = None
+                  ) -> Iterator[Tuple[int, Dict, CompiledRule, Optional[Dict]]]:
+        """Produit (rang de l'entrée dans le flux, entrée, règle, détail de l'agrégation) pour chaque correspondance."""
+        ruleset = self.analyzer.ruleset
+        if not ruleset.compiled_rules:
+            return
+        pool = self._pool(ruleset)
+        compiled_rules = ruleset.compiled_rules
+        aggregate = self.analyzer._aggregate
+        if tracker is None:
+            tracker = AggregationTracker()
+        pending = deque()
+        events = iter(log_data)
+        max_pending = self.workers * self.read_ahead
+        read = 0
+
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(events, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append((read, chunk, pool.submit(_match_chunk, chunk, log_source)))
+                read += len(chunk)
+            if not pending:
+                return
+            base, chunk, future = pending.popleft()
+            for offset, position in future.result():
+                yield from aggregate(base + offset, chunk[offset], compiled_rules[position], tracker)
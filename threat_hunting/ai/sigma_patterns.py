@@ -0,0 +1,53 @@
+"""Expressions régulières SIGMA précompilées.
+
+* Les motifs génériques ('*', '?') qui ne se réduisent pas à un littéral sont
+  fusionnés, pour un même élément de sélection, en une seule alternance
+  évaluée en un passage par valeur de champ.
+* Toutes les expressions sont compilées une seule fois par jeu de règles
+  (RegexCache), les doublons entre règles partageant le même objet compilé.
+* Les motifs '|re' ne sont pas
+  fusionnés : groupes nommés, références arrière et drapeaux en ligne d'un motif
+  utilisateur ne survivent pas à l'insertion dans une alternance.
+"""
+import re
+from typing import Dict, Optional, Pattern, Tuple
+
+
+def wildcard_to_regex(pattern: str, anchored: bool = True) -> str:
+    """Traduit un motif SIGMA à caractères génériques en expression régulière."""
+    regex = re.escape(pattern).replace('\\*', '.*').replace('\\?', '.')
+    return f'{regex}\\Z' if anchored else regex
+
+
+class RegexCache:
+    """Expressions régulières compilées une seule fois et partagées entre règles.
+
+    previous est le cache d'une compilation antérieure du jeu de règles (avant
+    un rechargement) : les motifs encore utilisés en sont repris sans être
+    recompilés, ceux qui ne le sont plus disparaissent avec l'ancien cache.
+    """
+
+    def __init__(self, previous: Optional['RegexCache'] = None):
+        self._compiled: Dict[Tuple[str, int], Pattern] = {}
+        self._previous = previous._compiled if previous is not None else {}
+
+    def compile(self, pattern: str, flags: int = 0) -> Pattern:
+        """Retourne le motif compilé ; lève re.error si le motif est invalide."""
+        key = (pattern, flags)
+        if key not in self._compiled:
+            compiled = self._previous.get(key)
+            self._compiled[key] = compiled if compiled is not None else re.compile(pattern, flags)
+        return self._compiled[key]
+
+    def release_previous(self):
+        """Libère le cache antérieur une fois la compilation terminée."""
+        self._previous = {}
+
+    def __len__(self):
+        return len(self._compiled)
+
+
+def merge_wildcards(patterns: Tuple[str, ...]) -> str:
+    """Fusionne des motifs génériques en une alternance ancrée en fin de valeur (à utiliser avec match)."""
+    branches = '|'.join(wildcard_to_regex(p, anchored=False) for p in patterns)
+    return f'(?:{branches})\\Z'
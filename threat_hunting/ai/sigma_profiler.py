@@ -0,0 +1,164 @@
+"""Coût d'évaluation de chaque règle SIGMA, mesuré par échantillonnage.
+
+Pour savoir quelles règles ralentissent les analyses, le RuleProfiler d'un
+SigmaAnalyzer (profile_sample_every non nul) relève pour chaque règle :
+
+* le nombre d'évaluations de sa recherche et le temps passé, mesurés sur une
+  entrée sur sample_every en moyenne (intervalle tiré au hasard, pour ne pas
+  se caler sur un flux périodique), puis extrapolés à toutes les entrées ;
+* la distribution des durées d'évaluation, dans un histogramme logarithmique
+  de taille fixe (quatre classes par doublement, soit environ 19 % de
+  précision), d'où le p99 ;
+* le nombre exact de correspondances (recherches satisfaites, avant agrégation).
+
+Hors échantillon, le surcoût est d'un décompte par entrée et d'un appel par
+correspondance : le profilage peut rester actif en production. Les
+statistiques sont indexées par règle (id, titre) et survivent aux
+rechargements du jeu de règles. Les entrées servies par le cache des
+verdicts ne sont pas évaluées et ne sont donc pas mesurées ; le mode colonnes
+(iter_batch_matches) n'est pas profilé.
+"""
+import math
+import random
+import threading
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .sigma_timing import elapsed_since
+
+DEFAULT_SAMPLE_EVERY = 100
+
+_BUCKETS_PER_OCTAVE = 4
+# Classes de l'histogramme : de 2**-30 s (~1 ns) à 2**2 s
+_MIN_EXPONENT = -30
+_BUCKETS = (2 - _MIN_EXPONENT) * _BUCKETS_PER_OCTAVE
+
+SORT_KEYS = ('total', 'p99', 'mean', 'evaluations', 'matches')
+
+
+def _bucket(elapsed: float) -> int:
+    if elapsed <= 0.0:
+        return 0
+    mantissa, exponent = math.frexp(elapsed)
+    bucket = (exponent - _MIN_EXPONENT) * _BUCKETS_PER_OCTAVE + int((mantissa - 0.5) * 2 * _BUCKETS_PER_OCTAVE)
+    return min(max(bucket, 0), _BUCKETS - 1)
+
+
+def _bucket_upper_bound(bucket: int) -> float:
+    octave, step = divmod(bucket + 1, _BUCKETS_PER_OCTAVE)
+    return math.ldexp(0.5 + step / (2 * _BUCKETS_PER_OCTAVE), octave + _MIN_EXPONENT)
+
+
+class RuleCost:
+    """Statistiques d'une règle ; evaluations et elapsed ne portent que sur les entrées échantillonnées."""
+
+    __slots__ = ('rule_id', 'title', 'source', 'evaluations', 'matches', 'elapsed', 'histogram')
+
+    def __init__(self, rule_id: str, title: str, source: Optional[str]):
+        self.rule_id = rule_id
+        self.title = title
+        self.source = source
+        self.evaluations = 0
+        self.matches = 0
+        self.elapsed = 0.0
+        self.histogram = [0] * _BUCKETS
+
+    def percentile(self, fraction: float) -> float:
+        """Borne supérieure (secondes) de la classe qui contient ce quantile des durées mesurées."""
+        if not self.evaluations:
+            return 0.0
+        rank = math.ceil(fraction * self.evaluations)
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                return _bucket_upper_bound(bucket)
+        return _bucket_upper_bound(_BUCKETS - 1)
+
+    def as_dict(self, sample_every: int) -> Dict:
+        mean = self.elapsed / self.evaluations if self.evaluations else 0.0
+        result = {
+            'rule_id': self.rule_id,
+            'title': self.title,
+            'evaluations': self.evaluations * sample_every,
+            'sampled_evaluations': self.evaluations,
+            'matches': self.matches,
+            'total_ms': round(self.elapsed * sample_every * 1e3, 3),
+            'mean_us': round(mean * 1e6, 3),
+            'p99_us': round(self.percentile(0.99) * 1e6, 3),
+        }
+        if self.source is not None:
+            result['file'] = self.source
+        return result
+
+
+class RuleProfiler:
+    """Mesure échantillonnée du coût des règles d'un SigmaAnalyzer (voir le module)."""
+
+    def __init__(self, sample_every: int = DEFAULT_SAMPLE_EVERY):
+        self.sample_every = max(1, sample_every)
+        self.sampled_events = 0
+        self._costs: Dict[Tuple[str, str], RuleCost] = {}
+        self._countdown = 1
+        self._random = random.Random()
+        self._lock = threading.Lock()
+
+    def sample(self) -> bool:
+        """Appelé une fois par entrée évaluée : vrai si elle doit être mesurée."""
+        self._countdown -= 1
+        if self._countdown > 0:
+            return False
+        every = self.sample_every
+        # Intervalle moyen sample_every, tiré au hasard
+        self._countdown = self._random.randint(1, 2 * every - 1) if every > 1 else 1
+        self.sampled_events += 1
+        return True
+
+    def _cost(self, compiled) -> RuleCost:
+        header = compiled.header
+        key = (header.id, header.title)
+        cost = self._costs.get(key)
+        if cost is None:
+            with self._lock:
+                cost = self._costs.setdefault(key, RuleCost(
+                    header.id, header.title, header.source if isinstance(header.source, str) else None))
+        return cost
+
+    def evaluate(self, view, candidates: Iterable) -> List:
+        """Évalue et mesure chaque règle candidate ; retourne celles dont la recherche est satisfaite."""
+        verdict = []
+        for compiled in candidates:
+            start = perf_counter()
+            matched = compiled.match(view)
+            elapsed = elapsed_since(start)
+            cost = self._cost(compiled)
+            cost.evaluations += 1
+            cost.elapsed += elapsed
+            cost.histogram[_bucket(elapsed)] += 1
+            if matched:
+                verdict.append(compiled)
+        return verdict
+
+    def matched(self, compiled):
+        self._cost(compiled).matches += 1
+
+    def report(self, sort: str = 'total', limit: int = 0) -> List[Dict]:
+        """Statistiques par règle, par coût décroissant selon sort (voir SORT_KEYS)."""
+        key = {'total': 'total_ms', 'p99': 'p99_us', 'mean': 'mean_us'}.get(sort, sort)
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Tri inconnu : {sort} (attendu : {', '.join(SORT_KEYS)})")
+        rows = [cost.as_dict(self.sample_every) for cost in list(self._costs.values())]
+        rows.sort(key=lambda row: row[key], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def stats(self, sort: str = 'total', limit: int = 0) -> Dict:
+        return {
+            'sample_every': self.sample_every,
+            'sampled_events': self.sampled_events,
+            'rules': self.report(sort, limit),
+        }
+
+    def reset(self):
+        with self._lock:
+            self._costs = {}
+            self.sampled_events = 0
@@ -0,0 +1,183 @@
+"""Traduction des détections SIGMA en clauses SQL WHERE paramétrées.
+
+Une recherche rétrospective sur des mois d'entrées stockées ne peut pas
+rapatrier chaque ligne en Python : l'arbre de détection d'une règle
+(sigma_compiler) est traduit en une condition SQL sur une colonne JSON,
+évaluée par la base, éventuellement à l'aide de ses index.
+
+* Égalités, contains / startswith / endswith et motifs génériques deviennent
+  LOWER(champ) IN (...) et LOWER(champ) LIKE ... ESCAPE '\\' ; les valeurs
+  sont toujours passées en paramètres.
+* Chaque test est gardé par « champ IS NOT NULL AND ... » : il vaut FALSE,
+  jamais NULL, pour un champ absent, ce qui préserve la sémantique de NOT
+  sans empêcher l'utilisation d'un index sur LOWER(champ).
+* Les tests sans équivalent SQL fidèle (expressions '|re', comparaisons
+  numériques, cidr, mots-clés sur toute l'entrée) sont approchés : la
+  condition produite sélectionne alors un sur-ensemble des entrées
+  concernées (le test est remplacé par TRUE, ou par FALSE sous un NOT), et
+  les lignes retournées doivent être vérifiées par le prédicat compilé.
+  SqlCondition.exact indique si cette vérification est superflue.
+
+Dialectes : PostgreSQL (jsonb, opérateurs ->> et #>>) et SQLite (json_extract,
+pour les tests). Avec PostgreSQL, un index sur l'expression d'un champ
+fréquemment recherché (LOWER(data ->> 'EventID'), ou un index trigramme
+pg_trgm pour les contains) rend la recherche entièrement indexée.
+"""
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+from .sigma_compiler import AndNode, FalseNode, FieldNode, Node, NotNode, OrNode
+from .sigma_fields import Accessor
+from .sigma_literals import CONTAINS, ENDSWITH, STARTSWITH
+
+# Fragment SQL et ses paramètres ; TRUE / FALSE pour une condition constante
+Fragment = Union[Tuple[str, List], bool]
+
+_LIKE_TEMPLATES = {CONTAINS: '%{}%', STARTSWITH: '{}%', ENDSWITH: '%{}'}
+
+
+class SqlCondition(NamedTuple):
+    """Condition WHERE paramétrée ; exact est faux si les lignes doivent être vérifiées en Python."""
+    sql: str
+    params: List
+    exact: bool
+
+
+class SqlDialect:
+    """Accès à un chemin d'une colonne JSON sous forme de texte, selon la base."""
+
+    name = ''
+
+    def path(self, column: str, path: Tuple[str, ...]) -> Tuple[str, List]:
+        raise NotImplementedError
+
+
+class PostgresDialect(SqlDialect):
+    name = 'postgresql'
+
+    def path(self, column: str, path: Tuple[str, ...]) -> Tuple[str, List]:
+        if len(path) == 1:
+            return f'({column} ->> %s)', [path[0]]
+        return f'({column} #>> %s)', [list(path)]
+
+
+class SqliteDialect(SqlDialect):
+    name = 'sqlite'
+
+    def path(self, column: str, path: Tuple[str, ...]) -> Tuple[str, List]:
+        json_path = '$' + ''.join('."{}"'.format(key.replace('"', '\\"')) for key in path)
+        # json_extract rend 1 / 0 pour true / false : texte 'true' / 'false' comme str(valeur).lower()
+        return (
+            f"(CASE json_type({column}, %s) WHEN 'true' THEN 'true' WHEN 'false' THEN 'false' "
+            f"ELSE json_extract({column}, %s) END)",
+            [json_path, json_path],
+        )
+
+
+DIALECTS = {dialect.name: dialect for dialect in (PostgresDialect(), SqliteDialect())}
+
+
+def like_pattern(pattern: str) -> str:
+    """Motif LIKE (échappement '\\') d'un motif générique SIGMA en minuscules."""
+    escaped = pattern.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped.replace('*', '%').replace('?', '_')
+
+
+def translate(tree: Node, column: str, dialect: SqlDialect,
+              accessor: Callable[[str], Accessor] = lambda field: field) -> SqlCondition:
+    """Traduit un arbre de détection en condition SQL sur la colonne JSON column (nom déjà protégé).
+
+    accessor traduit les noms de champs des règles (voir sigma_fields) ; le
+    premier chemin non nul d'un accesseur l'emporte, comme en Python.
+    """
+    translator = _Translator(column, dialect, accessor)
+    fragment = translator.translate(tree, True)
+    if fragment is True:
+        return SqlCondition('1 = 1', [], translator.exact)
+    if fragment is False:
+        return SqlCondition('1 = 0', [], translator.exact)
+    sql, params = fragment
+    return SqlCondition(sql, params, translator.exact)
+
+
+class _Translator:
+    """Traduction d'un arbre en condition SQL vraie sur un sur-ensemble (superset) ou un sous-ensemble de ses entrées."""
+
+    def __init__(self, column: str, dialect: SqlDialect, accessor: Callable[[str], Accessor]):
+        self.column = column
+        self.dialect = dialect
+        self.accessor = accessor
+        self.exact = True
+
+    def translate(self, node: Node, superset: bool) -> Fragment:
+        if isinstance(node, AndNode):
+            return _combine('AND', [self.translate(operand, superset) for operand in node.operands])
+        if isinstance(node, OrNode):
+            return _combine('OR', [self.translate(operand, superset) for operand in node.operands])
+        if isinstance(node, NotNode):
+            # NOT d'un sous-ensemble de x est un sur-ensemble de NOT x, et réciproquement
+            inner = self.translate(node.operand, not superset)
+            if isinstance(inner, bool):
+                return not inner
+            sql, params = inner
+            return f'NOT {sql}', params
+        if isinstance(node, FalseNode):
+            return False
+        if isinstance(node, FieldNode):
+            return self._field(node)
+        # Pas d'équivalent SQL fidèle : test laissé au prédicat compilé
+        self.exact = False
+        return superset
+
+    def _value(self, field: str) -> Tuple[str, List]:
+        accessor = self.accessor(field)
+        paths = [(accessor,)] if isinstance(accessor, str) else accessor
+        parts = [self.dialect.path(self.column, path) for path in paths]
+        if len(parts) == 1:
+            return parts[0]
+        return f"COALESCE({', '.join(sql for sql, _ in parts)})", [p for _, params in parts for p in params]
+
+    def _field(self, node: FieldNode) -> Fragment:
+        value, value_params = self._value(node.field)
+        if node.is_null:
+            return f'({value} IS NULL)', value_params
+
+        tests = []
+        params: List = []
+        if node.exact:
+            exact = sorted(node.exact)
+            tests.append(f"LOWER({value}) IN ({', '.join(['%s'] * len(exact))})")
+            params += value_params + exact
+        patterns = [_LIKE_TEMPLATES[kind].format(like_pattern(literal)) for kind, literal in node.atoms]
+        patterns += [like_pattern(pattern) for pattern in node.wildcards]
+        for pattern in patterns:
+            tests.append(f"LOWER({value}) LIKE %s ESCAPE '\\'")
+            params += value_params + [pattern]
+        if not tests:
+            return False
+        condition = tests[0] if len(tests) == 1 else '(' + ' OR '.join(tests) + ')'
+        return f'({value} IS NOT NULL AND {condition})', value_params + params
+
+
+def _combine(operator: str, fragments: List[Fragment]) -> Fragment:
+    """ET / OU de fragments, simplifié lorsque des opérandes sont constants."""
+    absorbing = operator == 'OR'
+    neutral = not absorbing
+    parts = []
+    for fragment in fragments:
+        if fragment is absorbing:
+            return absorbing
+        if fragment is not neutral:
+            parts.append(fragment)
+    if not parts:
+        return neutral
+    if len(parts) == 1:
+        return parts[0]
+    return (
+        '(' + f' {operator} '.join(sql for sql, _ in parts) + ')',
+        [param for _, params in parts for param in params],
+    )
+
+
+def dialect_for(vendor: str) -> Optional[SqlDialect]:
+    """Dialecte d'une base Django (connection.vendor), None si elle n'est pas prise en charge."""
+    return DIALECTS.get(vendor)
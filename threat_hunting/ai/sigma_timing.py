@@ -0,0 +1,25 @@
+"""Mesure des courtes durées d'évaluation (ordre adaptatif, profilage des règles).
+
+Une évaluation de prédicat dure souvent moins d'une microseconde, du même
+ordre que deux appels de perf_counter : la durée d'une mesure à vide,
+calibrée une fois au chargement du module, est retranchée de chaque mesure.
+"""
+from statistics import median
+from time import perf_counter
+
+
+def calibrate_timer_overhead(samples: int = 101) -> float:
+    """Durée médiane mesurée entre deux appels successifs de perf_counter, en secondes."""
+    durations = []
+    for _ in range(samples):
+        start = perf_counter()
+        durations.append(perf_counter() - start)
+    return median(durations)
+
+
+TIMER_OVERHEAD = calibrate_timer_overhead()
+
+
+def elapsed_since(start: float) -> float:
+    """Durée écoulée depuis start (perf_counter), coût de la mesure retranché."""
+    return max(perf_counter() - start - TIMER_OVERHEAD, 0.0)
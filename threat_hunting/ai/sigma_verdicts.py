@@ -0,0 +1,92 @@
+"""Cache des verdicts SIGMA pour les entrées répétées.
+
+Les collecteurs renvoient souvent des entrées identiques (battements de cœur,
+redémarrages de services...). Le verdict d'une entrée — les règles dont la
+recherche est satisfaite — ne dépend que de str(valeur) des champs que les
+règles référencent : deux entrées qui coïncident sur ces champs ont le même
+verdict, quels que soient leurs autres champs (horodatage, numéro
+d'enregistrement...).
+
+La clé du cache est donc le tuple des str(valeur) de ces seuls champs, plus
+la version du jeu de règles et le filtre de source de logs. Si une règle
+recherche des mots-clés sur toute l'entrée, la clé porte sur l'ensemble des
+couples (champ, valeur).
+
+Le cache est borné (LRU), vidé à chaque changement de version du jeu de
+règles, et compte les succès et les échecs. Les agrégations, qui ont un état,
+sont toujours appliquées après le cache.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from .sigma_fields import Accessor, resolve
+
+DEFAULT_VERDICT_CACHE_SIZE = 10000
+
+
+class VerdictCache:
+    """Cache LRU borné : clé des champs référencés -> règles dont la recherche est satisfaite."""
+
+    def __init__(self, max_size: int = DEFAULT_VERDICT_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def bind(self, version: int):
+        """Associe le cache à une version du jeu de règles ; le vide si elle a changé."""
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._entries.clear()
+                    self._version = version
+
+    @staticmethod
+    def key(event: Dict, scope: Hashable, fields: Optional[Tuple[Accessor, ...]]) -> Hashable:
+        """Clé canonique de l'entrée : str(valeur) des seuls champs référencés par le jeu de règles.
+
+        fields contient les accesseurs de ces champs (sigma_fields). scope doit contenir la version du jeu de règles : une analyse encore
+        en cours sur l'ancien jeu ne lit ni n'écrit les verdicts du nouveau.
+        """
+        if fields is None:
+            return scope, frozenset((name, str(value)) for name, value in event.items() if value is not None)
+        values = []
+        for accessor in fields:
+            value = event.get(accessor) if type(accessor) is str else resolve(event, accessor)
+            values.append(None if value is None else str(value))
+        return scope, tuple(values)
+
+    def get(self, key: Hashable) -> Optional[Tuple]:
+        verdict = self._entries.get(key)
+        if verdict is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # Évincée entre-temps par un autre thread : le verdict reste valable
+            pass
+        return verdict
+
+    def put(self, key: Hashable, verdict: Tuple):
+        with self._lock:
+            self._entries[key] = verdict
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'size': len(self._entries),
+            'max_size': self.max_size,
+        }
+
+    def __len__(self):
+        return len(self._entries)
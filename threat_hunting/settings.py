@@ -150,4 +150,27 @@ TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
 
 # Configuration des fichiers médias
 MEDIA_URL = '/media/'
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
\ No newline at end of file
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# Cache disque des règles SIGMA analysées (construit par `manage.py build_sigma_cache`)
+SIGMA_RULES_CACHE = os.getenv("SIGMA_RULES_CACHE", os.path.join(BASE_DIR, 'cache', 'sigma_rules.pickle'))
+
+# Taille du cache des verdicts SIGMA pour les entrées répétées (0 : désactivé)
+SIGMA_VERDICT_CACHE_SIZE = int(os.getenv("SIGMA_VERDICT_CACHE_SIZE", "0"))
+
+# Correspondance des noms de champs SIGMA vers les entrées imbriquées (fichier YAML, vide : aucune)
+# ex. threat_hunting/ai/sigma_field_mappings/ecs_windows.yml pour des entrées ECS
+SIGMA_FIELD_MAPPING = os.getenv("SIGMA_FIELD_MAPPING", "")
+
+# Réordonnancement des tests des sélections SIGMA selon leur coût et leur sélectivité observés
+# (1 : activé) ; les fenêtres de mesure évaluent chaque test sans court-circuit
+SIGMA_ADAPTIVE_ORDERING = os.getenv("SIGMA_ADAPTIVE_ORDERING", "0") == "1"
+
+# Profilage du coût des règles SIGMA : une entrée mesurée sur N en moyenne (0 : désactivé)
+SIGMA_PROFILE_SAMPLE_EVERY = int(os.getenv("SIGMA_PROFILE_SAMPLE_EVERY", "0"))
+
+# Budget de coût des règles publiées (RegleViewSet), mesuré sur le corpus threat_hunting/ai/benchmark :
+# flag enregistre la règle en signalant le dépassement, reject la refuse, off désactive la mesure.
+# La mesure est un temps d'exécution, sensible à la charge de la machine : le refus reste un choix explicite
+RULE_COST_BUDGET_MODE = os.getenv("RULE_COST_BUDGET_MODE", "flag")
+SIGMA_RULE_BUDGET_US = float(os.getenv("SIGMA_RULE_BUDGET_US", "20"))  # µs par entrée
+YARA_RULE_BUDGET_MS = float(os.getenv("YARA_RULE_BUDGET_MS", "5"))  # ms par Mio analysé
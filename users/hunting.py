@@ -0,0 +1,64 @@
+"""Recherches rétrospectives des règles SIGMA sur les entrées stockées (StoredEvent).
+
+La détection de la règle est traduite en une seule requête SQL (voir
+threat_hunting.ai.sigma_sql) : la base ne retourne que les entrées qui
+peuvent correspondre, lues par lots. Si la traduction n'est pas exacte
+(expressions '|re', cidr...), chaque ligne retournée est vérifiée par le
+prédicat compilé ; les agrégations sont appliquées dans l'ordre des
+horodatages.
+"""
+from typing import Dict, Iterator, Optional, Tuple
+
+from django.db import connections
+from django.db.models import BooleanField, ExpressionWrapper
+from django.db.models.expressions import RawSQL
+
+from threat_hunting.ai.sigma_aggregation import AggregationState
+from threat_hunting.ai.sigma_compiler import CompileContext, EventView, SigmaCompileError, compile_rule, parse_rule
+from threat_hunting.ai.sigma_fields import FieldMapping
+from threat_hunting.ai.sigma_sql import SqlCondition, dialect_for, translate
+
+from .models import StoredEvent
+
+HUNT_CHUNK_SIZE = 2000
+
+
+def sigma_condition(tree, queryset, accessor=lambda field: field) -> SqlCondition:
+    """Condition SQL d'un arbre de détection sur la colonne data du modèle de queryset."""
+    connection = connections[queryset.db]
+    dialect = dialect_for(connection.vendor)
+    if dialect is None:
+        raise SigmaCompileError(f"Base de données non prise en charge pour la recherche SQL : {connection.vendor}")
+    model = queryset.model
+    column = f"{connection.ops.quote_name(model._meta.db_table)}.{connection.ops.quote_name(model._meta.get_field('data').column)}"
+    return translate(tree, column, dialect, accessor)
+
+
+def hunt_sigma_rule(rule: Dict, queryset=None, field_mapping: Optional[FieldMapping] = None,
+                    chunk_size: int = HUNT_CHUNK_SIZE) -> Iterator[Tuple[StoredEvent, Optional[Dict]]]:
+    """Produit (entrée, détail de l'agrégation ou None) pour chaque entrée stockée qui satisfait la règle.
+
+    queryset restreint la recherche (période, source...) ; par défaut toutes
+    les entrées. Lève SigmaCompileError si la règle est invalide.
+    """
+    tree, aggregation = parse_rule(rule)
+    context = CompileContext(fields=field_mapping)
+    compiled = compile_rule(rule, context, (tree, aggregation))
+    context.finalize()
+
+    if queryset is None:
+        queryset = StoredEvent.objects.all()
+    condition = sigma_condition(tree, queryset, context.accessor)
+    matches = ExpressionWrapper(RawSQL(condition.sql, condition.params), output_field=BooleanField())
+    rows = queryset.filter(matches).order_by('timestamp', 'pk').iterator(chunk_size=chunk_size)
+
+    state = AggregationState(compiled.aggregation) if compiled.aggregation is not None else None
+    for event in rows:
+        if not condition.exact and not compiled.match(EventView(event.data)):
+            continue
+        if state is None:
+            yield event, None
+            continue
+        aggregated = state.update(event.data, event.timestamp.timestamp())
+        if aggregated is not None:
+            yield event, aggregated
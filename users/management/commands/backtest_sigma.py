@@ -0,0 +1,87 @@
+import sys
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+from threat_hunting.ai.sigma_backtest import archive_files, load_rule_files, run_backtest
+from threat_hunting.ai.sigma_fields import FieldMapping
+
+# Au-delà, seules les règles qui ont des correspondances sont listées
+MAX_LISTED_RULES = 50
+
+
+class Command(BaseCommand):
+    help = ("Rétro-analyse : applique des règles SIGMA aux journaux NDJSON archivés (éventuellement gzip) "
+            "d'un répertoire, sur un pool de processus, et écrit les correspondances en NDJSON")
+
+    def add_arguments(self, parser):
+        parser.add_argument('logs_dir', help="Répertoire des journaux archivés (*.ndjson, *.jsonl, *.json, *.log, .gz)")
+        parser.add_argument('--rule', action='append', default=[],
+                            help="Fichier ou répertoire de règles à tester (répétable ; par défaut : toutes les règles)")
+        parser.add_argument('--rules-dir', help="Répertoire des règles (par défaut : threat_hunting/ai/sigma_rules)")
+        parser.add_argument('--days', type=float, help="Seulement les fichiers modifiés ces N derniers jours")
+        parser.add_argument('--workers', type=int, help="Nombre de processus (par défaut : nombre de cœurs)")
+        parser.add_argument('--log-source', help="Produit des journaux (ex. windows) : seules ses règles sont évaluées")
+        parser.add_argument('--output', default='-', help="Fichier NDJSON des correspondances ('-' : sortie standard)")
+
+    def handle(self, *args, **options):
+        logs_dir = Path(options['logs_dir'])
+        if not logs_dir.is_dir():
+            raise CommandError(f"Répertoire introuvable : {logs_dir}")
+
+        mapping_path = getattr(settings, 'SIGMA_FIELD_MAPPING', None)
+        field_mapping = FieldMapping.from_file(mapping_path) if mapping_path else None
+        if options['rule']:
+            try:
+                rules = load_rule_files(options['rule'])
+            except ValueError as e:
+                raise CommandError(str(e))
+            analyzer = SigmaAnalyzer(options['rules_dir'], rules=rules, field_mapping=field_mapping)
+        else:
+            analyzer = SigmaAnalyzer(options['rules_dir'], field_mapping=field_mapping)
+        if not analyzer.compiled_rules:
+            raise CommandError("Aucune règle SIGMA compilable")
+
+        since = time.time() - options['days'] * 86400 if options['days'] else None
+        files = archive_files(logs_dir, since)
+        if not files:
+            raise CommandError(f"Aucun journal archivé dans {logs_dir}")
+
+        # Avec la sortie standard pour les correspondances, la progression passe par la sortie d'erreur
+        to_stdout = options['output'] == '-'
+        report = self.stderr if to_stdout else self.stdout
+        report.write(f"{len(analyzer.compiled_rules)} règles, {len(files)} fichiers")
+
+        def progress(file_report, done, total):
+            line = (f"[{done}/{total}] {file_report.path} : {file_report.events} entrées, "
+                    f"{sum(file_report.matches.values())} correspondances, "
+                    f"{file_report.events / file_report.elapsed if file_report.elapsed else 0:,.0f} entrées/s")
+            if file_report.error:
+                line += f" (interrompu : {file_report.error})"
+            report.write(line)
+
+        output = sys.stdout if to_stdout else open(options['output'], 'w', encoding='utf-8')
+        try:
+            summary = run_backtest(analyzer, files, output, options['workers'], options['log_source'], progress)
+        finally:
+            if not to_stdout:
+                output.close()
+
+        report.write("Correspondances par règle :")
+        # Jeu complet : les règles sans correspondance sont seulement comptées
+        listed = summary.matches if len(summary.matches) <= MAX_LISTED_RULES else [
+            (compiled, count) for compiled, count in summary.matches if count
+        ]
+        for compiled, count in listed:
+            report.write(f"  {count:>8}  {compiled.title} ({compiled.id})")
+        if len(listed) < len(summary.matches):
+            report.write(f"  {len(summary.matches) - len(listed)} règles sans correspondance")
+        style = self.style.WARNING if summary.errors else self.style.SUCCESS
+        report.write(style(
+            f"{summary.events} entrées en {summary.elapsed:.2f} s ({summary.events_per_second:,.0f} entrées/s), "
+            f"{sum(count for _, count in summary.matches)} correspondances, "
+            f"{len(summary.errors)} fichiers en erreur"
+        ))
@@ -0,0 +1,32 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+
+
+class Command(BaseCommand):
+    help = "Construit le cache disque des règles SIGMA analysées (à lancer au déploiement)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rules-dir', help="Répertoire des règles (par défaut : threat_hunting/ai/sigma_rules)")
+        parser.add_argument('--output', help="Fichier de cache (par défaut : settings.SIGMA_RULES_CACHE)")
+
+    def handle(self, *args, **options):
+        output = options['output'] or getattr(settings, 'SIGMA_RULES_CACHE', None)
+        if not output:
+            raise CommandError("Aucun fichier de cache : renseignez --output ou SIGMA_RULES_CACHE")
+
+        started = time.perf_counter()
+        # Sans cache_path, tous les fichiers sont relus : le cache est reconstruit entièrement
+        analyzer = SigmaAnalyzer(options['rules_dir'])
+        if not analyzer.save_cache(output):
+            raise CommandError(f"Impossible d'écrire le cache : {output}")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Cache SIGMA écrit : {output} ({len(analyzer.compiled_rules)} règles, "
+            f"{os.path.getsize(output) // 1024} Kio, {elapsed:.2f} s)"
+        ))
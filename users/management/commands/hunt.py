@@ -0,0 +1,157 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from threat_hunting.ai.log_formats import FORMATS, read_log_entries
+from threat_hunting.ai.sigma_aggregation import AggregationTracker
+from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+from threat_hunting.ai.sigma_backtest import load_rule_files
+from threat_hunting.ai.sigma_fields import FieldMapping
+from threat_hunting.ai.sigma_parallel import DEFAULT_CHUNK_SIZE, DEFAULT_READ_AHEAD, ParallelSigmaAnalyzer
+
+STDIN = '-'
+
+
+class Command(BaseCommand):
+    help = ("Chasse hors ligne : applique les règles SIGMA à des journaux locaux (NDJSON, CSV, syslog, "
+            "éventuellement gzip) ou à l'entrée standard, sans passer par l'API, "
+            "et écrit les correspondances en NDJSON")
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', default=[STDIN],
+                            help="Fichiers ou répertoires de journaux ('-' : entrée standard, par défaut)")
+        parser.add_argument('--format', choices=FORMATS,
+                            help="Format des journaux (par défaut : d'après l'extension puis le contenu)")
+        parser.add_argument('--rule', action='append', default=[],
+                            help="Fichier ou répertoire de règles (répétable ; par défaut : toutes les règles)")
+        parser.add_argument('--rules-dir', help="Répertoire des règles (par défaut : threat_hunting/ai/sigma_rules)")
+        parser.add_argument('--log-source', help="Produit des journaux (ex. windows) : seules ses règles sont évaluées")
+        parser.add_argument('--workers', type=int,
+                            help="Processus d'évaluation (par défaut : nombre de cœurs ; 1 : dans ce processus)")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help=f"Entrées par lot envoyé à un processus (par défaut : {DEFAULT_CHUNK_SIZE})")
+        parser.add_argument('--read-ahead', type=int, default=DEFAULT_READ_AHEAD,
+                            help=f"Lots lus d'avance par processus (par défaut : {DEFAULT_READ_AHEAD})")
+        parser.add_argument('--output', default=STDIN, help="Fichier NDJSON des correspondances ('-' : sortie standard)")
+
+    def handle(self, *args, **options):
+        mapping_path = getattr(settings, 'SIGMA_FIELD_MAPPING', None)
+        field_mapping = FieldMapping.from_file(mapping_path) if mapping_path else None
+        if options['rule']:
+            try:
+                rules = load_rule_files(options['rule'])
+            except ValueError as e:
+                raise CommandError(str(e))
+            analyzer = SigmaAnalyzer(options['rules_dir'], rules=rules, field_mapping=field_mapping)
+        else:
+            analyzer = SigmaAnalyzer(options['rules_dir'], field_mapping=field_mapping)
+        if not analyzer.compiled_rules:
+            raise CommandError("Aucune règle SIGMA compilable")
+        if options['chunk_size'] < 1 or options['read_ahead'] < 1:
+            raise CommandError("--chunk-size et --read-ahead doivent être positifs")
+
+        sources = self._sources(options['paths'])
+        workers = options['workers']
+        # Avec la sortie standard pour les correspondances, la progression passe par la sortie d'erreur
+        to_stdout = options['output'] == STDIN
+        report = self.stderr if to_stdout else self.stdout
+        output = sys.stdout if to_stdout else open(options['output'], 'w', encoding='utf-8')
+        parallel = None
+        if workers is None or workers > 1:
+            parallel = ParallelSigmaAnalyzer(analyzer, workers, options['chunk_size'], options['read_ahead'])
+        report.write(f"{len(analyzer.compiled_rules)} règles, {len(sources)} sources, "
+                     f"{parallel.workers if parallel else 1} processus")
+
+        started = time.perf_counter()
+        events = matches = errors = 0
+        try:
+            for source in sources:
+                file_started = time.perf_counter()
+                counter = [0]
+                file_matches = 0
+                error = None
+                try:
+                    for result in self._hunt(analyzer, parallel, source, options, counter):
+                        output.write(json.dumps(result, default=str) + '\n')
+                        file_matches += 1
+                except (OSError, ValueError) as e:
+                    # Fichier illisible ou gzip tronqué : les correspondances déjà écrites sont conservées
+                    error = str(e)
+                    errors += 1
+                elapsed = time.perf_counter() - file_started
+                events += counter[0]
+                matches += file_matches
+                line = (f"{source} : {counter[0]} entrées, {file_matches} correspondances, "
+                        f"{counter[0] / elapsed if elapsed else 0:,.0f} entrées/s")
+                if error:
+                    line += f" (interrompu : {error})"
+                report.write(line)
+        finally:
+            if parallel is not None:
+                parallel.close()
+            if to_stdout:
+                output.flush()
+            else:
+                output.close()
+
+        elapsed = time.perf_counter() - started
+        style = self.style.WARNING if errors else self.style.SUCCESS
+        report.write(style(
+            f"{events} entrées en {elapsed:.2f} s ({events / elapsed if elapsed else 0:,.0f} entrées/s), "
+            f"{matches} correspondances, {errors} sources en erreur"
+        ))
+
+    @staticmethod
+    def _sources(paths):
+        """Fichiers à analyser : les répertoires sont parcourus récursivement, '-' désigne l'entrée standard."""
+        sources = []
+        for raw in paths:
+            if raw == STDIN:
+                sources.append(STDIN)
+                continue
+            path = Path(raw)
+            if path.is_dir():
+                sources.extend(str(p) for p in sorted(path.rglob('*')) if p.is_file())
+            elif path.is_file():
+                sources.append(str(path))
+            else:
+                raise CommandError(f"Journal introuvable : {path}")
+        if not sources:
+            raise CommandError("Aucun journal à analyser")
+        return sources
+
+    @staticmethod
+    def _hunt(analyzer, parallel, source, options, counter):
+        """Correspondances d'une source ; les agrégations sont évaluées source par source."""
+        def counted(entries):
+            for entry in entries:
+                counter[0] += 1
+                yield entry
+
+        stream = sys.stdin.buffer if source == STDIN else open(source, 'rb')
+        try:
+            entries = counted(read_log_entries(stream, options['format'], '' if source == STDIN else source))
+            tracker = AggregationTracker()
+            if parallel is not None:
+                hits = parallel.iter_hits(entries, options['log_source'], tracker)
+            else:
+                hits = analyzer.iter_hits(entries, options['log_source'], tracker)
+            for offset, log_entry, compiled, aggregated in hits:
+                result = {
+                    'file': source,
+                    'event': offset,
+                    'rule_id': compiled.id,
+                    'title': compiled.title,
+                    'severity': compiled.severity,
+                    'log_entry': log_entry,
+                }
+                if aggregated is not None:
+                    result['aggregation'] = aggregated
+                yield result
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from threat_hunting.ai import rule_lint
+from threat_hunting.ai.rule_lint import lint_file, lint_rule_content
+from users.models import Regle
+
+YARA_RULES_DIR = Path(__file__).resolve().parents[2] / 'rules'
+SIGMA_RULES_DIR = Path(rule_lint.__file__).parent / 'sigma_rules'
+RULE_SUFFIXES = ('.yar', '.yara', '.yml', '.yaml')
+
+
+class Command(BaseCommand):
+    help = ("Analyse statique des performances des règles YARA et SIGMA : fichiers de règles "
+            "(par défaut users/rules et threat_hunting/ai/sigma_rules) et règles enregistrées (Regle)")
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help="Fichiers ou répertoires de règles (.yar, .yara, .yml, .yaml)")
+        parser.add_argument('--no-stored', action='store_true', help="Ne pas analyser les règles enregistrées en base")
+        parser.add_argument('--json', action='store_true', help="Avertissements au format JSON")
+        parser.add_argument('--strict', action='store_true', help="Échec de la commande s'il y a des avertissements")
+
+    def handle(self, *args, **options):
+        paths = [Path(path) for path in options['paths']] or [YARA_RULES_DIR, SIGMA_RULES_DIR]
+        report = []
+        for path in self._rule_files(paths):
+            try:
+                warnings = lint_file(path)
+            except (OSError, UnicodeDecodeError) as e:
+                raise CommandError(f"Règle illisible {path} : {e}")
+            report.append((str(path), warnings))
+        if not options['no_stored'] and not options['paths']:
+            for regle in Regle.objects.order_by('pk'):
+                report.append((f"Regle #{regle.pk} {regle.nom} ({regle.type})",
+                               lint_rule_content(regle.type, regle.contenu)))
+
+        count = sum(len(warnings) for _, warnings in report)
+        if options['json']:
+            self.stdout.write(json.dumps([
+                {'source': source, 'warnings': [warning.as_dict() for warning in warnings]}
+                for source, warnings in report
+            ], ensure_ascii=False, indent=2))
+        else:
+            for source, warnings in report:
+                for warning in warnings:
+                    self.stdout.write(f"{source} : {warning}")
+            style = self.style.WARNING if count else self.style.SUCCESS
+            self.stdout.write(style(f"{len(report)} sources analysées, {count} avertissements"))
+        if options['strict'] and count:
+            raise CommandError(f"{count} avertissements")
+
+    @staticmethod
+    def _rule_files(paths):
+        files = []
+        for path in paths:
+            if path.is_dir():
+                files.extend(sorted(p for p in path.rglob('*') if p.is_file() and p.suffix in RULE_SUFFIXES))
+            elif path.is_file():
+                files.append(path)
+            else:
+                raise CommandError(f"Règle introuvable : {path}")
+        return files
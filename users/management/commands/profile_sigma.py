@@ -0,0 +1,90 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from threat_hunting.ai.log_formats import FORMATS, read_log_entries
+from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+from threat_hunting.ai.sigma_backtest import load_rule_files
+from threat_hunting.ai.sigma_fields import FieldMapping
+from threat_hunting.ai.sigma_profiler import SORT_KEYS
+
+STDIN = '-'
+
+
+class Command(BaseCommand):
+    help = ("Profil de coût des règles SIGMA : rejoue des journaux locaux (NDJSON, CSV, syslog, "
+            "éventuellement gzip) et liste les règles par coût d'évaluation décroissant. "
+            "Pour les mesures de l'analyseur en production : GET /sigma-profile/")
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', default=[STDIN],
+                            help="Fichiers de journaux ('-' : entrée standard, par défaut)")
+        parser.add_argument('--format', choices=FORMATS,
+                            help="Format des journaux (par défaut : d'après l'extension puis le contenu)")
+        parser.add_argument('--rule', action='append', default=[],
+                            help="Fichier ou répertoire de règles (répétable ; par défaut : toutes les règles)")
+        parser.add_argument('--rules-dir', help="Répertoire des règles (par défaut : threat_hunting/ai/sigma_rules)")
+        parser.add_argument('--log-source', help="Produit des journaux (ex. windows) : seules ses règles sont évaluées")
+        parser.add_argument('--sample-every', type=int, default=1,
+                            help="Une entrée mesurée sur N en moyenne (par défaut : toutes)")
+        parser.add_argument('--sort', choices=SORT_KEYS, default='total', help="Critère de tri (par défaut : total)")
+        parser.add_argument('--limit', type=int, default=20, help="Nombre de règles listées (0 : toutes)")
+        parser.add_argument('--json', action='store_true', help="Rapport au format JSON")
+
+    def handle(self, *args, **options):
+        if options['sample_every'] < 1:
+            raise CommandError("--sample-every doit être positif")
+        mapping_path = getattr(settings, 'SIGMA_FIELD_MAPPING', None)
+        field_mapping = FieldMapping.from_file(mapping_path) if mapping_path else None
+        rules = None
+        if options['rule']:
+            try:
+                rules = load_rule_files(options['rule'])
+            except ValueError as e:
+                raise CommandError(str(e))
+        # Ordre des tests figé : le coût mesuré est celui des règles telles qu'elles sont écrites
+        analyzer = SigmaAnalyzer(options['rules_dir'], rules=rules, field_mapping=field_mapping,
+                                 adaptive_ordering=False, profile_sample_every=options['sample_every'])
+        if not analyzer.compiled_rules:
+            raise CommandError("Aucune règle SIGMA compilable")
+
+        started = time.perf_counter()
+        events = 0
+        for source in options['paths']:
+            if source != STDIN and not Path(source).is_file():
+                raise CommandError(f"Journal introuvable : {source}")
+            stream = sys.stdin.buffer if source == STDIN else open(source, 'rb')
+            try:
+                entries = read_log_entries(stream, options['format'], '' if source == STDIN else source)
+                for _ in analyzer._iter_search_hits(self._counted(entries), options['log_source']):
+                    pass
+                events += self._events
+            except (OSError, ValueError) as e:
+                raise CommandError(f"{source} : {e}")
+            finally:
+                if stream is not sys.stdin.buffer:
+                    stream.close()
+        elapsed = time.perf_counter() - started
+
+        stats = analyzer.profiler.stats(options['sort'], max(options['limit'], 0))
+        if options['json']:
+            self.stdout.write(json.dumps({'events': events, 'elapsed': round(elapsed, 3), **stats}, indent=2))
+            return
+
+        self.stdout.write(f"{events} entrées en {elapsed:.2f} s, {len(analyzer.compiled_rules)} règles, "
+                          f"{stats['sampled_events']} entrées mesurées (une sur {stats['sample_every']})")
+        self.stdout.write(f"{'total ms':>10} {'moy. µs':>9} {'p99 µs':>9} {'évaluations':>12} "
+                          f"{'corresp.':>9}  règle")
+        for row in stats['rules']:
+            self.stdout.write(f"{row['total_ms']:>10.1f} {row['mean_us']:>9.2f} {row['p99_us']:>9.2f} "
+                              f"{row['evaluations']:>12} {row['matches']:>9}  {row['title']} ({row['rule_id']})")
+
+    def _counted(self, entries):
+        self._events = 0
+        for entry in entries:
+            self._events += 1
+            yield entry
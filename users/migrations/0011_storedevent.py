@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-18 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_alter_notification_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('source', models.CharField(blank=True, db_index=True, max_length=100)),
+                ('data', models.JSONField()),
+            ],
+            options={
+                'ordering': ['timestamp'],
+            },
+        ),
+    ]
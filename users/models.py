@@ -110,4 +110,16 @@ class Machine(models.Model):
     description = models.TextField(blank=True)
 
     def __str__(self):
-        return self.ip_address
\ No newline at end of file
+        return self.ip_address
+
+class StoredEvent(models.Model):
+    """Entrée de log conservée pour les recherches rétrospectives (règles SIGMA traduites en SQL)."""
+    timestamp = models.DateTimeField(default=timezone.now, db_index=True)
+    source = models.CharField(max_length=100, blank=True, db_index=True)
+    data = models.JSONField()
+
+    class Meta:
+        ordering = ['timestamp']
+
+    def __str__(self):
+        return f"{self.source or 'Événement'} - {self.timestamp}"
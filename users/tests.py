@@ -1,7 +1,9 @@
 from django.test import TestCase
 from rest_framework.test import APITestCase
 from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+import json
 import time
+from unittest import mock
 from threat_hunting.ai.security_ai import SecurityAIAssistant
 
 class SigmaAnalyzerTestCase(TestCase):
@@ -31,3 +33,1044 @@ class NotificationSecurityAPITests(TestCase):
         response = self.client.get('/notifications/')  # adapte l’URL si besoin
         self.assertIn(response.status_code, [401, 403], "L'accès non autorisé doit être refusé")
 
+
+
+class SigmaCompilerTest(TestCase):
+    DETECTION = {
+        'selection': {'EventID': '4688', 'NewProcessName': '*powershell.exe'},
+        'filter': {'User': ['SYSTEM', 'LOCAL SERVICE']},
+        'keywords': ['mimikatz'],
+    }
+
+    def _match(self, condition, log_entry):
+        from threat_hunting.ai.sigma_compiler import EventView, compile_rule
+        detection = dict(self.DETECTION, condition=condition)
+        return compile_rule({'detection': detection}).match(EventView(log_entry))
+
+    def test_condition_grammar(self):
+        """Vérifie and/or/not, parenthèses et quantificateurs"""
+        log = {'EventID': 4688, 'NewProcessName': 'C:\\Windows\\PowerShell.exe', 'User': 'alice'}
+        self.assertTrue(self._match('selection and not filter', log))
+        self.assertFalse(self._match('selection and not filter', dict(log, User='system')))
+        self.assertTrue(self._match('(filter or keywords) or selection', log))
+        self.assertTrue(self._match('1 of sel*', log))
+        self.assertFalse(self._match('all of them', log))
+        self.assertTrue(self._match('all of them', dict(log, User='SYSTEM', CommandLine='mimikatz.exe')))
+        self.assertFalse(self._match('1 of timeframe*', log))
+
+    def test_plain_value_is_exact_match(self):
+        """Une valeur sans caractère générique doit être égale, pas seulement contenue"""
+        self.assertFalse(self._match('selection', {'EventID': '14688', 'NewProcessName': 'powershell.exe'}))
+
+    def test_invalid_condition(self):
+        from threat_hunting.ai.sigma_compiler import SigmaCompileError
+        for condition in ('selection and', 'unknown', '(selection'):
+            with self.assertRaises(SigmaCompileError):
+                self._match(condition, {})
+
+    def test_matches_rule_reuses_compiled_rules(self):
+        from threat_hunting.ai.sigma_compiler import compile_rule as compile_rule_function
+        rule = {'title': 'R', 'detection': dict(self.DETECTION, condition='selection and not filter')}
+        log = {'EventID': 4688, 'NewProcessName': 'C:\\Windows\\PowerShell.exe', 'User': 'alice'}
+        analyzer = SigmaAnalyzer(rules=[rule])
+        with mock.patch('threat_hunting.ai.sigma_analyzer.compile_rule') as compile_rule:
+            # Règle du jeu chargé : forme compilée reprise
+            self.assertTrue(analyzer._matches_rule(log, rule))
+            compile_rule.assert_not_called()
+        other = dict(rule, detection=dict(rule['detection'], condition='selection and filter'))
+        with mock.patch('threat_hunting.ai.sigma_analyzer.compile_rule', wraps=compile_rule_function) as compile_rule:
+            for _ in range(3):
+                self.assertFalse(analyzer._matches_rule(log, dict(other)))
+                self.assertFalse(analyzer._matches_rule(log, {'detection': {'condition': 'x and'}}))
+            self.assertEqual(compile_rule.call_count, 2)
+
+    def test_analyze_logs_matches_bundled_rules(self):
+        analyzer = SigmaAnalyzer()
+        results = analyzer.analyze_logs([{
+            "EventID": "4688",
+            "NewProcessName": "C:\\Windows\\System32\\powershell.exe",
+            "CommandLine": "powershell -nop -w hidden -c test"
+        }])
+        self.assertEqual([r['title'] for r in results], ['Suspicious PowerShell Command Line'])
+
+
+class SigmaRuleIndexTest(TestCase):
+    def _rule(self, title, detection, logsource=None):
+        from threat_hunting.ai.sigma_compiler import compile_rule
+        return compile_rule({'title': title, 'logsource': logsource or {'product': 'windows'},
+                             'detection': detection})
+
+    def test_candidates_are_pruned_by_discriminator_and_field(self):
+        from threat_hunting.ai.sigma_compiler import EventView
+        from threat_hunting.ai.sigma_index import RuleIndex
+        by_event = self._rule('4688', {'selection': {'EventID': [4688, 4689], 'Image': '*cmd.exe'},
+                                       'condition': 'selection'})
+        by_field = self._rule('cmdline', {'selection': {'CommandLine': '*-enc*'}, 'condition': 'selection'})
+        keywords = self._rule('keywords', {'keywords': ['mimikatz'], 'condition': 'keywords'})
+        linux = self._rule('linux', {'selection': {'EventID': 4688}, 'condition': 'selection'},
+                           logsource={'product': 'linux'})
+        index = RuleIndex([by_event, by_field, keywords, linux])
+
+        partitions = index.partitions({'product': 'windows'})
+        self.assertEqual(index.candidates(EventView({'EventID': '4689'}), partitions), [by_event, keywords])
+        self.assertEqual(index.candidates(EventView({'EventID': 1, 'CommandLine': 'x'}), partitions),
+                         [by_field, keywords])
+        self.assertEqual(index.candidates(EventView({'EventID': 4688}), index.partitions()),
+                         [by_event, keywords, linux])
+
+    def test_or_and_not_requirements(self):
+        rule = self._rule('or', {'a': {'EventID': 1, 'User': 'x'}, 'b': {'EventID': 2}, 'f': {'User': 'y'},
+                                 'condition': '(a or b) and not f'})
+        self.assertEqual(rule.tree.requirements(), {'EventID': frozenset({'1', '2'})})
+
+
+class SigmaLiteralScannerTest(TestCase):
+    def test_automaton_and_loop_agree(self):
+        from threat_hunting.ai import sigma_literals
+        from threat_hunting.ai.sigma_literals import LiteralScanner
+        atoms = [('contains', 'taskkill'), ('contains', 'kill'), ('startswith', 'task'),
+                 ('endswith', 'avast'), ('endswith', 'kill'), ('contains', '')]
+        texts = ['taskkill /f /im avast', 'killall', 'tasks', 'no match', '']
+        results = []
+        for threshold in (0, 10 ** 6):
+            scanner = LiteralScanner('CommandLine')
+            ids = [scanner.add(kind, literal) for kind, literal in atoms]
+            with mock.patch.object(sigma_literals, 'AHO_CORASICK_MIN_LITERALS', threshold):
+                scanner.build()
+            results.append([{atoms[ids.index(h)] for h in scanner.scan(t)} for t in texts])
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][0], {('contains', 'taskkill'), ('contains', 'kill'), ('startswith', 'task'),
+                                         ('endswith', 'avast'), ('contains', '')})
+        self.assertEqual(results[0][1], {('contains', 'kill'), ('contains', '')})
+
+    def test_wildcards_reduced_to_atoms(self):
+        from threat_hunting.ai.sigma_literals import literal_atom
+        self.assertEqual(literal_atom('*-nop*'), ('contains', '-nop'))
+        self.assertEqual(literal_atom('*powershell.exe'), ('endswith', 'powershell.exe'))
+        self.assertEqual(literal_atom('c:\\windows\\*'), ('startswith', 'c:\\windows\\'))
+        self.assertIsNone(literal_atom('*\\temp\\*.exe'))
+        self.assertIsNone(literal_atom('cmd?.exe'))
+
+
+class SigmaPatternTest(TestCase):
+    def _rule(self, selection):
+        from threat_hunting.ai.sigma_compiler import compile_rule
+        return compile_rule({'detection': {'selection': selection, 'condition': 'selection'}})
+
+    def test_wildcards_merged_per_item(self):
+        from threat_hunting.ai.sigma_compiler import EventView
+        rule = self._rule({'Image': ['*\\temp\\*.exe', '*\\appdata\\*.dll', 'c:\\tools\\x?.exe']})
+        self.assertTrue(rule.match(EventView({'Image': 'C:\\Users\\bob\\AppData\\lib.DLL'})))
+        self.assertTrue(rule.match(EventView({'Image': 'c:\\tools\\x1.exe'})))
+        self.assertFalse(rule.match(EventView({'Image': 'C:\\Users\\bob\\temp\\x.exe\n'})))
+        self.assertFalse(rule.match(EventView({'Image': 'C:\\Windows\\notepad.exe'})))
+
+    def test_regex_modifier(self):
+        from threat_hunting.ai.sigma_compiler import CompileContext, EventView, SigmaCompileError, compile_rule
+        rule = self._rule({'CommandLine|re': r'-[eE]nc(odedcommand)?\s+[A-Za-z0-9+/=]{20,}'})
+        self.assertTrue(rule.match(EventView({'CommandLine': 'powershell -Enc SQBFAFgAIAAoAE4AZQB3AC0ATwBiAGoA'})))
+        self.assertFalse(rule.match(EventView({'CommandLine': 'powershell -ENC SQBFAFgAIAAoAE4AZQB3AC0ATwBiAGoA'})))
+        self.assertTrue(self._rule({'CommandLine|re|i': '-enc'}).match(EventView({'CommandLine': '-ENC'})))
+        with self.assertRaises(SigmaCompileError):
+            self._rule({'CommandLine|re': '(unbalanced'})
+
+        context = CompileContext()
+        for _ in range(3):
+            compile_rule({'detection': {'selection': {'CommandLine|re': 'a+b'}, 'condition': 'selection'}}, context)
+        self.assertEqual(len(context.regexes), 1)
+
+
+class SigmaModifierTest(TestCase):
+    def _match(self, selection, event):
+        from threat_hunting.ai.sigma_compiler import EventView, compile_rule
+        rule = compile_rule({'detection': {'selection': selection, 'condition': 'selection'}})
+        return rule.match(EventView(event))
+
+    def test_contains_all_with_nested_list(self):
+        analyzer = SigmaAnalyzer()
+        logs = [{'CommandLine': 'taskkill /F /IM avast.exe'}, {'CommandLine': 'taskkill /f /im notepad.exe'},
+                {'CommandLine': 'taskkill /im kaspersky.exe'}]
+        expected = ["Tentative de désactivation d'antivirus"]
+        self.assertEqual([r['title'] for r in analyzer.analyze_logs(logs)], expected)
+        self.assertEqual([r['title'] for r in analyzer.analyze_batch(logs)], expected)
+
+    def test_value_modifiers(self):
+        import base64
+        self.assertTrue(self._match({'CommandLine|windash|contains': '-enc'}, {'CommandLine': 'powershell /enc x'}))
+        self.assertTrue(self._match({'CommandLine|windash|contains': '-enc'}, {'CommandLine': 'powershell –enc x'}))
+        encoded = base64.b64encode('xx IEX (New-Object'.encode('utf-16-le')).decode()
+        self.assertTrue(self._match({'CommandLine|wide|base64offset|contains': 'IEX (New-Object'},
+                                    {'CommandLine': f'powershell -enc {encoded}'}))
+        self.assertTrue(self._match({'Data|base64': 'secret'}, {'Data': base64.b64encode(b'secret').decode()}))
+        self.assertTrue(self._match({'A|startswith|all': ['ab', 'abc']}, {'A': 'ABCD'}))
+        self.assertFalse(self._match({'A|endswith|all': ['cd', 'zz']}, {'A': 'abcd'}))
+
+    def test_numeric_and_cidr(self):
+        from threat_hunting.ai.sigma_compiler import SigmaCompileError
+        self.assertTrue(self._match({'Port|gt': 1000}, {'Port': 1024}))
+        self.assertTrue(self._match({'Port|lte': [10, 20]}, {'Port': '15'}))
+        self.assertFalse(self._match({'Port|gte|all': [10, 20]}, {'Port': 15}))
+        self.assertFalse(self._match({'Port|gt': 1000}, {'Port': 'n/a'}))
+        networks = ['10.0.0.0/8', 'fe80::/10']
+        self.assertTrue(self._match({'Src|cidr': networks}, {'Src': '10.1.2.3'}))
+        self.assertTrue(self._match({'Src|cidr': networks}, {'Src': 'FE80::1'}))
+        self.assertFalse(self._match({'Src|cidr': networks}, {'Src': '11.1.2.3'}))
+        for selection in ({'Src|cidr': '10.0.0.0/33'}, {'Port|gt': 'beaucoup'}, {'A|contains|exists': 'x'}):
+            with self.assertRaises(SigmaCompileError):
+                self._match(selection, {})
+
+
+class SigmaFieldMappingTest(TestCase):
+    ECS = {'event': {'code': '4688'}, 'host': {'name': 'h1'},
+           'process': {'executable': 'C:\\Windows\\powershell.exe', 'command_line': 'powershell -nop'}}
+    FLAT = {'EventID': 4688, 'NewProcessName': 'C:\\powershell.exe', 'CommandLine': 'powershell -nop', 'Computer': 'h2'}
+
+    def _analyzer(self, **kwargs):
+        from pathlib import Path
+        from threat_hunting.ai.sigma_fields import FieldMapping
+        import threat_hunting.ai.sigma_analyzer as module
+        mapping = FieldMapping.from_file(Path(module.__file__).parent / 'sigma_field_mappings' / 'ecs_windows.yml')
+        return SigmaAnalyzer(field_mapping=mapping, **kwargs)
+
+    def test_mixed_formats_one_ruleset(self):
+        analyzer = self._analyzer(verdict_cache_size=10)
+        logs = [self.ECS, self.FLAT, {'process': {'command_line': 'taskkill /f /im avast.exe'}}]
+        expected = ['Suspicious PowerShell Command Line', 'Suspicious PowerShell Command Line',
+                    "Tentative de désactivation d'antivirus"]
+        self.assertEqual([r['title'] for r in analyzer.analyze_logs(logs)], expected)
+        self.assertEqual([r['title'] for r in analyzer.analyze_batch(logs)], expected)
+        groups = analyzer.analyze_logs_grouped(logs, group_by=['Computer'])
+        self.assertEqual([g['group'] for g in groups], [{'Computer': 'h1'}, {'Computer': 'h2'}, {'Computer': None}])
+        # Sans correspondance, seule l'entrée plate est reconnue
+        self.assertEqual(len(SigmaAnalyzer().analyze_logs(logs)), 1)
+
+    def test_dotted_fields_and_aggregation(self):
+        rule = {'title': 'Échecs', 'detection': {
+            'selection': {'event.code': 4625}, 'condition': 'selection | count() by user.name > 1'}}
+        analyzer = SigmaAnalyzer(rules=[rule])
+        logs = [{'event': {'code': 4625}, 'user': {'name': 'bob'}, '@timestamp': i} for i in range(2)]
+        logs.append({'event.code': 4625, 'user.name': 'bob', '@timestamp': 2})
+        results = analyzer.analyze_logs(logs)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['aggregation']['group'], {'user.name': 'bob'})
+        self.assertEqual(len(analyzer.analyze_logs(logs[1:])), 1)
+
+
+class SigmaStreamingTest(TestCase):
+    LOG = {"EventID": "4688", "NewProcessName": "C:\\Windows\\powershell.exe", "CommandLine": "powershell -nop"}
+
+    def test_iter_matches_consumes_lazily(self):
+        import io
+        from threat_hunting.ai.sigma_analyzer import read_ndjson
+        analyzer = SigmaAnalyzer()
+        lines = io.StringIO('\n'.join([json.dumps(self.LOG), '', 'pas du json', json.dumps({"EventID": 1})]))
+        matches = analyzer.iter_matches(read_ndjson(lines))
+        self.assertEqual(next(matches)['title'], 'Suspicious PowerShell Command Line')
+        self.assertEqual(list(matches), [])
+
+    def test_aiter_matches(self):
+        import asyncio
+        analyzer = SigmaAnalyzer()
+
+        async def events():
+            for entry in (self.LOG, {"EventID": 1}, self.LOG):
+                yield entry
+
+        async def collect():
+            return [result async for result in analyzer.aiter_matches(events())]
+        self.assertEqual(len(asyncio.run(collect())), 2)
+
+    def test_streaming_view(self):
+        response = self.client.post('/analyze-logs-sigma/', {'logs': [self.LOG, self.LOG], 'stream': True},
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[-1], {"status": "success", "matches": 2})
+
+    def test_read_stream_lines_gzip(self):
+        import gzip
+        import io
+        from threat_hunting.ai.sigma_analyzer import read_stream_lines
+        body = b'{"a": 1}\n' + b'x' * 100 + b'\n{"b": 2}\n'
+        # Deux membres gzip concaténés, lus par blocs de 7 octets ; la ligne de 100 octets est abandonnée
+        stream = io.BytesIO(gzip.compress(body[:20]) + gzip.compress(body[20:]))
+        lines = list(read_stream_lines(stream, chunk_size=7, max_line=50))
+        self.assertEqual([line for line in lines if line], [b'{"a": 1}', b'{"b": 2}'])
+        self.assertEqual(list(read_stream_lines(io.BytesIO(body), max_line=50)), [b'{"a": 1}', b'', b'{"b": 2}'])
+        with self.assertRaises(ValueError):
+            list(read_stream_lines(io.BytesIO(gzip.compress(body)[:-12])))
+
+    def test_ndjson_stream_view(self):
+        import gzip
+        body = gzip.compress('\n'.join(json.dumps(log) for log in [self.LOG, {"EventID": 1}, self.LOG]).encode())
+        response = self.client.post('/analyze-logs-sigma/stream/?log_source=windows', body,
+                                    content_type='application/x-ndjson', HTTP_CONTENT_ENCODING='gzip')
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(lines[-1], {"status": "success", "matches": 2})
+        self.assertEqual(lines[0]['title'], 'Suspicious PowerShell Command Line')
+        response = self.client.post('/analyze-logs-sigma/stream/', '[]', content_type='application/json')
+        self.assertEqual(response.status_code, 415)
+
+
+class SigmaParallelTest(TestCase):
+    def test_parallel_matches_sequential(self):
+        from threat_hunting.ai.sigma_parallel import ParallelSigmaAnalyzer
+        analyzer = SigmaAnalyzer()
+        match = {"EventID": "4688", "NewProcessName": "C:\\powershell.exe", "CommandLine": "powershell -nop"}
+        logs = [dict(match, CommandLine=f"powershell -nop {i}") if i % 3 else {"EventID": i} for i in range(50)]
+        logs.append(logs[1])
+
+        with ParallelSigmaAnalyzer(analyzer, workers=2, chunk_size=7) as parallel:
+            results = parallel.analyze_logs(iter(logs))
+        self.assertEqual(results, analyzer.analyze_logs(logs))
+        self.assertIs(results[-1]['log_entry'], logs[1])
+
+
+class SigmaHotReloadTest(TestCase):
+    RULE = ("title: {title}\nlogsource:\n    product: windows\n"
+            "detection:\n    selection:\n        EventID: {event_id}\n    condition: selection\n")
+
+    def test_reload_only_changed_files(self):
+        import os
+        import tempfile
+        from pathlib import Path
+        with tempfile.TemporaryDirectory() as rules_dir:
+            first, second = Path(rules_dir) / 'a.yml', Path(rules_dir) / 'b.yml'
+            first.write_text(self.RULE.format(title='A', event_id=1))
+            second.write_text(self.RULE.format(title='B', event_id=2))
+            analyzer = SigmaAnalyzer(rules_dir)
+            old_ruleset = analyzer.ruleset
+            self.assertFalse(analyzer.reload_if_changed())
+
+            second.write_text(self.RULE.format(title='B2', event_id=3))
+            os.utime(second, ns=(1, 1))
+            with mock.patch.object(analyzer, '_read_rule_file', wraps=analyzer._read_rule_file) as read:
+                self.assertTrue(analyzer.reload_if_changed())
+            read.assert_called_once()
+            self.assertEqual(read.call_args[0][0], str(second))
+
+            self.assertEqual(analyzer.ruleset.version, old_ruleset.version + 1)
+            self.assertEqual([r['title'] for r in analyzer.analyze_logs([{'EventID': 3}])], ['B2'])
+            # Une analyse qui a gardé l'ancien jeu n'est pas affectée
+            self.assertEqual([r.title for r in old_ruleset.compiled_rules], ['A', 'B'])
+
+            first.unlink()
+            self.assertTrue(analyzer.reload_if_changed())
+            self.assertEqual([r['title'] for r in analyzer.rules], ['B2'])
+
+    def test_shared_analyzer_is_reused(self):
+        from threat_hunting.ai.sigma_analyzer import get_shared_analyzer
+        self.assertIs(get_shared_analyzer(), get_shared_analyzer())
+
+
+class SigmaRuleCacheTest(TestCase):
+    RULE = SigmaHotReloadTest.RULE
+
+    def test_warm_start_skips_yaml(self):
+        import os
+        import tempfile
+        from pathlib import Path
+        with tempfile.TemporaryDirectory() as rules_dir, tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, 'sigma.pickle')
+            first, second = Path(rules_dir) / 'a.yml', Path(rules_dir) / 'b.yml'
+            first.write_text(self.RULE.format(title='A', event_id=1))
+            second.write_text(self.RULE.format(title='B', event_id=2))
+            SigmaAnalyzer(rules_dir, cache_path=cache_path)
+            self.assertTrue(os.path.exists(cache_path))
+
+            # Date de modification changée, contenu identique : toujours pas d'analyse YAML
+            os.utime(first, ns=(1, 1))
+            with mock.patch('threat_hunting.ai.sigma_analyzer.yaml.load') as load:
+                analyzer = SigmaAnalyzer(rules_dir, cache_path=cache_path)
+            load.assert_not_called()
+            self.assertEqual([r['title'] for r in analyzer.analyze_logs([{'EventID': 2}])], ['B'])
+
+            second.write_text(self.RULE.format(title='B2', event_id=3))
+            os.utime(second, ns=(2, 2))
+            analyzer = SigmaAnalyzer(rules_dir, cache_path=cache_path)
+            self.assertEqual([r['title'] for r in analyzer.analyze_logs([{'EventID': 3}])], ['B2'])
+
+    def test_stale_cache_is_ignored(self):
+        import os
+        import tempfile
+        from pathlib import Path
+        with tempfile.TemporaryDirectory() as rules_dir, tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, 'sigma.pickle')
+            (Path(rules_dir) / 'a.yml').write_text(self.RULE.format(title='A', event_id=1))
+            SigmaAnalyzer(rules_dir, cache_path=cache_path)
+            with mock.patch('threat_hunting.ai.sigma_cache.engine_fingerprint', return_value='autre'):
+                analyzer = SigmaAnalyzer(rules_dir, cache_path=cache_path)
+            self.assertEqual([r['title'] for r in analyzer.rules], ['A'])
+
+
+class SigmaCompactRuleModelTest(TestCase):
+    RULE = ("title: {title}\ndescription: Description {title}\nreferences:\n    - https://example.org/{title}\n"
+            "logsource:\n    product: windows\n"
+            "detection:\n    selection:\n        CommandLine: '*whoami*'\n    condition: selection\n")
+
+    def test_metadata_loaded_on_demand(self):
+        import tempfile
+        from pathlib import Path
+        from threat_hunting.ai.sigma_metadata import RuleHeader, clear_metadata_cache, rule_metadata
+        with tempfile.TemporaryDirectory() as rules_dir:
+            for title in ('A', 'B'):
+                (Path(rules_dir) / f'{title}.yml').write_text(self.RULE.format(title=title))
+            analyzer = SigmaAnalyzer(rules_dir)
+            first, second = analyzer.compiled_rules
+            # Ni règle YAML conservée, ni __dict__ ; littéraux internés, partagés entre règles
+            self.assertIsInstance(analyzer._files[str(Path(rules_dir) / 'A.yml')].rule, RuleHeader)
+            self.assertFalse(hasattr(first, '__dict__') or hasattr(first.tree, '__dict__'))
+            self.assertIs(first.tree.field, second.tree.field)
+            self.assertIs(first.tree.atoms[0][1], second.tree.atoms[0][1])
+
+            result = analyzer.analyze_logs([{'CommandLine': 'cmd /c WHOAMI'}])[0]
+            self.assertEqual(result['description'], 'Description A')
+            self.assertEqual(result['rule_details']['references'], ['https://example.org/A'])
+            self.assertEqual(result['rule_details']['file'], str(Path(rules_dir) / 'A.yml'))
+
+            # Copie : une modification ne touche ni le cache ni les résultats suivants
+            result['rule_details']['references'].append('modifié')
+            self.assertEqual(first.rule['references'], ['https://example.org/A'])
+            # Règle complète lue une fois par règle et par analyse ; description tirée de l'en-tête
+            with mock.patch('threat_hunting.ai.sigma_metadata.rule_metadata', wraps=rule_metadata) as read:
+                results = analyzer.analyze_logs([{'CommandLine': 'whoami'}] * 3)
+                grouped = analyzer.analyze_logs_grouped([{'CommandLine': 'whoami'}])
+            self.assertEqual(read.call_count, 2)
+            self.assertEqual(len(results), 6)
+            self.assertEqual(grouped[0]['description'], 'Description A')
+
+            # Fichier modifié depuis la compilation : métadonnées limitées à l'en-tête
+            (Path(rules_dir) / 'A.yml').write_text(self.RULE.format(title='A').replace('example.org', 'example.com'))
+            self.assertEqual(first.rule['references'], ['https://example.org/A'])
+            clear_metadata_cache()
+            details = first.rule
+            self.assertNotIn('references', details)
+            self.assertEqual((details['title'], details['description']), ('A', 'Description A'))
+
+
+class SigmaAggregationTest(TestCase):
+    BRUTE_FORCE = {
+        'title': 'Brute force',
+        'detection': {
+            'selection': {'EventID': 4625},
+            'timeframe': '5m',
+            'condition': 'selection | count() by TargetUserName > 2',
+        },
+    }
+
+    def _failures(self, user, *stamps):
+        return [{'EventID': 4625, 'TargetUserName': user, 'timestamp': stamp} for stamp in stamps]
+
+    def test_count_by_in_sliding_window(self):
+        analyzer = SigmaAnalyzer(rules=[self.BRUTE_FORCE])
+        # bob : 3 échecs en 20 s ; alice : 3 échecs étalés sur plus de 5 minutes
+        logs = self._failures('bob', 0, 10, 20) + self._failures('alice', 0, 200, 400)
+        logs.sort(key=lambda entry: entry['timestamp'])
+        results = analyzer.analyze_logs(logs)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['aggregation']['group'], {'TargetUserName': 'bob'})
+        self.assertEqual(results[0]['aggregation']['value'], 3)
+        self.assertEqual(results[0]['log_entry']['timestamp'], 20)
+
+    def test_iso_timestamps_use_event_time(self):
+        from threat_hunting.ai.sigma_aggregation import event_timestamp
+        for value in ('2024-01-01T00:00:00Z', '2024-01-01T00:00:00.000000000Z', '2024-01-01T01:00:00+0100',
+                      '2024-01-01T00:00:00', '1704067200', '1704067200000'):
+            self.assertEqual(event_timestamp({'@timestamp': value}), 1704067200.0, value)
+        # Journaux archivés : trois échecs à 10 minutes d'intervalle, jamais dans la même fenêtre
+        logs = [dict(entry, **{'@timestamp': f'2024-01-01T00:{minute:02d}:00Z'})
+                for minute, entry in zip((0, 10, 20), self._failures('bob', None, None, None))]
+        for entry in logs:
+            del entry['timestamp']
+        self.assertEqual(SigmaAnalyzer(rules=[self.BRUTE_FORCE]).analyze_logs(logs), [])
+
+    def test_state_is_bounded(self):
+        from threat_hunting.ai.sigma_aggregation import AggregationTracker
+        analyzer = SigmaAnalyzer(rules=[self.BRUTE_FORCE])
+        tracker = AggregationTracker(max_groups=100)
+        logs = (entry for stamp in range(10000) for entry in self._failures(f'user{stamp}', stamp))
+        self.assertEqual(list(analyzer.iter_matches(logs, tracker=tracker)), [])
+        state, = tracker.states.values()
+        self.assertLessEqual(len(state), 100)
+        # Les groupes sortis de la fenêtre de 5 minutes sont évincés
+        self.assertTrue(all(stamp >= 9999 - 300 for stamp, _ in state.groups.values()))
+
+    def test_unsupported_aggregation_is_rejected(self):
+        from threat_hunting.ai.sigma_compiler import SigmaCompileError, compile_rule
+        rule = {'detection': {'selection': {'EventID': 1}, 'condition': 'selection | count() < 3'}}
+        with self.assertRaises(SigmaCompileError):
+            compile_rule(rule)
+        rule['detection'].update(condition='selection | count() > 3', timeframe='09:00-17:00')
+        with self.assertRaises(SigmaCompileError):
+            compile_rule(rule)
+
+
+class SigmaBatchModeTest(TestCase):
+    RULES = [
+        {'title': 'Egalité', 'logsource': {'product': 'windows'},
+         'detection': {'selection': {'EventID': [4688, 4689], 'User': 'Bob'}, 'condition': 'selection'}},
+        {'title': 'Littéraux', 'logsource': {'product': 'windows'},
+         'detection': {'selection': {'CommandLine': ['*-enc*', 'cmd*', '*.ps1', '*\\te?p\\*']},
+                       'filter': {'Parent': None}, 'condition': 'selection and not filter'}},
+        {'title': 'Regex', 'logsource': {'product': 'linux'},
+         'detection': {'selection': {'CommandLine|re': 'Invoke-[A-Z]'}, 'condition': 'selection'}},
+        {'title': 'Mots-clés', 'detection': {'keywords': ['mimikatz'], 'condition': 'keywords'}},
+    ]
+    LOGS = [
+        {'EventID': 4688, 'User': 'bob', 'CommandLine': 'powershell -enc AAA', 'Parent': 'explorer.exe'},
+        {'EventID': '4689', 'User': 'BOB', 'CommandLine': 'CMD /c dir'},
+        {'EventID': 4624, 'User': 'alice', 'CommandLine': 'Invoke-Mimikatz', 'Parent': 'x'},
+        {'EventID': 4688, 'User': ['bob'], 'CommandLine': 'c:\\temp\\run.PS1', 'Parent': 'y'},
+        {'Message': 'rien'},
+    ]
+
+    def setUp(self):
+        from threat_hunting.ai import sigma_columnar
+        if not sigma_columnar.available():
+            self.skipTest('NumPy indisponible')
+
+    def test_same_results_as_row_mode(self):
+        analyzer = SigmaAnalyzer(rules=self.RULES)
+        for log_source in (None, 'windows', 'linux'):
+            expected = analyzer.analyze_logs(self.LOGS, log_source)
+            self.assertTrue(expected)
+            for batch_size in (1, 2, 100):
+                self.assertEqual(
+                    list(analyzer.iter_batch_matches(self.LOGS, log_source, batch_size=batch_size)), expected
+                )
+
+    def test_long_values_without_string_array(self):
+        from threat_hunting.ai.sigma_columnar import ColumnBatch
+        analyzer = SigmaAnalyzer(rules=self.RULES)
+        # Une ligne de commande de 32 Kio parmi 5000 valeurs distinctes : pas de tableau de chaînes de 650 Mio
+        logs = [dict(self.LOGS[number % 4], CommandLine=f'cmd /c echo {number}') for number in range(5000)]
+        logs[10] = dict(self.LOGS[0], CommandLine='powershell -enc ' + 'A' * 32768)
+        self.assertIsNone(ColumnBatch(logs).column('CommandLine').lowered_array())
+        expected = analyzer.analyze_logs(logs)
+        self.assertIn(logs[10], [result['log_entry'] for result in expected])
+        self.assertEqual(analyzer.analyze_batch(logs), expected)
+
+    def test_equal_keys_of_different_types(self):
+        # 1 == True == 1.0 comme clés de dictionnaire, mais '1', 'True' et '1.0' pour les tests
+        rules = [{'title': value, 'detection': {'sel': {'Elevated': value}, 'condition': 'sel'}}
+                 for value in ('true', '1', '1.0')]
+        analyzer = SigmaAnalyzer(rules=rules)
+        logs = [{'Elevated': value} for value in (1, True, 1.0, True, 1)]
+        expected = analyzer.analyze_logs(logs)
+        self.assertEqual([(r['title'], r['log_entry']['Elevated']) for r in expected],
+                         [('1', 1), ('true', True), ('1.0', 1.0), ('true', True), ('1', 1)])
+        self.assertEqual(analyzer.analyze_batch(logs), expected)
+
+    def test_aggregation_in_batch_mode(self):
+        analyzer = SigmaAnalyzer(rules=[SigmaAggregationTest.BRUTE_FORCE])
+        logs = [{'EventID': 4625, 'TargetUserName': 'bob', 'timestamp': stamp} for stamp in range(5)]
+        self.assertEqual(analyzer.analyze_batch(logs), analyzer.analyze_logs(logs))
+
+
+class SigmaCompactResultsTest(TestCase):
+    LOG = SigmaStreamingTest.LOG
+
+    def test_rule_table_sent_once(self):
+        analyzer = SigmaAnalyzer()
+        logs = [self.LOG, {"EventID": 1}, self.LOG]
+        compact = analyzer.analyze_logs_compact(logs, fields=['CommandLine'])
+        self.assertEqual(len(compact['rules']), 1)
+        self.assertEqual(compact['rules'][0]['title'], 'Suspicious PowerShell Command Line')
+        self.assertEqual(compact['results'], [
+            {'rule': 0, 'log': 0, 'fields': {'CommandLine': 'powershell -nop'}},
+            {'rule': 0, 'log': 2, 'fields': {'CommandLine': 'powershell -nop'}},
+        ])
+
+    def test_compact_view(self):
+        response = self.client.post('/analyze-logs-sigma/', {'logs': [self.LOG, self.LOG], 'compact': True},
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['format'], 'compact')
+        self.assertEqual(body['matches'], 2)
+        self.assertEqual([result['log'] for result in body['results']], [0, 1])
+        self.assertNotIn('rule_details', body['rules'][0])
+
+        response = self.client.post('/analyze-logs-sigma/', {'logs': [self.LOG], 'compact': True, 'fields': 'x'},
+                                    content_type='application/json')
+        self.assertEqual(response.json()['results'][0]['fields'], {'x': None})
+
+
+class SigmaGroupedResultsTest(TestCase):
+    LOG = SigmaStreamingTest.LOG
+
+    def test_groups_by_rule_and_key(self):
+        analyzer = SigmaAnalyzer()
+        logs = [dict(self.LOG, Computer=f'host-{i % 2}', timestamp=1700000000 + i) for i in range(10)]
+        groups = analyzer.analyze_logs_grouped(logs, group_by=['Computer'], max_samples=2)
+        self.assertEqual([group['group'] for group in groups], [{'Computer': 'host-0'}, {'Computer': 'host-1'}])
+        self.assertEqual([group['count'] for group in groups], [5, 5])
+        self.assertEqual(groups[0]['first_seen'], '2023-11-14T22:13:20+00:00')
+        self.assertEqual(groups[0]['last_seen'], '2023-11-14T22:13:28+00:00')
+        self.assertEqual(groups[0]['samples'], logs[0:4:2])
+
+    def test_grouped_view(self):
+        response = self.client.post('/analyze-logs-sigma/', {'logs': [self.LOG] * 3, 'group': True},
+                                    content_type='application/json')
+        body = response.json()
+        self.assertEqual((body['format'], body['matches'], body['groups']), ('grouped', 3, 1))
+        self.assertEqual(len(body['results'][0]['samples']), 3)
+
+
+class SigmaVerdictCacheTest(TestCase):
+    LOG = SigmaStreamingTest.LOG
+
+    def test_repeated_events_hit_cache(self):
+        analyzer = SigmaAnalyzer(verdict_cache_size=100)
+        logs = [dict(self.LOG, RecordNumber=i) for i in range(5)] + [{"EventID": 1, "RecordNumber": 9}]
+        results = analyzer.analyze_logs(logs)
+        self.assertEqual(results, SigmaAnalyzer().analyze_logs(logs))
+        self.assertEqual(analyzer.verdict_cache.stats()['hits'], 4)
+        self.assertEqual(analyzer.verdict_cache.stats()['misses'], 2)
+
+    def test_cache_is_bounded_and_invalidated_on_reload(self):
+        import os
+        import tempfile
+        from pathlib import Path
+        with tempfile.TemporaryDirectory() as rules_dir:
+            rule = Path(rules_dir) / 'a.yml'
+            rule.write_text(SigmaHotReloadTest.RULE.format(title='A', event_id=1))
+            analyzer = SigmaAnalyzer(rules_dir, verdict_cache_size=2)
+            analyzer.analyze_logs([{'EventID': i} for i in range(5)])
+            self.assertEqual(len(analyzer.verdict_cache), 2)
+
+            self.assertEqual(len(analyzer.analyze_logs([{'EventID': 1}])), 1)
+            rule.write_text(SigmaHotReloadTest.RULE.format(title='A', event_id=2))
+            os.utime(rule, ns=(1, 1))
+            analyzer.reload_if_changed()
+            self.assertEqual(analyzer.analyze_logs([{'EventID': 1}]), [])
+            self.assertEqual(len(analyzer.verdict_cache), 1)
+
+    def test_keyword_rules_key_on_whole_entry(self):
+        rules = [{'title': 'K', 'detection': {'keywords': ['mimikatz'], 'condition': 'keywords'}}]
+        analyzer = SigmaAnalyzer(rules=rules, verdict_cache_size=10)
+        logs = [{'Message': 'ok'}, {'Message': 'mimikatz'}, {'Message': 'ok', 'Other': 'MIMIKATZ'}]
+        self.assertEqual(len(analyzer.analyze_logs(logs)), 2)
+
+
+class SigmaSharedPredicateTest(TestCase):
+    SELECTION = {'EventID': 4688, 'NewProcessName': '*\\power?hell.exe'}
+
+    def test_identical_selections_evaluated_once(self):
+        from threat_hunting.ai.sigma_compiler import EventView
+        rules = [
+            {'title': 'A', 'detection': {'selection': dict(self.SELECTION), 'condition': 'selection'}},
+            {'title': 'B', 'detection': {'sel': dict(self.SELECTION), 'filter': {'User': 'system'},
+                                         'condition': 'sel and not filter'}},
+        ]
+        analyzer = SigmaAnalyzer(rules=rules)
+        first, second = analyzer.compiled_rules
+        self.assertEqual(analyzer.ruleset.context.memoized, 1)
+        # Les tables de clés ne servent qu'à la compilation
+        self.assertEqual(analyzer.ruleset.context.predicates, {})
+
+        view = EventView({'EventID': 4688, 'NewProcessName': 'C:\\PowerShell.exe', 'User': 'bob'})
+        self.assertTrue(first.match(view))
+        self.assertTrue(second.match(view))
+        memo = [key for key in view if isinstance(key, int)]
+        self.assertEqual(len(memo), 1)
+        self.assertEqual(
+            [r['title'] for r in analyzer.analyze_logs([view.event, dict(view.event, User='SYSTEM')])], ['A', 'B', 'A']
+        )
+
+
+class SigmaAdaptiveOrderingTest(TestCase):
+    def test_selective_cheap_operand_moves_first(self):
+        from threat_hunting.ai.sigma_adaptive import Junction
+
+        def expensive(view):
+            time.sleep(0.0005)
+            return True
+
+        def selective(view):
+            return view['EventID'] == '4688'
+
+        junction = Junction(True, (expensive, selective))
+        junction.start_profiling()
+        results = []
+        for event_id in ['4624'] * 18 + ['4688'] * 2:
+            results.append(all(operand({'EventID': event_id}) for operand in junction.order[0]))
+        self.assertEqual(results.count(True), 2)
+        self.assertTrue(junction.reorder())
+        self.assertEqual(junction.order[0], (selective, expensive))
+        stats = junction.statistics()
+        self.assertEqual(stats[0]['hit_rate'], 1.0)
+        self.assertEqual(stats[1]['hit_rate'], 0.1)
+
+    def test_reordering_keeps_results(self):
+        from threat_hunting.ai.sigma_adaptive import PredicateOptimizer
+        rules = [
+            {'title': 'A', 'detection': {
+                'selection': {'CommandLine|contains': ['-enc', 'hidden'], 'EventID': 4688},
+                'filter': {'User': ['system', 'svc']},
+                'condition': 'selection and not filter'}},
+            {'title': 'B', 'detection': {
+                'a': {'NewProcessName|endswith': '\\cmd.exe'}, 'b': {'EventID': 4624},
+                'condition': 'a or b'}},
+        ]
+        logs = [
+            {'EventID': 4688, 'CommandLine': 'powershell -enc AAA', 'User': 'bob', 'NewProcessName': 'C:\\cmd.exe'},
+            {'EventID': 4688, 'CommandLine': 'powershell -enc AAA', 'User': 'SYSTEM'},
+            {'EventID': 4624, 'CommandLine': 'logon'},
+            {'EventID': 4688, 'CommandLine': 'notepad.exe', 'NewProcessName': 'C:\\notepad.exe'},
+        ] * 20
+        # Désactivé par défaut
+        self.assertIsNone(SigmaAnalyzer(rules=rules).ruleset.optimizer)
+        expected = SigmaAnalyzer(rules=rules).analyze_logs(logs)
+        analyzer = SigmaAnalyzer(rules=rules, adaptive_ordering=True)
+        junctions = analyzer.ruleset.context.junctions
+        optimizer = analyzer.ruleset.optimizer = PredicateOptimizer(junctions, 10, 30)
+        for _ in range(5):
+            self.assertEqual(analyzer.analyze_logs(logs), expected)
+        self.assertGreater(optimizer.stats()['windows'], 0)
+
+        # Jeu partagé entre threads, fenêtres de mesure comprises
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(4) as pool:
+            for results in pool.map(lambda _: analyzer.analyze_logs(logs), range(8)):
+                self.assertEqual(results, expected)
+
+        # Tout ordre des opérandes donne les mêmes résultats
+        import random
+        analyzer.ruleset.optimizer = None
+        shuffle = random.Random(0)
+        for _ in range(10):
+            for junction in junctions:
+                junction.current = junction.order[0] = tuple(shuffle.sample(junction.operands, len(junction.operands)))
+            self.assertEqual(analyzer.analyze_logs(logs), expected)
+
+
+class SigmaSqlHuntTest(TestCase):
+    EVENTS = [
+        {'EventID': 4688, 'Image': 'C:\\Windows\\PowerShell.exe', 'CommandLine': 'powershell -enc AAA', 'User': 'bob'},
+        {'EventID': 4688, 'Image': 'C:\\Windows\\cmd.exe', 'CommandLine': 'cmd /c whoami', 'User': 'SYSTEM'},
+        {'EventID': '4624', 'User': 'alice', 'Elevated': True},
+        {'EventID': 4688, 'Image': 'C:\\Tools\\100%_sure.exe', 'CommandLine': None},
+        {'process': {'command_line': 'powershell -nop -enc BBB'}, 'EventID': 4688},
+    ]
+    RULES = [
+        {'selection': {'EventID': 4688, 'CommandLine|contains': '-enc'}, 'condition': 'selection'},
+        {'selection': {'Image|endswith': ['\\powershell.exe', '\\cmd.exe']}, 'filter': {'User': 'system'},
+         'condition': 'selection and not filter'},
+        {'selection': {'Image': '*\\100%_sure.exe'}, 'condition': 'selection'},
+        {'selection': {'EventID': 4688, 'CommandLine': None}, 'condition': 'selection'},
+        {'selection': {'Elevated': 'true'}, 'condition': 'selection'},
+        {'selection': {'CommandLine|re': 'who.mi'}, 'other': {'Image|contains': 'cmd'},
+         'condition': 'not selection or other'},
+        {'selection': {'process.command_line|startswith': 'powershell'}, 'condition': 'selection'},
+    ]
+
+    def setUp(self):
+        from users.models import StoredEvent
+        StoredEvent.objects.bulk_create(StoredEvent(source='windows', data=event) for event in self.EVENTS)
+
+    def test_sql_hunt_matches_python_engine(self):
+        from threat_hunting.ai.sigma_compiler import EventView, compile_rule
+        from users.hunting import hunt_sigma_rule
+        for detection in self.RULES:
+            rule = {'title': 'R', 'detection': detection}
+            compiled = compile_rule(rule)
+            expected = [event for event in self.EVENTS if compiled.match(EventView(event))]
+            self.assertEqual([event.data for event, _ in hunt_sigma_rule(rule)], expected, detection)
+
+    def test_translation_is_parameterised(self):
+        from threat_hunting.ai.sigma_compiler import parse_rule
+        from threat_hunting.ai.sigma_sql import DIALECTS, translate
+        tree, _ = parse_rule({'detection': self.RULES[1]})
+        condition = translate(tree, '"data"', DIALECTS['postgresql'])
+        self.assertTrue(condition.exact)
+        self.assertNotIn('powershell', condition.sql)
+        self.assertIn('%\\\\powershell.exe', condition.params)
+        self.assertIn('NOT', condition.sql)
+        tree, _ = parse_rule({'detection': self.RULES[5]})
+        self.assertFalse(translate(tree, '"data"', DIALECTS['postgresql']).exact)
+
+    def test_hunt_endpoint(self):
+        from django.contrib.auth import get_user_model
+        rule = "title: Encoded\ndetection:\n  selection:\n    CommandLine|contains: '-enc'\n  condition: selection\n"
+        response = self.client.post('/hunt-sigma/', {'rule': rule}, content_type='application/json')
+        self.assertIn(response.status_code, (401, 403))
+        self.client.force_login(get_user_model().objects.create_user('analyste', password='x'))
+
+        response = self.client.post('/hunt-sigma/', {'rule': rule, 'source': 'windows'}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.json()['matches'], response.json()['truncated']), (1, False))
+        # Quatre entrées 4688 : tronqué seulement au-delà de limit
+        rule = {'detection': {'selection': {'EventID': 4688}, 'condition': 'selection'}}
+        response = self.client.post('/hunt-sigma/', {'rule': rule, 'limit': 4}, content_type='application/json')
+        self.assertEqual((response.json()['matches'], response.json()['truncated']), (4, False))
+        response = self.client.post('/hunt-sigma/', {'rule': rule, 'limit': 3}, content_type='application/json')
+        self.assertEqual((response.json()['matches'], response.json()['truncated']), (3, True))
+        for limit in (0, -5, 'beaucoup'):
+            response = self.client.post('/hunt-sigma/', {'rule': rule, 'limit': limit}, content_type='application/json')
+            self.assertEqual(response.status_code, 400, limit)
+        response = self.client.post('/hunt-sigma/', {'rule': 'detection: 3'}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+class SigmaBacktestCommandTest(TestCase):
+    def test_backtest_over_archived_files(self):
+        import gzip
+        import io
+        import os
+        import tempfile
+        from django.core.management import call_command
+        log = {"EventID": "4688", "NewProcessName": "C:\\Windows\\powershell.exe", "CommandLine": "powershell -nop"}
+        with tempfile.TemporaryDirectory() as tmp:
+            with gzip.open(os.path.join(tmp, 'jour1.ndjson.gz'), 'wt') as f:
+                f.write('\n'.join(json.dumps(entry) for entry in [log, {"EventID": 1}, log]))
+            with open(os.path.join(tmp, 'jour2.jsonl'), 'w') as f:
+                f.write(json.dumps(log) + '\n')
+            with open(os.path.join(tmp, 'notes.txt'), 'w') as f:
+                f.write(json.dumps(log))
+            output = os.path.join(tmp, 'resultats.out')
+            report = io.StringIO()
+            call_command('backtest_sigma', tmp, '--workers', '2', '--output', output, stdout=report)
+            with open(output) as f:
+                matches = [json.loads(line) for line in f]
+        self.assertEqual(len(matches), 3)
+        self.assertEqual({m['file'].rsplit(os.sep, 1)[-1] for m in matches}, {'jour1.ndjson.gz', 'jour2.jsonl'})
+        self.assertIn('[2/2]', report.getvalue())
+        self.assertIn('4 entrées', report.getvalue())
+        self.assertIn('Suspicious PowerShell Command Line', report.getvalue())
+
+
+class SigmaHuntCommandTest(TestCase):
+    def test_log_formats(self):
+        import io
+        from threat_hunting.ai.log_formats import parse_syslog_line, read_log_entries
+        entry = parse_syslog_line("<38>Oct 18 10:00:01 web01 sshd[4242]: Failed password for root")
+        self.assertEqual(entry, {'timestamp': 'Oct 18 10:00:01', 'hostname': 'web01', 'program': 'sshd',
+                                 'pid': '4242', 'message': 'Failed password for root',
+                                 'facility': 'auth', 'severity': 'info'})
+        entry = parse_syslog_line("<165>1 2026-10-18T10:00:00Z db01 app - ID47 [x@1 a=\"b\"] démarrage")
+        self.assertEqual((entry['program'], entry['msgid'], entry['message']), ('app', 'ID47', 'démarrage'))
+        self.assertNotIn('pid', entry)
+        self.assertEqual(parse_syslog_line("texte libre"), {'message': 'texte libre'})
+        rows = list(read_log_entries(io.BytesIO(b'EventID,User\n4688,"bob, admin"\n4624,\n'), name='a.csv'))
+        self.assertEqual(rows, [{'EventID': '4688', 'User': 'bob, admin'}, {'EventID': '4624'}])
+        rows = list(read_log_entries(io.BytesIO(b'{"EventID": 1}\n'), name='journal.log'))
+        self.assertEqual(rows, [{'EventID': 1}])
+
+    def test_hunt_files(self):
+        import gzip
+        import io
+        import os
+        import tempfile
+        from django.core.management import call_command
+        log = {"EventID": "4688", "NewProcessName": "C:\\Windows\\powershell.exe", "CommandLine": "powershell -nop"}
+        with tempfile.TemporaryDirectory() as tmp:
+            with gzip.open(os.path.join(tmp, 'evenements.ndjson.gz'), 'wt') as f:
+                f.write('\n'.join(json.dumps(entry) for entry in [{"EventID": 1}, log]))
+            with open(os.path.join(tmp, 'export.csv'), 'w') as f:
+                f.write('EventID,NewProcessName,CommandLine\n1,a.exe,\n4688,C:\\Windows\\powershell.exe,powershell -nop\n')
+            output = os.path.join(tmp, 'resultats.out')
+            report = io.StringIO()
+            call_command('hunt', os.path.join(tmp, 'evenements.ndjson.gz'), os.path.join(tmp, 'export.csv'),
+                         '--workers', '1', '--output', output, stdout=report)
+            with open(output) as f:
+                matches = [json.loads(line) for line in f]
+        self.assertEqual([(m['file'].rsplit(os.sep, 1)[-1], m['event']) for m in matches],
+                         [('evenements.ndjson.gz', 1), ('export.csv', 1)])
+        self.assertEqual(matches[0]['title'], 'Suspicious PowerShell Command Line')
+        self.assertIn('4 entrées', report.getvalue())
+
+    def test_truncated_gzip(self):
+        import gzip
+        import io
+        import os
+        import random
+        import tempfile
+        from django.core.management import call_command
+        log = {"EventID": "4688", "NewProcessName": "C:\\Windows\\powershell.exe"}
+        noise = random.Random(0)
+        lines = [json.dumps(dict(log, CommandLine=f"powershell -nop {noise.getrandbits(64):x}")) for _ in range(2000)]
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = os.path.join(tmp, 'tronque.ndjson.gz')
+            content = gzip.compress('\n'.join(lines).encode())
+            with open(archive, 'wb') as f:
+                f.write(content[:len(content) // 2])
+            with open(os.path.join(tmp, 'messages.syslog.gz'), 'wb') as f:
+                f.write(gzip.compress(b'Oct 18 10:00:01 web01 sshd[1]: ok\n' * 2000)[:200])
+            with open(os.path.join(tmp, 'suite.jsonl'), 'w') as f:
+                f.write(lines[0] + '\n')
+            output = os.path.join(tmp, 'resultats.out')
+            report = io.StringIO()
+            call_command('hunt', archive, os.path.join(tmp, 'messages.syslog.gz'), os.path.join(tmp, 'suite.jsonl'),
+                         '--workers', '1', '--output', output, stdout=report)
+            with open(output) as f:
+                files = [json.loads(line)['file'].rsplit(os.sep, 1)[-1] for line in f]
+        # Correspondances lues avant la coupure conservées, sources suivantes analysées
+        self.assertGreater(files.count('tronque.ndjson.gz'), 0)
+        self.assertLess(files.count('tronque.ndjson.gz'), 2000)
+        self.assertEqual(files[-1], 'suite.jsonl')
+        self.assertEqual(report.getvalue().count('interrompu : Flux gzip tronqué'), 2)
+        self.assertIn('2 sources en erreur', report.getvalue())
+
+
+class SigmaRuleProfilerTest(TestCase):
+    RULES = [
+        {'title': 'PowerShell', 'id': 'r1', 'logsource': {'product': 'windows'},
+         'detection': {'sel': {'CommandLine|contains': 'powershell'}, 'condition': 'sel'}},
+        {'title': 'Regex', 'id': 'r2', 'logsource': {'product': 'windows'},
+         'detection': {'sel': {'CommandLine|re': '.*(mimikatz|procdump).*'}, 'condition': 'sel'}},
+    ]
+    LOGS = [{'CommandLine': 'powershell -nop'}, {'CommandLine': 'cmd /c dir'}] * 50
+
+    def test_profiler_counts(self):
+        analyzer = SigmaAnalyzer(rules=self.RULES, profile_sample_every=1, adaptive_ordering=False)
+        analyzer.analyze_logs(self.LOGS)
+        stats = analyzer.profiler.stats()
+        self.assertEqual(stats['sampled_events'], 100)
+        rows = {row['rule_id']: row for row in stats['rules']}
+        self.assertEqual((rows['r1']['evaluations'], rows['r1']['matches']), (100, 50))
+        self.assertEqual((rows['r2']['evaluations'], rows['r2']['matches']), (100, 0))
+        self.assertGreaterEqual(rows['r2']['p99_us'], rows['r2']['mean_us'])
+        self.assertEqual([row['rule_id'] for row in analyzer.profiler.report('matches', 1)], ['r1'])
+
+        # Échantillonné : correspondances exactes, évaluations extrapolées
+        sampled = SigmaAnalyzer(rules=self.RULES, profile_sample_every=10)
+        self.assertEqual(len(sampled.analyze_logs(self.LOGS)), 50)
+        self.assertEqual({row['rule_id']: row['matches'] for row in sampled.profiler.report()}, {'r1': 50, 'r2': 0})
+        self.assertLess(sampled.profiler.sampled_events, 100)
+
+    def test_profile_endpoint(self):
+        from django.contrib.auth import get_user_model
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from users.views import sigma_profile
+        user = get_user_model().objects.create_user('analyste', password='x')
+        factory = APIRequestFactory()
+        analyzer = SigmaAnalyzer(rules=self.RULES, profile_sample_every=1)
+        analyzer.analyze_logs(self.LOGS)
+        with mock.patch('users.views._shared_sigma_analyzer', return_value=analyzer):
+            request = factory.get('/sigma-profile/', {'limit': 1, 'sort': 'evaluations'})
+            force_authenticate(request, user)
+            response = sigma_profile(request)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['rules']), 1)
+            request = factory.delete('/sigma-profile/')
+            force_authenticate(request, user)
+            self.assertEqual(sigma_profile(request).status_code, 204)
+            self.assertEqual(analyzer.profiler.report(), [])
+        with mock.patch('users.views._shared_sigma_analyzer', return_value=SigmaAnalyzer(rules=self.RULES)):
+            request = factory.get('/sigma-profile/')
+            force_authenticate(request, user)
+            self.assertEqual(sigma_profile(request).status_code, 409)
+
+
+class RuleCostBudgetTest(TestCase):
+    SIGMA = ("title: Mimikatz\nlogsource: {product: windows}\n"
+             "detection:\n  sel: {EventID: 4688, CommandLine|contains: mimikatz}\n  condition: sel\n")
+    YARA_SLOW = 'rule zeros { strings: $a = { 00 00 } condition: #a > 10 }'
+
+    def _post(self, type_regle, contenu):
+        return self.client.post('/regles/', {'nom': 'candidate', 'type': type_regle, 'contenu': contenu},
+                                content_type='application/json')
+
+    def test_cost_reported(self):
+        response = self._post('SIGMA', self.SIGMA)
+        self.assertEqual(response.status_code, 201)
+        cost = response.json()['cost']
+        self.assertEqual((cost['type'], cost['over_budget']), ('SIGMA', False))
+        self.assertGreater(cost['baseline'], 0)
+        # Par défaut (flag), une règle illisible est enregistrée, signalée par l'analyse statique
+        response = self._post('SIGMA', 'detection: [')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('cost', response.json())
+        self.assertEqual(response.json()['lint'][0]['code'], 'syntax-error')
+
+    def test_budget_modes(self):
+        from django.test import override_settings
+        from users.models import Regle
+        with override_settings(YARA_RULE_BUDGET_MS=0.5):
+            with override_settings(RULE_COST_BUDGET_MODE='reject'):
+                response = self._post('YARA', self.YARA_SLOW)
+                self.assertEqual(response.status_code, 400)
+                self.assertTrue(response.json()['cost']['over_budget'])
+                self.assertTrue(response.json()['cost']['warnings'])
+                self.assertFalse(Regle.objects.exists())
+                self.assertEqual(self._post('SIGMA', 'detection: [').status_code, 400)
+            response = self._post('YARA', self.YARA_SLOW)
+            self.assertEqual(response.status_code, 201)
+            self.assertTrue(response.json()['cost']['over_budget'])
+        with override_settings(RULE_COST_BUDGET_MODE='off'):
+            self.assertNotIn('cost', self._post('YARA', 'rule { invalide').json())
+
+    def test_sigma_guards(self):
+        import time
+        from threat_hunting.ai.rule_budget import RuleCostError, measure_sigma_rule
+        from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+        ruleset = SigmaAnalyzer(rules=[]).ruleset
+        catastrophic = {'title': 'T', 'logsource': {'product': 'windows'},
+                        'detection': {'sel': {'CommandLine|re': '^(a+)+$'}, 'condition': 'sel'}}
+        start = time.perf_counter()
+        with self.assertRaises(RuleCostError):
+            measure_sigma_rule(catastrophic, ruleset)
+        self.assertLess(time.perf_counter() - start, 1)
+        response = self._post('SIGMA', 'title: T\ndetection:\n  sel: {CommandLine|re: "^(a+)+$"}\n  condition: sel\n')
+        self.assertEqual(response.status_code, 201)
+        self.assertIn('catastrophic-regex', [warning['code'] for warning in response.json()['lint']])
+        # Hors budget dès les premières entrées : la mesure s'arrête sans parcourir le corpus
+        slow = {'title': 'T', 'detection': {'sel': {'CommandLine|re': '(?:.*x){4}y'}, 'condition': 'sel'}}
+        cost = measure_sigma_rule(slow, ruleset, budget=0.001)
+        self.assertTrue(cost.over_budget)
+        self.assertFalse(cost.timed_out)
+        cost = measure_sigma_rule(slow, ruleset, budget=1e6, timeout=0.01)
+        self.assertTrue(cost.timed_out)
+        self.assertTrue(cost.as_dict()['over_budget'])
+
+
+class RuleLintTest(TestCase):
+    def test_yara_lint(self):
+        from threat_hunting.ai.rule_lint import lint_yara_text
+        source = r'''
+        rule lente {
+          strings:
+            $a = { 00 00 00 00 }
+            $b = /.*(evil|bad)[0-9]+/
+            $c = "js"
+            $d = "mimikatz.exe" nocase
+          condition:
+            for any i in (0..filesize) : ( uint8(i) == 0x4D ) or any of them
+        }'''
+        codes = {(warning.code, warning.location) for warning in lint_yara_text(source)}
+        self.assertLessEqual({('low-entropy-atom', 'lente / $a'), ('unanchored-regex', 'lente / $b'),
+                              ('short-atom', 'lente / $c'), ('filesize-loop', 'lente')}, codes)
+        self.assertFalse([code for code, location in codes if location == 'lente / $d'])
+        self.assertEqual(lint_yara_text('rule {')[0].code, 'syntax-error')
+
+    def test_sigma_lint(self):
+        from threat_hunting.ai.rule_lint import lint_sigma_rule
+        rule = {'title': 'T', 'logsource': {'product': 'windows'}, 'detection': {
+            'sel': {'CommandLine': ['*foo*bar', '*powershell.exe'], 'Image|re': '.*evil.*'},
+            'condition': 'sel'}}
+        self.assertEqual([warning.code for warning in lint_sigma_rule(rule)],
+                         ['leading-wildcard', 'unbounded-regex', 'no-discriminating-field'])
+        rule['detection']['sel'] = {'EventID': 4688, 'CommandLine|contains': 'mimikatz', 'Image|re': '^C:\\\\.*'}
+        self.assertEqual(lint_sigma_rule(rule), [])
+
+    def test_lint_returned_by_endpoint(self):
+        from django.test import override_settings
+        with override_settings(RULE_COST_BUDGET_MODE='off'):
+            response = self.client.post('/regles/', {'nom': 'ext', 'type': 'YARA',
+                                                     'contenu': 'rule ext { strings: $a = ".js" condition: $a }'},
+                                        content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertIn('short-atom', [warning['code'] for warning in response.json()['lint']])
+
+    def test_lint_rules_command(self):
+        import io
+        from django.core.management import call_command
+        output = io.StringIO()
+        call_command('lint_rules', '--json', stdout=output)
+        report = {entry['source'].rsplit('/', 1)[-1]: entry['warnings'] for entry in json.loads(output.getvalue())}
+        self.assertIn('malware_rules.yar', report)
+        self.assertIn('suspicious_powershell.yml', report)
@@ -5,7 +5,7 @@ from .views import (
     user_profile_view, ChangePasswordView, user_notifications, 
     trigger_alert, RapportViewSet, RegleViewSet, test_email_view, logout_view,
     ResultatAnalyseViewSet, CorrelationViewSet, security_chat, analyze_yara, analyze_sigma, 
-    scan_file, analyze_logs_sigma, get_rapports, csrf_cookie_view, NotificationViewSet, mark_as_read, mark_all_as_read , MarkAsReadNotificationView , MachineViewSet , supprimer_rapport
+    scan_file, analyze_logs_sigma, analyze_logs_sigma_stream, hunt_sigma, sigma_profile, get_rapports, csrf_cookie_view, NotificationViewSet, mark_as_read, mark_all_as_read , MarkAsReadNotificationView , MachineViewSet , supprimer_rapport
 )
 
 router = DefaultRouter()
@@ -34,6 +34,9 @@ urlpatterns = [
     path('analyze-sigma/', analyze_sigma, name='analyze_sigma'),
     path('scan-file/', scan_file, name='scan_file'),
     path('analyze-logs-sigma/',analyze_logs_sigma, name='analyze_logs_sigma'),
+    path('analyze-logs-sigma/stream/', analyze_logs_sigma_stream, name='analyze_logs_sigma_stream'),
+    path('hunt-sigma/', hunt_sigma, name='hunt_sigma'),
+    path('sigma-profile/', sigma_profile, name='sigma_profile'),
     path('get-rapports/', get_rapports, name='get_rapports'),
     path('user_notifications/<int:pk>/mark_as_read/', MarkAsReadNotificationView.as_view(), name='mark_as_read_notification'),
     path('user_notifications/mark_all_as_read/', mark_all_as_read, name='mark_all_as_read'),
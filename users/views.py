@@ -4,7 +4,7 @@ from rest_framework.response import Response
 from rest_framework import status, permissions
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, update_session_auth_hash, login
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.decorators import api_view, permission_classes, action
 from django.core.mail import send_mail
@@ -23,7 +23,21 @@ from django.views.decorators.http import require_http_methods
 import json
 from threat_hunting.ai.security_ai import security_assistant
 from threat_hunting.ai.yara_analyzer import YARAAnalyzer
-from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer
+from threat_hunting.ai.sigma_analyzer import SigmaAnalyzer, get_shared_analyzer, read_ndjson, read_stream_lines
+from threat_hunting.ai.sigma_index import LOGSOURCE_KEYS
+from threat_hunting.ai.sigma_profiler import SORT_KEYS
+from threat_hunting.ai.rule_lint import lint_rule_content
+from threat_hunting.ai.rule_budget import (
+    DEFAULT_SIGMA_BUDGET_US, DEFAULT_TIMEOUT_S, DEFAULT_YARA_BUDGET_MS, RuleCostError, measure_sigma_rule,
+    measure_yara_rule,
+)
+from threat_hunting.ai.sigma_compiler import SigmaCompileError
+from threat_hunting.ai.sigma_fields import FieldMapping
+from django.utils.dateparse import parse_datetime
+from .hunting import hunt_sigma_rule
+from .models import StoredEvent
+import yaml
+from threat_hunting.ai.sigma_grouping import DEFAULT_MAX_SAMPLES
 import yara
 from pathlib import Path
 from rest_framework.permissions import AllowAny
@@ -301,11 +315,85 @@ def get_rapports(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 class RegleViewSet(viewsets.ModelViewSet):
+    """Règles YARA / SIGMA ; le coût d'une règle est mesuré avant son enregistrement (voir rule_budget).
+
+    Selon RULE_COST_BUDGET_MODE, une règle qui dépasse son budget est
+    enregistrée et signalée (flag, par défaut) ou refusée (reject, 400) ; la
+    réponse contient les mesures sous la clé 'cost', et les avertissements de
+    l'analyse statique (voir rule_lint), qui ne bloquent pas l'enregistrement,
+    sous la clé 'lint'. Seul le mode reject refuse une règle illisible ou non
+    compilable. La mesure d'une règle SIGMA est interrompue après
+    RULE_COST_TIMEOUT_S secondes ; une règle à retour arrière catastrophique
+    n'est pas exécutée.
+    """
     queryset = Regle.objects.all()
     serializer_class = RegleSerializer
     permission_classes = [permissions.AllowAny]
 
+    def create(self, request, *args, **kwargs):
+        self._cost = self._lint = None
+        response = super().create(request, *args, **kwargs)
+        return self._with_checks(response)
+
+    def update(self, request, *args, **kwargs):
+        self._cost = self._lint = None
+        response = super().update(request, *args, **kwargs)
+        return self._with_checks(response)
+
+    def _with_checks(self, response):
+        if self._cost is not None:
+            response.data['cost'] = self._cost.as_dict()
+        if self._lint is not None:
+            response.data['lint'] = [warning.as_dict() for warning in self._lint]
+        return response
+
+    def _check_rule(self, type_regle, contenu, measure=True):
+        """Analyse statique, puis mesure du coût marginal de la règle si measure.
+
+        ValidationError si elle est illisible ou hors budget en mode reject.
+        """
+        if not contenu:
+            return
+        self._lint = lint_rule_content(type_regle, contenu)
+        mode = getattr(settings, 'RULE_COST_BUDGET_MODE', 'flag')
+        if mode == 'off' or not measure:
+            return
+        try:
+            if type_regle == 'SIGMA':
+                try:
+                    rule = yaml.safe_load(contenu)
+                except yaml.YAMLError as e:
+                    raise RuleCostError(f"YAML invalide : {e}")
+                if not isinstance(rule, dict):
+                    raise RuleCostError("La règle SIGMA doit être un objet YAML")
+                analyzer = _shared_sigma_analyzer()
+                # Jeu courant déjà compilé : seule la candidate est compilée
+                cost = measure_sigma_rule(rule, analyzer.ruleset,
+                                          getattr(settings, 'SIGMA_RULE_BUDGET_US', DEFAULT_SIGMA_BUDGET_US),
+                                          timeout=getattr(settings, 'RULE_COST_TIMEOUT_S', DEFAULT_TIMEOUT_S))
+            elif type_regle == 'YARA':
+                cost = measure_yara_rule(contenu, RULES_PATH,
+                                         getattr(settings, 'YARA_RULE_BUDGET_MS', DEFAULT_YARA_BUDGET_MS))
+            else:
+                return
+        except RuleCostError as e:
+            if mode == 'reject':
+                raise serializers.ValidationError({'contenu': str(e)})
+            # Erreur déjà signalée par l'analyse statique (syntax-error)
+            logger.warning(f"Coût de la règle {type_regle} non mesuré : {e}")
+            return
+        if cost.over_budget and mode == 'reject':
+            raise serializers.ValidationError({
+                'contenu': f"Règle trop coûteuse : {cost.marginal:.2f} {cost.unit} pour un budget de {cost.budget} {cost.unit}",
+                'cost': cost.as_dict(),
+                'lint': [warning.as_dict() for warning in self._lint],
+            })
+        if cost.over_budget:
+            logger.warning(f"Règle {type_regle} hors budget enregistrée : {cost.marginal:.2f} {cost.unit}")
+        self._cost = cost
+
     def perform_create(self, serializer):
+        self._check_rule(serializer.validated_data.get('type'), serializer.validated_data.get('contenu'))
         # Si l'utilisateur est authentifié, utiliser son ID
         if self.request.user.is_authenticated:
             serializer.save()
@@ -327,7 +415,11 @@ class RegleViewSet(viewsets.ModelViewSet):
             raise serializers.ValidationError("Le nom est obligatoire")
         if not serializer.validated_data.get('contenu'):
             raise serializers.ValidationError("Le contenu est obligatoire")
-        
+
+        # Contenu inchangé : coût déjà mesuré à l'enregistrement précédent
+        contenu = serializer.validated_data['contenu']
+        self._check_rule(type_regle, contenu, measure=contenu != instance.contenu)
+
         # Mettre à jour la règle
         serializer.save(type=type_regle)
 
@@ -442,6 +534,17 @@ def security_chat(request):
         
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
+def _shared_sigma_analyzer():
+    """Analyseur SIGMA partagé, configuré par les réglages SIGMA_*."""
+    return get_shared_analyzer(
+        cache_path=getattr(settings, 'SIGMA_RULES_CACHE', None),
+        verdict_cache_size=getattr(settings, 'SIGMA_VERDICT_CACHE_SIZE', 0),
+        field_mapping=getattr(settings, 'SIGMA_FIELD_MAPPING', None),
+        adaptive_ordering=getattr(settings, 'SIGMA_ADAPTIVE_ORDERING', False),
+        profile_sample_every=getattr(settings, 'SIGMA_PROFILE_SAMPLE_EVERY', 0),
+    )
+
+
 @csrf_exempt
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -454,17 +557,222 @@ def analyze_logs_sigma(request):
         if not isinstance(logs, list) or not logs:
             return Response({"error": "Les logs doivent être fournis dans une liste non vide"}, status=status.HTTP_400_BAD_REQUEST)
 
-        analyzer = SigmaAnalyzer()
+        # Format compact : table des règles envoyée une fois, références entières par correspondance,
+        # et seulement les champs de log demandés (liste ou "champ1,champ2")
+        compact = data.get('compact') or request.query_params.get('compact')
+        fields = data.get('fields') or request.query_params.get('fields')
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(',') if field.strip()]
+        if fields is not None and not (isinstance(fields, list) and all(isinstance(f, str) for f in fields)):
+            return Response({"error": "Le paramètre fields doit être une liste de noms de champs"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Mode regroupé : une entrée par (règle, valeurs des champs group_by) avec compteur,
+        # première/dernière occurrence et quelques exemples
+        group_by = data.get('group_by') or request.query_params.get('group_by')
+        grouped = group_by is not None or data.get('group') or request.query_params.get('group')
+        if isinstance(group_by, str):
+            group_by = [field.strip() for field in group_by.split(',') if field.strip()]
+        if group_by is not None and not (isinstance(group_by, list) and all(isinstance(f, str) for f in group_by)):
+            return Response({"error": "Le paramètre group_by doit être une liste de noms de champs"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            max_samples = int(data.get('samples') or request.query_params.get('samples') or DEFAULT_MAX_SAMPLES)
+        except (TypeError, ValueError):
+            return Response({"error": "Le paramètre samples doit être un entier"}, status=status.HTTP_400_BAD_REQUEST)
+
+        analyzer = _shared_sigma_analyzer()
+
+        if grouped:
+            groups = analyzer.analyze_logs_grouped(logs, log_source, group_by or (), max(max_samples, 0))
+            return Response({
+                "status": "success",
+                "format": "grouped",
+                "matches": sum(group["count"] for group in groups),
+                "groups": len(groups),
+                "results": groups
+            }, status=status.HTTP_200_OK)
+
+        # Mode flux : les correspondances sont renvoyées en NDJSON au fil de l'analyse
+        if data.get('stream') or request.query_params.get('stream'):
+            if compact:
+                matches = analyzer.iter_compact_matches(logs, log_source, fields)
+            else:
+                matches = analyzer.iter_matches(logs, log_source)
+            return StreamingHttpResponse(
+                _stream_sigma_matches(matches),
+                content_type='application/x-ndjson'
+            )
+
+        if compact:
+            compact_results = analyzer.analyze_logs_compact(logs, log_source, fields)
+            return Response({
+                "status": "success",
+                "format": "compact",
+                "matches": len(compact_results["results"]),
+                "rules": compact_results["rules"],
+                "results": compact_results["results"]
+            }, status=status.HTTP_200_OK)
+
         results = analyzer.analyze_logs(logs, log_source)
 
-        return Response({
+        response = {
             "status": "success",
             "matches": len(results),
             "results": results
-        }, status=status.HTTP_200_OK)
+        }
+        if analyzer.verdict_cache is not None:
+            response["verdict_cache"] = analyzer.verdict_cache.stats()
+        return Response(response, status=status.HTTP_200_OK)
 
     except Exception as e:
         return Response({"error": f"Erreur lors de l'analyse: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _stream_sigma_matches(matches):
+    """Sérialise les correspondances SIGMA en NDJSON, suivies d'une ligne de synthèse.
+
+    En format compact, les entrées de la table des règles ('ref') sont
+    intercalées avant leur première correspondance et ne sont pas comptées.
+    """
+    count = 0
+    try:
+        for result in matches:
+            if 'ref' not in result:
+                count += 1
+            yield json.dumps(result, default=str) + '\n'
+        yield json.dumps({"status": "success", "matches": count}) + '\n'
+    except Exception as e:
+        logger.error(f"Erreur lors de l'analyse SIGMA en flux : {e}")
+        yield json.dumps({"status": "error", "matches": count, "error": f"Erreur lors de l'analyse: {str(e)}"}) + '\n'
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def analyze_logs_sigma_stream(request):
+    """Analyse SIGMA d'un flux NDJSON (application/x-ndjson), éventuellement compressé en gzip.
+
+    Le corps n'est jamais chargé en entier : les entrées sont lues et
+    analysées au fil de la réception, les correspondances renvoyées en NDJSON
+    au fil de l'analyse (voir _stream_sigma_matches). La mémoire utilisée par
+    requête est bornée quelle que soit la taille de l'envoi.
+
+    Paramètres de l'URL : log_source (produit) ou product / category /
+    service, compact et fields comme pour analyze_logs_sigma.
+    """
+    if request.content_type != 'application/x-ndjson':
+        return JsonResponse({"error": "Le corps doit être au format application/x-ndjson"}, status=415)
+
+    params = request.GET
+    log_source = {key: params[key] for key in LOGSOURCE_KEYS if params.get(key)} or params.get('log_source') or None
+    fields = [field.strip() for field in params.get('fields', '').split(',') if field.strip()] or None
+    # gzip annoncé par Content-Encoding, sinon détecté d'après les premiers octets
+    gzipped = True if request.headers.get('Content-Encoding', '').lower() == 'gzip' else None
+
+    analyzer = _shared_sigma_analyzer()
+    logs = read_ndjson(read_stream_lines(_request_stream(request), gzipped))
+    if params.get('compact'):
+        matches = analyzer.iter_compact_matches(logs, log_source, fields)
+    else:
+        matches = analyzer.iter_matches(logs, log_source)
+    return StreamingHttpResponse(_stream_sigma_matches(matches), content_type='application/x-ndjson')
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def sigma_profile(request):
+    """Coût mesuré de chaque règle SIGMA de l'analyseur partagé (voir sigma_profiler).
+
+    GET : règles par coût décroissant ; paramètres sort (total, p99, mean,
+    evaluations, matches) et limit. DELETE : remet les mesures à zéro.
+    Le profilage est activé par SIGMA_PROFILE_SAMPLE_EVERY.
+    """
+    profiler = _shared_sigma_analyzer().profiler
+    if profiler is None:
+        return Response({"enabled": False, "error": "Profilage désactivé (SIGMA_PROFILE_SAMPLE_EVERY = 0)"},
+                        status=status.HTTP_409_CONFLICT)
+    if request.method == 'DELETE':
+        profiler.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    sort = request.query_params.get('sort', 'total')
+    if sort not in SORT_KEYS:
+        return Response({"error": f"Tri inconnu : {sort} (attendu : {', '.join(SORT_KEYS)})"},
+                        status=status.HTTP_400_BAD_REQUEST)
+    try:
+        limit = int(request.query_params.get('limit', 0))
+    except ValueError:
+        return Response({"error": "Le paramètre limit doit être un entier"}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({"enabled": True, **profiler.stats(sort, max(limit, 0))}, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def hunt_sigma(request):
+    """Recherche rétrospective d'une règle SIGMA (YAML ou objet) sur les entrées stockées.
+
+    La détection est évaluée par la base en une seule requête (voir
+    users.hunting). Paramètres : rule, since / until (ISO 8601), source et
+    limit (nombre maximal d'entrées retournées, 1000 par défaut).
+    """
+    data = request.data
+    rule = data.get('rule')
+    if isinstance(rule, str):
+        try:
+            rule = yaml.safe_load(rule)
+        except yaml.YAMLError as e:
+            return Response({"error": f"Règle YAML invalide : {e}"}, status=status.HTTP_400_BAD_REQUEST)
+    if not isinstance(rule, dict):
+        return Response({"error": "Le paramètre rule doit être une règle SIGMA"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        limit = int(data.get('limit', 1000))
+    except (TypeError, ValueError):
+        limit = 0
+    if limit < 1:
+        return Response({"error": "Le paramètre limit doit être un entier positif"}, status=status.HTTP_400_BAD_REQUEST)
+
+    queryset = StoredEvent.objects.all()
+    for name, lookup in (('since', 'timestamp__gte'), ('until', 'timestamp__lt')):
+        if data.get(name):
+            moment = parse_datetime(str(data[name]))
+            if moment is None:
+                return Response({"error": f"Le paramètre {name} doit être une date ISO 8601"}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(**{lookup: moment})
+    if data.get('source'):
+        queryset = queryset.filter(source=data['source'])
+
+    mapping_path = getattr(settings, 'SIGMA_FIELD_MAPPING', None)
+    try:
+        results = []
+        for event, aggregated in hunt_sigma_rule(rule, queryset, FieldMapping.from_file(mapping_path) if mapping_path else None):
+            result = {"id": event.pk, "timestamp": event.timestamp, "source": event.source, "log_entry": event.data}
+            if aggregated is not None:
+                result["aggregation"] = aggregated
+            results.append(result)
+            # Une entrée de plus que limit : seule façon de savoir si la liste est tronquée
+            if len(results) > limit:
+                break
+    except SigmaCompileError as e:
+        return Response({"error": f"Règle non compilable : {e}"}, status=status.HTTP_400_BAD_REQUEST)
+    truncated = len(results) > limit
+    del results[limit:]
+    return Response({
+        "status": "success",
+        "matches": len(results),
+        "truncated": truncated,
+        "results": results
+    }, status=status.HTTP_200_OK)
+
+
+def _request_stream(request):
+    """Flux du corps de la requête.
+
+    Un envoi chunked n'a pas de Content-Length : Django n'en lit alors rien,
+    mais le serveur WSGI (gunicorn, uWSGI) qui le décode le signale par
+    wsgi.input_terminated et son flux d'entrée peut être lu jusqu'au bout.
+    """
+    environ = request.META
+    if not environ.get('CONTENT_LENGTH') and environ.get('wsgi.input_terminated'):
+        return environ['wsgi.input']
+    return request
+
 @csrf_exempt
 def scan_file(request):
     if request.method == 'POST':